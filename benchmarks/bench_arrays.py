@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos arrays INT/FLOAT/BOOL: buffers array.array (TypedArray, atual)
+contra as listas de objetos Python usadas antes (funções de criação
+anteriores, reimplementadas abaixo e trocadas no módulo durante a medição).
+Mede a memória de arrays grandes preenchidos e o tempo de programas que
+leem e escrevem arrays.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_arrays.py [--repeat N] [--engine tree|closure|vm|python]
+"""
+import io
+import sys
+import time
+import argparse
+import contextlib
+import tracemalloc
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime import Interpreter as interpreter_module
+from runtime.engines import ENGINES
+from bench_engines import quicksort_sintetico
+
+
+_DEFAULTS = {'INT': 0, 'FLOAT': 0.0, 'STRING': "", 'BOOL': False}
+
+
+def lista(type_name, size):
+    return [_DEFAULTS.get(type_name.upper())] * int(size)
+
+
+def lista_de_linhas(value, rows, cols):
+    return [[value for _ in range(int(cols))] for _ in range(int(rows))]
+
+
+def matriz_de_listas(type_name, rows, cols):
+    return lista_de_linhas(_DEFAULTS.get(type_name.upper()), rows, cols)
+
+
+@contextlib.contextmanager
+def arrays_em_listas():
+    """Cria os arrays como listas (comportamento anterior) dentro do bloco."""
+    originais = (interpreter_module.new_array, interpreter_module.new_matrix, interpreter_module.fill_matrix)
+    interpreter_module.new_array = lista
+    interpreter_module.new_matrix = matriz_de_listas
+    interpreter_module.fill_matrix = lista_de_linhas
+    try:
+        yield
+    finally:
+        interpreter_module.new_array, interpreter_module.new_matrix, interpreter_module.fill_matrix = originais
+
+
+def preenchido(declaracao, tamanho, valor):
+    """Array declarado e preenchido com valores distintos (cada int/float da lista é um objeto)."""
+    return f'''
+{declaracao};
+SEQ {{
+    for i = 0; i < {tamanho}; i = i + 1 {{
+        v[i] = {valor};
+    }}
+}}
+'''
+
+
+def preenchida(declaracao, linhas, colunas, valor):
+    return f'''
+{declaracao};
+SEQ {{
+    for i = 0; i < {linhas}; i = i + 1 {{
+        for j = 0; j < {colunas}; j = j + 1 {{
+            m[i][j] = {valor};
+        }}
+    }}
+}}
+'''
+
+
+def crivo(limite):
+    """Crivo de Eratóstenes: leitura e escrita de um array INT em laços."""
+    return f'''
+INT composto[{limite}];
+INT primos = 0;
+SEQ {{
+    for i = 2; i < {limite}; i = i + 1 {{
+        if composto[i] == 0 {{
+            primos = primos + 1;
+            for j = i * i; j < {limite}; j = j + i {{
+                composto[j] = 1;
+            }}
+        }}
+    }}
+    print(primos);
+}}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def memoria(classe, fonte):
+    """Memória (bytes) alocada na execução e ainda em uso no fim (os arrays globais)."""
+    ast = analisa(fonte)
+    tracemalloc.start()
+    try:
+        interpretador = classe(output_stream=io.StringIO())
+        interpretador.interpret(ast)
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def cronometra(classe, fonte, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        saida = io.StringIO()
+        ast = analisa(fonte)
+        inicio = time.perf_counter()
+        classe(output_stream=saida).interpret(ast)
+        duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=5, help='repetições por caso (usa o menor tempo)')
+    argumentos.add_argument('--engine', choices=list(ENGINES), default='tree', help='modo de execução medido')
+    opcoes = argumentos.parse_args()
+    classe = ENGINES[opcoes.engine]
+
+    memorias = [
+        ('INT v[100000]', preenchido('INT v[100000]', 100000, 'i * 1000')),
+        ('FLOAT v[100000]', preenchido('FLOAT v[100000]', 100000, 'i * 0.5')),
+        ('BOOL v[100000]', preenchido('BOOL v[100000]', 0, 'i')),
+        ('INT m[100][1000]', preenchida('INT m[100][1000]', 100, 1000, 'i * 1000 + j')),
+    ]
+    print("=" * 80)
+    print(f" {'Memória (' + opcoes.engine + ')':34} | {'listas':>10} | {'buffers':>10} | redução")
+    print("=" * 80)
+    for nome, fonte in memorias:
+        with arrays_em_listas():
+            antigo = memoria(classe, fonte)
+        novo = memoria(classe, fonte)
+        formata = lambda b: f'{b / 2 ** 20:.2f} MB'
+        print(f" {nome:34} | {formata(antigo):>10} | {formata(novo):>10} | {antigo / novo:.1f}x")
+
+    casos = [
+        ('crivo (100000)', crivo(100000)),
+        ('quicksort sintético (2000)', quicksort_sintetico(2000)),
+    ]
+    print("=" * 80)
+    print(f" {'Tempo (' + opcoes.engine + ')':34} | {'listas':>10} | {'buffers':>10} | ganho")
+    print("=" * 80)
+    for nome, fonte in casos:
+        with arrays_em_listas():
+            antigo, saida_antiga = cronometra(classe, fonte, opcoes.repeat)
+        novo, saida_nova = cronometra(classe, fonte, opcoes.repeat)
+        if saida_nova != saida_antiga:
+            print(f" {nome}: saída diferente dos arrays em listas")
+            return 1
+        formata = lambda t: f'{t * 1000:.1f} ms'
+        print(f" {nome:34} | {formata(antigo):>10} | {formata(novo):>10} | {antigo / novo:.2f}x")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark de um PAR com N ramos que esperam em receive: modo python (uma
+thread por ramo) contra o modo async (uma corrotina por ramo, uma thread).
+Cada caso roda em um processo separado, para medir a memória máxima (RSS)
+de cada um.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_async.py [--branches N,N,...] [--max-threads N]
+"""
+import io
+import os
+import sys
+import time
+import argparse
+import resource
+import subprocess
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+
+
+def programa(n):
+    """n ramos esperando um valor de entrada; alimenta envia os n valores e soma recebe os dobros."""
+    ramos = ''.join(f'        espera({k});\n' for k in range(n))
+    return f'''
+C_CHANNEL entrada;
+C_CHANNEL saida;
+VOID espera(INT k) {{
+    INT x;
+    entrada.receive(x);
+    saida.send(x * 2);
+}}
+VOID alimenta() {{
+    for i = 0; i < {n}; i = i + 1 {{
+        entrada.send(i);
+    }}
+}}
+VOID soma() {{
+    INT total = 0;
+    INT y;
+    for j = 0; j < {n}; j = j + 1 {{
+        saida.receive(y);
+        total = total + y;
+    }}
+    print(total);
+}}
+SEQ {{
+    PAR {{
+        soma();
+{ramos}        alimenta();
+    }}
+}}
+'''
+
+
+def caso(engine, n):
+    """Executa um caso neste processo: imprime tempo (s), memória máxima (KiB) e a saída."""
+    ast = Parser(Lexer(programa(n)).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    ENGINES[engine](output_stream=saida).interpret(ast)
+    duracao = time.perf_counter() - inicio
+    print(duracao, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, saida.getvalue())
+
+
+def mede(engine, n):
+    """(tempo, memória máxima em MiB, saída) de um caso executado em outro processo."""
+    resultado = subprocess.run([sys.executable, __file__, '--caso', engine, str(n)],
+                               capture_output=True, text=True, cwd=os.getcwd())
+    if resultado.returncode != 0:
+        return None
+    duracao, memoria, saida = resultado.stdout.split(maxsplit=2)
+    return float(duracao), int(memoria) / 1024, saida.strip()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--branches', default='100,1000,5000,20000', help='números de ramos, separados por vírgula')
+    argumentos.add_argument('--max-threads', type=int, default=5000, help='maior N medido no modo python (threads)')
+    argumentos.add_argument('--caso', nargs=2, metavar=('ENGINE', 'N'), help=argparse.SUPPRESS)
+    opcoes = argumentos.parse_args()
+    if opcoes.caso:
+        caso(opcoes.caso[0], int(opcoes.caso[1]))
+        return 0
+
+    print("=" * 80)
+    print(f" {'ramos':>6} | {'python (threads)':>24} | {'async (corrotinas)':>24}")
+    print("=" * 80)
+    for n in (int(valor) for valor in opcoes.branches.split(',')):
+        colunas = []
+        saidas = set()
+        for engine in ('python', 'async'):
+            if engine == 'python' and n > opcoes.max_threads:
+                colunas.append('não medido')
+                continue
+            resultado = mede(engine, n)
+            if resultado is None:
+                colunas.append('falhou')
+                continue
+            duracao, memoria, saida = resultado
+            saidas.add(saida)
+            colunas.append(f'{duracao * 1000:8.1f} ms {memoria:7.1f} MiB')
+        if len(saidas) > 1:
+            print(f" {n}: saídas diferentes: {saidas}")
+            return 1
+        print(f" {n:>6} | {colunas[0]:>24} | {colunas[1]:>24}")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark das chamadas de função em cada modo de execução: custo por
+chamada (fib recursivo) e profundidade de recursão suportada (soma recursiva
+de um vetor, uma chamada aninhada por elemento, como o quicksort em um vetor
+já ordenado). A VirtualMachine guarda as chamadas em uma pilha própria; os
+demais modos usam a pilha do Python e param com RecursionError.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_calls.py [--repeat N] [--fib N] [--depth N]
+"""
+import io
+import sys
+import time
+import argparse
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+
+
+def fib(n):
+    return f'''
+INT fib(INT n) {{
+    if n < 2 {{
+        return n;
+    }}
+    return fib(n - 1) + fib(n - 2);
+}}
+SEQ {{
+    print(fib({n}));
+}}
+'''
+
+
+def chamadas_de_fib(n):
+    """Número de chamadas de fib(n) (contando a primeira)."""
+    a, b = 1, 1
+    for _ in range(n - 1):
+        a, b = b, a + b + 1
+    return b
+
+
+def soma_recursiva(tamanho):
+    """Soma dos elementos de um vetor com uma chamada por elemento: recursão com profundidade igual ao tamanho."""
+    return f'''
+INT v[{tamanho}];
+INT soma(INT i) {{
+    if i == {tamanho} {{
+        return 0;
+    }}
+    return v[i] + soma(i + 1);
+}}
+SEQ {{
+    for k = 0; k < {tamanho}; k = k + 1 {{
+        v[k] = k;
+    }}
+    print(soma(0));
+}}
+'''
+
+
+def executa(classe, fonte):
+    """Tempo de execução (s) e saída; a saída é o nome do erro se a execução falhou."""
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    saida = io.StringIO()
+    inicio = time.perf_counter()
+    try:
+        classe(output_stream=saida).interpret(ast)
+    except RecursionError:
+        return time.perf_counter() - inicio, 'RecursionError'
+    return time.perf_counter() - inicio, saida.getvalue()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=3, help='repetições por caso (usa o menor tempo)')
+    argumentos.add_argument('--fib', type=int, default=20, help='n do fib recursivo')
+    argumentos.add_argument('--depth', type=int, default=20000, help='profundidade da soma recursiva')
+    opcoes = argumentos.parse_args()
+    nomes = list(ENGINES)
+
+    chamadas = chamadas_de_fib(opcoes.fib)
+    print("=" * 80)
+    print(f" Custo por chamada: fib({opcoes.fib}), {chamadas} chamadas")
+    print("=" * 80)
+    saidas = set()
+    for nome in nomes:
+        melhor = None
+        for _ in range(opcoes.repeat):
+            tempo, saida = executa(ENGINES[nome], fib(opcoes.fib))
+            melhor = tempo if melhor is None else min(melhor, tempo)
+        saidas.add(saida)
+        print(f" {nome:10} | {melhor * 1000:8.1f} ms | {melhor / chamadas * 1e6:6.2f} µs/chamada")
+    if len(saidas) > 1:
+        print(" fib: saídas diferentes entre os modos de execução")
+        return 1
+
+    print("=" * 80)
+    print(f" Profundidade: soma recursiva de {opcoes.depth} elementos")
+    print("=" * 80)
+    for nome in nomes:
+        tempo, saida = executa(ENGINES[nome], soma_recursiva(opcoes.depth))
+        resultado = saida if saida == 'RecursionError' else 'ok: ' + saida.strip()
+        print(f" {nome:10} | {tempo * 1000:8.1f} ms | {resultado}")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos modos de execução (runtime/engines.py): o mesmo programa,
+analisado uma vez, executado por cada engine, com conferência de que todas
+produzem a mesma saída.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_engines.py [--repeat N] [--size N]
+"""
+import io
+import re
+import sys
+import time
+import argparse
+import contextlib
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+
+
+def quicksort_sintetico(tamanho):
+    """Mesma estrutura de tests/programa6_quicksort.minipar, com o vetor gerado no programa."""
+    return f'''
+INT array_global[{tamanho}];
+INT tamanho_global;
+
+class Quicksort {{
+    VOID ordenar() {{
+        this.quicksort_recursivo(0, tamanho_global - 1);
+    }}
+
+    VOID quicksort_recursivo(INT low, INT high) {{
+        if low < high {{
+            INT pi;
+            pi = this.partition(low, high);
+            this.quicksort_recursivo(low, pi - 1);
+            this.quicksort_recursivo(pi + 1, high);
+        }}
+    }}
+
+    INT partition(INT low, INT high) {{
+        INT pivot;
+        INT i;
+        INT j;
+        pivot = array_global[high];
+        i = low - 1;
+        for j = low; j < high; j = j + 1 {{
+            if array_global[j] <= pivot {{
+                i = i + 1;
+                this.swap(i, j);
+            }}
+        }}
+        this.swap(i + 1, high);
+        return i + 1;
+    }}
+
+    VOID swap(INT i, INT j) {{
+        INT temp;
+        temp = array_global[i];
+        array_global[i] = array_global[j];
+        array_global[j] = temp;
+    }}
+}}
+
+VOID main() {{
+    INT semente;
+    INT k;
+    semente = 12345;
+    for k = 0; k < {tamanho}; k = k + 1 {{
+        semente = (semente * 1103515245 + 12345) % 2147483648;
+        array_global[k] = semente % 100000;
+    }}
+    tamanho_global = {tamanho};
+    Quicksort sorter;
+    sorter = new Quicksort();
+    sorter.ordenar();
+    print(array_global[0]);
+    print(" ");
+    print(array_global[{tamanho} - 1]);
+    print("\\n");
+}}
+
+SEQ {{
+    main();
+}}
+'''
+
+
+def cronometra(classe, fonte, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()):
+            ast = Parser(Lexer(fonte).tokenize()).parse()
+            SemanticAnalyzer().analyze(ast)
+        with contextlib.redirect_stdout(saida):
+            inicio = time.perf_counter()
+            classe(output_stream=saida, input_callback=lambda prompt: '').interpret(ast)
+            duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=5, help='repetições por caso (usa o menor tempo)')
+    argumentos.add_argument('--size', type=int, default=3000, help='tamanho do vetor do quicksort sintético')
+    opcoes = argumentos.parse_args()
+
+    casos = [(f'quicksort sintético ({opcoes.size})', quicksort_sintetico(opcoes.size))]
+    for caminho in ('tests/programa3_neuronio.minipar', 'tests/programa4_xor_cpp.minipar',
+                    'tests/programa5_recomendacao.minipar'):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            casos.append((caminho, f.read()))
+
+    nomes = list(ENGINES)
+    print("=" * 80)
+    print(f" {'Caso':38} | " + " | ".join(f'{nome:>10}' for nome in nomes) + " | ganho")
+    print("=" * 80)
+    for caso, fonte in casos:
+        tempos = []
+        saidas = set()
+        for nome in nomes:
+            tempo, saida = cronometra(ENGINES[nome], fonte, opcoes.repeat)
+            tempos.append(tempo)
+            # O input_callback impresso pelo Interpreter inclui o endereço da função
+            saidas.add(re.sub(r'0x[0-9a-f]+', 'ADDR', saida))
+        if len(saidas) > 1:
+            print(f" {caso}: saídas diferentes entre os modos de execução")
+            return 1
+        colunas = " | ".join(f'{tempo * 1000:>7.1f} ms' for tempo in tempos)
+        print(f" {caso:38} | {colunas} | {tempos[0] / min(tempos):.2f}x")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
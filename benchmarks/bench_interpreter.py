@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark do interpretador: operações escolhidas pelo tipo estático anotado
+pelo SemanticAnalyzer (Interpreter atual) contra a avaliação genérica, que
+decide operador e tipos a cada BinaryOpNode (InterpretadorGenerico, abaixo).
+A coluna "sem tipos" é o Interpreter atual sobre uma AST não analisada.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_interpreter.py [--repeat N]
+"""
+import io
+import sys
+import time
+import argparse
+import contextlib
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import BinaryOpNode, ConditionNode, NumberNode
+from runtime.Interpreter import Interpreter
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+
+
+class InterpretadorGenerico(Interpreter):
+    """Avaliação de números, operadores e condições anterior, para comparação."""
+
+    def specialize(self, ast):
+        pass
+
+    def evaluate_expression(self, node):
+        if isinstance(node, NumberNode):
+            value = node.value
+            if '.' in str(value):
+                return float(value)
+            return int(value)
+        elif isinstance(node, BinaryOpNode):
+            left = self.evaluate_expression(node.left)
+            right = self.evaluate_expression(node.right)
+            return self.apply_binary_op(left, node.operator, right)
+        return super().evaluate_expression(node)
+
+    def evaluate_condition(self, node):
+        if isinstance(node, ConditionNode):
+            left = self.evaluate_expression(node.left)
+            right = self.evaluate_expression(node.right)
+            return self.apply_comparison(left, node.operator, right)
+        return self.evaluate_expression(node)
+
+
+def programa_sintetico(iteracoes):
+    """Laço com aritmética inteira, real e concatenação de strings."""
+    return f'''
+INT calcula(INT n) {{
+    INT total = 0;
+    FLOAT media = 0.0;
+    STRING s = "";
+    INT i = 0;
+    for i = 0; i < n; i = i + 1 {{
+        total = total + i * 3 % 7 - i / 2;
+        media = media + total / 2.0;
+        s = "v" + i % 10;
+    }}
+    print(s);
+    print(media);
+    return total;
+}}
+SEQ {{
+    print(calcula({iteracoes}));
+}}
+'''
+
+
+def cronometra(classe, fonte, analisa, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            ast = Parser(Lexer(fonte).tokenize()).parse()
+            if analisa:
+                SemanticAnalyzer().analyze(ast)
+            inicio = time.perf_counter()
+            classe(input_callback=lambda prompt: '').interpret(ast)
+            duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=5, help='repetições por caso (usa o menor tempo)')
+    opcoes = argumentos.parse_args()
+
+    casos = [('sintético (20k iterações)', programa_sintetico(20000))]
+    for caminho in ('tests/programa3_neuronio.minipar', 'tests/programa4_xor_cpp.minipar'):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            casos.append((caminho, f.read()))
+
+    print("=" * 80)
+    print(f" {'Caso':34} | {'genérico':>10} | {'sem tipos':>10} | {'com tipos':>10} | ganho")
+    print("=" * 80)
+    for nome, fonte in casos:
+        antigo, saida_antiga = cronometra(InterpretadorGenerico, fonte, False, opcoes.repeat)
+        sem_tipos, _ = cronometra(Interpreter, fonte, False, opcoes.repeat)
+        novo, saida_nova = cronometra(Interpreter, fonte, True, opcoes.repeat)
+        if saida_nova != saida_antiga:
+            print(f" {nome}: saída diferente da avaliação genérica")
+            return 1
+        formata = lambda t: f'{t * 1000:.1f} ms'
+        print(f" {nome:34} | {formata(antigo):>10} | {formata(sem_tipos):>10} | {formata(novo):>10} | {antigo / novo:.2f}x")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
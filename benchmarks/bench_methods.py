@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark da chamada de método no Interpreter: tabelas de métodos por classe
+com cache em cada chamada (Interpreter atual) contra a busca anterior, que
+percorria a lista de métodos da classe e depois a do pai a cada chamada
+(InterpretadorBuscaLinear, abaixo).
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_methods.py [--repeat N]
+"""
+import io
+import sys
+import time
+import argparse
+import contextlib
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from runtime.Interpreter import Interpreter
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+
+
+class InterpretadorBuscaLinear(Interpreter):
+    """Busca de métodos anterior (classe e um nível de herança), para comparação."""
+
+    def lookup_method(self, node, obj):
+        for method in obj.class_def.methods:
+            if method.name == node.method_name:
+                return method
+        if obj.class_def.parent and obj.class_def.parent in obj.parent_classes:
+            parent_def = obj.parent_classes[obj.class_def.parent]
+            for method in parent_def.methods:
+                if method.name == node.method_name:
+                    return method
+        return None
+
+
+def formas(n):
+    """Hierarquia com vários métodos; a chamada no laço alterna entre as classes."""
+    return f'''
+class Forma {{
+    INT lado;
+    VOID define(INT l) {{ this.lado = l; }}
+    INT lados() {{ return 0; }}
+    INT cor() {{ return 1; }}
+    INT borda() {{ return 2; }}
+    INT camada() {{ return 3; }}
+    INT area() {{ return this.lado * this.lado; }}
+    INT perimetro() {{ return this.lados() * this.lado; }}
+}}
+class Triangulo extends Forma {{
+    INT lados() {{ return 3; }}
+}}
+class Quadrado extends Forma {{
+    INT lados() {{ return 4; }}
+}}
+Forma f[2];
+INT total = 0;
+SEQ {{
+    f[0] = new Triangulo();
+    f[1] = new Quadrado();
+    f[0].define(2);
+    f[1].define(3);
+    for i = 0; i < {n}; i = i + 1 {{
+        total = total + f[i % 2].perimetro() + f[i % 2].area();
+    }}
+    print(total);
+}}
+'''
+
+
+def cronometra(classe, fonte, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            ast = Parser(Lexer(fonte).tokenize()).parse()
+            SemanticAnalyzer().analyze(ast)
+            inicio = time.perf_counter()
+            classe().interpret(ast)
+            duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=5, help='repetições por caso (usa o menor tempo)')
+    opcoes = argumentos.parse_args()
+
+    with open('tests/programa5_recomendacao.minipar', 'r', encoding='utf-8') as f:
+        recomendacao = f.read()
+    casos = [
+        ('formas (10000 iterações)', formas(10000)),
+        ('tests/programa5_recomendacao', recomendacao),
+    ]
+
+    print("=" * 80)
+    print(f" {'Caso':34} | {'linear':>10} | {'tabelas':>10} | ganho")
+    print("=" * 80)
+    for nome, fonte in casos:
+        antigo, saida_antiga = cronometra(InterpretadorBuscaLinear, fonte, opcoes.repeat)
+        novo, saida_nova = cronometra(Interpreter, fonte, opcoes.repeat)
+        if saida_nova != saida_antiga:
+            print(f" {nome}: saída diferente da busca linear")
+            return 1
+        formata = lambda t: f'{t * 1000:.1f} ms'
+        print(f" {nome:34} | {formata(antigo):>10} | {formata(novo):>10} | {antigo / novo:.2f}x")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark dos objetos: layout por Shape (slots em lista copiados de um molde
+por classe, ObjectInstance atual) contra o layout anterior, que percorria os
+AttributeNode da classe a cada new e guardava os atributos em um dicionário
+(ObjetoDicionario, abaixo).
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_objects.py [--repeat N]
+"""
+import io
+import sys
+import time
+import argparse
+import contextlib
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import NumberNode
+from runtime.Interpreter import Interpreter, ObjectInstance
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+
+
+class ObjetoDicionario(ObjectInstance):
+    """Layout anterior dos objetos, para comparação."""
+
+    attributes = None
+
+    def __init__(self, class_name, class_def, parent_classes=None, methods=None):
+        self.class_name = class_name
+        self.class_def = class_def
+        self.parent_classes = parent_classes or {}
+        self.methods = methods
+        self.attributes = {}
+        for attr in class_def.attributes:
+            if attr.is_2d_array and attr.array_dimensions:
+                dim1, dim2 = attr.array_dimensions
+                if isinstance(dim1, NumberNode):
+                    dim1 = int(dim1.value)
+                if isinstance(dim2, NumberNode):
+                    dim2 = int(dim2.value)
+                if attr.type_name.upper() == "INT":
+                    self.attributes[attr.name] = [[0 for _ in range(int(dim2))] for _ in range(int(dim1))]
+                elif attr.type_name.upper() == "FLOAT":
+                    self.attributes[attr.name] = [[0.0 for _ in range(int(dim2))] for _ in range(int(dim1))]
+                else:
+                    self.attributes[attr.name] = [[None for _ in range(int(dim2))] for _ in range(int(dim1))]
+            elif attr.is_array and attr.array_size:
+                size = attr.array_size
+                if isinstance(size, NumberNode):
+                    size = int(size.value)
+                if attr.type_name.upper() == "INT":
+                    self.attributes[attr.name] = [0] * int(size)
+                elif attr.type_name.upper() == "FLOAT":
+                    self.attributes[attr.name] = [0.0] * int(size)
+                elif attr.type_name.upper() == "STRING":
+                    self.attributes[attr.name] = [""] * int(size)
+                elif attr.type_name.upper() == "BOOL":
+                    self.attributes[attr.name] = [False] * int(size)
+                else:
+                    self.attributes[attr.name] = [None] * int(size)
+            else:
+                self.attributes[attr.name] = None
+
+    def get_attribute(self, name):
+        if name in self.attributes:
+            return self.attributes[name]
+        if self.class_def.parent and self.class_def.parent in self.parent_classes:
+            parent_def = self.parent_classes[self.class_def.parent]
+            for attr in parent_def.attributes:
+                if attr.name == name:
+                    return self.attributes.get(name)
+        return None
+
+    def set_attribute(self, name, value):
+        self.attributes[name] = value
+
+
+class InterpretadorDicionario(Interpreter):
+    """Interpreter que cria objetos com o layout anterior."""
+
+    def new_instance(self, class_name, class_def):
+        return ObjetoDicionario(class_name, class_def, self.classes, self.method_tables.get(class_def))
+
+
+CLASSE = '''
+class Base {
+    INT id;
+    STRING nome;
+}
+class Ponto extends Base {
+    INT x;
+    INT y;
+    FLOAT peso;
+    STRING rotulo;
+    INT historico[4];
+    VOID move(INT dx) { this.x = this.x + dx; }
+}
+'''
+
+
+def instanciacao(n):
+    return CLASSE + f'''
+Ponto v[16];
+SEQ {{
+    for i = 0; i < {n}; i = i + 1 {{
+        v[i % 16] = new Ponto();
+    }}
+    print(v[0].x);
+}}
+'''
+
+
+def atributos(n):
+    return CLASSE + f'''
+Ponto p = new Ponto();
+SEQ {{
+    p.x = 0;
+    p.y = 1;
+    p.id = 7;
+    for i = 0; i < {n}; i = i + 1 {{
+        p.x = p.x + p.y;
+        p.id = p.id + p.x % 3;
+        p.move(1);
+    }}
+    print(p.x + p.id);
+}}
+'''
+
+
+def cronometra(classe, fonte, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            ast = Parser(Lexer(fonte).tokenize()).parse()
+            SemanticAnalyzer().analyze(ast)
+            inicio = time.perf_counter()
+            classe().interpret(ast)
+            duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=5, help='repetições por caso (usa o menor tempo)')
+    opcoes = argumentos.parse_args()
+
+    with open('tests/programa5_recomendacao.minipar', 'r', encoding='utf-8') as f:
+        recomendacao = f.read()
+    casos = [
+        ('new (20000 objetos)', instanciacao(20000)),
+        ('atributos (10000 iterações)', atributos(10000)),
+        ('tests/programa5_recomendacao', recomendacao),
+    ]
+
+    print("=" * 80)
+    print(f" {'Caso':34} | {'dict':>10} | {'shape':>10} | ganho")
+    print("=" * 80)
+    for nome, fonte in casos:
+        antigo, saida_antiga = cronometra(InterpretadorDicionario, fonte, opcoes.repeat)
+        novo, saida_nova = cronometra(Interpreter, fonte, opcoes.repeat)
+        if saida_nova != saida_antiga:
+            print(f" {nome}: saída diferente do layout com dicionário")
+            return 1
+        formata = lambda t: f'{t * 1000:.1f} ms'
+        print(f" {nome:34} | {formata(antigo):>10} | {formata(novo):>10} | {antigo / novo:.2f}x")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark do PAR com ramos que só calculam: K ramos com o mesmo trabalho,
+em threads e em processos (par_backend='process'), para K = 1, 2, 4... até
+o número de núcleos. Com threads e GIL o tempo cresce com K (um ramo por
+vez); em um CPython free-threaded (python3.13t+) as threads escalam como os
+processos. Com processos o tempo fica perto do de um ramo enquanto houver
+núcleos livres. A eficiência é (K x tempo de um ramo) / (núcleos x tempo).
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_par.py [--repeat N] [--engine tree|closure|vm|python] [--work N] [--max-branches K]
+"""
+import io
+import os
+import sys
+import time
+import argparse
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.ProcessPar import fork_available
+from runtime.LockStripes import FREE_THREADED
+
+
+def programa(ramos, trabalho):
+    """K ramos; o ramo k soma os quadrados de 0..trabalho-1 em r[k]."""
+    comandos = ''.join(f'        calcula({k});\n' for k in range(ramos))
+    return f'''
+INT r[{ramos}];
+VOID calcula(INT k) {{
+    INT s = 0;
+    for i = 0; i < {trabalho}; i = i + 1 {{
+        s = s + (i * i) % 7;
+    }}
+    r[k] = s;
+}}
+SEQ {{
+    PAR {{
+{comandos}    }}
+    print(vsum(r));
+}}
+'''
+
+
+def cronometra(classe, fonte, par_backend, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        ast = Parser(Lexer(fonte).tokenize()).parse()
+        SemanticAnalyzer().analyze(ast)
+        saida = io.StringIO()
+        inicio = time.perf_counter()
+        classe(output_stream=saida, par_backend=par_backend).interpret(ast)
+        duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def main():
+    nucleos = os.cpu_count() or 1
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=3, help='repetições por caso (usa o menor tempo)')
+    argumentos.add_argument('--engine', choices=list(ENGINES), default='closure', help='modo de execução medido')
+    argumentos.add_argument('--work', type=int, default=200000, help='iterações do laço de cada ramo')
+    argumentos.add_argument('--max-branches', type=int, default=max(nucleos, 2), help='maior número de ramos')
+    opcoes = argumentos.parse_args()
+    classe = ENGINES[opcoes.engine]
+    processos_disponiveis = fork_available()
+
+    ramos = [1]
+    while ramos[-1] * 2 <= opcoes.max_branches:
+        ramos.append(ramos[-1] * 2)
+    if ramos[-1] != opcoes.max_branches:
+        ramos.append(opcoes.max_branches)
+
+    print("=" * 80)
+    print(f" PAR com K ramos de {opcoes.work} iterações ({opcoes.engine}, {nucleos} núcleo(s))")
+    print(f" Python {sys.version.split()[0]}, GIL {'desligado (free-threaded)' if FREE_THREADED else 'ligado'}")
+    if not processos_disponiveis:
+        print(" fork não disponível neste sistema: medindo só threads")
+    print("=" * 80)
+    print(f" {'K':>3} | {'threads':>10} | {'efic.':>6} | {'processos':>10} | {'efic.':>6} | threads/processos")
+    um_ramo = {}
+
+    def eficiencia(backend, k, tempo):
+        um_ramo.setdefault(backend, tempo)
+        return f'{k * um_ramo[backend] / (min(k, nucleos) * tempo) * 100:5.1f}%'
+
+    formata = lambda t: f'{t * 1000:.1f} ms'
+    for k in ramos:
+        fonte = programa(k, opcoes.work)
+        threads, saida_threads = cronometra(classe, fonte, 'thread', opcoes.repeat)
+        linha = f" {k:>3} | {formata(threads):>10} | {eficiencia('thread', k, threads):>6} | "
+        if processos_disponiveis:
+            processos, saida_processos = cronometra(classe, fonte, 'process', opcoes.repeat)
+            if saida_threads != saida_processos:
+                print(f" K={k}: saídas diferentes ({saida_threads!r} e {saida_processos!r})")
+                return 1
+            linha += f"{formata(processos):>10} | {eficiencia('process', k, processos):>6} | {threads / processos:4.2f}x"
+        else:
+            linha += f"{'-':>10} | {'-':>6} | -"
+        print(linha)
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark de blocos PAR dentro de laços: o pool do Scheduler (threads
+reutilizadas entre os blocos) contra uma thread nova por comando do PAR
+(o modelo do antigo ThreadManager, reproduzido aqui). Os ramos fazem pouco
+trabalho, então o tempo mostra o custo de criar e esperar as threads.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_par_loop.py [--repeat N] [--iterations N] [--branches K]
+"""
+import io
+import sys
+import time
+import argparse
+import threading
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime import Interpreter as interpreter_module
+from runtime.engines import ENGINES
+
+
+class ThreadPorComando:
+    """Mesma interface de Scheduler.run, com uma thread nova por função."""
+
+    def run(self, functions):
+        threads = [threading.Thread(target=function) for function in functions]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+
+def programa(iteracoes, ramos):
+    comandos = ''.join(f'            incrementa({k});\n' for k in range(ramos))
+    return f'''
+INT v[{ramos}];
+VOID incrementa(INT i) {{
+    v[i] = v[i] + 1;
+}}
+SEQ {{
+    for k = 0; k < {iteracoes}; k = k + 1 {{
+        PAR {{
+{comandos}        }}
+    }}
+    print(vsum(v));
+}}
+'''
+
+
+def cronometra(classe, fonte, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        ast = Parser(Lexer(fonte).tokenize()).parse()
+        SemanticAnalyzer().analyze(ast)
+        saida = io.StringIO()
+        inicio = time.perf_counter()
+        classe(output_stream=saida).interpret(ast)
+        duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=3, help='repetições por caso (usa o menor tempo)')
+    argumentos.add_argument('--iterations', type=int, default=2000, help='iterações do laço com o PAR')
+    argumentos.add_argument('--branches', type=int, default=4, help='comandos de cada PAR')
+    opcoes = argumentos.parse_args()
+    fonte = programa(opcoes.iterations, opcoes.branches)
+    blocos = opcoes.iterations
+
+    print("=" * 80)
+    print(f" {blocos} blocos PAR de {opcoes.branches} comandos em um laço")
+    print("=" * 80)
+    print(f" {'modo':10} | {'thread/comando':>14} | {'scheduler':>10} | ganho | µs/bloco (scheduler)")
+    padrao = interpreter_module.default_scheduler
+    for nome, classe in ENGINES.items():
+        interpreter_module.default_scheduler = ThreadPorComando
+        try:
+            antigo, saida_antiga = cronometra(classe, fonte, opcoes.repeat)
+        finally:
+            interpreter_module.default_scheduler = padrao
+        novo, saida_nova = cronometra(classe, fonte, opcoes.repeat)
+        if saida_antiga != saida_nova:
+            print(f" {nome}: saídas diferentes ({saida_antiga!r} e {saida_nova!r})")
+            return 1
+        print(f" {nome:10} | {antigo * 1000:11.1f} ms | {novo * 1000:7.1f} ms | {antigo / novo:4.2f}x | "
+              f"{novo / blocos * 1e6:8.1f}")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmark do parser: expressões por tabela de precedência + despacho de
+comandos por dicionário (Parser atual) contra a descida recursiva com um
+método por nível de precedência e cadeia de elif (ParserRecursivo, abaixo).
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_parser.py [--repeat N]
+"""
+import sys
+import glob
+import time
+import argparse
+import contextlib
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from lexer.token_type import TokenType
+from parser.Parser import Parser
+from parser.AST import BinaryOpNode, ConditionNode, UnaryOpNode
+
+
+class ParserRecursivo(Parser):
+    """Gramática de expressões e despacho de comandos anteriores, para comparação."""
+
+    def parse_statement(self):
+        self.skip_comments()
+        if self.match(TokenType.SEQ, TokenType.PAR):
+            return self.parse_block()
+        elif self.match(TokenType.IF):
+            return self.parse_if()
+        elif self.match(TokenType.WHILE):
+            return self.parse_while()
+        elif self.match(TokenType.FOR):
+            return self.parse_for()
+        elif self.match(TokenType.PRINT):
+            return self.parse_print()
+        elif self.match(TokenType.RETURN):
+            return self.parse_return()
+        elif self.match(TokenType.THIS):
+            node = self.parse_this_statement()
+            if node is not None:
+                return node
+        elif self.match(TokenType.INT, TokenType.FLOAT, TokenType.STRING, TokenType.BOOL, TokenType.C_CHANNEL):
+            return self.parse_declaration()
+        elif self.match(TokenType.IDENT):
+            if self.peek().type == TokenType.IDENT:
+                return self.parse_declaration()
+            elif self.peek().type == TokenType.DOT:
+                return self.parse_member_statement()
+            elif self.peek().type == TokenType.LBRACKET:
+                return self.parse_array_statement()
+            elif self.peek().type == TokenType.ASSIGN:
+                return self.parse_assignment_statement()
+            elif self.peek().type == TokenType.LPAREN:
+                return self.parse_call_statement()
+        if self.match(TokenType.SEMICOLON):
+            self.advance()
+        return None
+
+    def parse_condition(self):
+        return self.parse_logical_and()
+
+    def parse_logical_and(self):
+        left = self.parse_logical_or()
+        while self.match(TokenType.AND):
+            operator = self.advance().lexeme
+            left = BinaryOpNode(left, operator, self.parse_logical_or())
+        return left
+
+    def parse_logical_or(self):
+        left = self.parse_relational()
+        while self.match(TokenType.OR):
+            operator = self.advance().lexeme
+            left = BinaryOpNode(left, operator, self.parse_relational())
+        return left
+
+    def parse_relational(self):
+        left = self.parse_expression()
+        if self.match(TokenType.EQ, TokenType.NEQ, TokenType.GT, TokenType.LT, TokenType.GTE, TokenType.LTE):
+            operator = self.advance().lexeme
+            return ConditionNode(left, operator, self.parse_expression())
+        return left
+
+    def parse_expression(self):
+        return self.parse_additive()
+
+    def parse_additive(self):
+        left = self.parse_multiplicative()
+        while self.match(TokenType.PLUS, TokenType.MINUS):
+            operator = self.advance().lexeme
+            left = BinaryOpNode(left, operator, self.parse_multiplicative())
+        return left
+
+    def parse_multiplicative(self):
+        left = self.parse_unary()
+        while self.match(TokenType.MUL, TokenType.DIV, TokenType.MOD):
+            operator = self.advance().lexeme
+            left = BinaryOpNode(left, operator, self.parse_unary())
+        return left
+
+    def parse_unary(self):
+        if self.match(TokenType.LPAREN):
+            self.advance()
+            expr = self.parse_expression()
+            self.expect(TokenType.RPAREN)
+            return expr
+        elif self.match(TokenType.MINUS):
+            operator = self.advance().lexeme
+            return UnaryOpNode(operator, self.parse_unary())
+        return self.parse_primary()
+
+
+def programa_sintetico(funcoes):
+    """Programa grande com declarações, laços, condições e expressões."""
+    partes = []
+    for i in range(funcoes):
+        partes.append(f'''
+INT f{i}(INT a, INT b) {{
+    INT x = a * {i} + b / 2 - (a % 3) * -b;
+    FLOAT y = 1.5 * (x + a) - b * (x - 1);
+    INT v[10];
+    for k = 0; k < 10; k = k + 1 {{
+        v[k] = k * x + f{i}(k, b - 1) % 7;
+    }}
+    while x > 0 && y != 0 || a == b {{
+        x = x - 1;
+        if x % 2 == 0 {{ print("par"); }} else {{ print(x * 2 + 1); }}
+    }}
+    return x + y * 2;
+}}
+''')
+    partes.append('SEQ {\n' + ''.join(f'    print(f{i}(1, 2));\n' for i in range(funcoes)) + '}\n')
+    return ''.join(partes)
+
+
+def cronometra(classe, programas, repeticoes):
+    """Menor tempo total (s) entre as repetições, ou 'RecursionError'."""
+    melhor = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        try:
+            # Avisos do parser não entram na medição
+            with contextlib.redirect_stdout(None):
+                for tokens in programas:
+                    classe(tokens).parse()
+        except RecursionError:
+            return 'RecursionError'
+        duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=5, help='repetições por caso (usa o menor tempo)')
+    opcoes = argumentos.parse_args()
+
+    fontes_testes = []
+    for caminho in sorted(glob.glob('tests/*.minipar')):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            fontes_testes.append(f.read())
+    casos = [
+        ('tests/*.minipar', fontes_testes),
+        ('sintético (2000 funções)', [programa_sintetico(2000)]),
+        ('expressão longa (50k termos)', ['SEQ { x = ' + ' + '.join(f'a{i} * {i}' for i in range(50000)) + '; }']),
+        ('parênteses aninhados (5000)', ['SEQ { x = ' + '(' * 5000 + '1' + ')' * 5000 + '; }']),
+        ('"-" unário aninhado (5000)', ['SEQ { x = ' + '-' * 5000 + '1; }']),
+    ]
+
+    print("=" * 80)
+    print(f" {'Caso':32} | {'tokens':>8} | {'recursivo':>14} | {'tabela':>10} | ganho")
+    print("=" * 80)
+    for nome, fontes in casos:
+        programas = [Lexer(fonte).tokenize() for fonte in fontes]
+        total = sum(len(tokens) for tokens in programas)
+        antigo = cronometra(ParserRecursivo, programas, opcoes.repeat)
+        novo = cronometra(Parser, programas, opcoes.repeat)
+        formata = lambda t: t if isinstance(t, str) else f'{t * 1000:.1f} ms'
+        ganho = f'{antigo / novo:.2f}x' if not isinstance(antigo, str) and not isinstance(novo, str) else '-'
+        print(f" {nome:32} | {total:8} | {formata(antigo):>14} | {formata(novo):>10} | {ganho}")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark do RETURN no Interpreter: registros de conclusão (cada comando
+retorna None ou (valor,), Interpreter atual) contra o RETURN por exceção,
+que levantava ReturnException a cada retorno e a capturava em execute_body
+(InterpretadorComExcecoes, abaixo). Os casos são programas recursivos.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_returns.py [--repeat N]
+"""
+import io
+import sys
+import time
+import random
+import argparse
+import contextlib
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from runtime.Interpreter import Interpreter, ReturnException
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from bench_engines import quicksort_sintetico
+
+
+class InterpretadorComExcecoes(Interpreter):
+    """RETURN anterior, por exceção, e os laços de comandos sem conclusão, para comparação."""
+
+    def execute_return(self, node):
+        raise ReturnException(self.evaluate_expression(node.expression))
+
+    def execute_block(self, node):
+        if node.block_type == "seq":
+            for stmt in node.statements:
+                self.execute_statement(stmt)
+        elif node.block_type == "par":
+            self.execute_parallel_block(node)
+
+    def execute_if(self, node):
+        condition = self.evaluate_condition(node.condition)
+        if condition:
+            for stmt in node.then_body:
+                self.execute_statement(stmt)
+        elif node.else_body:
+            for stmt in node.else_body:
+                self.execute_statement(stmt)
+
+    def execute_while(self, node):
+        while self.evaluate_condition(node.condition):
+            for stmt in node.body:
+                self.execute_statement(stmt)
+
+    def execute_for(self, node):
+        self.bind_variable(node, node.var, self.evaluate_expression(node.init_expr))
+        while self.evaluate_condition(node.condition):
+            for stmt in node.body:
+                self.execute_statement(stmt)
+            self.execute_statement(node.increment)
+
+    def execute_body(self, callable_node, frame):
+        state = self.thread_state
+        old_frame = state.frame
+        state.frame = frame
+        try:
+            for stmt in callable_node.body:
+                self.execute_statement(stmt)
+        except ReturnException as e:
+            return e.value
+        finally:
+            state.frame = old_frame
+        return None
+
+
+def fibonacci_recursivo(n):
+    """Fibonacci ingênuo: uma chamada e um RETURN por nó da árvore de recursão."""
+    return f'''
+INT fib(INT n) {{
+    if n < 2 {{
+        return n;
+    }}
+    return fib(n - 1) + fib(n - 2);
+}}
+SEQ {{
+    print(fib({n}));
+}}
+'''
+
+
+def cronometra(classe, fonte, entrada, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        saida = io.StringIO()
+        with contextlib.redirect_stdout(saida):
+            ast = Parser(Lexer(fonte).tokenize()).parse()
+            SemanticAnalyzer().analyze(ast)
+            inicio = time.perf_counter()
+            classe(input_callback=lambda prompt: entrada).interpret(ast)
+            duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=5, help='repetições por caso (usa o menor tempo)')
+    opcoes = argumentos.parse_args()
+
+    gerador = random.Random(42)
+    vetor = ' '.join(str(gerador.randrange(100000)) for _ in range(100))
+    with open('tests/programa6_quicksort.minipar', 'r', encoding='utf-8') as f:
+        quicksort_teste = f.read()
+    casos = [
+        ('fibonacci recursivo (18)', fibonacci_recursivo(18), ''),
+        ('quicksort sintético (2000)', quicksort_sintetico(2000), ''),
+        ('tests/programa6_quicksort (100)', quicksort_teste, vetor),
+    ]
+
+    print("=" * 80)
+    print(f" {'Caso':34} | {'exceções':>10} | {'conclusão':>10} | ganho")
+    print("=" * 80)
+    for nome, fonte, entrada in casos:
+        antigo, saida_antiga = cronometra(InterpretadorComExcecoes, fonte, entrada, opcoes.repeat)
+        novo, saida_nova = cronometra(Interpreter, fonte, entrada, opcoes.repeat)
+        if saida_nova != saida_antiga:
+            print(f" {nome}: saída diferente do RETURN por exceção")
+            return 1
+        formata = lambda t: f'{t * 1000:.1f} ms'
+        print(f" {nome:34} | {formata(antigo):>10} | {formata(novo):>10} | {antigo / novo:.2f}x")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
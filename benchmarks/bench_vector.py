@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Benchmark das funções vetoriais (vdot, vsum, vmatmul...) contra os laços
+MiniPar equivalentes, que leem um elemento por iteração. Com o NumPy
+instalado as funções usam o NumPy; --sem-numpy mede o Python puro.
+
+Uso (na raiz do repositório):
+    python benchmarks/bench_vector.py [--repeat N] [--engine tree|closure|vm|python] [--sem-numpy]
+"""
+import io
+import sys
+import time
+import argparse
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime import vector
+from runtime.engines import ENGINES
+
+
+# Vezes que cada operação é executada no programa
+REPETICOES = 20
+
+
+def preparacao(n):
+    return f'''
+FLOAT a[{n}];
+FLOAT b[{n}];
+FLOAT r = 0.0;
+SEQ {{
+    for i = 0; i < {n}; i = i + 1 {{
+        a[i] = i * 0.5;
+        b[i] = 2.0 - i * 0.25;
+    }}
+'''
+
+
+def repete(corpo):
+    """Corpo executado REPETICOES vezes, para o preenchimento dos arrays pesar pouco."""
+    linhas = ''.join('    ' + linha + '\n' for linha in corpo.splitlines())
+    return f'    for t = 0; t < {REPETICOES}; t = t + 1 {{\n{linhas}    }}\n'
+
+
+def produto_escalar(n, vetorial):
+    if vetorial:
+        corpo = '    r = vdot(a, b);\n'
+    else:
+        corpo = f'''    r = 0.0;
+    for i = 0; i < {n}; i = i + 1 {{
+        r = r + a[i] * b[i];
+    }}
+'''
+    return preparacao(n) + repete(corpo) + '    print(r);\n}\n'
+
+
+def soma_de_vetores(n, vetorial):
+    if vetorial:
+        corpo = '    a = vadd(a, vscale(b, 3));\n'
+    else:
+        corpo = f'''    for i = 0; i < {n}; i = i + 1 {{
+        a[i] = a[i] + b[i] * 3;
+    }}
+'''
+    return preparacao(n) + repete(corpo) + f'    print(a[{n - 1}]);\n}}\n'
+
+
+def maximo(n, vetorial):
+    if vetorial:
+        corpo = '    r = vmax(b) + vargmax(b);\n'
+    else:
+        corpo = f'''    INT k = 0;
+    for i = 1; i < {n}; i = i + 1 {{
+        if b[i] > b[k] {{
+            k = i;
+        }}
+    }}
+    r = b[k] + k;
+'''
+    return preparacao(n) + repete(corpo) + '    print(r);\n}\n'
+
+
+def produto_de_matrizes(n, vetorial):
+    if vetorial:
+        corpo = '    c = vmatmul(x, y);\n'
+    else:
+        corpo = f'''    for i = 0; i < {n}; i = i + 1 {{
+        for j = 0; j < {n}; j = j + 1 {{
+            INT s = 0;
+            for k = 0; k < {n}; k = k + 1 {{
+                s = s + x[i][k] * y[k][j];
+            }}
+            c[i][j] = s;
+        }}
+    }}
+'''
+    return f'''
+INT x[{n}][{n}];
+INT y[{n}][{n}];
+INT c[{n}][{n}];
+SEQ {{
+    for i = 0; i < {n}; i = i + 1 {{
+        for j = 0; j < {n}; j = j + 1 {{
+            x[i][j] = i + j;
+            y[i][j] = i - j;
+        }}
+    }}
+''' + corpo + f'    print(c[{n - 1}][{n - 1}]);\n}}\n'
+
+
+def cronometra(classe, fonte, repeticoes):
+    """Menor tempo de execução (s) entre as repetições e a saída do programa."""
+    melhor = None
+    for _ in range(repeticoes):
+        saida = io.StringIO()
+        ast = Parser(Lexer(fonte).tokenize()).parse()
+        SemanticAnalyzer().analyze(ast)
+        inicio = time.perf_counter()
+        classe(output_stream=saida).interpret(ast)
+        duracao = time.perf_counter() - inicio
+        melhor = duracao if melhor is None else min(melhor, duracao)
+    return melhor, saida.getvalue()
+
+
+def mesma_saida(antiga, nova):
+    """Saídas iguais, ou números que diferem só nos últimos bits (ordem da soma de FLOAT)."""
+    if antiga == nova:
+        return True
+    try:
+        return abs(float(antiga) - float(nova)) <= 1e-9 * max(abs(float(antiga)), 1.0)
+    except ValueError:
+        return False
+
+
+def main():
+    argumentos = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    argumentos.add_argument('--repeat', type=int, default=5, help='repetições por caso (usa o menor tempo)')
+    argumentos.add_argument('--engine', choices=list(ENGINES), default='tree', help='modo de execução medido')
+    argumentos.add_argument('--sem-numpy', action='store_true', help='mede as funções em Python puro')
+    opcoes = argumentos.parse_args()
+    classe = ENGINES[opcoes.engine]
+    if opcoes.sem_numpy:
+        vector.numpy = None
+
+    casos = [
+        (f'vdot (10000, {REPETICOES}x)', produto_escalar, 10000),
+        (f'vadd + vscale (10000, {REPETICOES}x)', soma_de_vetores, 10000),
+        (f'vmax + vargmax (10000, {REPETICOES}x)', maximo, 10000),
+        ('vmatmul (40x40)', produto_de_matrizes, 40),
+    ]
+    implementacao = 'NumPy' if vector.numpy is not None else 'Python puro'
+    print("=" * 80)
+    print(f" {'Caso (' + opcoes.engine + ', ' + implementacao + ')':34} | {'laço':>10} | {'vetorial':>10} | ganho")
+    print("=" * 80)
+    for nome, programa, n in casos:
+        antigo, saida_antiga = cronometra(classe, programa(n, False), opcoes.repeat)
+        novo, saida_nova = cronometra(classe, programa(n, True), opcoes.repeat)
+        if not mesma_saida(saida_antiga, saida_nova):
+            print(f" {nome}: saída diferente do laço ({saida_antiga!r} e {saida_nova!r})")
+            return 1
+        formata = lambda t: f'{t * 1000:.1f} ms'
+        print(f" {nome:34} | {formata(antigo):>10} | {formata(novo):>10} | {antigo / novo:.2f}x")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
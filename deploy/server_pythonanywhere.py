@@ -43,10 +43,12 @@ except ImportError:
 
 # Importar componentes do interpretador
 from src.lexer.Lexer import Lexer
-from src.parser.Parser import Parser
 from src.semantic.SemanticAnalyzer import SemanticAnalyzer
-from src.runtime.Interpreter import Interpreter
 from src.utils.ast_printer import print_ast
+# Pelo mesmo nome de módulo que main.py e os outros servidores usam, para que
+# as entradas .miniparc gravadas aqui sejam legíveis por eles (e vice-versa)
+from cache.ProgramCache import ProgramCache
+from runtime.engines import create_interpreter
 
 # ============================================================================
 # Configuração Flask
@@ -58,6 +60,9 @@ app = Flask(__name__, static_folder='frontend', static_url_path='')
 if CORS_AVAILABLE:
     CORS(app)
 
+# Cache em disco de programas compilados (.miniparc): AST e relatório semântico
+PROGRAM_CACHE = ProgramCache.from_environment()
+
 # Dicionário para gerenciar sessões de input
 input_sessions = {}
 input_lock = threading.Lock()
@@ -123,6 +128,7 @@ def interpretar():
         codigo = data['codigo']
         session_id = data.get('session_id', str(uuid.uuid4()))
         input_value = data.get('input_value', None)
+        engine = data.get('engine')  # Modo de execução: 'tree' ou 'closure' (opcional)
         
         # ============================================================================
         # 1. ANÁLISE LÉXICA
@@ -141,10 +147,10 @@ def interpretar():
             })
         
         # ============================================================================
-        # 2. ANÁLISE SINTÁTICA (Parser)
+        # 2. ANÁLISE SINTÁTICA (Parser, ou AST do cache se o código não mudou)
         # ============================================================================
-        parser = Parser(tokens)
-        ast = parser.parse()
+        program = PROGRAM_CACHE.compile(codigo)
+        ast = program.ast
         
         # Gerar representação textual da AST
         buf_ast = io.StringIO()
@@ -157,7 +163,7 @@ def interpretar():
         symbol_table_data = None
         
         try:
-            from src.parser.AST import ast_to_dict
+            from src.parser.Traversal import ast_to_dict
             ast_json = ast_to_dict(ast)
         except Exception as e:
             ast_json = None
@@ -178,20 +184,16 @@ def interpretar():
         # ============================================================================
         # 3. ANÁLISE SEMÂNTICA
         # ============================================================================
-        sa = SemanticAnalyzer()
-        semantic_result = sa.analyze(ast)
+        semantic_result, symbol_table_data = program.semantic_report()
+        PROGRAM_CACHE.save(program)
         
         response['semantico'] = semantic_result
         
         if semantic_result and semantic_result.get('errors'):
             response['erros'].extend(semantic_result['errors'])
         
-        # Capturar tabela de símbolos
-        try:
-            symbol_table_data = sa.symbol_table.to_dict() if hasattr(sa, 'symbol_table') else None
-            response['symbol_table'] = symbol_table_data
-        except Exception as e:
-            pass
+        # Tabela de símbolos
+        response['symbol_table'] = symbol_table_data
         
         # Se houver erros semânticos críticos, não executar
         if semantic_result and not semantic_result.get('success'):
@@ -223,7 +225,7 @@ def interpretar():
                     raise InterruptedError("INPUT_REQUIRED")
             
             # Criar interpretador
-            interpreter = Interpreter(output_stream=output_buffer, input_callback=input_callback)
+            interpreter = create_interpreter(engine, output_stream=output_buffer, input_callback=input_callback)
             
             # Executar programa
             try:
@@ -879,6 +879,9 @@ SEQ {
     }
   }
 
+  // Sessão incremental no servidor: só os trechos editados são reanalisados
+  let parseSessionId = null;
+
   // Executar -> enviar para backend (usa WebSocket se disponível, senão REST)
   async function interpretarCodigo(){
     const code = getEditorValue();
@@ -901,8 +904,9 @@ SEQ {
     
     // Fallback para REST API
     try{
-      const resp = await fetch('http://127.0.0.1:8000/interpretar',{method:'POST',headers:{'Content-Type':'application/json'},body:JSON.stringify({code})});
+      const resp = await fetch('http://127.0.0.1:8000/interpretar',{method:'POST',headers:{'Content-Type':'application/json'},body:JSON.stringify({code, session_id: parseSessionId})});
       const data = await resp.json();
+      if (data.session_id) parseSessionId = data.session_id;
       processInterpretResult(data);
     }catch(err){ 
       console.error(err); 
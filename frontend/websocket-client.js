@@ -13,6 +13,8 @@ class MiniParWebSocketClient {
     this.messageHandlers = [];
     this.statusHandlers = [];
     this.errorHandlers = [];
+    // Último código enviado nesta conexão: os próximos envios mandam só o delta
+    this.lastCode = null;
   }
 
   connect() {
@@ -23,6 +25,7 @@ class MiniParWebSocketClient {
         this.ws.onopen = () => {
           console.log('✅ WebSocket conectado:', this.url);
           this.reconnectAttempts = 0;
+          this.lastCode = null;  // nova conexão = nova sessão incremental no servidor
           this.notifyStatus('connected', 'Conectado ao servidor');
           resolve();
         };
@@ -30,6 +33,11 @@ class MiniParWebSocketClient {
         this.ws.onmessage = (event) => {
           try {
             const data = JSON.parse(event.data);
+            if (data.resync && this.lastCode !== null) {
+              // Servidor perdeu a sessão incremental: reenviar o código completo
+              this.ws.send(JSON.stringify({ code: this.lastCode }));
+              return;
+            }
             this.messageHandlers.forEach(handler => handler(data));
           } catch (e) {
             console.error('Erro ao processar mensagem:', e);
@@ -73,7 +81,9 @@ class MiniParWebSocketClient {
 
   send(code) {
     if (this.ws && this.ws.readyState === WebSocket.OPEN) {
-      this.ws.send(JSON.stringify({ code }));
+      const delta = this.lastCode === null ? null : computeDelta(this.lastCode, code);
+      this.ws.send(JSON.stringify(delta ? { delta } : { code }));
+      this.lastCode = code;
       return true;
     } else {
       this.notifyError('WebSocket não está conectado');
@@ -113,6 +123,28 @@ class MiniParWebSocketClient {
   }
 }
 
+/**
+ * Trecho alterado entre dois textos: {start, end, text} substitui
+ * previous.slice(start, end) por text (maior prefixo/sufixo comuns).
+ * start e end contam code points, como os índices de str no servidor
+ * (Python), e não unidades UTF-16: um emoji antes da edição conta 1.
+ */
+function computeDelta(previous, current) {
+  const before = Array.from(previous);
+  const after = Array.from(current);
+  const limit = Math.min(before.length, after.length);
+  let prefix = 0;
+  while (prefix < limit && before[prefix] === after[prefix]) prefix++;
+  let suffix = 0;
+  while (suffix < limit - prefix &&
+         before[before.length - 1 - suffix] === after[after.length - 1 - suffix]) suffix++;
+  return {
+    start: prefix,
+    end: before.length - suffix,
+    text: after.slice(prefix, after.length - suffix).join('')
+  };
+}
+
 // Exportar para uso global
 if (typeof window !== 'undefined') {
   window.MiniParWebSocketClient = MiniParWebSocketClient;
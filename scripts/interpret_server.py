@@ -10,9 +10,15 @@ Uso:
 Exemplo:
   python3 scripts/interpret_server.py --host 127.0.0.1 --port 8000
 
+Requisição JSON:
+  {"code": "..."}                                    (código completo)
+  {"code": "...", "session_id": "..."}               (reanálise incremental)
+  {"session_id": "...", "delta": {"start": 0, "end": 3, "text": "..."}}
+
 Resposta JSON:
   {
     "lexico": [ {"type": "IDENT", "lexeme": "var"}, ... ],
+    "session_id": "<sessão incremental do editor>",
     "semantico": { ... },
     "ast": "<string representation>"
   }
@@ -29,10 +35,16 @@ import threading
 import queue
 import time
 import uuid
+from collections import OrderedDict
 
 # Active runs registry: run_id -> run state dict
 RUNS = {}
 
+# Incremental parse sessions (one per editor): session_id -> ParseSession,
+# evicted in least-recently-used order
+SESSIONS = OrderedDict()
+MAX_SESSIONS = 256
+
 
 HERE = os.path.dirname(os.path.dirname(__file__))
 # Ensure 'src' is on sys.path so imports like `from lexer.Lexer import Lexer` work
@@ -41,13 +53,18 @@ if SRC_PATH not in sys.path:
     sys.path.insert(0, SRC_PATH)
 
 from lexer.Lexer import Lexer
-from parser.Parser import Parser
+from lexer.token_buffer import dumps_with_raw
+from parser.ParseSession import ParseSession
 from semantic.SemanticAnalyzer import SemanticAnalyzer
 from utils.ast_printer import print_ast
-from runtime.Interpreter import Interpreter
+from runtime.engines import create_interpreter
 from codegen.TACGenerator import TACGenerator
+from cache.ProgramCache import ProgramCache
 from contextlib import redirect_stdout
 
+# On-disk cache of compiled programs (.miniparc): AST, semantic report and TAC
+PROGRAM_CACHE = ProgramCache.from_environment()
+
 
 class SimpleHandler(BaseHTTPRequestHandler):
     def _set_headers(self, status=200, content_type='application/json'):
@@ -115,29 +132,53 @@ class SimpleHandler(BaseHTTPRequestHandler):
             data = {}
 
         code = data.get('code') or data.get('codigo') or ''
+        # Modo de execução opcional: um de runtime.engines.ENGINES (tree, closure,
+        # vm, python, async); padrão: MINIPAR_ENGINE
+        engine = data.get('engine')
+
+        # Incremental front end: reuse the editor's session and apply either the
+        # text delta it sent or the difference to the full code
+        session_id = data.get('session_id')
+        session = SESSIONS.get(session_id) if session_id else None
+        delta = data.get('delta')
+        if delta is not None and session is None:
+            self._set_headers(409)
+            self.wfile.write(json.dumps({'erro': 'Sessão incremental inexistente: envie o código completo', 'resync': True}).encode())
+            return
+        if session is None:
+            session_id = uuid.uuid4().hex
+            session = ParseSession()
+        SESSIONS[session_id] = session
+        SESSIONS.move_to_end(session_id)
+        while len(SESSIONS) > MAX_SESSIONS:
+            SESSIONS.popitem(last=False)
+
+        parse_error = None
+        program = None
+        try:
+            if delta is not None:
+                session.apply_edit(int(delta['start']), int(delta['end']), delta.get('text', ''))
+                code = session.source
+            # Unchanged programs come straight from the cache (the session is
+            # repositioned on the cached AST); otherwise the session reparses
+            program = PROGRAM_CACHE.compile(code, session)
+        except (SyntaxError, ValueError, KeyError) as e:
+            parse_error = e
+        code = session.source
 
         # Run lexer
         try:
             lexer = Lexer(code)
-            tokens = lexer.tokenize()
-            lex_out = []
-            has_error = False
-            error_messages = []
-            
-            for t in tokens:
-                ttype = getattr(t.type, 'name', str(t.type))
-                lex_out.append({'type': ttype, 'lexeme': t.lexeme, 'line': t.line})
-                
-                # Verificar se há token de erro
-                if ttype == 'ERROR':
-                    has_error = True
-                    error_messages.append(t.lexeme)
+            tokens = lexer.tokenize_buffer()
+            # 'lexico' já sai como JSON pronto, sem um dict por token
+            lex_out = tokens.to_json({'type': 'type', 'lexeme': 'lexeme', 'line': 'line'})
+            error_messages = tokens.errors()
             
             # Se há erro léxico, retornar imediatamente com mensagem clara
-            if has_error:
+            if error_messages:
                 self._set_headers(400)
                 error_text = '\n'.join(error_messages)
-                self.wfile.write(json.dumps({'erro': error_text, 'lexico': lex_out}).encode())
+                self.wfile.write(dumps_with_raw({'erro': error_text, 'session_id': session_id}, {'lexico': lex_out}).encode())
                 return
                 
         except Exception as e:
@@ -145,10 +186,11 @@ class SimpleHandler(BaseHTTPRequestHandler):
             self.wfile.write(json.dumps({'erro': f'Erro no lexer: {e}'}).encode())
             return
 
-        # Parse to AST
+        # Parse to AST (already done incrementally by the session)
         try:
-            parser = Parser(tokens)
-            ast = parser.parse()
+            if parse_error is not None:
+                raise parse_error
+            ast = program.ast
             # print AST to string by capturing stdout from print_ast
             try:
                 buf_ast = io.StringIO()
@@ -168,16 +210,17 @@ class SimpleHandler(BaseHTTPRequestHandler):
 
         # Semantic analysis (best-effort)
         try:
-            sa = SemanticAnalyzer()
-            sem_res = sa.analyze(ast) if ast is not None else {'success': False, 'errors': ['AST inválida']}
-            # Adicionar symbol table à resposta
-            symbol_table_data = sa.symbol_table.to_dict() if hasattr(sa, 'symbol_table') else None
+            if ast is not None:
+                sem_res, symbol_table_data = program.semantic_report()
+            else:
+                sem_res = {'success': False, 'errors': ['AST inválida']}
+                symbol_table_data = None
         except Exception as e:
             sem_res = {'success': False, 'errors': [f'Erro semântico: {e}']}
             symbol_table_data = None
 
         response = {
-            'lexico': lex_out,
+            'session_id': session_id,
             'semantico': sem_res,
             'symbol_table': symbol_table_data,
             'ast': ast_text
@@ -186,7 +229,7 @@ class SimpleHandler(BaseHTTPRequestHandler):
         # Adicionar AST em formato JSON para renderização gráfica
         if ast is not None:
             try:
-                from parser.AST import ast_to_dict
+                from parser.Traversal import ast_to_dict
                 response['ast_json'] = ast_to_dict(ast)
             except Exception as e:
                 # Se não conseguir serializar, apenas ignorar
@@ -195,9 +238,7 @@ class SimpleHandler(BaseHTTPRequestHandler):
         # Attempt to generate TAC (three-address code) from the AST if available
         try:
             if ast is not None:
-                tac_gen = TACGenerator()
-                tac_gen.generate(ast)
-                tac_text = tac_gen.to_string()
+                tac_text = program.tac_generator().to_string()
                 response['tac'] = tac_text
                 # debug helpers
                 response['tac_len'] = len(tac_text)
@@ -213,6 +254,10 @@ class SimpleHandler(BaseHTTPRequestHandler):
             response['tac_generated'] = False
             print(f"[TAC] Error generating TAC: {e}")
 
+        # Store the stages computed above before execution touches anything
+        if program is not None:
+            PROGRAM_CACHE.save(program)
+
         # Try to execute the AST using the Interpreter and capture stdout.
         # To support interactive `input()` we run execution in a background thread
         # and expose a small run registry (RUNS) where the frontend can POST input
@@ -227,7 +272,7 @@ class SimpleHandler(BaseHTTPRequestHandler):
             response['prompt'] = None
             
             self._set_headers()
-            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+            self.wfile.write(dumps_with_raw(response, {'lexico': lex_out}, ensure_ascii=False).encode('utf-8'))
             return
         
         try:
@@ -257,7 +302,8 @@ class SimpleHandler(BaseHTTPRequestHandler):
                 return val
 
             # Criar interpreter com output_stream e input_callback
-            interp = Interpreter(
+            interp = create_interpreter(
+                engine,
                 output_stream=run['buf'],
                 input_callback=run_input_provider
             )
@@ -314,7 +360,7 @@ class SimpleHandler(BaseHTTPRequestHandler):
 
         self._set_headers(200)
         try:
-            self.wfile.write(json.dumps(response, ensure_ascii=False).encode('utf-8'))
+            self.wfile.write(dumps_with_raw(response, {'lexico': lex_out}, ensure_ascii=False).encode('utf-8'))
         except TypeError as e:
             # If JSON serialization fails, try to identify the problematic field
             print(f"[ERROR] JSON serialization failed: {e}")
@@ -326,7 +372,7 @@ class SimpleHandler(BaseHTTPRequestHandler):
                 except TypeError:
                     print(f"[ERROR] Field '{key}' contains non-serializable data")
                     safe_response[key] = f"<error: {type(value).__name__} not serializable>"
-            self.wfile.write(json.dumps(safe_response, ensure_ascii=False).encode('utf-8'))
+            self.wfile.write(dumps_with_raw(safe_response, {'lexico': lex_out}, ensure_ascii=False).encode('utf-8'))
 
 
 def main():
@@ -23,9 +23,12 @@ except ImportError:
     sys.exit(1)
 
 from lexer.Lexer import Lexer
-from parser.Parser import Parser
+from lexer.token_buffer import dumps_with_raw
+from parser.ParseSession import ParseSession
+from parser.Traversal import ast_to_dict
 from semantic.SemanticAnalyzer import SemanticAnalyzer
-from runtime.Interpreter import Interpreter
+from runtime.engines import create_interpreter
+from cache.ProgramCache import ProgramCache
 
 try:
     from codegen.TACGenerator import TACGenerator
@@ -34,16 +37,35 @@ except ImportError:
     TAC_AVAILABLE = False
     print("⚠️ TACGenerator não disponível")
 
+# Cache em disco de programas compilados (.miniparc), compartilhado pelas conexões
+PROGRAM_CACHE = ProgramCache.from_environment()
+
 
 async def handle_interpret(websocket, path):
     """Handler para mensagens WebSocket"""
     print(f"Nova conexão: {websocket.remote_address}")
     
+    # Sessão incremental do editor desta conexão: mensagens seguintes podem
+    # trazer só o delta {'start', 'end', 'text'} em vez do código completo
+    session = None
+    
     try:
         async for message in websocket:
             try:
                 data = json.loads(message)
                 code = data.get('code', '')
+                delta = data.get('delta')
+                engine = data.get('engine')  # Opcional: um de runtime.engines.ENGINES (tree, closure, vm, python, async)
+                
+                if delta is not None:
+                    if session is None:
+                        await websocket.send(json.dumps({
+                            'erro': 'Sessão incremental inexistente: envie o código completo',
+                            'resync': True,
+                            'success': False
+                        }))
+                        continue
+                    code = session.source[:delta['start']] + delta.get('text', '') + session.source[delta['end']:]
                 
                 if not code:
                     await websocket.send(json.dumps({
@@ -60,11 +82,16 @@ async def handle_interpret(websocket, path):
                 
                 # Lexer
                 lexer = Lexer(code)
-                tokens = lexer.tokenize()
+                tokens = lexer.tokenize_buffer()
                 
-                # Parser
-                parser = Parser(tokens)
-                ast = parser.parse()
+                # Parser (reanalisa só os itens de topo atingidos pela edição;
+                # programa inalterado vem direto do cache .miniparc)
+                if session is None:
+                    session = ParseSession()
+                if delta is not None:
+                    session.apply_edit(delta['start'], delta['end'], delta.get('text', ''))
+                program = PROGRAM_CACHE.compile(code, session)
+                ast = program.ast
                 
                 await websocket.send(json.dumps({
                     'status': 'processing',
@@ -72,10 +99,10 @@ async def handle_interpret(websocket, path):
                 }))
                 
                 # Análise Semântica
-                analyzer = SemanticAnalyzer()
-                semantic_result = analyzer.analyze(ast)
+                semantic_result, symbol_table_data = program.semantic_report()
                 
                 if not semantic_result['success']:
+                    PROGRAM_CACHE.save(program)
                     await websocket.send(json.dumps({
                         'erro': '\n'.join(semantic_result['errors']),
                         'semantico': semantic_result,
@@ -89,10 +116,10 @@ async def handle_interpret(websocket, path):
                 }))
                 
                 # Interpreter - Capturar stdout
-                interpreter = Interpreter()
                 output_buffer = io.StringIO()
                 
                 try:
+                    interpreter = create_interpreter(engine)
                     with redirect_stdout(output_buffer):
                         interpreter.interpret(ast)
                     output = output_buffer.getvalue()
@@ -101,43 +128,30 @@ async def handle_interpret(websocket, path):
                 finally:
                     output_buffer.close()
                 
-                # Serializar tokens
-                tokens_list = []
-                lexer2 = Lexer(code)
-                for tok in lexer2.tokenize():
-                    tokens_list.append({
-                        'type': tok.type.name if hasattr(tok.type, 'name') else str(tok.type),
-                        'value': tok.lexeme,
-                        'line': tok.line,
-                        'column': tok.column
-                    })
-                
-                # Obter symbol table
-                symbol_table_data = analyzer.symbol_table.to_dict() if hasattr(analyzer, 'symbol_table') else {}
+                # Serializar tokens (JSON gerado direto das colunas do buffer)
+                tokens_json = tokens.to_json({'type': 'type', 'value': 'lexeme', 'line': 'line', 'column': 'column'})
                 
                 # Gerar TAC (Three-Address Code)
                 tac_text = ''
                 if TAC_AVAILABLE and ast:
                     try:
-                        tac_gen = TACGenerator()
-                        tac_gen.generate(ast)
-                        tac_text = tac_gen.to_string()
+                        tac_text = program.tac_generator().to_string()
                     except Exception as e:
                         print(f"⚠️ Erro ao gerar TAC: {e}")
                         tac_text = f'Erro ao gerar TAC: {str(e)}'
+                PROGRAM_CACHE.save(program)
                 
                 # Resposta de sucesso
                 response = {
                     'success': True,
                     'saida': output,
-                    'lexico': tokens_list,
                     'semantico': semantic_result,
                     'ast': ast_to_dict(ast) if ast else None,
                     'symbol_table': symbol_table_data,
                     'tac': tac_text,
                 }
                 
-                await websocket.send(json.dumps(response))
+                await websocket.send(dumps_with_raw(response, {'lexico': tokens_json}))
                 
             except json.JSONDecodeError:
                 await websocket.send(json.dumps({
@@ -157,31 +171,6 @@ async def handle_interpret(websocket, path):
         print(f"Conexão fechada: {websocket.remote_address}")
 
 
-def ast_to_dict(node):
-    """Converte AST para dicionário serializável"""
-    if node is None:
-        return None
-    
-    result = {
-        'type': node.__class__.__name__,
-    }
-    
-    # Adicionar atributos relevantes
-    if hasattr(node, '__dict__'):
-        for key, value in node.__dict__.items():
-            if key.startswith('_'):
-                continue
-            
-            if isinstance(value, list):
-                result[key] = [ast_to_dict(item) if hasattr(item, '__dict__') else item for item in value]
-            elif hasattr(value, '__dict__') and not isinstance(value, (str, int, float, bool)):
-                result[key] = ast_to_dict(value)
-            else:
-                result[key] = value
-    
-    return result
-
-
 async def main():
     """Inicia o servidor WebSocket"""
     host = os.getenv('WS_HOST', '0.0.0.0')
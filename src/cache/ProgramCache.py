@@ -0,0 +1,342 @@
+# ============================================================================
+# ProgramCache.py - Cache em Disco de Programas Compilados (.miniparc)
+# ============================================================================
+# Evita repetir léxico → sintático → semântico → TAC quando o fonte não
+# mudou, no estilo do __pycache__ do Python. Cada programa compilado vira um
+# arquivo <hash>.miniparc com a AST validada, as posições dos itens de topo,
+# o relatório semântico (com a tabela de símbolos), o TAC, o bytecode da
+# VirtualMachine, o código Python gerado (code object via marshal) e a AST
+# otimizada pelo ASTOptimizer, quando pedida. Os avisos que
+# cada etapa imprime também são guardados e repetidos quando a entrada é
+# carregada, então a saída é a mesma com ou sem cache.
+#
+# - Chave: SHA-256 do fonte + impressão digital do compilador (conteúdo dos
+#   módulos do front end, versão do Python e do formato), então qualquer
+#   mudança no lexer/parser/analisador invalida o cache sozinha; com
+#   optimize=True a chave é outra, pois bytecode e Python vêm da AST otimizada
+# - Formato: cabeçalho MAGIC + pickle compactado com zlib
+# - Diretório configurável (MINIPAR_CACHE_DIR), tamanho limitado
+#   (MINIPAR_CACHE_MAX_BYTES) com remoção LRU pela data de acesso
+# - MINIPAR_CACHE=0 (ou --no-cache no main.py) desliga o cache
+#
+# O conteúdo é carregado com pickle: o diretório é criado só para o usuário
+# atual (0o700) e não deve ser compartilhado com quem não é confiável.
+# ============================================================================
+
+import io
+import os
+import copy
+import sys
+import pickle
+import hashlib
+import tempfile
+import zlib
+from contextlib import redirect_stdout
+
+from parser.ParseSession import ParseSession
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from codegen.TACGenerator import TACGenerator
+from codegen.BytecodeCompiler import BytecodeCompiler
+from codegen.PythonGenerator import PythonGenerator
+from optimizer.ASTOptimizer import ASTOptimizer
+
+
+MAGIC = b'MPC1'
+CACHE_SUFFIX = '.miniparc'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Módulos (relativos a src/) cujo conteúdo define a saída cacheada
+_COMPILER_MODULES = (
+    'lexer/Lexer.py', 'lexer/token.py', 'lexer/token_type.py',
+    'parser/AST.py', 'parser/Parser.py', 'parser/ParseSession.py', 'parser/Traversal.py',
+    'semantic/SemanticAnalyzer.py', 'symbol_table/SymbolTable.py',
+    'codegen/TACGenerator.py', 'codegen/BytecodeCompiler.py', 'codegen/PythonGenerator.py',
+    'optimizer/ASTOptimizer.py', 'runtime/Resolver.py', 'runtime/typed_ops.py', 'cache/ProgramCache.py',
+)
+
+_fingerprint = None
+
+
+def compiler_fingerprint():
+    """Impressão digital do compilador: muda quando qualquer etapa muda."""
+    global _fingerprint
+    if _fingerprint is None:
+        digest = hashlib.sha256(MAGIC)
+        digest.update(f'{sys.version_info[0]}.{sys.version_info[1]}'.encode())
+        src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for module in _COMPILER_MODULES:
+            digest.update(module.encode())
+            with open(os.path.join(src_dir, module), 'rb') as f:
+                digest.update(f.read())
+        _fingerprint = digest.digest()
+    return _fingerprint
+
+
+def default_cache_dir():
+    """MINIPAR_CACHE_DIR ou <XDG_CACHE_HOME|~/.cache>/minipar."""
+    directory = os.environ.get('MINIPAR_CACHE_DIR')
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'minipar')
+
+
+def _run_stage(output, stage, function):
+    """Executa uma etapa guardando em output[stage] o que ela imprimir."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            return function()
+    finally:
+        text = buffer.getvalue()
+        if text:
+            output[stage] = text
+            sys.stdout.write(text)
+
+
+class CompiledProgram:
+    """
+    Resultado da compilação de um fonte. A AST (e as posições dos itens de
+    topo) sempre existe; relatório semântico, TAC, bytecode e Python são calculados na primeira
+    vez que são pedidos e passam a fazer parte da entrada do cache.
+    """
+
+    __slots__ = ('key', 'ast', 'spans', 'optimize', 'optimized', 'optimization', 'semantic', 'symbol_table',
+                 'tac', 'code', 'python', 'output', 'from_cache', '_dirty', '_replayed')
+
+    def __init__(self, key, ast, spans, optimize=False):
+        self.key = key                # Chave no cache (hash do fonte + compilador)
+        self.ast = ast                # ProgramNode
+        self.spans = spans            # [(início, fim)] de cada item de topo no fonte
+        self.optimize = optimize      # Executar a AST otimizada (executable_ast)
+        self.optimized = None         # Cópia de self.ast reescrita pelo ASTOptimizer
+        self.optimization = None      # OptimizationReport da otimização
+        self.semantic = None          # Resultado de SemanticAnalyzer.analyze()
+        self.symbol_table = None      # SymbolTable.to_dict() após a análise
+        self.tac = None               # TACGenerator com o código gerado
+        self.code = None              # BytecodeProgram (de executable_ast())
+        self.python = None            # PythonProgram (de executable_ast())
+        self.output = {}              # Etapa -> avisos impressos ao calculá-la
+        self.from_cache = False       # True se a entrada veio do disco
+        self._dirty = True            # Há etapas novas ainda não gravadas
+        self._replayed = set()        # Etapas cujos avisos já foram repetidos
+
+    def semantic_report(self):
+        """(resultado da análise semântica, tabela de símbolos serializada)."""
+        if self.semantic is None:
+            analyzer = SemanticAnalyzer()
+            self.semantic = _run_stage(self.output, 'semantic', lambda: analyzer.analyze(self.ast))
+            self.symbol_table = analyzer.symbol_table.to_dict()
+            self._dirty = True
+        else:
+            self.replay('semantic')
+        return self.semantic, self.symbol_table
+
+    def executable_ast(self):
+        """
+        AST que os modos de execução recebem: self.ast, ou com optimize uma
+        cópia otimizada depois da análise semântica (que anota os tipos). A
+        cópia deixa self.ast como o parser a criou, para --show-ast, o TAC e
+        a ParseSession, que reaproveita os nós entre edições.
+        """
+        if not self.optimize:
+            return self.ast
+        if self.optimized is None:
+            self.semantic_report()
+            optimized = copy.deepcopy(self.ast)
+            self.optimization = _run_stage(self.output, 'optimize', lambda: ASTOptimizer().optimize(optimized))
+            self.optimized = optimized
+            self._dirty = True
+        else:
+            self.replay('optimize')
+        return self.optimized
+
+    def tac_generator(self):
+        """TACGenerator já executado sobre a AST."""
+        if self.tac is None:
+            generator = TACGenerator()
+            _run_stage(self.output, 'tac', lambda: generator.generate(self.ast))
+            self.tac = generator
+            self._dirty = True
+        else:
+            self.replay('tac')
+        return self.tac
+
+    def bytecode(self):
+        """BytecodeProgram da AST, para a VirtualMachine."""
+        if self.code is None:
+            ast = self.executable_ast()
+            self.code = _run_stage(self.output, 'bytecode', lambda: BytecodeCompiler().compile(ast))
+            self._dirty = True
+        else:
+            self.replay('bytecode')
+        return self.code
+
+    def python_program(self):
+        """PythonProgram da AST, para o PythonRuntime."""
+        if self.python is None:
+            ast = self.executable_ast()
+            self.python = _run_stage(self.output, 'python', lambda: PythonGenerator().compile(ast))
+            self._dirty = True
+        else:
+            self.replay('python')
+        return self.python
+
+    def replay(self, stage):
+        """Repete (uma vez) os avisos de uma etapa carregada do cache."""
+        if self.from_cache and stage not in self._replayed:
+            self._replayed.add(stage)
+            sys.stdout.write(self.output.get(stage, ''))
+
+    def __getstate__(self):
+        return (self.key, self.ast, self.spans, self.optimize, self.optimized, self.optimization,
+                self.semantic, self.symbol_table, self.tac, self.code, self.python, self.output)
+
+    def __setstate__(self, state):
+        (self.key, self.ast, self.spans, self.optimize, self.optimized, self.optimization,
+         self.semantic, self.symbol_table, self.tac, self.code, self.python, self.output) = state
+        self.from_cache = True
+        self._dirty = False
+        self._replayed = set()
+
+
+class ProgramCache:
+    """Diretório de arquivos .miniparc com limite de tamanho e remoção LRU."""
+
+    def __init__(self, directory=None, max_bytes=None, enabled=True, optimize=False):
+        self.directory = directory or default_cache_dir()
+        if max_bytes is None:
+            max_bytes = int(os.environ.get('MINIPAR_CACHE_MAX_BYTES', DEFAULT_MAX_BYTES))
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.optimize = optimize  # Programas compilados executam a AST otimizada
+
+    @classmethod
+    def from_environment(cls):
+        """Cache padrão, desligado (enabled=False) se MINIPAR_CACHE=0."""
+        enabled = os.environ.get('MINIPAR_CACHE', '1').lower() not in ('0', 'no', 'off', 'false')
+        return cls(enabled=enabled)
+
+    # ------------------- API pública -------------------
+    def key(self, source):
+        digest = hashlib.sha256(compiler_fingerprint())
+        digest.update(b'O1' if self.optimize else b'O0')
+        digest.update(source.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def compile(self, source, session=None):
+        """
+        Retorna o CompiledProgram de source, do disco quando possível; senão
+        analisa o fonte (com session, se informada, ou uma ParseSession nova).
+        Com session, ela termina posicionada em source nos dois casos. Erros
+        de sintaxe são propagados. Chame save() depois de pedir as etapas
+        desejadas (semantic_report, tac_generator) para gravá-las juntas.
+        """
+        key = self.key(source) if self.enabled else None
+        program = self._read(key) if self.enabled else None
+        if program is not None:
+            if session is not None:
+                session.load_program(source, program.ast, program.spans)
+            program.replay('ast')
+            return program
+
+        output = {}
+        if session is None:
+            session = _run_stage(output, 'ast', lambda: ParseSession(source))
+        else:
+            _run_stage(output, 'ast', lambda: session.update(source))
+        program = CompiledProgram(key, session.ast, [(item.start, item.end) for item in session.items], self.optimize)
+        program.output = output
+        return program
+
+    def save(self, program):
+        """Grava a entrada se ela tiver etapas ainda não gravadas."""
+        if not self.enabled or not program._dirty:
+            return
+        try:
+            data = MAGIC + zlib.compress(pickle.dumps(program, pickle.HIGHEST_PROTOCOL))
+        except Exception as e:
+            # AST profunda demais ou valor não serializável: segue sem cache
+            print(f"AVISO: programa não gravado no cache: {e}")
+            return
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            # Escrita atômica: outro processo nunca vê um arquivo pela metade
+            fd, temp_path = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self._path(program.key))
+        except OSError as e:
+            print(f"AVISO: não foi possível gravar no cache '{self.directory}': {e}")
+            return
+        program._dirty = False
+        self._evict()
+
+    def clear(self):
+        """Remove todas as entradas do cache."""
+        for name, _, _ in self._entries():
+            self._remove(os.path.join(self.directory, name))
+
+    # ------------------- Internos -------------------
+    def _path(self, key):
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def _read(self, key):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            if not data.startswith(MAGIC):
+                raise ValueError('cabeçalho inválido')
+            program = pickle.loads(zlib.decompress(data[len(MAGIC):]))
+            if not isinstance(program, CompiledProgram) or program.key != key:
+                raise ValueError('entrada não corresponde à chave')
+        except Exception:
+            # Arquivo corrompido ou de outra versão: descarta e recompila
+            self._remove(path)
+            return None
+        try:
+            # Marca o acesso para a ordem LRU
+            os.utime(path)
+        except OSError:
+            pass
+        return program
+
+    def _entries(self):
+        """(nome, tamanho, último acesso) de cada arquivo .miniparc."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(CACHE_SUFFIX):
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((entry.name, stat.st_size, stat.st_mtime))
+        except OSError:
+            pass
+        return entries
+
+    def _evict(self):
+        """Remove as entradas menos usadas até caber em max_bytes."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        entries.sort(key=lambda entry: entry[2])
+        for name, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.directory, name))
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,534 @@
+# ============================================================================
+# BytecodeCompiler.py - Compilador da AST para Bytecode de Pilha
+# ============================================================================
+# Traduz o ProgramNode em bytecode compacto executado pela VirtualMachine
+# (runtime/VirtualMachine.py):
+#
+# - Cada instrução ocupa dois inteiros (opcode, argumento) em um array('i')
+# - O argumento indexa as tabelas do CodeObject: constantes, nomes, variáveis
+#   (slot, nome), operadores, chamadas, nós da AST e blocos PAR, ou é o
+#   destino de um salto
+# - Um CodeObject por função, por método e para o programa; o frame de
+#   funções/métodos usa o layout do Resolver (parâmetros, 'this', slots)
+# - Comandos pouco frequentes (input, send/receive, declarações de canal e
+#   de array) viram EXEC_NODE: a VM executa o nó com os métodos do Interpreter
+#
+# BytecodeProgram guarda a AST junto com o bytecode e pode ser serializado
+# com pickle (cache .miniparc, envio a processos de trabalho).
+# ============================================================================
+
+from array import array
+
+from parser.AST import *
+from runtime.Resolver import Resolver
+from runtime.natives import NATIVE_FUNCTIONS
+from runtime.typed_ops import COMPARISONS, literal_value
+
+
+# ------------------- Opcodes -------------------
+
+OPCODES = (
+    'LOAD_CONST',             # empilha constants[arg]
+    'LOAD_GLOBAL',            # empilha a global names[arg] (None se não existe)
+    'LOAD_LOCAL',             # empilha variables[arg]: slot do frame, ou global
+    'STORE_GLOBAL',           # atribuição global (atualiza a tabela de símbolos)
+    'STORE_LOCAL',            # atribuição: no slot se já tem valor local, senão global
+    'BIND_GLOBAL',            # variável do for no escopo global
+    'BIND_LOCAL',             # variável do for: no frame se houver um, senão global
+    'DECLARE',                # declaração simples nodes[arg] com o valor do topo
+    'INSTANTIATE',            # Classe obj = new Classe() (nodes[arg])
+    'POP',
+    'BINARY_OP',              # operação operators[arg] sobre os dois do topo
+    'COMPARE',                # comparação COMPARISON_OPERATORS[arg]
+    'UNARY_NEG',
+    'JUMP',                   # pc = arg
+    'JUMP_IF_FALSE',          # desempilha; se falso, pc = arg
+    'PRINT',
+    'RETURN_VALUE',
+    'END',                    # fim do código (retorno sem valor)
+    'CALL_FUNCTION',          # calls[arg] = (nome, nº de argumentos empilhados)
+    'PREPARE_METHOD',         # desempilha o objeto e decide quantos argumentos avaliar
+    'PREPARE_ELEMENT_METHOD', # idem, só para objetos MiniPar (elemento de array)
+    'SKIP_ARG',               # pula o argumento (até arg) se não deve ser avaliado
+    'CALL_METHOD',            # chama o método preparado com os argumentos avaliados
+    'LOAD_ATTR',              # substitui o objeto do topo por seu atributo names[arg]
+    'STORE_ATTR',             # objeto.names[arg] = valor
+    'TEST_OBJECT',            # se o topo não é objeto MiniPar: desempilha e pc = arg
+    'TEST_LIST',              # se o topo não é lista: desempilha e pc = arg
+    'TEST_LIST_OR_NONE',      # se o topo não é lista: troca por None e pc = arg
+    'SUBSCR',                 # array[índice]
+    'SUBSCR_2D',              # array[i][j]
+    'STORE_SUBSCR',           # array[índice] = valor
+    'STORE_SUBSCR_2D',        # array[i][j] = valor
+    'NEW',                    # new constants[arg]()
+    'EXEC_NODE',              # executa nodes[arg] com o Interpreter
+    'EVAL_NODE',              # avalia nodes[arg] com o Interpreter
+    'PAR',                    # executa os códigos de blocks[arg] em threads
+)
+
+for _number, _name in enumerate(OPCODES):
+    globals()[_name] = _number
+
+COMPARISON_OPERATORS = tuple(COMPARISONS)
+
+
+class CodeObject:
+    """Bytecode de uma função, método ou do programa, com suas tabelas."""
+    __slots__ = ('name', 'code', 'constants', 'names', 'variables', 'nodes',
+                 'operators', 'calls', 'method_calls', 'blocks',
+                 'parameter_slots', 'this_slot', 'frame_size')
+
+    def __init__(self, name):
+        self.name = name
+        self.code = array('i')
+        self.constants = []
+        self.names = []
+        self.variables = []     # (slot, nome)
+        self.nodes = []         # nós executados pelo Interpreter
+        self.operators = []     # (operador, tipo esquerdo, tipo direito)
+        self.calls = []         # (nome da função, nº de argumentos)
+        self.method_calls = []  # (nome do método, nº de argumentos)
+        self.blocks = []        # lista de CodeObject por bloco PAR
+        self.parameter_slots = []
+        self.this_slot = None
+        self.frame_size = 0
+
+    def __getstate__(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def disassemble(self):
+        """Listagem legível do bytecode (uma instrução por linha)."""
+        lines = [f"== {self.name} =="]
+        for pc in range(0, len(self.code), 2):
+            lines.append(f"{pc:5}  {OPCODES[self.code[pc]]:<22} {self.code[pc + 1]}")
+        for block in self.blocks:
+            for code in block:
+                lines.append(code.disassemble())
+        return '\n'.join(lines)
+
+
+class BytecodeProgram:
+    """Programa compilado: código principal, corpos por FunctionNode/MethodNode e a AST."""
+    __slots__ = ('ast', 'main', 'bodies')
+
+    def __init__(self, ast, main, bodies):
+        self.ast = ast
+        self.main = main
+        self.bodies = bodies  # FunctionNode/MethodNode -> CodeObject
+
+    def __getstate__(self):
+        return {'ast': self.ast, 'main': self.main, 'bodies': self.bodies}
+
+    def __setstate__(self, state):
+        self.ast = state['ast']
+        self.main = state['main']
+        self.bodies = state['bodies']
+
+
+class _Emitter:
+    """Monta um CodeObject: emissão de instruções, tabelas sem repetição e saltos."""
+
+    def __init__(self, code_object):
+        self.code_object = code_object
+        self.code = code_object.code
+        self._indexes = {}
+
+    def emit(self, opcode, argument=0):
+        position = len(self.code)
+        self.code.append(opcode)
+        self.code.append(argument)
+        return position
+
+    def here(self):
+        return len(self.code)
+
+    def patch(self, position, target=None):
+        self.code[position + 1] = self.here() if target is None else target
+
+    def index(self, table_name, value, key=None):
+        """Índice de value na tabela (reaproveita entradas iguais)."""
+        key = (table_name, type(value), value) if key is None else (table_name, key)
+        position = self._indexes.get(key)
+        if position is None:
+            table = getattr(self.code_object, table_name)
+            position = self._indexes[key] = len(table)
+            table.append(value)
+        return position
+
+    def node(self, node):
+        return self.index('nodes', node, key=id(node))
+
+
+class BytecodeCompiler:
+    """Compila um ProgramNode em BytecodeProgram."""
+
+    def __init__(self):
+        self.resolver = Resolver()
+        self.functions = {}   # nome -> FunctionNode (a última definição vale)
+        self.bodies = {}
+        self._out = None
+
+    def compile(self, program):
+        self.resolver.resolve(program)
+        for node in program.children:
+            if isinstance(node, FunctionNode):
+                self.functions[node.name] = node
+
+        for node in program.children:
+            if isinstance(node, FunctionNode):
+                self.compile_callable(node)
+            elif isinstance(node, ClassNode):
+                for method in node.methods:
+                    self.compile_callable(method, is_method=True)
+
+        main = CodeObject('<programa>')
+        previous = self._use(main)
+        for node in program.children:
+            if isinstance(node, FunctionCallNode):
+                self.expression(node)
+                self._out.emit(POP)
+            else:
+                self.statement(node)
+        self._out.emit(END)
+        self._out = previous
+        return BytecodeProgram(program, main, self.bodies)
+
+    def compile_callable(self, node, is_method=False):
+        """CodeObject do corpo de uma função ou método."""
+        layout = self.resolver.layouts.get(node)
+        if layout is None:
+            layout = self.resolver.resolve_callable(node, is_method)
+        code_object = CodeObject(node.name)
+        code_object.parameter_slots = list(layout.parameter_slots)
+        code_object.this_slot = layout.this_slot
+        code_object.frame_size = layout.size
+        previous = self._use(code_object)
+        self.block(node.body)
+        self._out.emit(END)
+        self._out = previous
+        self.bodies[node] = code_object
+        return code_object
+
+    def _use(self, code_object):
+        previous = self._out
+        self._out = _Emitter(code_object)
+        return previous
+
+    # ------------------- Variáveis -------------------
+
+    def load(self, node, name):
+        if not isinstance(name, str):
+            # Nome que não é identificador: get_variable nunca o encontra
+            self.constant(None)
+        elif node.slot is None:
+            self._out.emit(LOAD_GLOBAL, self._out.index('names', name))
+        else:
+            self._out.emit(LOAD_LOCAL, self._out.index('variables', (node.slot, name)))
+
+    def constant(self, value):
+        self._out.emit(LOAD_CONST, self._out.index('constants', value))
+
+    # ------------------- Comandos -------------------
+
+    def block(self, statements):
+        for stmt in statements or ():
+            self.statement(stmt)
+
+    def statement(self, node):
+        compiler = self._STATEMENTS.get(node.__class__)
+        if compiler is not None:
+            compiler(self, node)
+        elif node is not None and not isinstance(node, (ClassNode, FunctionNode, CommentNode)):
+            self._out.emit(EXEC_NODE, self._out.node(node))
+
+    def _block_node(self, node):
+        if node.block_type == "seq":
+            self.block(node.statements)
+        elif node.block_type == "par":
+            threads = []
+            for stmt in node.statements:
+                if isinstance(stmt, FunctionCallNode):
+                    # Só funções do programa viram thread (como no Interpreter)
+                    if stmt.name not in self.functions:
+                        continue
+                code_object = CodeObject('<par>')
+                previous = self._use(code_object)
+                if isinstance(stmt, FunctionCallNode):
+                    self.expression(stmt)
+                    self._out.emit(POP)
+                else:
+                    self.statement(stmt)
+                self._out.emit(END)
+                self._out = previous
+                threads.append(code_object)
+            self._out.code_object.blocks.append(threads)
+            self._out.emit(PAR, len(self._out.code_object.blocks) - 1)
+
+    def _declaration(self, node):
+        if node.type_name.lower() == "c_channel" or node.is_2d_array or node.is_array:
+            self._out.emit(EXEC_NODE, self._out.node(node))
+            return
+        self.expression(node.initial_value) if node.initial_value else self.constant(None)
+        self._out.emit(DECLARE, self._out.node(node))
+
+    def _assignment(self, node):
+        self.expression(node.expression)
+        if node.slot is None:
+            self._out.emit(STORE_GLOBAL, self._out.index('names', node.identifier))
+        else:
+            self._out.emit(STORE_LOCAL, self._out.index('variables', (node.slot, node.identifier)))
+
+    def _store_subscript(self, index, index2, value):
+        self.expression(index)
+        if index2 is not None:
+            self.expression(index2)
+            self.expression(value)
+            self._out.emit(STORE_SUBSCR_2D)
+        else:
+            self.expression(value)
+            self._out.emit(STORE_SUBSCR)
+
+    def _array_assignment(self, node):
+        self.load(node, node.array_name)
+        skip = self._out.emit(TEST_LIST)
+        self._store_subscript(node.index, node.index2, node.expression)
+        self._out.patch(skip)
+
+    def _attribute_assignment(self, node):
+        self.load(node, node.object_name)
+        skip = self._out.emit(TEST_OBJECT)
+        self.expression(node.expression)
+        self._out.emit(STORE_ATTR, self._out.index('names', node.attribute_name))
+        self._out.patch(skip)
+
+    def _if(self, node):
+        self.condition(node.condition)
+        to_else = self._out.emit(JUMP_IF_FALSE)
+        self.block(node.then_body)
+        if node.else_body:
+            to_end = self._out.emit(JUMP)
+            self._out.patch(to_else)
+            self.block(node.else_body)
+            self._out.patch(to_end)
+        else:
+            self._out.patch(to_else)
+
+    def _while(self, node):
+        top = self._out.here()
+        self.condition(node.condition)
+        to_end = self._out.emit(JUMP_IF_FALSE)
+        self.block(node.body)
+        self._out.emit(JUMP, top)
+        self._out.patch(to_end)
+
+    def _for(self, node):
+        self.expression(node.init_expr)
+        if node.slot is None:
+            self._out.emit(BIND_GLOBAL, self._out.index('names', node.var))
+        else:
+            self._out.emit(BIND_LOCAL, self._out.index('variables', (node.slot, node.var)))
+        top = self._out.here()
+        self.condition(node.condition)
+        to_end = self._out.emit(JUMP_IF_FALSE)
+        self.block(node.body)
+        self.statement(node.increment)
+        self._out.emit(JUMP, top)
+        self._out.patch(to_end)
+
+    def _print(self, node):
+        self.expression(node.expression)
+        self._out.emit(PRINT)
+
+    def _return(self, node):
+        self.expression(node.expression)
+        self._out.emit(RETURN_VALUE)
+
+    def _call_statement(self, node):
+        self.expression(node)
+        self._out.emit(POP)
+
+    def _instantiation(self, node):
+        self._out.emit(INSTANTIATE, self._out.node(node))
+
+    def _element_attribute_assignment(self, node):
+        self.element(node.array_access)
+        skip = self._out.emit(TEST_OBJECT)
+        self.expression(node.value)
+        self._out.emit(STORE_ATTR, self._out.index('names', node.attribute_name))
+        self._out.patch(skip)
+
+    def _object_attribute_array_assignment(self, node):
+        # this.produtos[i] = valor
+        self.load(node, node.object_name)
+        skip_object = self._out.emit(TEST_OBJECT)
+        self._out.emit(LOAD_ATTR, self._out.index('names', node.attr_name))
+        skip_list = self._out.emit(TEST_LIST)
+        self._store_subscript(node.index, node.index2, node.value)
+        self._out.patch(skip_object)
+        self._out.patch(skip_list)
+
+    _STATEMENTS = {
+        BlockNode: _block_node,
+        DeclarationNode: _declaration,
+        AssignmentNode: _assignment,
+        ArrayAssignmentNode: _array_assignment,
+        AttributeAssignmentNode: _attribute_assignment,
+        IfNode: _if,
+        WhileNode: _while,
+        ForNode: _for,
+        PrintNode: _print,
+        ReturnNode: _return,
+        FunctionCallNode: _call_statement,
+        MethodCallNode: _call_statement,
+        ArrayElementMethodCallNode: _call_statement,
+        InstantiationNode: _instantiation,
+        ArrayElementAttributeAssignmentNode: _element_attribute_assignment,
+        ObjectAttributeArrayAssignmentNode: _object_attribute_array_assignment,
+    }
+
+    # ------------------- Expressões -------------------
+
+    def expression(self, node):
+        compiler = self._EXPRESSIONS.get(node.__class__)
+        if compiler is not None:
+            compiler(self, node)
+        elif node is None:
+            self.constant(None)
+        else:
+            self._out.emit(EVAL_NODE, self._out.node(node))
+
+    def condition(self, node):
+        if not isinstance(node, ConditionNode):
+            self.expression(node)
+            return
+        self.expression(node.left)
+        self.expression(node.right)
+        if node.operator in COMPARISONS:
+            self._out.emit(COMPARE, COMPARISON_OPERATORS.index(node.operator))
+        else:
+            self._out.emit(POP)
+            self._out.emit(POP)
+            self.constant(False)
+
+    def element(self, array_access):
+        """Elemento de array que guarda um objeto (arr[i] ou this.arr[i])."""
+        self.expression(array_access)
+
+    def _number(self, node):
+        self.constant(literal_value(node))
+
+    def _string(self, node):
+        self.constant(str(node.value))
+
+    def _identifier(self, node):
+        self.load(node, node.name)
+
+    def _binary_op(self, node):
+        self.expression(node.left)
+        self.expression(node.right)
+        left_type = node.left.static_type if node.left is not None else None
+        right_type = node.right.static_type if node.right is not None else None
+        self._out.emit(BINARY_OP, self._out.index('operators', (node.operator, left_type, right_type)))
+
+    def _unary_op(self, node):
+        self.expression(node.operand)
+        if node.operator == '-':
+            self._out.emit(UNARY_NEG)
+
+    def _condition_expression(self, node):
+        # evaluate_expression não avalia ConditionNode (só evaluate_condition)
+        self.constant(None)
+
+    def _attribute_access(self, node):
+        if isinstance(node.object_name, str):
+            self.load(node, node.object_name)
+        else:
+            self.expression(node.object_name)
+        self._out.emit(LOAD_ATTR, self._out.index('names', node.attribute_name))
+
+    def _subscript(self, index, index2):
+        skip = self._out.emit(TEST_LIST_OR_NONE)
+        self.expression(index)
+        if index2 is not None:
+            self.expression(index2)
+            self._out.emit(SUBSCR_2D)
+        else:
+            self._out.emit(SUBSCR)
+        self._out.patch(skip)
+
+    def _array_access(self, node):
+        if isinstance(node.array_name, str):
+            self.load(node, node.array_name)
+        else:
+            self.expression(node.array_name)
+        self._subscript(node.index, node.index2)
+
+    def _array_access_with_object(self, node):
+        if not isinstance(node.object_attr_access, AttributeAccessNode):
+            self.constant(None)
+            return
+        self.expression(node.object_attr_access)
+        self._subscript(node.index, node.index2)
+
+    def _function_call(self, node):
+        if node.name.lower() in NATIVE_FUNCTIONS:
+            self._out.emit(EVAL_NODE, self._out.node(node))
+            return
+        func = self.functions.get(node.name)
+        if func is None:
+            self.constant(None)
+            return
+        # Só os argumentos que têm parâmetro são avaliados
+        arguments = node.arguments[:len(func.parameters)]
+        for argument in arguments:
+            self.expression(argument)
+        self._out.emit(CALL_FUNCTION, self._out.index('calls', (node.name, len(arguments))))
+
+    def _arguments_and_call(self, node):
+        # Cada argumento só é avaliado se o método preparado o recebe
+        for argument in node.arguments:
+            skip = self._out.emit(SKIP_ARG)
+            self.expression(argument)
+            self._out.patch(skip)
+        self._out.emit(CALL_METHOD)
+
+    def _method_call(self, node):
+        if isinstance(node.object_name, str):
+            self.load(node, node.object_name)
+        else:
+            self.expression(node.object_name)
+        self._out.emit(PREPARE_METHOD, self._out.index('method_calls', (node.method_name, len(node.arguments))))
+        self._arguments_and_call(node)
+
+    def _element_method_call(self, node):
+        self.element(node.array_access)
+        self._out.emit(PREPARE_ELEMENT_METHOD, self._out.index('method_calls', (node.method_name, len(node.arguments))))
+        self._arguments_and_call(node)
+
+    def _element_attribute_access(self, node):
+        self.element(node.array_access)
+        self._out.emit(LOAD_ATTR, self._out.index('names', node.attribute_name))
+
+    def _new_expression(self, node):
+        self._out.emit(NEW, self._out.index('constants', node.class_name))
+
+    _EXPRESSIONS = {
+        NumberNode: _number,
+        StringNode: _string,
+        IdentifierNode: _identifier,
+        BinaryOpNode: _binary_op,
+        UnaryOpNode: _unary_op,
+        ConditionNode: _condition_expression,
+        AttributeAccessNode: _attribute_access,
+        ArrayAccessNode: _array_access,
+        ArrayAccessWithObjectNode: _array_access_with_object,
+        FunctionCallNode: _function_call,
+        MethodCallNode: _method_call,
+        ArrayElementMethodCallNode: _element_method_call,
+        ArrayElementAttributeAccessNode: _element_attribute_access,
+        NewExpressionNode: _new_expression,
+    }
@@ -0,0 +1,680 @@
+# ============================================================================
+# PythonGenerator.py - Tradução de MiniPar para Código Python
+# ============================================================================
+# Gera um módulo Python equivalente ao programa, compilado com compile() e
+# executado pelo PythonRuntime (runtime/PythonRuntime.py), que fornece os
+# canais, as threads do PAR, print/input e o escopo global. Laços, operações
+# e chamadas passam a ser bytecode do próprio CPython.
+#
+# - Funções viram def f_<nome>(...) e métodos def m<n>_<Classe>_<método>(this, ...)
+# - Variáveis locais (slots do Resolver) viram variáveis Python v_<nome>,
+#   iniciadas com UNSET: leitura de um local sem valor cai no escopo global,
+#   atribuição só é local se o nome já tem valor local, e declarações só são
+#   locais se a chamada recebeu argumentos (_framed), como no Interpreter
+# - Código fora de funções e cada comando de um PAR (def _par<n>_<i>) usam
+#   só o escopo global (_G); os comandos do PAR são definidos no nível do
+#   módulo (o compile() do CPython fica quadrático com milhares de funções
+#   aninhadas em uma só)
+# - Operações com tipo estático int/float viram o operador do Python com um
+#   teste do tipo real; as demais usam a função escolhida por select_operation
+#
+# Com coroutines=True (modo async, runtime/AsyncRuntime.py) funções,
+# métodos, comandos do PAR e _main viram async def: chamadas de funções e
+# métodos, send/receive e o PAR são aguardados com await, e os comandos de um
+# PAR rodam como corrotinas de um único event loop.
+#
+# PythonProgram guarda a AST, o fonte e o code object, serializado com
+# marshal (cache .miniparc). --emit-python no main.py mostra o fonte.
+# ============================================================================
+
+import marshal
+from contextlib import contextmanager
+
+from parser.AST import *
+from runtime.Resolver import Resolver
+from runtime.natives import NATIVE_FUNCTIONS
+from runtime.typed_ops import COMPARISONS, literal_value
+
+
+PYTHON_FILENAME = '<minipar>'
+
+# Operações com versão inline: (operador, tipo esquerdo, tipo direito) ->
+# (operador Python, teste da classe de cada operando, divisor não pode ser 0)
+_NUMBER_TYPES = ('int', 'float')
+_INLINE_OPS = {('+', left, right): ('+', 'in _NUMBERS', False)
+               for left in _NUMBER_TYPES for right in _NUMBER_TYPES}
+_INLINE_OPS[('/', 'int', 'int')] = ('//', 'is int', True)
+_INLINE_OPS[('%', 'int', 'int')] = ('%', 'is int', True)
+
+# Nós avaliados (e descartados) quando aparecem como comando
+_EXPRESSION_STATEMENTS = (FunctionCallNode, MethodCallNode, ArrayElementMethodCallNode,
+                          ArrayElementAttributeAccessNode, AttributeAccessNode,
+                          ArrayAccessNode, ArrayAccessWithObjectNode)
+
+
+def python_name(prefix, name):
+    """
+    Nome Python de uma variável/função MiniPar: prefix_nome se o nome é
+    ASCII; senão prefixx_ + hex do UTF-8. O lexer aceita qualquer \\w, mas
+    nem todo \\w é válido em um identificador Python (ex.: x²) e o Python
+    normaliza identificadores não ASCII com NFKC (ﬁ e fi seriam o mesmo).
+    """
+    if name.isascii():
+        return f'{prefix}_{name}'
+    return f'{prefix}x_{name.encode("utf-8").hex()}'
+
+
+class PythonProgram:
+    """Fonte Python gerado, seu code object e os nós da AST que ele referencia (_N)."""
+    __slots__ = ('ast', 'source', 'nodes', 'code')
+
+    def __init__(self, ast, source, nodes):
+        self.ast = ast
+        self.source = source
+        self.nodes = nodes
+        self.code = compile(source, PYTHON_FILENAME, 'exec')
+
+    def __getstate__(self):
+        return (self.ast, self.source, self.nodes, marshal.dumps(self.code))
+
+    def __setstate__(self, state):
+        self.ast, self.source, self.nodes, code = state
+        self.code = marshal.loads(code)
+
+    def print_source(self):
+        """Imprime o fonte Python gerado"""
+        print("\n" + "=" * 80)
+        print("CÓDIGO PYTHON GERADO")
+        print("=" * 80)
+        print(self.source)
+
+
+class _Scope:
+    """Acesso às variáveis no código de uma função, método ou do escopo global."""
+    __slots__ = ('locals', 'framed', 'certain', 'in_function')
+
+    def __init__(self, locals=None, framed=None, certain=(), in_function=False):
+        self.locals = locals or {}   # slot -> variável Python (vazio: tudo global)
+        self.framed = framed         # None, '_framed' (funções) ou True (métodos)
+        self.certain = certain       # slots que sempre têm valor ('this')
+        self.in_function = in_function
+
+
+_GLOBAL_SCOPE = _Scope()
+
+
+class PythonGenerator:
+    """Gera o módulo Python de um ProgramNode."""
+
+    def __init__(self, coroutines=False):
+        self.coroutines = coroutines
+        self.resolver = Resolver()
+        self.functions = {}    # nome -> FunctionNode (a última definição vale)
+        self.nodes = []        # nós usados pelo código gerado (_N[i])
+        self.operations = []   # (operador, tipo esquerdo, tipo direito) de cada _op<i>
+        self.source = None
+        self._indexes = {}
+        self._lines = []
+        self._hoisted = []     # linhas dos def _par<n>_<i>, no nível do módulo
+        self._indent = 0
+        self._temps = 0
+        self._blocks = 0
+        self._methods = 0
+        self.scope = _GLOBAL_SCOPE
+
+    def compile(self, program):
+        """PythonProgram com o fonte gerado já compilado."""
+        return PythonProgram(program, self.generate(program), self.nodes)
+
+    def generate(self, program):
+        """Fonte Python do programa."""
+        self.resolver.resolve(program)
+        for node in program.children:
+            if isinstance(node, FunctionNode):
+                self.functions[node.name] = node
+
+        for node in program.children:
+            if isinstance(node, FunctionNode):
+                self._callable(python_name('f', node.name), node)
+            elif isinstance(node, ClassNode):
+                for method in node.methods:
+                    name = python_name(f'm{self._methods}', f'{node.name}_{method.name}')
+                    self._methods += 1
+                    self._callable(name, method, is_method=True)
+                    self.emit(f'_methods[_N[{self.node(method)}]] = {name}')
+
+        # Declarações globais já executadas em collect_definitions são
+        # executadas de novo aqui, como no Interpreter
+        self.define('_main', '')
+        with self._indented(_GLOBAL_SCOPE):
+            self.block([node for node in program.children
+                        if not isinstance(node, (ClassNode, FunctionNode))])
+
+        header = ['# Gerado por PythonGenerator a partir de um programa MiniPar']
+        for index, (op, left_type, right_type) in enumerate(self.operations):
+            header.append(f'_op{index} = select_operation({op!r}, {left_type!r}, {right_type!r})')
+        self.source = '\n'.join(header + self._hoisted + self._lines) + '\n'
+        return self.source
+
+    # ------------------- Emissão -------------------
+
+    def emit(self, line):
+        self._lines.append('    ' * self._indent + line)
+
+    @contextmanager
+    def _indented(self, scope=None):
+        previous = self.scope
+        if scope is not None:
+            self.scope = scope
+        self._indent += 1
+        start = len(self._lines)
+        try:
+            yield
+        finally:
+            if len(self._lines) == start:
+                self.emit('pass')
+            self._indent -= 1
+            self.scope = previous
+
+    def define(self, name, parameters):
+        """Linha do def (async def com coroutines)."""
+        self.emit(f'{"async def" if self.coroutines else "def"} {name}({parameters}):')
+
+    def awaited(self, call):
+        """Expressão da chamada, aguardada com coroutines."""
+        return f'(await {call})' if self.coroutines else call
+
+    def temp(self):
+        self._temps += 1
+        return f'_t{self._temps}'
+
+    def node(self, node):
+        """Índice do nó em _N."""
+        key = ('node', id(node))
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = len(self.nodes)
+            self.nodes.append(node)
+        return index
+
+    def operation(self, op, left_type, right_type):
+        """Índice da operação em _op<i>."""
+        key = ('op', op, left_type, right_type)
+        index = self._indexes.get(key)
+        if index is None:
+            index = self._indexes[key] = len(self.operations)
+            self.operations.append((op, left_type, right_type))
+        return index
+
+    def _callable(self, name, node, is_method=False):
+        """def de uma função ou método, com os parâmetros nos slots do layout."""
+        layout = self.resolver.layouts.get(node)
+        if layout is None:
+            layout = self.resolver.resolve_callable(node, is_method)
+        slots = ([layout.this_slot] if is_method else []) + list(layout.parameter_slots)
+        if not slots:
+            # Função sem parâmetros: o frame é sempre vazio, tudo é global
+            self.define(name, '')
+            with self._indented(_Scope(in_function=True)):
+                self.block(node.body)
+            return
+
+        variables = {slot: python_name('v', local) for slot, local in enumerate(layout.names)}
+        parameters = []
+        repeated = []
+        for position, slot in enumerate(slots):
+            parameter = variables[slot]
+            if parameter in parameters:
+                # Parâmetro com nome repetido: vale o último argumento
+                repeated.append((f'_p{position}', parameter))
+                parameter = f'_p{position}'
+            parameters.append(parameter)
+        signature = [parameter if is_method and position == 0 else f'{parameter}=UNSET'
+                     for position, parameter in enumerate(parameters)]
+        self.define(name, ", ".join(signature))
+
+        scope = _Scope(variables, True if is_method else '_framed',
+                       (layout.this_slot,) if is_method else (), in_function=True)
+        with self._indented(scope):
+            others = [variable for slot, variable in variables.items() if slot not in slots]
+            if others:
+                self.emit(' = '.join(others) + ' = UNSET')
+            if not is_method:
+                self.emit(f'_framed = {parameters[0]} is not UNSET')
+            for parameter, variable in repeated:
+                self.emit(f'if {parameter} is not UNSET: {variable} = {parameter}')
+            self.block(node.body)
+
+    # ------------------- Variáveis -------------------
+
+    def _local(self, node):
+        slot = node.slot
+        if slot is None:
+            return None
+        return self.scope.locals.get(slot)
+
+    def load(self, node, name):
+        """Expressão que lê a variável name acessada por node."""
+        if not isinstance(name, str):
+            return 'None'
+        variable = self._local(node)
+        if variable is None:
+            return f'_get({name!r})'
+        if node.slot in self.scope.certain:
+            return variable
+        return f'({variable} if {variable} is not UNSET else _get({name!r}))'
+
+    def store(self, node, name, value, update=True):
+        """Atribuição: local se o nome já tem valor local, senão global."""
+        variable = self._local(node)
+        store_global = '_assign' if update else '_set_global'
+        if variable is None:
+            self.emit(f'{store_global}({name!r}, {value})')
+        elif node.slot in self.scope.certain:
+            self.emit(f'{variable} = {value}')
+        else:
+            temp = self.temp()
+            self.emit(f'{temp} = {value}')
+            self.emit(f'if {variable} is not UNSET: {variable} = {temp}')
+            self.emit(f'else: {store_global}({name!r}, {temp})')
+
+    def bind(self, node, name, value, declaration=None):
+        """Declaração (declaration é o DeclarationNode), for ou instanciação."""
+        variable = self._local(node)
+        framed = self.scope.framed
+        if declaration is not None:
+            local = [f'{variable} = {{}}', f'_types[{name!r}] = {declaration.type_name!r}']
+            other = f'_declare(_N[{self.node(declaration)}], {{}})'
+        else:
+            local = [f'{variable} = {{}}']
+            other = f'_set_global({name!r}, {{}})'
+        if variable is None or framed is None:
+            self.emit(other.format(value))
+        elif framed is True:
+            for line in local:
+                self.emit(line.format(value))
+        else:
+            temp = self.temp()
+            self.emit(f'{temp} = {value}')
+            self.emit(f'if {framed}:')
+            with self._indented():
+                for line in local:
+                    self.emit(line.format(temp))
+            self.emit('else:')
+            with self._indented():
+                self.emit(other.format(temp))
+
+    # ------------------- Comandos -------------------
+
+    def block(self, statements):
+        for stmt in statements or ():
+            self.statement(stmt)
+
+    def statement(self, node):
+        generator = self._STATEMENTS.get(node.__class__)
+        if generator is not None:
+            generator(self, node)
+        elif isinstance(node, _EXPRESSION_STATEMENTS):
+            self.emit(self.expression(node))
+
+    def _block_node(self, node):
+        if node.block_type == "seq":
+            self.block(node.statements)
+        elif node.block_type == "par":
+            # Cada comando vira uma função executada em uma thread (ou uma
+            # corrotina), sem frame
+            block = self._blocks
+            self._blocks += 1
+            threads = []
+            for stmt in node.statements:
+                if isinstance(stmt, FunctionCallNode) and stmt.name not in self.functions:
+                    continue
+                name = f'_par{block}_{len(threads)}'
+                # Em linhas próprias: um PAR aninhado termina as suas antes
+                lines, indent = self._lines, self._indent
+                self._lines, self._indent = [], 0
+                self.define(name, '')
+                with self._indented(_GLOBAL_SCOPE):
+                    if isinstance(stmt, FunctionCallNode):
+                        self.emit(self.expression(stmt))
+                    else:
+                        self.statement(stmt)
+                self._hoisted.extend(self._lines)
+                self._lines, self._indent = lines, indent
+                threads.append(name)
+            self.emit(self.awaited(f'_parallel(({"".join(thread + ", " for thread in threads)}))'))
+
+    def _declaration(self, node):
+        if node.type_name.lower() == "c_channel":
+            value = f'_channel(_N[{self.node(node)}])'
+        elif node.is_2d_array and node.array_dimensions:
+            rows = self.temp()
+            cols = self.temp()
+            dimensions = node.array_dimensions
+            self.emit(f'{rows} = {self.expression(dimensions[0])}')
+            self.emit(f'{cols} = {self.expression(dimensions[1]) if len(dimensions) > 1 and dimensions[1] is not None else 0}')
+            if node.initial_value:
+                if isinstance(node.initial_value, BraceInitNode):
+                    values = ', '.join(self.expression(value) for value in node.initial_value.values)
+                    value = f'_matrix_from_values([{values}], {rows}, {cols})'
+                else:
+                    value = f'_fill_matrix({self.expression(node.initial_value)}, {rows}, {cols})'
+            else:
+                value = f'_new_matrix({node.type_name!r}, {rows}, {cols})'
+        elif node.is_array:
+            if node.initial_value:
+                if isinstance(node.initial_value, ArrayInitNode):
+                    value = f'_array_of([{", ".join(self.expression(element) for element in node.initial_value.elements)}])'
+                elif isinstance(node.initial_value, BraceInitNode):
+                    value = f'_array_of([{", ".join(self.expression(element) for element in node.initial_value.values)}])'
+                else:
+                    value = self.expression(node.initial_value)
+            elif node.array_size:
+                value = f'_new_array({node.type_name!r}, {self.expression(node.array_size)})'
+            else:
+                value = '[]'
+        elif node.initial_value:
+            value = self.expression(node.initial_value)
+        else:
+            value = 'None'
+        self.bind(node, node.identifier, value, declaration=node)
+
+    def _assignment(self, node):
+        self.store(node, node.identifier, self.expression(node.expression))
+
+    def _store_subscript(self, array, index, index2, value):
+        # Índices e valor avaliados antes da conversão com int(), como no Interpreter
+        first = self.temp()
+        self.emit(f'{first} = {self.expression(index)}')
+        if index2 is None:
+            self.emit(f'{array}[int({first})] = {self.expression(value)}')
+            return
+        second = self.temp()
+        new_value = self.temp()
+        row = self.temp()
+        self.emit(f'{second} = {self.expression(index2)}')
+        self.emit(f'{new_value} = {self.expression(value)}')
+        self.emit(f'if isinstance({row} := {array}[int({first})], _ARRAYS): {row}[int({second})] = {new_value}')
+
+    def _array_assignment(self, node):
+        array = self.temp()
+        self.emit(f'if isinstance({array} := {self.load(node, node.array_name)}, _ARRAYS):')
+        with self._indented():
+            self._store_subscript(array, node.index, node.index2, node.expression)
+
+    def _set_attribute(self, obj, attribute, value):
+        temp = self.temp()
+        self.emit(f'if isinstance({temp} := {obj}, ObjectInstance):')
+        with self._indented():
+            self.emit(f'{temp}.set_attribute({attribute!r}, {self.expression(value)})')
+
+    def _attribute_assignment(self, node):
+        self._set_attribute(self.load(node, node.object_name), node.attribute_name, node.expression)
+
+    def _element_attribute_assignment(self, node):
+        self._set_attribute(self.expression(node.array_access), node.attribute_name, node.value)
+
+    def _object_attribute_array_assignment(self, node):
+        # this.produtos[i] = valor
+        obj = self.temp()
+        array = self.temp()
+        self.emit(f'if isinstance({obj} := {self.load(node, node.object_name)}, ObjectInstance) '
+                  f'and isinstance({array} := {obj}.get_attribute({node.attr_name!r}), _ARRAYS):')
+        with self._indented():
+            self._store_subscript(array, node.index, node.index2, node.value)
+
+    def _if(self, node):
+        self.emit(f'if {self.condition(node.condition)}:')
+        with self._indented():
+            self.block(node.then_body)
+        if node.else_body:
+            self.emit('else:')
+            with self._indented():
+                self.block(node.else_body)
+
+    def _while(self, node):
+        self.emit(f'while {self.condition(node.condition)}:')
+        with self._indented():
+            self.block(node.body)
+
+    def _for(self, node):
+        self.bind(node, node.var, self.expression(node.init_expr))
+        self.emit(f'while {self.condition(node.condition)}:')
+        with self._indented():
+            self.block(node.body)
+            self.statement(node.increment)
+
+    def _print(self, node):
+        self.emit(f'_print({self.expression(node.expression)})')
+
+    def _input(self, node):
+        prompt = f'str({self.expression(node.prompt)})' if node.prompt else '""'
+        self.store(node, node.identifier, f'_input({prompt}, {node.identifier!r})', update=False)
+
+    def _channel_of(self, node):
+        channel = self.temp()
+        self.emit(f'if ({channel} := {self.load(node, node.channel)}) is None: '
+                  f'{channel} = _implicit_channel({node.channel!r})')
+        return channel
+
+    def _send(self, node):
+        channel = self._channel_of(node)
+        values = ', '.join(self.expression(value) for value in node.values)
+        send = self.awaited(f'{channel}.send_async({values})') if self.coroutines else f'{channel}.send({values})'
+        self.emit(f'if isinstance({channel}, Channel): {send}')
+
+    def _receive(self, node):
+        channel = self._channel_of(node)
+        values = self.temp()
+        method = 'receive_async' if self.coroutines else 'receive'
+        receive = self.awaited(f'{channel}.{method}({len(node.variables)})')
+        self.emit(f'if isinstance({channel}, Channel) and ({values} := {receive}) is not None:')
+        with self._indented():
+            self.emit(f'if not isinstance({values}, tuple): {values} = ({values},)')
+            for position, var in enumerate(node.variables):
+                self.emit(f'if {position} < len({values}):')
+                with self._indented():
+                    if isinstance(var, IdentifierNode):
+                        self.store(var, var.name, f'{values}[{position}]', update=False)
+                    else:
+                        self.emit(f'_G[str(_N[{self.node(var)}])] = {values}[{position}]')
+
+    def _return(self, node):
+        value = self.expression(node.expression)
+        if self.scope.in_function:
+            self.emit(f'return {value}')
+        else:
+            # RETURN fora de uma função: mesmo comportamento do Interpreter
+            self.emit(f'raise ReturnException({value})')
+
+    def _instantiation(self, node):
+        obj = self.temp()
+        self.emit(f'if ({obj} := _new({node.class_name!r})) is not None:')
+        with self._indented():
+            self.bind(node, node.var_name, obj)
+
+    _STATEMENTS = {
+        BlockNode: _block_node,
+        DeclarationNode: _declaration,
+        AssignmentNode: _assignment,
+        ArrayAssignmentNode: _array_assignment,
+        AttributeAssignmentNode: _attribute_assignment,
+        IfNode: _if,
+        WhileNode: _while,
+        ForNode: _for,
+        PrintNode: _print,
+        InputNode: _input,
+        SendNode: _send,
+        ReceiveNode: _receive,
+        ReturnNode: _return,
+        InstantiationNode: _instantiation,
+        ArrayElementAttributeAssignmentNode: _element_attribute_assignment,
+        ObjectAttributeArrayAssignmentNode: _object_attribute_array_assignment,
+    }
+
+    # ------------------- Expressões -------------------
+
+    def expression(self, node):
+        generator = self._EXPRESSIONS.get(node.__class__)
+        if generator is not None:
+            return generator(self, node)
+        return 'None'
+
+    def condition(self, node):
+        if not isinstance(node, ConditionNode):
+            return self.expression(node)
+        left = self.expression(node.left)
+        right = self.expression(node.right)
+        if node.operator in COMPARISONS:
+            return f'({left} {node.operator} {right})'
+        # Operador desconhecido: os dois lados são avaliados e o resultado é falso
+        return f'({left}, {right}, False)[2]'
+
+    def _number(self, node):
+        return repr(literal_value(node))
+
+    def _string(self, node):
+        return repr(str(node.value))
+
+    def _identifier(self, node):
+        return self.load(node, node.name)
+
+    def _binary_op(self, node):
+        left = self.expression(node.left)
+        right = self.expression(node.right)
+        op = node.operator
+        if op in ('-', '*'):
+            return f'({left} {op} {right})'
+        if op == '&&':
+            return f'(bool({left}) & bool({right}))'
+        if op == '||':
+            return f'(bool({left}) | bool({right}))'
+        left_type = node.left.static_type if node.left is not None else None
+        right_type = node.right.static_type if node.right is not None else None
+        operation = f'_op{self.operation(op, left_type, right_type)}'
+        inline = _INLINE_OPS.get((op, left_type, right_type))
+        if inline is None:
+            return f'{operation}({left}, {right})'
+        # Previsão do tipo estático conferida pela classe dos dois valores;
+        # literais numéricos já têm a classe conhecida e não são testados
+        python_op, test, nonzero = inline
+        tests = []
+        operands = []
+        for operand_node, operand in ((node.left, left), (node.right, right)):
+            if isinstance(operand_node, NumberNode):
+                value_class = literal_value(operand_node).__class__
+                if not (value_class in (int, float) if test == 'in _NUMBERS' else value_class is int):
+                    return f'{operation}({left}, {right})'
+                operands.append(operand)
+            else:
+                temp = self.temp()
+                tests.append(f'(({temp} := {operand}).__class__ {test})')
+                operands.append(temp)
+        a, b = operands
+        guard = ' & '.join(tests)
+        if nonzero and not (isinstance(node.right, NumberNode) and literal_value(node.right)):
+            guard = f'{guard} and {b}' if guard else b
+        if not guard:
+            return f'({a} {python_op} {b})'
+        return f'({a} {python_op} {b} if {guard} else {operation}({a}, {b}))'
+
+    def _unary_op(self, node):
+        operand = self.expression(node.operand)
+        if node.operator == '-':
+            return f'(-{operand})'
+        return operand
+
+    def _condition_expression(self, node):
+        # evaluate_expression não avalia ConditionNode (só evaluate_condition)
+        return 'None'
+
+    def _get_attribute(self, obj, attribute):
+        temp = self.temp()
+        return f'({temp}.get_attribute({attribute!r}) if isinstance({temp} := {obj}, ObjectInstance) else None)'
+
+    def _attribute_access(self, node):
+        if isinstance(node.object_name, str):
+            obj = self.load(node, node.object_name)
+        else:
+            obj = self.expression(node.object_name)
+        return self._get_attribute(obj, node.attribute_name)
+
+    def _subscript(self, array, index, index2):
+        temp = self.temp()
+        if index2 is None:
+            return f'({temp}[int({self.expression(index)})] if isinstance({temp} := {array}, _ARRAYS) else None)'
+        return (f'(_item2({temp}, {self.expression(index)}, {self.expression(index2)}) '
+                f'if isinstance({temp} := {array}, _ARRAYS) else None)')
+
+    def _array_access(self, node):
+        if isinstance(node.array_name, str):
+            array = self.load(node, node.array_name)
+        else:
+            array = self.expression(node.array_name)
+        return self._subscript(array, node.index, node.index2)
+
+    def _array_access_with_object(self, node):
+        # this.produtos[i] ou this.obj.arr[i]
+        if not isinstance(node.object_attr_access, AttributeAccessNode):
+            return 'None'
+        return self._subscript(self.expression(node.object_attr_access), node.index, node.index2)
+
+    def _function_call(self, node):
+        arguments = [self.expression(argument) for argument in node.arguments]
+        native = NATIVE_FUNCTIONS.get(node.name.lower())
+        if native is not None:
+            _, minimum, maximum = native
+            if len(arguments) < minimum:
+                return 'None'
+            return f'_{node.name.lower()}({", ".join(arguments[:maximum])})'
+        func = self.functions.get(node.name)
+        if func is None:
+            return 'None'
+        # Só os argumentos que têm parâmetro são avaliados
+        return self.awaited(f'{python_name("f", node.name)}({", ".join(arguments[:len(func.parameters)])})')
+
+    def _call(self, invoke, arity, obj, method_name, arguments):
+        # O método chamado só é conhecido na execução: cada argumento é avaliado
+        # se o método o recebe (_arity diz quantos)
+        if not arguments:
+            return self.awaited(f'{invoke}({obj}, {method_name!r}, 0)')
+        temp = self.temp()
+        count = self.temp()
+        values = ''.join(f', ({self.expression(argument)} if {count} > {position} else None)'
+                         for position, argument in enumerate(arguments))
+        return self.awaited(f'{invoke}({temp} := {obj}, {method_name!r}, '
+                            f'{count} := {arity}({temp}, {method_name!r}, {len(arguments)}){values})')
+
+    def _method_call(self, node):
+        if isinstance(node.object_name, str):
+            obj = self.load(node, node.object_name)
+        else:
+            obj = self.expression(node.object_name)
+        return self._call('_invoke', '_arity', obj, node.method_name, node.arguments)
+
+    def _element_method_call(self, node):
+        return self._call('_invoke_element', '_element_arity', self.expression(node.array_access),
+                          node.method_name, node.arguments)
+
+    def _element_attribute_access(self, node):
+        return self._get_attribute(self.expression(node.array_access), node.attribute_name)
+
+    def _new_expression(self, node):
+        return f'_new({node.class_name!r})'
+
+    _EXPRESSIONS = {
+        NumberNode: _number,
+        StringNode: _string,
+        IdentifierNode: _identifier,
+        BinaryOpNode: _binary_op,
+        UnaryOpNode: _unary_op,
+        ConditionNode: _condition_expression,
+        AttributeAccessNode: _attribute_access,
+        ArrayAccessNode: _array_access,
+        ArrayAccessWithObjectNode: _array_access_with_object,
+        FunctionCallNode: _function_call,
+        MethodCallNode: _method_call,
+        ArrayElementMethodCallNode: _element_method_call,
+        ArrayElementAttributeAccessNode: _element_attribute_access,
+        NewExpressionNode: _new_expression,
+    }
@@ -8,6 +8,7 @@ três operandos, facilitando otimização e geração de código de máquina.
 
 from typing import List, Tuple, Optional, Any
 from parser.AST import *
+from parser.Traversal import NodeVisitor
 
 
 class TACInstruction:
@@ -71,7 +72,7 @@ class TACInstruction:
         return self.__str__()
 
 
-class TACGenerator:
+class TACGenerator(NodeVisitor):
     """Gerador de Código de Três Endereços a partir da AST"""
     
     def __init__(self):
@@ -122,16 +123,8 @@ class TACGenerator:
         
         return self.instructions
     
-    def visit(self, node) -> Optional[str]:
-        """Visita um nó da AST e retorna o temporário com resultado (se houver)"""
-        if node is None:
-            return None
-        
-        # Mapeia tipo do nó para método visitor
-        node_type = type(node).__name__
-        method_name = f'visit_{node_type}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
+    # visit(node) vem de NodeVisitor: despacha para visit_<Classe> e retorna o
+    # temporário com o resultado (se houver)
     
     def generic_visit(self, node):
         """Visitor genérico para nós não implementados"""
@@ -1,10 +1,67 @@
 import re
 from .token_type import TokenType
-from .token import Token
+from .token import Token, SLASH_COMMENT_ERROR
+from .token_buffer import TokenBuffer
+
+
+# ------------------- Tabelas do motor por regex -------------------
+# Expressão mestre: uma única passada sobre o código-fonte. A ordem das
+# alternativas importa ('//' antes de '/', string fechada antes da aberta).
+_MASTER_PATTERN = re.compile(r"""
+      (?P<WS>\s+)
+    | \#(?P<COMMENT>[^\n\0]*)
+    | (?P<SLASH2>//[^\n\0]{0,30})
+    | "(?P<TEXT>[^"\0]*)"
+    | (?P<UNTERMINATED>"[^"\0]*)
+    | (?P<NUMBER>[0-9]+(?:\.[0-9]*)?)
+    | (?P<IDENT>[A-Za-z_]\w*)
+    | (?P<OP>&&|\|\||==|!=|>=|<=|[-+*/%(){}\[\];.,&|=!<>])
+    | (?P<OTHER>.)
+""", re.VERBOSE | re.DOTALL)
+
+# Operadores e símbolos reconhecidos pelo grupo OP
+_OPERATORS = {
+    '&&': TokenType.AND, '&': TokenType.REFERENCE,
+    '||': TokenType.OR, '|': TokenType.UNKNOWN,
+    '==': TokenType.EQ, '=': TokenType.ASSIGN,
+    '!=': TokenType.NEQ, '!': TokenType.UNKNOWN,
+    '>=': TokenType.GTE, '>': TokenType.GT,
+    '<=': TokenType.LTE, '<': TokenType.LT,
+    '/': TokenType.DIV,
+    '+': TokenType.PLUS, '-': TokenType.MINUS, '*': TokenType.MUL,
+    '%': TokenType.MOD,
+    '(': TokenType.LPAREN, ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE, '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET, ']': TokenType.RBRACKET,
+    ';': TokenType.SEMICOLON, '.': TokenType.DOT,
+    ',': TokenType.COMMA,
+}
+
+# Símbolos isolados do scanner caractere a caractere
+_SYMBOLS = {
+    '+': TokenType.PLUS, '-': TokenType.MINUS, '*': TokenType.MUL,
+    '%': TokenType.MOD,
+    '(': TokenType.LPAREN, ')': TokenType.RPAREN,
+    '{': TokenType.LBRACE, '}': TokenType.RBRACE,
+    '[': TokenType.LBRACKET, ']': TokenType.RBRACKET,
+    ';': TokenType.SEMICOLON, '.': TokenType.DOT,
+    ',': TokenType.COMMA,
+}
+
+ENGINES = ('regex', 'scanner')
+
+# Tamanho do bloco lido por Lexer.from_stream()
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class Lexer:
-    def __init__(self, source_code: str):
+    def __init__(self, source_code: str, engine: str = 'regex'):
+        if engine not in ENGINES:
+            raise ValueError(f"Motor léxico desconhecido: '{engine}'. Use um de {ENGINES}")
         self.source = source_code
+        self.engine = engine
+        self._reader = None                # read() do stream em Lexer.from_stream()
+        self.chunk_size = STREAM_CHUNK_SIZE
         self.position = 0
         self.line = 1
         self.column = 1
@@ -65,6 +122,178 @@ class Lexer:
 
     # ------------------- Função principal -------------------
     def tokenize(self):
+        if self.engine == 'regex':
+            return list(self._scan_regex())
+        return self.tokenize_scanner()
+
+    def tokenize_buffer(self):
+        """
+        Tokeniza para um TokenBuffer: tipos, offsets, linhas e colunas ficam
+        em colunas array.array e os lexemas são fatiados do fonte sob demanda,
+        sem criar um objeto Token por token.
+        """
+        if self._reader is not None:
+            # O buffer referencia o fonte completo pelos offsets
+            self.source += self._reader()
+            self._reader = None
+        # Os dois motores produzem os mesmos tokens; só o de regex expõe offsets
+        buffer = TokenBuffer(self.source)
+        buffer.extend_spans(self._scan_spans())
+        return buffer
+
+    def iter_tokens(self):
+        """
+        Versão preguiçosa de tokenize(): gera um token por vez, de modo que o
+        Parser consome enquanto o lexer avança e nenhuma lista é montada.
+        """
+        if self.engine == 'regex':
+            return self._scan_regex()
+        return iter(self.tokenize_scanner())
+
+    @classmethod
+    def from_stream(cls, stream, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Cria um lexer que lê o código de um arquivo ou socket (qualquer objeto
+        com read(n) em modo texto) em blocos de chunk_size caracteres.
+        Use com iter_tokens() para lexar e analisar sem carregar o fonte todo.
+        """
+        lexer = cls('')
+        lexer._reader = stream.read
+        lexer.chunk_size = chunk_size
+        return lexer
+
+    # ------------------- Motor por regex -------------------
+    def _scan_regex(self):
+        """Gera objetos Token a partir dos trechos reconhecidos por _scan_spans()."""
+        error = TokenType.ERROR
+        for type_, start, end, line, col in self._scan_spans():
+            if type_ is error:
+                lexeme = SLASH_COMMENT_ERROR.format(line=line)
+            else:
+                # Relido a cada token: em modo stream o buffer é trocado
+                lexeme = self.source[start:end]
+            yield Token(type_, lexeme, line, col)
+
+    def _scan_spans(self):
+        """
+        Reconhece os tokens numa única passada guiada por _MASTER_PATTERN e
+        gera tuplas (tipo, início, fim, linha, coluna), onde source[início:fim]
+        é o lexema (para ERROR é o trecho '//...' do fonte).
+        Os lexemas são fatiados direto do código-fonte e linha/coluna são
+        atualizadas incrementalmente (só espaços e strings contêm '\\n').
+        Produz exatamente a mesma sequência de tokens do scanner original.
+
+        Em modo stream o buffer guarda apenas o trecho ainda não consumido:
+        um token que encosta no fim do buffer pode continuar no próximo bloco,
+        então o buffer é completado e o token reconhecido de novo.
+        """
+        source = self.source
+        n = len(source)
+        match = _MASTER_PATTERN.match
+        keywords = self.keywords
+        operators = _OPERATORS
+        ident = TokenType.IDENT
+        reader = self._reader
+        base = 0                               # offset absoluto de source[0]
+        pos = self.position
+        line = self.line
+        line_start = pos - (self.column - 1)   # offset do início da linha corrente
+
+        while True:
+            if pos < n:
+                m = match(source, pos)
+                kind = m.lastgroup
+                end = m.end()
+                if kind == 'OTHER' or (kind == 'NUMBER' and end < n and source[end] > '\x7f'):
+                    # Caractere fora das classes ASCII: mesmas regras do scanner
+                    kind = 'UNICODE'
+                    type_, end = self._scan_unicode(source, pos)
+                complete = end < n
+            else:
+                complete = False
+
+            if not complete and reader is not None:
+                chunk = reader(self.chunk_size)
+                if chunk:
+                    base += pos
+                    line_start -= pos
+                    source = self.source = source[pos:] + chunk
+                    n = len(source)
+                    pos = 0
+                    continue
+                reader = self._reader = None
+
+            if pos >= n:
+                break
+
+            if kind == 'WS':
+                newlines = source.count('\n', pos, end)
+                if newlines:
+                    line += newlines
+                    line_start = source.rindex('\n', pos, end) + 1
+                pos = end
+                continue
+
+            col = pos - line_start + 1
+
+            if kind == 'IDENT':
+                yield keywords.get(source[pos:end].lower(), ident), pos, end, line, col
+            elif kind == 'OP':
+                yield operators[m.group(kind)], pos, end, line, col
+            elif kind == 'NUMBER':
+                yield TokenType.NUMBER, pos, end, line, col
+            elif kind == 'TEXT':
+                yield TokenType.TEXT, pos + 1, end - 1, line, col
+                newlines = source.count('\n', pos, end)
+                if newlines:
+                    line += newlines
+                    line_start = source.rindex('\n', pos, end) + 1
+            elif kind == 'COMMENT':
+                yield TokenType.COMMENT, pos + 1, end, line, col
+            elif kind == 'SLASH2':
+                yield TokenType.ERROR, pos, end, line, col
+            elif kind == 'UNTERMINATED':
+                yield TokenType.UNKNOWN, pos, end, line, col
+                newlines = source.count('\n', pos, end)
+                if newlines:
+                    line += newlines
+                    line_start = source.rindex('\n', pos, end) + 1
+                pos = end
+                break
+            else:
+                yield type_, pos, end, line, col
+            pos = end
+
+        self.position = base + pos
+        self.line = line
+        self.column = pos - line_start + 1
+        yield TokenType.EOF, pos, pos, self.line, self.column
+
+    def _scan_unicode(self, source, pos):
+        """
+        Reconhece um número, identificador ou símbolo a partir de pos usando
+        isdigit()/isalpha()/isalnum(), como o scanner caractere a caractere.
+        Retorna (tipo, fim).
+        """
+        n = len(source)
+        char = source[pos]
+        end = pos + 1
+        if char.isdigit():
+            while end < n and source[end].isdigit():
+                end += 1
+            if end < n and source[end] == '.':
+                end += 1
+                while end < n and source[end].isdigit():
+                    end += 1
+            return TokenType.NUMBER, end
+        if char.isalpha() or char == '_':
+            while end < n and (source[end].isalnum() or source[end] == '_'):
+                end += 1
+            return self.keywords.get(source[pos:end].lower(), TokenType.IDENT), end
+        return TokenType.UNKNOWN, end
+
+    # ------------------- Scanner caractere a caractere -------------------
+    def tokenize_scanner(self):
         tokens = []
 
         while self.position < len(self.source):
@@ -96,7 +325,7 @@ class Lexer:
                     while self.peek() != '\n' and self.peek() != '\0' and len(error_preview) < 30:
                         error_preview += self.advance()
                     # Criar token de erro com mensagem clara
-                    error_msg = f"Comentário '//' não suportado. Use '#' para comentários. Linha {start_line}"
+                    error_msg = SLASH_COMMENT_ERROR.format(line=start_line)
                     self.add_token(tokens, TokenType.ERROR, error_msg, start_line, start_col)
                     continue
                 # É apenas divisão
@@ -183,18 +412,8 @@ class Lexer:
                 continue
 
             # ------------------- Símbolos isolados -------------------
-            symbols = {
-                '+': TokenType.PLUS, '-': TokenType.MINUS, '*': TokenType.MUL,
-                '%': TokenType.MOD,
-                '(': TokenType.LPAREN, ')': TokenType.RPAREN,
-                '{': TokenType.LBRACE, '}': TokenType.RBRACE,
-                '[': TokenType.LBRACKET, ']': TokenType.RBRACKET,
-                ';': TokenType.SEMICOLON, '.': TokenType.DOT,
-                ',': TokenType.COMMA,
-            }
-
-            if char in symbols:
-                self.add_token(tokens, symbols[char], char, start_line, start_col)
+            if char in _SYMBOLS:
+                self.add_token(tokens, _SYMBOLS[char], char, start_line, start_col)
             else:
                 self.add_token(tokens, TokenType.UNKNOWN, char, start_line, start_col)
 
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 from .token_type import TokenType
 
+# Mensagem do token ERROR emitido para comentários no estilo '//'
+SLASH_COMMENT_ERROR = "Comentário '//' não suportado. Use '#' para comentários. Linha {line}"
+
 @dataclass
 class Token:
     """
@@ -0,0 +1,141 @@
+import json
+from array import array
+from json.encoder import encode_basestring, encode_basestring_ascii
+
+from .token_type import TokenType
+from .token import Token, SLASH_COMMENT_ERROR
+
+# Tipo do token indexado pelo código guardado na coluna `types`
+_TYPE_BY_CODE = [None] * (max(t.value for t in TokenType) + 1)
+for _type in TokenType:
+    _TYPE_BY_CODE[_type.value] = _type
+
+# Campos exportados por padrão em to_json() (chave JSON -> campo do token)
+DEFAULT_JSON_FIELDS = {'type': 'type', 'lexeme': 'lexeme', 'line': 'line', 'column': 'column'}
+
+
+class TokenBuffer:
+    """
+    Armazenamento compacto de tokens em colunas array.array.
+
+    Cada token ocupa um código de tipo (1 byte), offsets de início/fim do
+    lexema no fonte e sua linha/coluna. O lexema não é guardado: é fatiado
+    de `source` apenas quando pedido. Iterar o buffer gera objetos Token
+    sob demanda, então ele pode ser entregue diretamente ao Parser.
+    """
+
+    __slots__ = ('source', 'types', 'starts', 'ends', 'lines', 'columns')
+
+    def __init__(self, source: str):
+        self.source = source
+        self.types = array('B')    # TokenType.value
+        self.starts = array('q')   # Offset inicial do lexema
+        self.ends = array('q')     # Offset final (exclusivo) do lexema
+        self.lines = array('i')
+        self.columns = array('i')
+
+    # ------------------- Construção -------------------
+    def append(self, type_, start, end, line, column):
+        self.types.append(type_._value_)
+        self.starts.append(start)
+        self.ends.append(end)
+        self.lines.append(line)
+        self.columns.append(column)
+
+    def extend_spans(self, spans):
+        """Adiciona tuplas (tipo, início, fim, linha, coluna) do Lexer."""
+        types, starts, ends = self.types.append, self.starts.append, self.ends.append
+        lines, columns = self.lines.append, self.columns.append
+        for type_, start, end, line, column in spans:
+            types(type_._value_)
+            starts(start)
+            ends(end)
+            lines(line)
+            columns(column)
+
+    # ------------------- Acesso -------------------
+    def __len__(self):
+        return len(self.types)
+
+    def type_at(self, index):
+        return _TYPE_BY_CODE[self.types[index]]
+
+    def lexeme(self, index):
+        """Lexema do token, fatiado do fonte (ERROR recebe a mensagem do lexer)."""
+        if self.types[index] == TokenType.ERROR.value:
+            return SLASH_COMMENT_ERROR.format(line=self.lines[index])
+        return self.source[self.starts[index]:self.ends[index]]
+
+    def lexemes(self):
+        """Lista com o lexema de cada token."""
+        source = self.source
+        error = TokenType.ERROR.value
+        return [
+            SLASH_COMMENT_ERROR.format(line=line) if code == error else source[start:end]
+            for code, start, end, line in zip(self.types, self.starts, self.ends, self.lines)
+        ]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self.types)
+        return Token(self.type_at(index), self.lexeme(index), self.lines[index], self.columns[index])
+
+    def __iter__(self):
+        """Gera objetos Token um a um (para o Parser ou código legado)."""
+        source = self.source
+        error = TokenType.ERROR.value
+        for code, start, end, line, column in zip(self.types, self.starts, self.ends, self.lines, self.columns):
+            if code == error:
+                lexeme = SLASH_COMMENT_ERROR.format(line=line)
+            else:
+                lexeme = source[start:end]
+            yield Token(_TYPE_BY_CODE[code], lexeme, line, column)
+
+    def errors(self):
+        """Mensagens dos tokens ERROR, na ordem em que aparecem."""
+        error = TokenType.ERROR.value
+        return [
+            SLASH_COMMENT_ERROR.format(line=self.lines[i])
+            for i, code in enumerate(self.types) if code == error
+        ]
+
+    # ------------------- Exportação JSON -------------------
+    def to_json(self, fields=None, ensure_ascii=True):
+        """
+        Serializa todos os tokens como um array JSON de objetos, sem montar
+        um dict por token. `fields` mapeia a chave JSON para o campo do
+        token: 'type', 'lexeme', 'line', 'column', 'start' ou 'end'.
+        """
+        fields = fields or DEFAULT_JSON_FIELDS
+        encode = encode_basestring_ascii if ensure_ascii else encode_basestring
+        template = '{' + ','.join(f'{encode(key)}: %s' for key in fields) + '}'
+        columns = [self._json_column(field, encode) for field in fields.values()]
+        return '[' + ', '.join(template % row for row in zip(*columns)) + ']'
+
+    def _json_column(self, field, encode):
+        if field == 'type':
+            names = [None if t is None else encode(t.name) for t in _TYPE_BY_CODE]
+            return [names[code] for code in self.types]
+        if field == 'lexeme':
+            return [encode(lexeme) for lexeme in self.lexemes()]
+        if field == 'line':
+            return self.lines
+        if field == 'column':
+            return self.columns
+        if field == 'start':
+            return self.starts
+        if field == 'end':
+            return self.ends
+        raise ValueError(f"Campo de token desconhecido: '{field}'")
+
+
+def dumps_with_raw(obj, raw_fields, **kwargs):
+    """
+    json.dumps(obj) acrescentando campos cujo valor já é JSON pronto (por
+    exemplo TokenBuffer.to_json()), sem decodificar e serializar de novo.
+    """
+    rest = json.dumps({k: v for k, v in obj.items() if k not in raw_fields}, **kwargs)
+    raw = ', '.join(f'{json.dumps(key)}: {value}' for key, value in raw_fields.items())
+    if rest == '{}':
+        return '{' + raw + '}'
+    return '{' + raw + ', ' + rest[1:]
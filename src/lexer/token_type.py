@@ -1,6 +1,10 @@
 from enum import Enum, auto
 
 class TokenType(Enum):
+    # Hash por identidade (em C): membros são únicos, e o hash padrão de
+    # Enum, em Python, pesa nas tabelas de despacho do parser
+    __hash__ = object.__hash__
+
     # Palavras-chave
     CLASS = auto()
     EXTENDS = auto()
@@ -8,10 +8,13 @@ sys.path.insert(0, os.path.dirname(__file__))
 from lexer.Lexer import Lexer
 from parser.Parser import Parser
 from parser.AST import DeclarationNode
-from runtime.Interpreter import Interpreter
+from runtime.engines import ENGINES, create_interpreter, default_engine
+from runtime.VirtualMachine import CallStackOverflow
+from runtime.ProcessPar import PAR_BACKENDS
 from utils.ast_printer import print_ast
 import semantic.SemanticAnalyzer as Sa
 from codegen.TACGenerator import TACGenerator
+from cache.ProgramCache import ProgramCache
 
 
 def print_tokens(tokens):
@@ -27,7 +30,7 @@ def print_tokens(tokens):
 
 def main():
     if len(sys.argv) < 2:
-        print("Uso: python main.py <arquivo.minipar> [--show-tokens] [--show-ast] [--show-symbols] [--emit-tac] [--save-tac <arquivo>]")
+        print("Uso: python main.py <arquivo.minipar> [--show-tokens] [--show-ast] [--show-positions] [--show-symbols] [--emit-tac] [--save-tac <arquivo>] [--emit-python] [--no-optimize] [--show-optimizations] [--no-cache] [--engine <tree|closure|vm|python|async>] [--max-depth <n>] [--par <thread|process>]")
         sys.exit(1)
     
     file_path = sys.argv[1]
@@ -35,7 +38,13 @@ def main():
     show_ast_flag = "--show-ast" in sys.argv
     show_symbols = "--show-symbols" in sys.argv
     emit_tac = "--emit-tac" in sys.argv
+    emit_python = "--emit-python" in sys.argv
     save_tac = None
+    cache = ProgramCache.from_environment()
+    if "--no-cache" in sys.argv:
+        cache.enabled = False
+    # Otimização da AST (ASTOptimizer) ligada por padrão
+    cache.optimize = "--no-optimize" not in sys.argv
     
     # Verifica se deve salvar TAC em arquivo
     if "--save-tac" in sys.argv:
@@ -47,6 +56,37 @@ def main():
             print("Error: --save-tac requires a filename")
             sys.exit(1)
     
+    # Modo de execução: percurso da AST (tree), closures compiladas (closure)
+    # bytecode (vm), código Python gerado (python) ou gerado com corrotinas (async)
+    engine = None
+    if "--engine" in sys.argv:
+        idx = sys.argv.index("--engine")
+        if idx + 1 >= len(sys.argv) or sys.argv[idx + 1] not in ENGINES:
+            print(f"Error: --engine requires one of: {', '.join(ENGINES)}")
+            sys.exit(1)
+        engine = sys.argv[idx + 1]
+    
+    # Profundidade máxima de chamadas MiniPar aninhadas (só no modo vm, que
+    # guarda as chamadas em uma pilha própria)
+    engine_options = {}
+    if "--max-depth" in sys.argv:
+        idx = sys.argv.index("--max-depth")
+        if idx + 1 >= len(sys.argv) or not sys.argv[idx + 1].isdigit() or int(sys.argv[idx + 1]) < 1:
+            print("Error: --max-depth requires a positive integer")
+            sys.exit(1)
+        if (engine or default_engine()) != 'vm':
+            print("Error: --max-depth requires --engine vm")
+            sys.exit(1)
+        engine_options['max_call_depth'] = int(sys.argv[idx + 1])
+    
+    # Comandos do PAR em threads (padrão) ou em processos filhos
+    if "--par" in sys.argv:
+        idx = sys.argv.index("--par")
+        if idx + 1 >= len(sys.argv) or sys.argv[idx + 1] not in PAR_BACKENDS:
+            print(f"Error: --par requires one of: {', '.join(PAR_BACKENDS)}")
+            sys.exit(1)
+        engine_options['par_backend'] = sys.argv[idx + 1]
+    
     # Parse optional channel mappings from CLI:
     # --channel-bind name=host:port   (can repeat)
     # --channel-connect name=host:port (can repeat)
@@ -84,14 +124,17 @@ def main():
         source_code = f.read()
     
     try:
-        lexer = Lexer(source_code)
-        tokens = lexer.tokenize()
-        
         if show_tokens_flag:
-            print_tokens(tokens)
+            print_tokens(Lexer(source_code).tokenize())
         
-        parser = Parser(tokens)
-        ast = parser.parse()
+        # AST (e TAC, se já gerado antes) vêm do cache .miniparc quando o
+        # fonte e o compilador não mudaram
+        program = cache.compile(source_code)
+        ast = program.ast
+        # A análise anota o tipo estático das expressões (static_type), que o
+        # interpretador usa para especializar as operações; os erros não são
+        # mostrados aqui
+        program.semantic_report()
         # analyzer = Sa.SemanticAnalyzer()
         # errors = analyzer.analyze(ast)
         # if errors:
@@ -106,13 +149,12 @@ def main():
             print("=" * 50)
             print("ÁRVORE DE SINTAXE ABSTRATA (AST)")
             print("=" * 50)
-            print_ast(ast)
+            print_ast(ast, show_positions="--show-positions" in sys.argv)
             print()
         
         # Gera TAC se solicitado
         if emit_tac or save_tac:
-            tac_gen = TACGenerator()
-            tac_gen.generate(ast)
+            tac_gen = program.tac_generator()
             
             if emit_tac:
                 tac_gen.print_tac()
@@ -120,6 +162,24 @@ def main():
             if save_tac:
                 tac_gen.save_to_file(save_tac)
         
+        # AST executada: otimizada (a menos que --no-optimize), também do cache
+        executable_ast = program.executable_ast()
+        if "--show-optimizations" in sys.argv and program.optimization is not None:
+            print(program.optimization)
+        
+        # O bytecode da VirtualMachine e o código Python gerado também vêm do cache
+        selected_engine = engine or default_engine()
+        if emit_python:
+            program.python_program().print_source()
+        compiled = None
+        if selected_engine == 'vm':
+            compiled = program.bytecode()
+        elif selected_engine == 'python':
+            compiled = program.python_program()
+        
+        # Grava antes de executar: o programa em execução não entra no cache
+        cache.save(program)
+        
         # If program declares channels, offer an interactive prompt per channel
         # asking whether this machine will RECEIVE (bind/listen) or SEND (connect).
         # Only offer interactive network role prompts if the channel declaration
@@ -170,8 +230,11 @@ def main():
         print("=" * 50)
         print("EXECUÇÃO")
         print("=" * 50)
-        interpreter = Interpreter(channel_bind=channel_bind, channel_connect=channel_connect, node_id=node_id, channel_map=channel_map)
-        interpreter.interpret(ast)
+        interpreter = create_interpreter(engine, channel_bind=channel_bind, channel_connect=channel_connect, node_id=node_id, channel_map=channel_map, **engine_options)
+        if compiled is not None:
+            interpreter.execute(compiled)
+        else:
+            interpreter.interpret(executable_ast)
         print()
 
         if show_symbols:
@@ -181,6 +244,10 @@ def main():
             interpreter.symbol_table.print_table()
             print()
 
+    except CallStackOverflow as e:
+        # Erro do programa MiniPar: o traceback do Python não ajuda
+        print(f"\nErro: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"Erro: {e}")
         import traceback
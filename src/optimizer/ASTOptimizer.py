@@ -0,0 +1,352 @@
+# ============================================================================
+# ASTOptimizer.py - Otimização da AST antes da Execução
+# ============================================================================
+# Gerenciador de passagens que reescreve a AST já analisada (com static_type)
+# antes de ela ir para o interpretador ou para os geradores de código. Cada
+# passagem é um NodeTransformer que conta os nós que reescreveu:
+#
+# - literals: troca o texto de cada NumberNode ('3', '2.5') pelo int/float
+#   correspondente, uma vez, em vez de a cada avaliação
+# - fold: calcula operações entre constantes (2 * 3 + 1 -> 7, "a" + 1 -> "a1")
+# - propagate: troca a leitura de variáveis globais declaradas uma única vez
+#   com valor constante e nunca mais escritas pelo próprio valor
+# - dead-code: remove if/while com condição constante falsa (ou mantém só o
+#   ramo escolhido) e comandos depois de um return no mesmo bloco
+#
+# Toda reescrita mantém a saída do programa: operações que levantariam erro
+# (divisão por zero, tipos incompatíveis) não são calculadas, comparações
+# dentro de expressões (que o interpretador avalia como None) não são
+# tratadas como constantes, e cada comando de um PAR continua sendo uma
+# thread. As passagens repetem até nenhuma reescrever mais nada (ou
+# MAX_ROUNDS rodadas), já que uma propagação pode permitir um novo cálculo.
+# ============================================================================
+
+from parser.AST import *
+from parser.Traversal import NodeTransformer, walk
+from runtime.Resolver import NAME_FIELDS
+from runtime.typed_ops import COMPARISONS, apply_binary_op, literal_value
+
+
+MAX_ROUNDS = 4
+
+# Resultado de constant_value para expressões que não são constantes
+NOT_CONSTANT = object()
+
+# Operadores calculados em tempo de compilação ('&&' e '||' dão bool, que não
+# tem literal na linguagem)
+_FOLDABLE_OPERATORS = ('+', '-', '*', '/', '%')
+
+# Nós que executam código do programa quando avaliados
+_CALL_NODES = (FunctionCallNode, MethodCallNode, ArrayElementMethodCallNode, NewExpressionNode)
+
+
+def constant_value(node):
+    """Valor de um literal (NumberNode/StringNode), ou NOT_CONSTANT."""
+    if node.__class__ is NumberNode:
+        return literal_value(node)
+    if node.__class__ is StringNode:
+        return str(node.value)
+    return NOT_CONSTANT
+
+
+def condition_value(node):
+    """Valor de uma condição de if/while se ela é constante, ou NOT_CONSTANT."""
+    if node.__class__ is ConditionNode:
+        left = constant_value(node.left)
+        right = constant_value(node.right)
+        if left is NOT_CONSTANT or right is NOT_CONSTANT:
+            return NOT_CONSTANT
+        comparison = COMPARISONS.get(node.operator)
+        if comparison is None:
+            return False
+        try:
+            return comparison(left, right)
+        except TypeError:
+            return NOT_CONSTANT
+    if node.__class__ is BinaryOpNode and node.operator in ('&&', '||'):
+        left = constant_value(node.left)
+        right = constant_value(node.right)
+        if left is NOT_CONSTANT or right is NOT_CONSTANT:
+            return NOT_CONSTANT
+        return apply_binary_op(left, node.operator, right)
+    return constant_value(node)
+
+
+def constant_node(value, original):
+    """Literal com value no lugar de original (mesma posição no fonte), ou None."""
+    if value.__class__ is int or value.__class__ is float:
+        node = NumberNode(value)
+        node.static_type = 'int' if value.__class__ is int else 'float'
+    elif value.__class__ is str:
+        node = StringNode(value)
+        node.static_type = 'string'
+    else:
+        return None
+    if original.line is not None:
+        node.set_span(*original.span)
+    return node
+
+
+class OptimizationPass(NodeTransformer):
+    """Passagem do ASTOptimizer: run(program) reescreve e retorna quantos nós mudou."""
+
+    name = None
+
+    def __init__(self):
+        self.rewritten = 0
+
+    def run(self, program):
+        self.rewritten = 0
+        self.visit(program)
+        return self.rewritten
+
+    def visit_AttributeNode(self, node):
+        # Tamanhos de arrays de atributos são lidos direto do nó pelo
+        # ObjectInstance, sem avaliar a expressão: ficam como estão
+        return node
+
+
+class LiteralDecoding(OptimizationPass):
+    """Texto dos NumberNode -> int/float."""
+
+    name = 'literals'
+
+    def visit_NumberNode(self, node):
+        if node.value.__class__ is not int and node.value.__class__ is not float:
+            node.value = literal_value(node)
+            self.rewritten += 1
+        return node
+
+
+class ConstantFolding(OptimizationPass):
+    """Operações aritméticas e concatenações entre literais."""
+
+    name = 'fold'
+
+    def visit_BinaryOpNode(self, node):
+        self.generic_visit(node)
+        if node.operator not in _FOLDABLE_OPERATORS:
+            return node
+        left = constant_value(node.left)
+        right = constant_value(node.right)
+        if left is NOT_CONSTANT or right is NOT_CONSTANT:
+            return node
+        if node.operator == '*' and (left.__class__ is str or right.__class__ is str):
+            # "abc" * n poderia gerar uma string enorme na compilação
+            return node
+        try:
+            value = apply_binary_op(left, node.operator, right)
+        except (ArithmeticError, TypeError, ValueError):
+            # O erro continua acontecendo na execução
+            return node
+        folded = constant_node(value, node)
+        if folded is None:
+            return node
+        self.rewritten += 1
+        return folded
+
+    def visit_UnaryOpNode(self, node):
+        self.generic_visit(node)
+        if node.operator != '-':
+            return node
+        value = constant_value(node.operand)
+        if value.__class__ is not int and value.__class__ is not float:
+            return node
+        self.rewritten += 1
+        return constant_node(-value, node)
+
+
+class ConstantPropagation(OptimizationPass):
+    """
+    Leituras de variáveis globais constantes. Uma variável é constante se é
+    declarada uma única vez, no topo do programa, com um literal, e nenhum
+    outro nó escreve (ou usa como objeto, array ou canal) o seu nome. As
+    declarações do topo executam antes de tudo (collect_definitions), mas em
+    ordem: as anteriores à variável não podem lê-la nem chamar funções.
+    """
+
+    name = 'propagate'
+
+    def __init__(self):
+        super().__init__()
+        self.constants = {}
+
+    def run(self, program):
+        self.constants = self.find_constants(program)
+        if not self.constants:
+            return 0
+        return super().run(program)
+
+    def find_constants(self, program):
+        """Nome -> valor das variáveis que podem ser propagadas."""
+        candidates = {}
+        blocked = set()
+        for node in program.children:
+            if node.__class__ is not DeclarationNode:
+                continue
+            if (not node.is_array and not node.is_2d_array and node.initial_value is not None
+                    and node.type_name.lower() != 'c_channel'):
+                value = constant_value(node.initial_value)
+                if value is not NOT_CONSTANT and node.identifier not in blocked:
+                    candidates.setdefault(node.identifier, (node, value))
+            # Declarações seguintes só são seguras se esta não executa código
+            # nem lê um nome ainda não declarado
+            for child in walk(node):
+                if isinstance(child, _CALL_NODES):
+                    return self._never_written(program, candidates)
+                if child.__class__ is IdentifierNode:
+                    blocked.add(child.name)
+        return self._never_written(program, candidates)
+
+    def _never_written(self, program, candidates):
+        if not candidates:
+            return {}
+        uses = {}
+        for node in walk(program):
+            if node.__class__ is IdentifierNode:
+                continue
+            field = NAME_FIELDS.get(node.__class__)
+            if field is not None:
+                name = getattr(node, field)
+                if isinstance(name, str):
+                    uses[name] = uses.get(name, 0) + 1
+            if node.__class__ is ReceiveNode:
+                for var in node.variables:
+                    name = var.name if isinstance(var, IdentifierNode) else str(var)
+                    uses[name] = uses.get(name, 0) + 1
+            elif isinstance(node, (FunctionNode, MethodNode)):
+                for _, name in node.parameters:
+                    uses[name] = uses.get(name, 0) + 1
+        # A única ocorrência permitida é a própria declaração
+        return {name: value for name, (_, value) in candidates.items() if uses.get(name, 0) == 1}
+
+    def visit_IdentifierNode(self, node):
+        if node.name in self.constants:
+            self.rewritten += 1
+            return constant_node(self.constants[node.name], node)
+        return node
+
+    def visit_ReceiveNode(self, node):
+        # As variáveis de receive são escritas, não leituras
+        return node
+
+
+class DeadCodeElimination(OptimizationPass):
+    """
+    if/while com condição constante e comandos depois de um return. Os
+    ramos mantidos entram no lugar do if; no topo do programa e em um PAR
+    (onde cada comando é uma thread) eles ficam juntos em um bloco SEQ.
+    """
+
+    name = 'dead-code'
+
+    def statements(self, statements, sequential):
+        """Lista de comandos otimizada; sequential=False no topo e em PAR."""
+        result = []
+        for index, stmt in enumerate(statements):
+            new = self.visit(stmt)
+            if new is None:
+                continue
+            if isinstance(new, list):
+                if sequential:
+                    result.extend(new)
+                else:
+                    block = BlockNode('seq', new)
+                    if stmt.line is not None:
+                        block.set_span(*stmt.span)
+                    result.append(block)
+            else:
+                result.append(new)
+            if sequential and result and result[-1].__class__ is ReturnNode:
+                # O restante do bloco nunca executa
+                self.rewritten += len(statements) - index - 1
+                break
+        statements[:] = result
+        return statements
+
+    def visit_ProgramNode(self, node):
+        self.statements(node.children, sequential=False)
+        return node
+
+    def visit_FunctionNode(self, node):
+        self.statements(node.body, sequential=True)
+        return node
+
+    visit_MethodNode = visit_FunctionNode
+
+    def visit_BlockNode(self, node):
+        self.statements(node.statements, sequential=node.block_type != 'par')
+        return node
+
+    def visit_IfNode(self, node):
+        self.statements(node.then_body, sequential=True)
+        if node.else_body:
+            self.statements(node.else_body, sequential=True)
+        condition = condition_value(node.condition)
+        if condition is NOT_CONSTANT:
+            return node
+        self.rewritten += 1
+        kept = node.then_body if condition else node.else_body
+        return kept or None
+
+    def visit_WhileNode(self, node):
+        self.statements(node.body, sequential=True)
+        condition = condition_value(node.condition)
+        if condition is NOT_CONSTANT or condition:
+            return node
+        self.rewritten += 1
+        return None
+
+    def visit_ForNode(self, node):
+        # A inicialização sempre executa (e cria a variável): só o corpo muda
+        self.statements(node.body, sequential=True)
+        return node
+
+
+# Passagens disponíveis, na ordem padrão
+PASSES = {
+    LiteralDecoding.name: LiteralDecoding,
+    ConstantFolding.name: ConstantFolding,
+    ConstantPropagation.name: ConstantPropagation,
+    DeadCodeElimination.name: DeadCodeElimination,
+}
+
+
+class OptimizationReport:
+    """Quantos nós cada passagem reescreveu."""
+    __slots__ = ('counts',)
+
+    def __init__(self, names):
+        self.counts = dict.fromkeys(names, 0)
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def __str__(self):
+        details = ', '.join(f'{name}: {count}' for name, count in self.counts.items())
+        return f"Otimização: {self.total} nó(s) reescrito(s) ({details})"
+
+
+class ASTOptimizer:
+    """Executa as passagens escolhidas (nomes de PASSES) sobre a AST."""
+
+    def __init__(self, passes=None):
+        names = list(PASSES) if passes is None else list(passes)
+        for name in names:
+            if name not in PASSES:
+                raise ValueError(f"Passagem de otimização desconhecida: '{name}' (disponíveis: {', '.join(PASSES)})")
+        self.passes = [PASSES[name]() for name in names]
+
+    def optimize(self, program):
+        """Reescreve program (ProgramNode) no lugar e retorna o OptimizationReport."""
+        report = OptimizationReport(optimization_pass.name for optimization_pass in self.passes)
+        for _ in range(MAX_ROUNDS):
+            rewritten = 0
+            for optimization_pass in self.passes:
+                count = optimization_pass.run(program)
+                report.counts[optimization_pass.name] += count
+                rewritten += count
+            if rewritten == 0:
+                break
+        return report
@@ -0,0 +1,7 @@
+"""
+Módulo de otimização da AST para MiniPar
+"""
+
+from .ASTOptimizer import ASTOptimizer, OptimizationReport, PASSES
+
+__all__ = ['ASTOptimizer', 'OptimizationReport', 'PASSES']
@@ -3,27 +3,76 @@
 # ============================================================================
 # Define todos os nós da AST que representam as construções da linguagem MiniPar.
 # Cada nó armazena informações sobre uma estrutura sintática específica.
+#
+# Os nós usam __slots__ (sem __dict__ por instância) e cada classe lista seus
+# campos em _fields, na ordem do construtor. Todo nó pode ainda carregar a
+# posição que ocupa no fonte: (line, col, end_line, end_col), com colunas
+# começando em 1 como nos tokens e end_col logo após o último caractere.
+# Passagens posteriores (ex.: a análise semântica) anotam os nós nos campos
+# de ANNOTATION_FIELDS.
 # ============================================================================
 
+# Campos de posição presentes em todos os nós
+SPAN_FIELDS = ('line', 'col', 'end_line', 'end_col')
+
+# Anotações de passagens sobre a AST:
+# - static_type: tipo inferido de uma expressão ('int', 'float', 'string',
+#   'bool', 'array' ou o nome da classe), None se desconhecido
+# - slot: índice da variável no frame da função/método que contém o nó
+#   (runtime/Resolver.py), None se o nome só pode ser global
+ANNOTATION_FIELDS = ('static_type', 'slot')
+
+_OPTIONAL_FIELDS = frozenset(SPAN_FIELDS + ANNOTATION_FIELDS)
+
+
 class ASTNode:
     """Classe base para todos os nós da AST."""
-    pass
+    __slots__ = SPAN_FIELDS + ANNOTATION_FIELDS
+    _fields = ()
+
+    def __getattr__(self, name):
+        # Só é chamado para atributos ausentes: posição ou anotação não
+        # atribuída vale None
+        if name in _OPTIONAL_FIELDS:
+            return None
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def span(self):
+        """Tupla (line, col, end_line, end_col) ou None se o nó não tem posição."""
+        if self.line is None:
+            return None
+        return (self.line, self.col, self.end_line, self.end_col)
+
+    def set_span(self, line, col, end_line, end_col):
+        """Define a posição do nó no fonte e retorna o próprio nó."""
+        self.line = line
+        self.col = col
+        self.end_line = end_line
+        self.end_col = end_col
+        return self
 
 
 class ProgramNode(ASTNode):
     """Nó raiz do programa - contém todas as classes, funções e blocos."""
+    __slots__ = _fields = ('children',)
+
     def __init__(self):
         self.children = []  # Lista de nós filhos (classes, funções, blocos)
 
 
 class CommentNode(ASTNode):
     """Representa um comentário no código."""
+    __slots__ = _fields = ('text',)
+
     def __init__(self, text):
         self.text = text  # Texto do comentário
 
 
 class ClassNode(ASTNode):
     """Representa uma definição de classe com herança opcional."""
+    __slots__ = _fields = ('name', 'parent', 'attributes', 'methods')
+
     def __init__(self, name, parent, attributes, methods):
         self.name = name              # Nome da classe
         self.parent = parent          # Nome da classe pai (ou None)
@@ -33,6 +82,8 @@ class ClassNode(ASTNode):
 
 class AttributeNode(ASTNode):
     """Representa um atributo de classe (pode ser array 1D ou 2D)."""
+    __slots__ = _fields = ('type_name', 'name', 'is_array', 'array_size', 'is_2d_array', 'array_dimensions')
+
     def __init__(self, type_name, name, is_array=False, array_size=None, is_2d_array=False, array_dimensions=None):
         self.type_name = type_name           # Tipo do atributo (int, real, string, etc.)
         self.name = name                     # Nome do atributo
@@ -44,6 +95,8 @@ class AttributeNode(ASTNode):
 
 class MethodNode(ASTNode):
     """Representa um método dentro de uma classe."""
+    __slots__ = _fields = ('return_type', 'name', 'parameters', 'body')
+
     def __init__(self, return_type, name, parameters, body):
         self.return_type = return_type  # Tipo de retorno do método
         self.name = name                # Nome do método
@@ -53,6 +106,8 @@ class MethodNode(ASTNode):
 
 class FunctionNode(ASTNode):
     """Representa uma função global (fora de classes)."""
+    __slots__ = _fields = ('return_type', 'name', 'parameters', 'body')
+
     def __init__(self, return_type, name, parameters, body):
         self.return_type = return_type  # Tipo de retorno da função
         self.name = name                # Nome da função
@@ -62,6 +117,8 @@ class FunctionNode(ASTNode):
 
 class BlockNode(ASTNode):
     """Representa um bloco SEQ (sequencial) ou PAR (paralelo)."""
+    __slots__ = _fields = ('block_type', 'statements')
+
     def __init__(self, block_type, statements):
         self.block_type = block_type  # "seq" ou "par"
         self.statements = statements  # Lista de statements a executar
@@ -69,6 +126,8 @@ class BlockNode(ASTNode):
 
 class AssignmentNode(ASTNode):
     """Representa uma atribuição simples: var = expressão."""
+    __slots__ = _fields = ('identifier', 'expression')
+
     def __init__(self, identifier, expression):
         self.identifier = identifier  # Nome da variável
         self.expression = expression  # Expressão a atribuir
@@ -76,6 +135,8 @@ class AssignmentNode(ASTNode):
 
 class IfNode(ASTNode):
     """Representa uma estrutura IF-ELSE."""
+    __slots__ = _fields = ('condition', 'then_body', 'else_body')
+
     def __init__(self, condition, then_body, else_body=None):
         self.condition = condition    # Condição a avaliar
         self.then_body = then_body    # Statements do bloco IF
@@ -84,6 +145,8 @@ class IfNode(ASTNode):
 
 class WhileNode(ASTNode):
     """Representa um loop WHILE."""
+    __slots__ = _fields = ('condition', 'body')
+
     def __init__(self, condition, body):
         self.condition = condition  # Condição do loop
         self.body = body            # Statements do corpo do loop
@@ -91,6 +154,8 @@ class WhileNode(ASTNode):
 
 class ForNode(ASTNode):
     """Representa um loop FOR com inicialização, condição e incremento."""
+    __slots__ = _fields = ('var', 'init_expr', 'condition', 'increment', 'body')
+
     def __init__(self, var, init_expr, condition, increment, body):
         self.var = var                # Variável de controle
         self.init_expr = init_expr    # Expressão de inicialização
@@ -101,6 +166,8 @@ class ForNode(ASTNode):
 
 class InstantiationNode(ASTNode):
     """Representa a criação de um objeto: TipoVar nome = new Classe()."""
+    __slots__ = _fields = ('type_name', 'var_name', 'class_name')
+
     def __init__(self, type_name, var_name, class_name):
         self.type_name = type_name    # Tipo da variável
         self.var_name = var_name      # Nome da variável
@@ -109,12 +176,16 @@ class InstantiationNode(ASTNode):
 
 class NewExpressionNode(ASTNode):
     """Representa uma expressão 'new Classe()' (criação inline de objeto)."""
+    __slots__ = _fields = ('class_name',)
+
     def __init__(self, class_name):
         self.class_name = class_name  # Nome da classe a instanciar
 
 
 class ArrayElementMethodCallNode(ASTNode):
     """Representa chamada de método em elemento de array: arr[i].metodo()."""
+    __slots__ = _fields = ('array_access', 'method_name', 'arguments')
+
     def __init__(self, array_access, method_name, arguments=None):
         self.array_access = array_access  # Nó ArrayAccessNode
         self.method_name = method_name    # Nome do método
@@ -123,6 +194,8 @@ class ArrayElementMethodCallNode(ASTNode):
 
 class ArrayElementAttributeAssignmentNode(ASTNode):
     """Representa atribuição a atributo de objeto em array: arr[i].attr = valor."""
+    __slots__ = _fields = ('array_access', 'attribute_name', 'value')
+
     def __init__(self, array_access, attribute_name, value):
         self.array_access = array_access    # Nó ArrayAccessNode
         self.attribute_name = attribute_name  # Nome do atributo
@@ -131,6 +204,8 @@ class ArrayElementAttributeAssignmentNode(ASTNode):
 
 class ArrayElementAttributeAccessNode(ASTNode):
     """Representa acesso a atributo de objeto em array: arr[i].attr."""
+    __slots__ = _fields = ('array_access', 'attribute_name')
+
     def __init__(self, array_access, attribute_name):
         self.array_access = array_access    # Nó ArrayAccessNode
         self.attribute_name = attribute_name  # Nome do atributo
@@ -138,6 +213,8 @@ class ArrayElementAttributeAccessNode(ASTNode):
 
 class ArrayAccessWithObjectNode(ASTNode):
     """Representa acesso a array que é atributo de objeto: obj.arr[i] ou this.arr[i]."""
+    __slots__ = _fields = ('object_attr_access', 'index', 'index2')
+
     def __init__(self, object_attr_access, index, index2=None):
         self.object_attr_access = object_attr_access  # Nó AttributeAccessNode
         self.index = index      # Índice primário
@@ -146,6 +223,8 @@ class ArrayAccessWithObjectNode(ASTNode):
 
 class ObjectAttributeArrayAssignmentNode(ASTNode):
     """Representa atribuição a elemento de array que é atributo: obj.arr[i] = valor."""
+    __slots__ = _fields = ('object_name', 'attr_name', 'index', 'value', 'index2')
+
     def __init__(self, object_name, attr_name, index, value, index2=None):
         self.object_name = object_name  # Nome do objeto
         self.attr_name = attr_name      # Nome do atributo array
@@ -156,6 +235,8 @@ class ObjectAttributeArrayAssignmentNode(ASTNode):
 
 class MethodCallNode(ASTNode):
     """Representa chamada de método: objeto.metodo(args)."""
+    __slots__ = _fields = ('object_name', 'method_name', 'arguments')
+
     def __init__(self, object_name, method_name, arguments=None):
         self.object_name = object_name  # Nome do objeto
         self.method_name = method_name  # Nome do método
@@ -164,6 +245,8 @@ class MethodCallNode(ASTNode):
 
 class FunctionCallNode(ASTNode):
     """Representa chamada de função: funcao(args)."""
+    __slots__ = _fields = ('name', 'arguments')
+
     def __init__(self, name, arguments=None):
         self.name = name  # Nome da função
         self.arguments = arguments or []  # Lista de argumentos
@@ -171,12 +254,16 @@ class FunctionCallNode(ASTNode):
 
 class PrintNode(ASTNode):
     """Representa comando PRINT(expressão)."""
+    __slots__ = _fields = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression  # Expressão a imprimir
 
 
 class InputNode(ASTNode):
     """Representa comando INPUT para leitura de dados do usuário."""
+    __slots__ = _fields = ('identifier', 'prompt')
+
     def __init__(self, identifier, prompt=None):
         self.identifier = identifier  # Variável que receberá o valor
         self.prompt = prompt         # Mensagem opcional (prompt)
@@ -184,6 +271,8 @@ class InputNode(ASTNode):
 
 class SendNode(ASTNode):
     """Representa envio de dados por canal: canal.SEND(valores)."""
+    __slots__ = _fields = ('channel', 'values')
+
     def __init__(self, channel, values):
         self.channel = channel  # Nome do canal
         self.values = values    # Lista de valores a enviar
@@ -191,6 +280,8 @@ class SendNode(ASTNode):
 
 class ReceiveNode(ASTNode):
     """Representa recebimento de dados por canal: canal.RECEIVE(variáveis)."""
+    __slots__ = _fields = ('channel', 'variables')
+
     def __init__(self, channel, variables):
         self.channel = channel      # Nome do canal
         self.variables = variables  # Lista de variáveis que receberão valores
@@ -198,12 +289,16 @@ class ReceiveNode(ASTNode):
 
 class ReturnNode(ASTNode):
     """Representa comando RETURN em funções."""
+    __slots__ = _fields = ('expression',)
+
     def __init__(self, expression):
         self.expression = expression  # Expressão a retornar
 
 
 class BinaryOpNode(ASTNode):
     """Representa operação binária: left operador right (+, -, *, /, &&, ||)."""
+    __slots__ = _fields = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left          # Operando esquerdo
         self.operator = operator  # Operador (+, -, *, /, &&, ||)
@@ -212,6 +307,8 @@ class BinaryOpNode(ASTNode):
 
 class UnaryOpNode(ASTNode):
     """Representa operação unária: operador operando (ex: -5)."""
+    __slots__ = _fields = ('operator', 'operand')
+
     def __init__(self, operator, operand):
         self.operator = operator  # Operador unário (-, !)
         self.operand = operand    # Operando
@@ -219,24 +316,32 @@ class UnaryOpNode(ASTNode):
 
 class NumberNode(ASTNode):
     """Representa um número literal (inteiro ou real)."""
+    __slots__ = _fields = ('value',)
+
     def __init__(self, value):
         self.value = value  # Valor numérico
 
 
 class StringNode(ASTNode):
     """Representa uma string literal."""
+    __slots__ = _fields = ('value',)
+
     def __init__(self, value):
         self.value = value  # Valor da string
 
 
 class IdentifierNode(ASTNode):
     """Representa um identificador (nome de variável, função, etc.)."""
+    __slots__ = _fields = ('name',)
+
     def __init__(self, name):
         self.name = name  # Nome do identificador
 
 
 class AttributeAccessNode(ASTNode):
     """Representa acesso a atributo de objeto: objeto.atributo."""
+    __slots__ = _fields = ('object_name', 'attribute_name')
+
     def __init__(self, object_name, attribute_name):
         self.object_name = object_name      # Nome do objeto
         self.attribute_name = attribute_name  # Nome do atributo
@@ -244,6 +349,8 @@ class AttributeAccessNode(ASTNode):
 
 class AttributeAssignmentNode(ASTNode):
     """Representa atribuição a atributo: objeto.atributo = expressão."""
+    __slots__ = _fields = ('object_name', 'attribute_name', 'expression')
+
     def __init__(self, object_name, attribute_name, expression):
         self.object_name = object_name      # Nome do objeto
         self.attribute_name = attribute_name  # Nome do atributo
@@ -252,6 +359,8 @@ class AttributeAssignmentNode(ASTNode):
 
 class ConditionNode(ASTNode):
     """Representa uma condição: left operador right (==, !=, <, >, <=, >=)."""
+    __slots__ = _fields = ('left', 'operator', 'right')
+
     def __init__(self, left, operator, right):
         self.left = left          # Lado esquerdo
         self.operator = operator  # Operador relacional
@@ -262,9 +371,12 @@ class DeclarationNode(ASTNode):
     """Representa declaração de variável com inicialização opcional.
 
     Para canais (`c_channel`) pode conter um `channel_info` com metadados
-    (por exemplo: identificadores ou endpoints) extraídos da declaração.
+    (por exemplo: identificadores ou endpoints) extraídos da declaração e a
+    capacidade (`channel_capacity`) de um canal limitado.
     """
-    def __init__(self, type_name, identifier, initial_value=None, is_array=False, array_size=None, is_2d_array=False, array_dimensions=None, channel_info=None):
+    __slots__ = _fields = ('type_name', 'identifier', 'initial_value', 'is_array', 'array_size', 'is_2d_array', 'array_dimensions', 'channel_info', 'channel_capacity')
+
+    def __init__(self, type_name, identifier, initial_value=None, is_array=False, array_size=None, is_2d_array=False, array_dimensions=None, channel_info=None, channel_capacity=None):
         self.type_name = type_name          # Tipo da variável
         self.identifier = identifier        # Nome da variável
         self.initial_value = initial_value  # Valor inicial (opcional)
@@ -273,10 +385,13 @@ class DeclarationNode(ASTNode):
         self.is_2d_array = is_2d_array      # True se for array 2D
         self.array_dimensions = array_dimensions  # [linhas, colunas] para arrays 2D
         self.channel_info = channel_info    # Metadados para c_channel, se houver
+        self.channel_capacity = channel_capacity  # Capacidade do c_channel (None = sem limite)
 
 
 class ArrayAccessNode(ASTNode):
     """Representa acesso a elemento de array: arr[i] ou arr[i][j]."""
+    __slots__ = _fields = ('array_name', 'index', 'index2')
+
     def __init__(self, array_name, index, index2=None):
         self.array_name = array_name  # Nome do array
         self.index = index            # Índice primário
@@ -285,6 +400,8 @@ class ArrayAccessNode(ASTNode):
 
 class ArrayAssignmentNode(ASTNode):
     """Representa atribuição a elemento de array: arr[i] = expr ou arr[i][j] = expr."""
+    __slots__ = _fields = ('array_name', 'index', 'expression', 'index2')
+
     def __init__(self, array_name, index, expression, index2=None):
         self.array_name = array_name  # Nome do array
         self.index = index            # Índice primário
@@ -294,82 +411,15 @@ class ArrayAssignmentNode(ASTNode):
 
 class ArrayInitNode(ASTNode):
     """Representa inicialização de array com colchetes: [val1, val2, ...]."""
+    __slots__ = _fields = ('elements',)
+
     def __init__(self, elements):
         self.elements = elements  # Lista de elementos
 
 
 class BraceInitNode(ASTNode):
     """Representa inicialização com chaves: {val1, val2, ...}."""
+    __slots__ = _fields = ('values',)
+
     def __init__(self, values):
         self.values = values  # Lista de valores
-
-# Função para serializar AST em formato JSON
-def ast_to_dict(node):
-    """Converte um nó da AST para dicionário (serializável em JSON)."""
-    if node is None:
-        return None
-    
-    result = {
-        'type': type(node).__name__
-    }
-    
-    # Atributos simples (strings, números, booleanos)
-    simple_attrs = [
-        'value', 'name', 'operator', 'text', 'parent', 'class_name', 
-        'type_name', 'var_name', 'identifier', 'method_name', 'object_name',
-        'attribute_name', 'array_name', 'var', 'return_type', 'block_type',
-        'prompt', 'channel', 'is_array', 'is_2d_array', 'attr_name'
-    ]
-    
-    for attr in simple_attrs:
-        if hasattr(node, attr):
-            val = getattr(node, attr)
-            if val is not None:
-                result[attr] = str(val) if not isinstance(val, (bool, int, float)) else val
-    
-    # Atributos que são nós únicos (recursão simples)
-    single_node_attrs = [
-        'condition', 'expression', 'left', 'right', 'operand', 
-        'init_expr', 'increment', 'initial_value', 'index', 'index2',
-        'array_access', 'object_attr_access', 'array_size', 'object'
-    ]
-    
-    for attr in single_node_attrs:
-        if hasattr(node, attr):
-            val = getattr(node, attr)
-            if val is not None:
-                result[attr] = ast_to_dict(val)
-    
-    # Atributos que são listas de nós (recursão em listas)
-    list_attrs = [
-        'children', 'attributes', 'methods', 'parameters', 'body', 
-        'statements', 'arguments', 'values', 'elements', 'variables',
-        'then_body', 'else_body'
-    ]
-    
-    for attr in list_attrs:
-        if hasattr(node, attr):
-            val = getattr(node, attr)
-            if val:
-                if isinstance(val, list):
-                    result[attr] = [ast_to_dict(item) for item in val]
-                else:
-                    # Se não for lista mas existir (ex: then_body pode ser lista ou None)
-                    result[attr] = ast_to_dict(val)
-    
-    # Atributos especiais
-    if hasattr(node, 'array_dimensions') and node.array_dimensions:
-        result['array_dimensions'] = [ast_to_dict(dim) if hasattr(dim, '__class__') and issubclass(dim.__class__, ASTNode) else dim for dim in node.array_dimensions]
-    
-    if hasattr(node, 'channel_info') and node.channel_info:
-        result['channel_info'] = str(node.channel_info)
-    
-    if hasattr(node, 'params') and node.params:
-        # params pode ser lista de tuplas (tipo, nome)
-        if isinstance(node.params, list) and node.params:
-            if isinstance(node.params[0], tuple):
-                result['params'] = [{'type': str(p[0]), 'name': str(p[1])} for p in node.params]
-            else:
-                result['params'] = [ast_to_dict(p) for p in node.params]
-    
-    return result
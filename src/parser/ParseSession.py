@@ -0,0 +1,258 @@
+# ============================================================================
+# ParseSession.py - Análise Léxica/Sintática Incremental
+# ============================================================================
+# Mantém o código-fonte e a AST de um editor entre execuções. Ao receber uma
+# edição (delta de texto), relexa e reanalisa apenas os itens de topo do
+# ProgramNode atingidos pela edição, reaproveitando as subárvores intactas.
+#
+# Cada item de topo guarda o intervalo [início, fim) que ocupa no fonte. Uma
+# edição em [a, b) invalida os itens que tocam esse trecho e o item anterior
+# (cujo fim pode depender do token seguinte). A análise recomeça no fim do
+# item anterior a eles e segue até reencontrar, já deslocado pela edição, o
+# início de um item antigo posterior à edição; dali em diante os nós antigos
+# são reaproveitados, com as posições (line/col) deslocadas pela edição.
+# ============================================================================
+
+import bisect
+
+from lexer.Lexer import Lexer
+from lexer.token import Token, SLASH_COMMENT_ERROR
+from lexer.token_type import TokenType
+from parser.Parser import Parser
+from parser.AST import ProgramNode
+from parser.Traversal import walk
+
+
+# Bloco comparado de uma vez (comparação de fatias é feita em C)
+_COMPARE_BLOCK = 4096
+
+
+def _common_prefix(a, b):
+    """Tamanho do maior prefixo comum entre a e b."""
+    limit = min(len(a), len(b))
+    i = 0
+    while i + _COMPARE_BLOCK <= limit and a[i:i + _COMPARE_BLOCK] == b[i:i + _COMPARE_BLOCK]:
+        i += _COMPARE_BLOCK
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _common_suffix(a, b, max_a, max_b):
+    """Tamanho do maior sufixo comum, sem ultrapassar max_a/max_b caracteres."""
+    limit = min(max_a, max_b)
+    len_a, len_b = len(a), len(b)
+    i = 0
+    while i + _COMPARE_BLOCK <= limit and \
+            a[len_a - i - _COMPARE_BLOCK:len_a - i] == b[len_b - i - _COMPARE_BLOCK:len_b - i]:
+        i += _COMPARE_BLOCK
+    while i < limit and a[len_a - 1 - i] == b[len_b - 1 - i]:
+        i += 1
+    return i
+
+
+class _TopLevelItem:
+    """Item de topo do programa e o trecho do fonte que ele ocupa."""
+
+    __slots__ = ('start', 'end', 'node')
+
+    def __init__(self, start, end, node):
+        self.start = start  # Offset do primeiro token do item
+        self.end = end      # Offset logo após o último token do item
+        self.node = node    # Subárvore (ClassNode, FunctionNode, ...)
+
+
+class ParseSession:
+    """
+    Sessão de parsing incremental de um programa MiniPar.
+
+    Uso:
+        session = ParseSession(codigo)
+        ast = session.apply_edit(inicio, fim, novo_texto)  # delta do editor
+        ast = session.update(codigo_completo)              # delta calculado
+    """
+
+    def __init__(self, source=''):
+        self.source = source
+        self.items = []            # Itens de topo em ordem de posição
+        self.ast = None            # ProgramNode atual
+        self.last_reparsed = 0     # Itens reanalisados na última atualização
+        self.last_reused = 0       # Itens reaproveitados na última atualização
+        self._reparse_all()
+
+    # ------------------- API pública -------------------
+    def update(self, new_source):
+        """
+        Atualiza a sessão para new_source. O delta é o trecho entre o maior
+        prefixo e o maior sufixo comuns ao fonte anterior.
+        """
+        old = self.source
+        if new_source == old:
+            if self.ast is None:
+                # A última análise falhou: refaz para levantar o erro de novo
+                return self._reparse_all()
+            self.last_reparsed = 0
+            self.last_reused = len(self.items)
+            return self.ast
+        prefix = _common_prefix(old, new_source)
+        suffix = _common_suffix(old, new_source, len(old) - prefix, len(new_source) - prefix)
+        return self.apply_edit(prefix, len(old) - suffix, new_source[prefix:len(new_source) - suffix])
+
+    def load_program(self, source, ast, spans):
+        """
+        Posiciona a sessão em source usando uma AST já pronta (por exemplo,
+        do cache de programas) e o intervalo [início, fim) de cada item de
+        topo, sem reanalisar nada.
+        """
+        self.source = source
+        self.items = [_TopLevelItem(start, end, node) for (start, end), node in zip(spans, ast.children)]
+        self.ast = ast
+        self.last_reparsed = 0
+        self.last_reused = len(self.items)
+        return ast
+
+    def apply_edit(self, start, end, text):
+        """
+        Substitui source[start:end] por text e atualiza a AST.
+        Retorna o novo ProgramNode. Em caso de erro de sintaxe a exceção é
+        propagada e a próxima atualização refaz a análise completa.
+        """
+        if not 0 <= start <= end <= len(self.source):
+            raise ValueError(f"Edição fora do código-fonte: [{start}, {end}) em {len(self.source)} caracteres")
+
+        old_source = self.source
+        self.source = old_source[:start] + text + old_source[end:]
+        if self.ast is None:
+            return self._reparse_all()
+
+        items = self.items
+        ends = [item.end for item in items]
+        # Primeiro item atingido: o anterior ao primeiro que termina em/após start
+        first = max(bisect.bisect_left(ends, start) - 1, 0)
+        region_start = items[first - 1].end if first > 0 else 0
+
+        # Itens antigos que podem ser reaproveitados, indexados pelo novo início
+        delta = len(text) - (end - start)
+        resume = {}
+        for index in range(first + 1, len(items)):
+            if items[index].start >= end:
+                resume[items[index].start + delta] = index
+
+        try:
+            parsed, resumed_at = self._parse_region(region_start, start + len(text), resume)
+        except SyntaxError:
+            self.ast = None
+            self.items = []
+            raise
+
+        tail = []
+        if resumed_at is not None:
+            tail = items[resumed_at:]
+            for item in tail:
+                item.start += delta
+                item.end += delta
+            self._shift_positions(tail, old_source, end, start + len(text))
+
+        self.items = items[:first] + parsed + tail
+        self.last_reparsed = len(parsed)
+        self.last_reused = first + len(tail)
+        self.ast = self._build_program()
+        return self.ast
+
+    # ------------------- Internos -------------------
+    def _reparse_all(self):
+        self.items = []
+        self.ast = None
+        parsed, _ = self._parse_region(0, 0, {})
+        self.items = parsed
+        self.last_reparsed = len(parsed)
+        self.last_reused = 0
+        self.ast = self._build_program()
+        return self.ast
+
+    def _build_program(self):
+        program = ProgramNode()
+        program.children = [item.node for item in self.items]
+        return program
+
+    def _shift_positions(self, tail, old_source, old_end, new_end):
+        """
+        Atualiza line/col dos nós reaproveitados após a edição. O fim da
+        edição passou de old_end (fonte antigo) para new_end (fonte novo):
+        as linhas seguintes só mudam de número; na própria linha do fim da
+        edição também as colunas se deslocam.
+        """
+        source = self.source
+        old_line = old_source.count('\n', 0, old_end) + 1
+        old_col = old_end - old_source.rfind('\n', 0, old_end)
+        line_delta = source.count('\n', 0, new_end) + 1 - old_line
+        col_delta = new_end - source.rfind('\n', 0, new_end) - old_col
+        if line_delta == 0 and col_delta == 0:
+            return
+
+        for item in tail:
+            if line_delta == 0 and item.node.line != old_line:
+                # Item começa em linha posterior: nada muda, nem nos filhos
+                continue
+            for node in walk(item.node):
+                if node.line is not None:
+                    if node.line == old_line:
+                        node.col += col_delta
+                    if node.end_line == old_line:
+                        node.end_col += col_delta
+                    node.line += line_delta
+                    node.end_line += line_delta
+
+    def _parse_region(self, region_start, damage_end, resume):
+        """
+        Analisa itens de topo a partir de region_start. Para antes de um
+        token em offset >= damage_end que inicie um item antigo (resume:
+        novo offset -> índice do item). Retorna (itens, índice retomado).
+        """
+        source = self.source
+        lexer = Lexer(source)
+        lexer.position = region_start
+        lexer.line = source.count('\n', 0, region_start) + 1
+        lexer.column = region_start - (source.rfind('\n', 0, region_start) + 1) + 1
+
+        starts = []
+        ends = []
+        parser = Parser(self._tokens(lexer, starts, ends))
+        parsed = []
+
+        while True:
+            parser.skip_comments()
+            if parser.match(TokenType.EOF):
+                return parsed, None
+            offset = starts[parser.pos]
+            if offset >= damage_end and offset in resume:
+                return parsed, resume[offset]
+            node = parser.parse_top_level()
+            if node is None:
+                # Mesmo comportamento da análise completa: o programa termina aqui
+                return parsed, None
+            parsed.append(_TopLevelItem(offset, ends[parser.pos - 1], node))
+
+    @staticmethod
+    def _tokens(lexer, starts, ends):
+        """Gera Tokens registrando o offset de início/fim de cada um no fonte."""
+        source = lexer.source
+        error = TokenType.ERROR
+        text = TokenType.TEXT
+        comment = TokenType.COMMENT
+        for type_, start, end, line, column in lexer._scan_spans():
+            if type_ is error:
+                lexeme = SLASH_COMMENT_ERROR.format(line=line)
+            else:
+                lexeme = source[start:end]
+            # Os spans delimitam o lexema; aspas e '#' fazem parte do token
+            if type_ is text:
+                starts.append(start - 1)
+                ends.append(end + 1)
+            elif type_ is comment:
+                starts.append(start - 1)
+                ends.append(end)
+            else:
+                starts.append(start)
+                ends.append(end)
+            yield Token(type_, lexeme, line, column)
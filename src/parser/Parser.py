@@ -6,41 +6,146 @@
 # construir a Árvore de Sintaxe Abstrata (AST).
 #
 # Características:
-# - Lookahead de 1-2 tokens para decisões de parsing
+# - Lookahead de 1-2 tokens para decisões de parsing, lidos sob demanda
+#   de um buffer circular (aceita lista ou gerador de tokens)
 # - Precedência de operadores (multiplicação > adição > relacional > lógico)
+#   definida em tabela e resolvida com pilhas explícitas, sem recursão
+# - Comandos e operandos despachados por tabelas indexadas por TokenType
+# - Cada nó recebe sua posição no fonte (line, col, end_line, end_col)
 # - Suporte a estruturas OO, concorrência (SEQ/PAR), arrays 1D/2D
 # ============================================================================
 
 from lexer.token_type import TokenType
+from lexer.token import Token
 from parser.AST import *
 
 
+# Capacidade do buffer circular de lookahead (potência de 2 para usar máscara).
+# O parser nunca olha mais que 2 tokens adiante do atual.
+LOOKAHEAD = 4
+_RING_MASK = LOOKAHEAD - 1
+
+# Precedência dos operadores binários (maior liga mais forte). Todos são
+# associativos à esquerda, exceto os relacionais, que geram ConditionNode e
+# não encadeiam. '&&' liga mais fraco que '||', como na gramática original.
+BINARY_PRECEDENCE = {
+    TokenType.AND: 1,
+    TokenType.OR: 2,
+    TokenType.EQ: 3, TokenType.NEQ: 3,
+    TokenType.GT: 3, TokenType.LT: 3, TokenType.GTE: 3, TokenType.LTE: 3,
+    TokenType.PLUS: 4, TokenType.MINUS: 4,
+    TokenType.MUL: 5, TokenType.DIV: 5, TokenType.MOD: 5,
+}
+RELATIONAL_PRECEDENCE = 3
+ADDITIVE_PRECEDENCE = 4   # parse_expression: apenas aritmética
+
+# Tabelas de despacho: tipo do token -> nome do método do Parser
+_STATEMENT_HANDLERS = {
+    TokenType.SEQ: 'parse_block',
+    TokenType.PAR: 'parse_block',
+    TokenType.IF: 'parse_if',
+    TokenType.WHILE: 'parse_while',
+    TokenType.FOR: 'parse_for',
+    TokenType.PRINT: 'parse_print',
+    TokenType.RETURN: 'parse_return',
+    TokenType.THIS: 'parse_this_statement',
+    TokenType.INT: 'parse_declaration',
+    TokenType.FLOAT: 'parse_declaration',
+    TokenType.STRING: 'parse_declaration',
+    TokenType.BOOL: 'parse_declaration',
+    TokenType.C_CHANNEL: 'parse_declaration',
+    TokenType.IDENT: 'parse_ident_statement',
+}
+
+# Comando iniciado por IDENT, pelo tipo do token seguinte
+_IDENT_STATEMENT_HANDLERS = {
+    TokenType.IDENT: 'parse_declaration',
+    TokenType.DOT: 'parse_member_statement',
+    TokenType.LBRACKET: 'parse_array_statement',
+    TokenType.ASSIGN: 'parse_assignment_statement',
+    TokenType.LPAREN: 'parse_call_statement',
+}
+
+_PRIMARY_HANDLERS = {
+    TokenType.NUMBER: 'parse_number',
+    TokenType.TEXT: 'parse_string',
+    TokenType.NEW: 'parse_new_expression',
+    TokenType.THIS: 'parse_this_expression',
+    TokenType.IDENT: 'parse_identifier_expression',
+    TokenType.STRLEN: 'parse_builtin_call',
+    TokenType.SUBSTR: 'parse_builtin_call',
+    TokenType.CHARAT: 'parse_builtin_call',
+    TokenType.INDEXOF: 'parse_builtin_call',
+    TokenType.PARSEINT: 'parse_builtin_call',
+}
+
+
+def _token_end(token):
+    """(linha, coluna) logo após o último caractere do token no fonte."""
+    if token.type is TokenType.TEXT:
+        # O lexema não inclui as aspas e pode ocupar várias linhas
+        text = token.lexeme
+        newlines = text.count('\n')
+        if newlines:
+            return token.line + newlines, len(text) - text.rfind('\n') + 1
+        return token.line, token.column + len(text) + 2
+    return token.line, token.column + len(token.lexeme)
+
+
 class Parser:
     """Parser descendente recursivo para MiniPar."""
     
     def __init__(self, tokens):
-        """Inicializa o parser com lista de tokens do lexer."""
-        self.tokens = tokens  # Lista de tokens gerados pelo lexer
-        self.pos = 0          # Posição atual na lista de tokens
+        """
+        Inicializa o parser com os tokens do lexer: uma lista (tokenize())
+        ou um gerador (iter_tokens()). Os tokens são lidos sob demanda para
+        um buffer circular, então o parser não precisa da lista completa.
+        """
+        self._stream = iter(tokens)       # Fonte dos tokens
+        self._ring = [None] * LOOKAHEAD   # Buffer circular de lookahead
+        self._read = 0                    # Quantidade de tokens já lidos da fonte
+        self._last = None                 # Último token lido (repetido após o fim)
+        self.pos = 0                      # Quantidade de tokens já consumidos
+        self._prev = None                 # Último token consumido (fim dos spans)
+        # Tabelas de despacho com métodos já ligados (respeitam subclasses)
+        self._statement_handlers = {t: getattr(self, name) for t, name in _STATEMENT_HANDLERS.items()}
+        self._ident_statement_handlers = {t: getattr(self, name) for t, name in _IDENT_STATEMENT_HANDLERS.items()}
+        self._primary_handlers = {t: getattr(self, name) for t, name in _PRIMARY_HANDLERS.items()}
+
+    def _fill(self, pos):
+        """Lê tokens da fonte até que a posição pos esteja no buffer."""
+        ring = self._ring
+        while self._read <= pos:
+            token = next(self._stream, None)
+            if token is None:
+                # Fonte esgotada: repete o último token (EOF), como antes
+                token = self._last or Token(TokenType.EOF, '', 1, 1)
+            self._last = token
+            ring[self._read & _RING_MASK] = token
+            self._read += 1
 
     def current_token(self):
         """Retorna o token atual sem avançar."""
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return self.tokens[-1]  # Retorna EOF se passou do fim
+        pos = self.pos
+        if pos >= self._read:
+            self._fill(pos)
+        return self._ring[pos & _RING_MASK]
 
     def peek(self, offset=1):
         """Olha adiante (lookahead) sem consumir tokens."""
+        if offset >= LOOKAHEAD:
+            raise ValueError(f"Lookahead máximo é {LOOKAHEAD - 1} tokens")
         pos = self.pos + offset
-        if pos < len(self.tokens):
-            return self.tokens[pos]
-        return self.tokens[-1]
+        if pos >= self._read:
+            self._fill(pos)
+        return self._ring[pos & _RING_MASK]
 
     def advance(self):
         """Consome e retorna o token atual, avançando para o próximo."""
         token = self.current_token()
         if token.type != TokenType.EOF:
             self.pos += 1
+            self._prev = token
         return token
 
     def expect(self, token_type):
@@ -54,6 +159,13 @@ class Parser:
         """Verifica se o token atual é um dos tipos especificados."""
         return self.current_token().type in token_types
 
+    def _set_span(self, node, start):
+        """Posição de node: do token start até o último token consumido."""
+        node.line = start.line
+        node.col = start.column
+        node.end_line, node.end_col = _token_end(self._prev)
+        return node
+
     def skip_comments(self):
         """Pula todos os comentários consecutivos."""
         while self.match(TokenType.COMMENT):
@@ -72,51 +184,49 @@ class Parser:
         self.skip_comments()
         
         while not self.match(TokenType.EOF):
-            self.skip_comments()
-            
-            if self.match(TokenType.CLASS):
-                program.children.append(self.parse_class())
-            elif self.match(TokenType.VOID, TokenType.INT, TokenType.FLOAT, TokenType.STRING, TokenType.BOOL):
-                if self.peek().type == TokenType.IDENT and self.peek(2).type == TokenType.LPAREN:
-                    program.children.append(self.parse_function())
-                else:
-                    program.children.append(self.parse_declaration())
-            elif self.match(TokenType.IDENT):
-                if self.peek().type == TokenType.IDENT:
-                    if self.peek(2).type == TokenType.LPAREN:
-                        program.children.append(self.parse_function())
-                    else:
-                        program.children.append(self.parse_declaration())
-                elif self.peek().type == TokenType.LPAREN:
-                    program.children.append(self.parse_statement())
-                elif self.peek().type == TokenType.ASSIGN:
-                    program.children.append(self.parse_statement())
-                elif self.peek().type == TokenType.DOT:
-                    program.children.append(self.parse_statement())
-                elif self.peek().type == TokenType.LBRACKET:
-                    program.children.append(self.parse_statement())
-                else:
-                    break
-            elif self.match(TokenType.C_CHANNEL):
-                program.children.append(self.parse_declaration())
-            elif self.match(TokenType.SEQ, TokenType.PAR):
-                program.children.append(self.parse_block())
-            elif self.match(TokenType.PRINT):
-                program.children.append(self.parse_statement())
-            elif self.match(TokenType.COMMENT):
-                self.advance()
-            else:
+            node = self.parse_top_level()
+            if node is None:
                 break
-            
+            program.children.append(node)
             self.skip_comments()
         
         return program
 
+    def parse_top_level(self):
+        """
+        Parse de um único item de topo (classe, função, declaração, bloco
+        SEQ/PAR ou comando). Retorna None se o token atual não inicia nenhum
+        item, o que encerra o programa.
+        """
+        self.skip_comments()
+        
+        if self.match(TokenType.CLASS):
+            return self.parse_class()
+        elif self.match(TokenType.VOID, TokenType.INT, TokenType.FLOAT, TokenType.STRING, TokenType.BOOL):
+            if self.peek().type == TokenType.IDENT and self.peek(2).type == TokenType.LPAREN:
+                return self.parse_function()
+            return self.parse_declaration()
+        elif self.match(TokenType.IDENT):
+            if self.peek().type == TokenType.IDENT:
+                if self.peek(2).type == TokenType.LPAREN:
+                    return self.parse_function()
+                return self.parse_declaration()
+            elif self.peek().type in (TokenType.LPAREN, TokenType.ASSIGN, TokenType.DOT, TokenType.LBRACKET):
+                return self.parse_statement()
+        elif self.match(TokenType.C_CHANNEL):
+            return self.parse_declaration()
+        elif self.match(TokenType.SEQ, TokenType.PAR):
+            return self.parse_block()
+        elif self.match(TokenType.PRINT):
+            return self.parse_statement()
+        return None
+
     def parse_class(self):
         """
         Parse de definição de classe com herança opcional.
         Sintaxe: class Nome [extends Pai] { atributos e métodos }
         """
+        start = self.current_token()
         self.expect(TokenType.CLASS)
         name = self.expect(TokenType.IDENT).lexeme
         
@@ -163,7 +273,7 @@ class Parser:
                     self.expect(TokenType.LBRACE)
                     body = self.parse_statements_list()
                     self.expect(TokenType.RBRACE)
-                    methods.append(MethodNode(return_type, name_token.lexeme, parameters, body))
+                    methods.append(self._set_span(MethodNode(return_type, name_token.lexeme, parameters, body), return_type_token))
                 elif self.match(TokenType.LBRACKET):
                     self.advance()
                     array_size = None
@@ -182,19 +292,25 @@ class Parser:
                         self.expect(TokenType.RBRACKET)
                     
                     if is_2d:
-                        attributes.append(AttributeNode(return_type, name_token.lexeme, is_array=False, array_size=None, is_2d_array=True, array_dimensions=[array_size, array_size2]))
+                        attribute = AttributeNode(return_type, name_token.lexeme, is_array=False, array_size=None, is_2d_array=True, array_dimensions=[array_size, array_size2])
                     else:
-                        attributes.append(AttributeNode(return_type, name_token.lexeme, is_array=True, array_size=array_size))
+                        attribute = AttributeNode(return_type, name_token.lexeme, is_array=True, array_size=array_size)
                     if self.match(TokenType.SEMICOLON):
                         self.advance()
+                    attributes.append(self._set_span(attribute, return_type_token))
                 else:
-                    attributes.append(AttributeNode(return_type, name_token.lexeme))
+                    attribute = AttributeNode(return_type, name_token.lexeme)
                     if self.match(TokenType.SEMICOLON):
                         self.advance()
+                    attributes.append(self._set_span(attribute, return_type_token))
+            else:
+                # Token que não inicia membro (inclusive EOF de classe não fechada)
+                token = self.current_token()
+                raise SyntaxError(f"Unexpected {token.type} in class '{name}' at line {token.line}, column {token.column}")
             self.skip_comments()
         
         self.expect(TokenType.RBRACE)
-        return ClassNode(name, parent, attributes, methods)
+        return self._set_span(ClassNode(name, parent, attributes, methods), start)
 
     def parse_function(self):
         """
@@ -202,6 +318,7 @@ class Parser:
         Sintaxe: tipo nome(parametros) { corpo }
         Suporta parâmetros array com [] no tipo.
         """
+        start = self.current_token()
         return_type = self.advance().lexeme
         name = self.expect(TokenType.IDENT).lexeme
         self.expect(TokenType.LPAREN)
@@ -232,20 +349,28 @@ class Parser:
         body = self.parse_statements_list()
         self.expect(TokenType.RBRACE)
         
-        return FunctionNode(return_type, name, parameters, body)
+        return self._set_span(FunctionNode(return_type, name, parameters, body), start)
 
     def parse_declaration(self):
+        start = self.current_token()
         type_name = self.advance().lexeme
         identifier = self.expect(TokenType.IDENT).lexeme
 
         # Special handling for channel declaration syntax:
-        # c_channel chan [id1 id2 ...];  -> store extra identifiers in channel_info
+        # c_channel chan [id1 id2 ...] [capacidade];  -> store extra identifiers in channel_info
         channel_info = None
+        channel_capacity = None
         if type_name.lower() == 'c_channel':
             channel_info = []
             # Collect following identifiers until semicolon or other token
             while self.match(TokenType.IDENT):
                 channel_info.append(self.advance().lexeme)
+            # Capacidade opcional: send espera enquanto o canal está cheio
+            if self.match(TokenType.NUMBER):
+                token = self.advance()
+                if not token.lexeme.isdigit():
+                    raise SyntaxError(f"Capacidade do canal '{identifier}' deve ser um inteiro (recebido {token.lexeme}) at line {token.line}, column {token.column}")
+                channel_capacity = int(token.lexeme)
         
         is_array = False
         is_2d_array = False
@@ -290,15 +415,10 @@ class Parser:
             self.advance()
 
         # Return DeclarationNode with optional channel_info
-        try:
-            return DeclarationNode(type_name, identifier, initial_value, is_array, array_size, is_2d_array, array_dimensions, channel_info)
-        except TypeError:
-            # Fallback in case AST.DeclarationNode not updated
-            node = DeclarationNode(type_name, identifier, initial_value, is_array, array_size, is_2d_array, array_dimensions)
-            setattr(node, 'channel_info', channel_info)
-            return node
+        return self._set_span(DeclarationNode(type_name, identifier, initial_value, is_array, array_size, is_2d_array, array_dimensions, channel_info, channel_capacity), start)
     
     def parse_array_init(self):
+        start = self.current_token()
         self.expect(TokenType.LBRACKET)
         elements = []
         
@@ -310,9 +430,10 @@ class Parser:
                 self.advance()
         
         self.expect(TokenType.RBRACKET)
-        return ArrayInitNode(elements)
+        return self._set_span(ArrayInitNode(elements), start)
     
     def parse_brace_init(self):
+        start = self.current_token()
         self.expect(TokenType.LBRACE)
         values = []
         
@@ -324,9 +445,10 @@ class Parser:
                 self.advance()
         
         self.expect(TokenType.RBRACE)
-        return BraceInitNode(values)
+        return self._set_span(BraceInitNode(values), start)
 
     def parse_block(self):
+        start = self.current_token()
         block_type = self.advance().lexeme.lower()
         
         if self.match(TokenType.LBRACE):
@@ -339,13 +461,19 @@ class Parser:
                 self.skip_comments()
                 if self.match(TokenType.EOF, TokenType.SEQ, TokenType.PAR):
                     break
+                old_pos = self.pos
                 stmt = self.parse_statement()
                 if stmt:
                     statements.append(stmt)
                 if self.match(TokenType.SEQ, TokenType.PAR):
                     break
+                # Mesma proteção de parse_statements_list contra loop infinito
+                if self.pos == old_pos and not self.match(TokenType.EOF):
+                    token = self.current_token()
+                    print(f"AVISO: Token não processado na linha {token.line}: {token.type.name} = '{token.lexeme}'")
+                    self.advance()
         
-        return BlockNode(block_type, statements)
+        return self._set_span(BlockNode(block_type, statements), start)
 
     def parse_statements_list(self):
         statements = []
@@ -374,263 +502,264 @@ class Parser:
         return statements
 
     def parse_statement(self):
+        """
+        Parse de um comando. O token inicial escolhe o método na tabela
+        _STATEMENT_HANDLERS; sem método (ou se ele não reconhecer o comando),
+        apenas um ';' opcional é consumido e None é retornado.
+        """
         self.skip_comments()
         
-        if self.match(TokenType.SEQ, TokenType.PAR):
-            return self.parse_block()
-        elif self.match(TokenType.IF):
-            return self.parse_if()
-        elif self.match(TokenType.WHILE):
-            return self.parse_while()
-        elif self.match(TokenType.FOR):
-            return self.parse_for()
-        elif self.match(TokenType.PRINT):
-            return self.parse_print()
-        elif self.match(TokenType.RETURN):
-            return self.parse_return()
-        elif self.match(TokenType.THIS):
-            obj_name = self.advance().lexeme
-            if self.match(TokenType.DOT):
-                self.expect(TokenType.DOT)
-                attr_name = self.expect(TokenType.IDENT).lexeme
-                
-                # Criar AttributeAccessNode inicial
-                attr_access = AttributeAccessNode(obj_name, attr_name)
-                
-                # Suporte a acesso encadeado: this.obj.attr ou this.obj.arr[i]
-                while self.match(TokenType.DOT):
-                    self.advance()
-                    next_attr = self.expect(TokenType.IDENT).lexeme
-                    attr_access = AttributeAccessNode(attr_access, next_attr)
-                
-                # Verificar se é acesso a array (this.attr[index] ou this.obj.arr[index])
-                if self.match(TokenType.LBRACKET):
-                    self.advance()
-                    index = self.parse_expression()
-                    self.expect(TokenType.RBRACKET)
-                    
-                    # Verificar se há segunda dimensão
-                    index2 = None
-                    if self.match(TokenType.LBRACKET):
-                        self.advance()
-                        index2 = self.parse_expression()
-                        self.expect(TokenType.RBRACKET)
-                    
-                    # Verificar se é acesso a método/atributo de objeto no array
-                    if self.match(TokenType.DOT):
-                        self.expect(TokenType.DOT)
-                        member_name = self.expect(TokenType.IDENT).lexeme
-                        
-                        if self.match(TokenType.LPAREN):
-                            # Chamada de método: this.produtos[i].metodo() ou this.obj.arr[i].metodo()
-                            self.advance()
-                            args = self.parse_arguments()
-                            self.expect(TokenType.RPAREN)
-                            if self.match(TokenType.SEMICOLON):
-                                self.advance()
-                            # Usar attr_access já construído
-                            array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
-                            return ArrayElementMethodCallNode(array_access, member_name, args)
-                        elif self.match(TokenType.ASSIGN):
-                            # Atribuição: this.produtos[i].nome = valor ou this.obj.arr[i].nome = valor
-                            self.advance()
-                            expression = self.parse_expression()
-                            if self.match(TokenType.SEMICOLON):
-                                self.advance()
-                            array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
-                            return ArrayElementAttributeAssignmentNode(array_access, member_name, expression)
-                    elif self.match(TokenType.ASSIGN):
-                        # Atribuição simples a elemento do array: this.produtos[i] = valor ou this.obj.arr[i] = valor
-                        self.advance()
-                        expression = self.parse_expression()
-                        if self.match(TokenType.SEMICOLON):
-                            self.advance()
-                        # Para compatibilidade com ObjectAttributeArrayAssignmentNode, 
-                        # extrair object_name e attr_name do attr_access final
-                        if isinstance(attr_access, AttributeAccessNode):
-                            # Se attr_access é encadeado, precisamos usar o nó completo
-                            # mas ObjectAttributeArrayAssignmentNode espera strings
-                            # Vamos mudar para usar ArrayAccessWithObjectNode + AttributeAssignmentNode
-                            array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
-                            # Retornar uma atribuição ao elemento do array
-                            return ObjectAttributeArrayAssignmentNode(obj_name, attr_name, index, expression, index2)
-                elif self.match(TokenType.ASSIGN):
-                    self.advance()
-                    expression = self.parse_expression()
-                    if self.match(TokenType.SEMICOLON):
-                        self.advance()
-                    return AttributeAssignmentNode(obj_name, attr_name, expression)
-                elif self.match(TokenType.LPAREN):
-                    self.advance()
-                    args = self.parse_arguments()
-                    self.expect(TokenType.RPAREN)
-                    if self.match(TokenType.SEMICOLON):
-                        self.advance()
-                    return MethodCallNode(obj_name, attr_name, args)
-        elif self.match(TokenType.INT, TokenType.FLOAT, TokenType.STRING, TokenType.BOOL, TokenType.C_CHANNEL):
-            return self.parse_declaration()
-        elif self.match(TokenType.IDENT):
-            if self.peek().type == TokenType.IDENT:
-                return self.parse_declaration()
-            elif self.peek().type == TokenType.DOT:
-                object_name = self.advance().lexeme
-                self.expect(TokenType.DOT)
-                
-                method_token = self.current_token()
-                if self.match(TokenType.SEND):
-                    method_name = self.advance().lexeme
-                elif self.match(TokenType.RECEIVE):
-                    method_name = self.advance().lexeme
-                elif self.match(TokenType.IDENT):
-                    method_name = self.advance().lexeme
-                else:
-                    raise SyntaxError(f"Expected method name after dot at line {method_token.line}")
-                
-                if self.match(TokenType.LPAREN):
-                    self.advance()
-                    args = self.parse_arguments()
-                    self.expect(TokenType.RPAREN)
-                    if self.match(TokenType.SEMICOLON):
-                        self.advance()
-                    
-                    if method_name.lower() == "send":
-                        return SendNode(object_name, args)
-                    elif method_name.lower() == "receive":
-                        return ReceiveNode(object_name, args)
-                    else:
-                        return MethodCallNode(object_name, method_name, args)
-                elif self.match(TokenType.ASSIGN):
-                    self.advance()
-                    expression = self.parse_expression()
-                    if self.match(TokenType.SEMICOLON):
-                        self.advance()
-                    return AttributeAssignmentNode(object_name, method_name, expression)
-                else:
-                    if self.match(TokenType.SEMICOLON):
-                        self.advance()
-                    return AttributeAccessNode(object_name, method_name)
-            elif self.peek().type == TokenType.LBRACKET:
-                array_name = self.advance().lexeme
-                self.expect(TokenType.LBRACKET)
+        start = self.current_token()
+        handler = self._statement_handlers.get(start.type)
+        if handler is not None:
+            node = handler()
+            if node is not None:
+                if node.line is None:
+                    self._set_span(node, start)
+                return node
+        
+        if self.match(TokenType.SEMICOLON):
+            self.advance()
+        
+        return None
+
+    def parse_ident_statement(self):
+        """Comando iniciado por identificador: decidido pelo token seguinte."""
+        handler = self._ident_statement_handlers.get(self.peek().type)
+        if handler is not None:
+            return handler()
+        return None
+
+    def parse_this_statement(self):
+        """this.attr = expr; this.metodo(...); this.arr[i] = expr; ..."""
+        obj_name = self.advance().lexeme
+        if self.match(TokenType.DOT):
+            self.expect(TokenType.DOT)
+            attr_name = self.expect(TokenType.IDENT).lexeme
+
+            # Criar AttributeAccessNode inicial
+            attr_access = AttributeAccessNode(obj_name, attr_name)
+
+            # Suporte a acesso encadeado: this.obj.attr ou this.obj.arr[i]
+            while self.match(TokenType.DOT):
+                self.advance()
+                next_attr = self.expect(TokenType.IDENT).lexeme
+                attr_access = AttributeAccessNode(attr_access, next_attr)
+
+            # Verificar se é acesso a array (this.attr[index] ou this.obj.arr[index])
+            if self.match(TokenType.LBRACKET):
+                self.advance()
                 index = self.parse_expression()
                 self.expect(TokenType.RBRACKET)
-                
+
                 # Verificar se há segunda dimensão
                 index2 = None
                 if self.match(TokenType.LBRACKET):
                     self.advance()
                     index2 = self.parse_expression()
                     self.expect(TokenType.RBRACKET)
-                
+
                 # Verificar se é acesso a método/atributo de objeto no array
                 if self.match(TokenType.DOT):
                     self.expect(TokenType.DOT)
                     member_name = self.expect(TokenType.IDENT).lexeme
-                    
+
                     if self.match(TokenType.LPAREN):
-                        # Chamada de método em elemento do array
+                        # Chamada de método: this.produtos[i].metodo() ou this.obj.arr[i].metodo()
                         self.advance()
                         args = self.parse_arguments()
                         self.expect(TokenType.RPAREN)
                         if self.match(TokenType.SEMICOLON):
                             self.advance()
-                        # Criar node especial para método em array
-                        array_access = ArrayAccessNode(array_name, index, index2)
+                        # Usar attr_access já construído
+                        array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
                         return ArrayElementMethodCallNode(array_access, member_name, args)
                     elif self.match(TokenType.ASSIGN):
-                        # Atribuição a atributo de elemento do array
+                        # Atribuição: this.produtos[i].nome = valor ou this.obj.arr[i].nome = valor
                         self.advance()
                         expression = self.parse_expression()
                         if self.match(TokenType.SEMICOLON):
                             self.advance()
-                        array_access = ArrayAccessNode(array_name, index, index2)
+                        array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
                         return ArrayElementAttributeAssignmentNode(array_access, member_name, expression)
-                    else:
-                        # Acesso a atributo de elemento do array
-                        array_access = ArrayAccessNode(array_name, index, index2)
-                        return ArrayElementAttributeAccessNode(array_access, member_name)
                 elif self.match(TokenType.ASSIGN):
+                    # Atribuição simples a elemento do array: this.produtos[i] = valor ou this.obj.arr[i] = valor
                     self.advance()
-                    
-                    if self.match(TokenType.INPUT):
-                        self.advance()
-                        self.expect(TokenType.LPAREN)
-                        prompt = None
-                        if not self.match(TokenType.RPAREN):
-                            prompt = self.parse_expression()
-                        self.expect(TokenType.RPAREN)
-                        if self.match(TokenType.SEMICOLON):
-                            self.advance()
-                        
-                        temp_var = f"__temp_input_{array_name}"
-                        input_node = InputNode(temp_var, prompt)
-                        assign_node = ArrayAssignmentNode(array_name, index, IdentifierNode(temp_var), index2)
-                        return BlockNode("seq", [input_node, assign_node])
-                    else:
-                        expression = self.parse_expression()
-                        if self.match(TokenType.SEMICOLON):
-                            self.advance()
-                        return ArrayAssignmentNode(array_name, index, expression, index2)
-                else:
+                    expression = self.parse_expression()
                     if self.match(TokenType.SEMICOLON):
                         self.advance()
-                    return ArrayAccessNode(array_name, index, index2)
-            elif self.peek().type == TokenType.ASSIGN:
-                identifier = self.advance().lexeme
-                self.expect(TokenType.ASSIGN)
-                
-                if self.match(TokenType.INPUT):
+                    # Para compatibilidade com ObjectAttributeArrayAssignmentNode, 
+                    # extrair object_name e attr_name do attr_access final
+                    if isinstance(attr_access, AttributeAccessNode):
+                        # Se attr_access é encadeado, precisamos usar o nó completo
+                        # mas ObjectAttributeArrayAssignmentNode espera strings
+                        # Vamos mudar para usar ArrayAccessWithObjectNode + AttributeAssignmentNode
+                        array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
+                        # Retornar uma atribuição ao elemento do array
+                        return ObjectAttributeArrayAssignmentNode(obj_name, attr_name, index, expression, index2)
+            elif self.match(TokenType.ASSIGN):
+                self.advance()
+                expression = self.parse_expression()
+                if self.match(TokenType.SEMICOLON):
                     self.advance()
-                    self.expect(TokenType.LPAREN)
-                    prompt = None
-                    if not self.match(TokenType.RPAREN):
-                        prompt = self.parse_expression()
-                    self.expect(TokenType.RPAREN)
-                    if self.match(TokenType.SEMICOLON):
-                        self.advance()
-                    return InputNode(identifier, prompt)
-                elif self.match(TokenType.NEW):
+                return AttributeAssignmentNode(obj_name, attr_name, expression)
+            elif self.match(TokenType.LPAREN):
+                self.advance()
+                args = self.parse_arguments()
+                self.expect(TokenType.RPAREN)
+                if self.match(TokenType.SEMICOLON):
                     self.advance()
-                    class_name = self.expect(TokenType.IDENT).lexeme
-                    self.expect(TokenType.LPAREN)
-                    self.expect(TokenType.RPAREN)
-                    if self.match(TokenType.SEMICOLON):
-                        self.advance()
-                    return InstantiationNode(None, identifier, class_name)
-                else:
-                    expression = self.parse_expression()
-                    if self.match(TokenType.SEMICOLON):
-                        self.advance()
-                    return AssignmentNode(identifier, expression)
-            elif self.peek().type == TokenType.LPAREN:
-                name = self.advance().lexeme
-                self.expect(TokenType.LPAREN)
+                return MethodCallNode(obj_name, attr_name, args)
+        return None
+
+    def parse_member_statement(self):
+        """obj.send(...), obj.receive(...), obj.metodo(...) ou obj.attr = expr."""
+        object_name = self.advance().lexeme
+        self.expect(TokenType.DOT)
+
+        method_token = self.current_token()
+        if self.match(TokenType.SEND):
+            method_name = self.advance().lexeme
+        elif self.match(TokenType.RECEIVE):
+            method_name = self.advance().lexeme
+        elif self.match(TokenType.IDENT):
+            method_name = self.advance().lexeme
+        else:
+            raise SyntaxError(f"Expected method name after dot at line {method_token.line}")
+
+        if self.match(TokenType.LPAREN):
+            self.advance()
+            args = self.parse_arguments()
+            self.expect(TokenType.RPAREN)
+            if self.match(TokenType.SEMICOLON):
+                self.advance()
+
+            if method_name.lower() == "send":
+                return SendNode(object_name, args)
+            elif method_name.lower() == "receive":
+                return ReceiveNode(object_name, args)
+            else:
+                return MethodCallNode(object_name, method_name, args)
+        elif self.match(TokenType.ASSIGN):
+            self.advance()
+            expression = self.parse_expression()
+            if self.match(TokenType.SEMICOLON):
+                self.advance()
+            return AttributeAssignmentNode(object_name, method_name, expression)
+        else:
+            if self.match(TokenType.SEMICOLON):
+                self.advance()
+            return AttributeAccessNode(object_name, method_name)
+
+    def parse_array_statement(self):
+        """arr[i] = expr, arr[i][j] = input(...), arr[i].metodo(...), ..."""
+        array_name = self.advance().lexeme
+        self.expect(TokenType.LBRACKET)
+        index = self.parse_expression()
+        self.expect(TokenType.RBRACKET)
+
+        # Verificar se há segunda dimensão
+        index2 = None
+        if self.match(TokenType.LBRACKET):
+            self.advance()
+            index2 = self.parse_expression()
+            self.expect(TokenType.RBRACKET)
+
+        # Verificar se é acesso a método/atributo de objeto no array
+        if self.match(TokenType.DOT):
+            self.expect(TokenType.DOT)
+            member_name = self.expect(TokenType.IDENT).lexeme
+
+            if self.match(TokenType.LPAREN):
+                # Chamada de método em elemento do array
+                self.advance()
                 args = self.parse_arguments()
                 self.expect(TokenType.RPAREN)
                 if self.match(TokenType.SEMICOLON):
                     self.advance()
-                return FunctionCallNode(name, args)
-            elif self.peek().type == TokenType.IDENT:
-                type_name = self.advance().lexeme
-                var_name = self.expect(TokenType.IDENT).lexeme
-                self.expect(TokenType.ASSIGN)
-                self.expect(TokenType.NEW)
-                class_name = self.expect(TokenType.IDENT).lexeme
+                # Criar node especial para método em array
+                array_access = ArrayAccessNode(array_name, index, index2)
+                return ArrayElementMethodCallNode(array_access, member_name, args)
+            elif self.match(TokenType.ASSIGN):
+                # Atribuição a atributo de elemento do array
+                self.advance()
+                expression = self.parse_expression()
+                if self.match(TokenType.SEMICOLON):
+                    self.advance()
+                array_access = ArrayAccessNode(array_name, index, index2)
+                return ArrayElementAttributeAssignmentNode(array_access, member_name, expression)
+            else:
+                # Acesso a atributo de elemento do array
+                array_access = ArrayAccessNode(array_name, index, index2)
+                return ArrayElementAttributeAccessNode(array_access, member_name)
+        elif self.match(TokenType.ASSIGN):
+            self.advance()
+
+            if self.match(TokenType.INPUT):
+                self.advance()
                 self.expect(TokenType.LPAREN)
+                prompt = None
+                if not self.match(TokenType.RPAREN):
+                    prompt = self.parse_expression()
                 self.expect(TokenType.RPAREN)
                 if self.match(TokenType.SEMICOLON):
                     self.advance()
-                return InstantiationNode(type_name, var_name, class_name)
-        elif self.match(TokenType.COMMENT):
+
+                temp_var = f"__temp_input_{array_name}"
+                input_node = InputNode(temp_var, prompt)
+                assign_node = ArrayAssignmentNode(array_name, index, IdentifierNode(temp_var), index2)
+                return BlockNode("seq", [input_node, assign_node])
+            else:
+                expression = self.parse_expression()
+                if self.match(TokenType.SEMICOLON):
+                    self.advance()
+                return ArrayAssignmentNode(array_name, index, expression, index2)
+        else:
+            if self.match(TokenType.SEMICOLON):
+                self.advance()
+            return ArrayAccessNode(array_name, index, index2)
+
+    def parse_assignment_statement(self):
+        """x = input(...), x = new Classe() ou x = expr."""
+        identifier = self.advance().lexeme
+        self.expect(TokenType.ASSIGN)
+
+        if self.match(TokenType.INPUT):
             self.advance()
-            return None
-        
+            self.expect(TokenType.LPAREN)
+            prompt = None
+            if not self.match(TokenType.RPAREN):
+                prompt = self.parse_expression()
+            self.expect(TokenType.RPAREN)
+            if self.match(TokenType.SEMICOLON):
+                self.advance()
+            return InputNode(identifier, prompt)
+        elif self.match(TokenType.NEW):
+            self.advance()
+            class_name = self.expect(TokenType.IDENT).lexeme
+            self.expect(TokenType.LPAREN)
+            self.expect(TokenType.RPAREN)
+            if self.match(TokenType.SEMICOLON):
+                self.advance()
+            return InstantiationNode(None, identifier, class_name)
+        else:
+            expression = self.parse_expression()
+            if self.match(TokenType.SEMICOLON):
+                self.advance()
+            return AssignmentNode(identifier, expression)
+
+    def parse_call_statement(self):
+        """Chamada de função como comando: f(...);"""
+        name = self.advance().lexeme
+        self.expect(TokenType.LPAREN)
+        args = self.parse_arguments()
+        self.expect(TokenType.RPAREN)
         if self.match(TokenType.SEMICOLON):
             self.advance()
-        
-        return None
+        return FunctionCallNode(name, args)
 
     def parse_if(self):
+        start = self.current_token()
         self.expect(TokenType.IF)
         condition = self.parse_condition()
         self.expect(TokenType.LBRACE)
@@ -647,7 +776,7 @@ class Parser:
                 else_body = self.parse_statements_list()
                 self.expect(TokenType.RBRACE)
         
-        return IfNode(condition, then_body, else_body)
+        return self._set_span(IfNode(condition, then_body, else_body), start)
 
     def parse_while(self):
         self.expect(TokenType.WHILE)
@@ -666,15 +795,16 @@ class Parser:
         condition = self.parse_condition()
         self.expect(TokenType.SEMICOLON)
         
-        increment_var = self.expect(TokenType.IDENT).lexeme
+        increment_token = self.expect(TokenType.IDENT)
         self.expect(TokenType.ASSIGN)
         increment_expr = self.parse_expression()
+        increment = self._set_span(AssignmentNode(increment_token.lexeme, increment_expr), increment_token)
         
         self.expect(TokenType.LBRACE)
         body = self.parse_statements_list()
         self.expect(TokenType.RBRACE)
         
-        return ForNode(var, init_expr, condition, AssignmentNode(increment_var, increment_expr), body)
+        return ForNode(var, init_expr, condition, increment, body)
 
     def parse_print(self):
         self.expect(TokenType.PRINT)
@@ -706,245 +836,288 @@ class Parser:
         return args
 
     def parse_condition(self):
-        left = self.parse_logical_and()
-        return left
-    
-    def parse_logical_and(self):
-        left = self.parse_logical_or()
-        
-        while self.match(TokenType.AND):
-            operator = self.advance().lexeme
-            right = self.parse_logical_or()
-            left = BinaryOpNode(left, operator, right)
-        
-        return left
-    
-    def parse_logical_or(self):
-        left = self.parse_relational()
-        
-        while self.match(TokenType.OR):
-            operator = self.advance().lexeme
-            right = self.parse_relational()
-            left = BinaryOpNode(left, operator, right)
-        
-        return left
-    
-    def parse_relational(self):
-        left = self.parse_expression()
-        
-        if self.match(TokenType.EQ, TokenType.NEQ, TokenType.GT, TokenType.LT, TokenType.GTE, TokenType.LTE):
-            operator = self.advance().lexeme
-            right = self.parse_expression()
-            return ConditionNode(left, operator, right)
-        
-        return left
+        """Condição completa: lógicos, relacionais e aritméticos."""
+        return self.parse_binary(0)
 
     def parse_expression(self):
-        return self.parse_additive()
+        """Expressão aritmética (sem relacionais nem lógicos)."""
+        return self.parse_binary(ADDITIVE_PRECEDENCE)
 
-    def parse_additive(self):
-        left = self.parse_multiplicative()
-        
-        while self.match(TokenType.PLUS, TokenType.MINUS):
-            operator = self.advance().lexeme
-            right = self.parse_multiplicative()
-            left = BinaryOpNode(left, operator, right)
-        
-        return left
+    def parse_binary(self, min_prec):
+        """
+        Parse de operandos ligados por operadores de precedência >= min_prec
+        (tabela BINARY_PRECEDENCE), com pilhas explícitas de operandos e
+        operadores em vez de um método por nível. Parênteses e '-' unário
+        também são empilhados, então aninhamentos profundos não esbarram no
+        limite de recursão do Python.
+        """
+        precedence_of = BINARY_PRECEDENCE
+        minus = TokenType.MINUS
+        lparen = TokenType.LPAREN
+        operands = []
+        bounds = []        # Posição de cada operando, incluindo parênteses
+        operators = []     # (precedência, lexema)
+        groups = []        # Parênteses abertos: (min_prec, '-' pendentes, base, token '(')
+        base = 0           # Início dos operadores do grupo atual
+        negations = []     # Tokens '-' unários aguardando o próximo operando
 
-    def parse_multiplicative(self):
-        left = self.parse_unary()
-        
-        while self.match(TokenType.MUL, TokenType.DIV, TokenType.MOD):
-            operator = self.advance().lexeme
-            right = self.parse_unary()
-            left = BinaryOpNode(left, operator, right)
-        
-        return left
+        while True:
+            # Operando: prefixos '-' e '(' seguidos de um primário
+            token = self.current_token()
+            while token.type is minus or token.type is lparen:
+                self.advance()
+                if token.type is minus:
+                    negations.append(token)
+                else:
+                    # Dentro de parênteses vale apenas parse_expression
+                    groups.append((min_prec, negations, base, token))
+                    min_prec, negations, base = ADDITIVE_PRECEDENCE, [], len(operators)
+                token = self.current_token()
+            operand = self.parse_primary()
+            if negations:
+                operand = self._negate(operand, negations)
+                token = negations[0]
+                negations = []
+            operands.append(operand)
+            bounds.append((token.line, token.column) + _token_end(self._prev))
 
-    def parse_unary(self):
-        if self.match(TokenType.NUMBER):
-            value = self.advance().lexeme
-            return NumberNode(value)
-        elif self.match(TokenType.TEXT):
-            value = self.advance().lexeme
-            return StringNode(value)
-        elif self.match(TokenType.NEW):
+            # Operador seguinte (ou fim de grupo/expressão)
+            while True:
+                token = self.current_token()
+                prec = precedence_of.get(token.type)
+                if prec is not None and prec >= min_prec:
+                    top = operators[-1][0] if len(operators) > base else -1
+                    while top >= prec and not top == prec == RELATIONAL_PRECEDENCE:
+                        self._reduce(operands, bounds, operators)
+                        top = operators[-1][0] if len(operators) > base else -1
+                    # Relacionais não encadeiam: 'a < b < c' termina em 'a < b'
+                    if not top == prec == RELATIONAL_PRECEDENCE:
+                        operators.append((prec, self.advance().lexeme))
+                        break
+                while len(operators) > base:
+                    self._reduce(operands, bounds, operators)
+                if not groups:
+                    return operands.pop()
+                self.expect(TokenType.RPAREN)
+                min_prec, negations, base, token = groups.pop()
+                operand = operands.pop()
+                bounds.pop()
+                if negations:
+                    operand = self._negate(operand, negations)
+                    token = negations[0]
+                    negations = []
+                operands.append(operand)
+                bounds.append((token.line, token.column) + _token_end(self._prev))
+
+    def _negate(self, operand, minus_tokens):
+        """Aplica os '-' unários pendentes (o mais próximo do operando primeiro)."""
+        end_line, end_col = _token_end(self._prev)
+        for token in reversed(minus_tokens):
+            operand = UnaryOpNode('-', operand).set_span(token.line, token.column, end_line, end_col)
+        return operand
+
+    @staticmethod
+    def _reduce(operands, bounds, operators):
+        """Aplica o operador do topo aos dois últimos operandos."""
+        prec, operator = operators.pop()
+        right = operands.pop()
+        left = operands.pop()
+        end_line, end_col = bounds.pop()[2:]
+        line, col = bounds.pop()[:2]
+        if prec == RELATIONAL_PRECEDENCE:
+            node = ConditionNode(left, operator, right)
+        else:
+            node = BinaryOpNode(left, operator, right)
+        operands.append(node.set_span(line, col, end_line, end_col))
+        bounds.append((line, col, end_line, end_col))
+
+    def parse_primary(self):
+        """Parse de um operando sem prefixos: literal, identificador, chamada, new, ..."""
+        start = self.current_token()
+        handler = self._primary_handlers.get(start.type)
+        if handler is None:
+            raise SyntaxError(f"Unexpected token: {start}")  # nó raiz da AST
+        return self._set_span(handler(), start)
+
+    def parse_number(self):
+        value = self.advance().lexeme
+        return NumberNode(value)
+
+    def parse_string(self):
+        value = self.advance().lexeme
+        return StringNode(value)
+
+    def parse_new_expression(self):
+        self.advance()
+        class_name = self.expect(TokenType.IDENT).lexeme
+        self.expect(TokenType.LPAREN)
+        self.expect(TokenType.RPAREN)
+        return NewExpressionNode(class_name)
+
+    def parse_this_expression(self):
+        """this, this.attr, this.a.b, this.metodo(...), this.arr[i], ..."""
+        name = self.advance().lexeme
+        if self.match(TokenType.DOT):
             self.advance()
-            class_name = self.expect(TokenType.IDENT).lexeme
-            self.expect(TokenType.LPAREN)
-            self.expect(TokenType.RPAREN)
-            return NewExpressionNode(class_name)
-        elif self.match(TokenType.THIS):
-            name = self.advance().lexeme
-            if self.match(TokenType.DOT):
+            attr_or_method = self.expect(TokenType.IDENT).lexeme
+
+            # Criar AttributeAccessNode inicial
+            result = AttributeAccessNode(name, attr_or_method)
+
+            # Suporte a acesso encadeado: this.obj.attr ou this.obj.method()
+            while self.match(TokenType.DOT):
                 self.advance()
-                attr_or_method = self.expect(TokenType.IDENT).lexeme
-                
-                # Criar AttributeAccessNode inicial
-                result = AttributeAccessNode(name, attr_or_method)
-                
-                # Suporte a acesso encadeado: this.obj.attr ou this.obj.method()
-                while self.match(TokenType.DOT):
-                    self.advance()
-                    next_attr = self.expect(TokenType.IDENT).lexeme
-                    # Encadear: result se torna o objeto base para o próximo acesso
-                    result = AttributeAccessNode(result, next_attr)
-                
-                # Verificar se é chamada de método no final da cadeia
-                if self.match(TokenType.LPAREN):
-                    self.advance()
-                    args = self.parse_arguments()
-                    self.expect(TokenType.RPAREN)
-                    # Converter último AttributeAccessNode para MethodCallNode
-                    if isinstance(result, AttributeAccessNode):
-                        return MethodCallNode(result.object_name, result.attribute_name, args)
-                elif self.match(TokenType.LBRACKET):
-                    # this.attribute[index] - atributo é array
-                    self.advance()
-                    index = self.parse_expression()
-                    self.expect(TokenType.RBRACKET)
-                    
-                    # Verificar se há segunda dimensão
-                    index2 = None
-                    if self.match(TokenType.LBRACKET):
-                        self.advance()
-                        index2 = self.parse_expression()
-                        self.expect(TokenType.RBRACKET)
-                    
-                    # Verificar se é acesso a atributo/método de objeto no array
-                    if self.match(TokenType.DOT):
-                        self.advance()
-                        member_name = self.expect(TokenType.IDENT).lexeme
-                        if self.match(TokenType.LPAREN):
-                            # this.array[i].metodo() ou this.obj.array[i].metodo()
-                            self.advance()
-                            args = self.parse_arguments()
-                            self.expect(TokenType.RPAREN)
-                            # Usar result (cadeia completa) ao invés de reconstruir
-                            array_access = ArrayAccessWithObjectNode(result, index, index2)
-                            return ArrayElementMethodCallNode(array_access, member_name, args)
-                        else:
-                            # this.array[i].attribute ou this.obj.array[i].attribute
-                            # Usar result (cadeia completa) ao invés de reconstruir
-                            array_access = ArrayAccessWithObjectNode(result, index, index2)
-                            return ArrayElementAttributeAccessNode(array_access, member_name)
-                    else:
-                        # this.array[i] ou this.obj.arr[i]
-                        # Usar result (cadeia completa)
-                        return ArrayAccessWithObjectNode(result, index, index2)
-                else:
-                    # Retornar o resultado (pode ser encadeado)
-                    return result
-            return IdentifierNode(name)
-        elif self.match(TokenType.IDENT):
-            name = self.advance().lexeme
+                next_attr = self.expect(TokenType.IDENT).lexeme
+                # Encadear: result se torna o objeto base para o próximo acesso
+                result = AttributeAccessNode(result, next_attr)
+
+            # Verificar se é chamada de método no final da cadeia
             if self.match(TokenType.LPAREN):
                 self.advance()
                 args = self.parse_arguments()
                 self.expect(TokenType.RPAREN)
-                return FunctionCallNode(name, args)
+                # Converter último AttributeAccessNode para MethodCallNode
+                if isinstance(result, AttributeAccessNode):
+                    return MethodCallNode(result.object_name, result.attribute_name, args)
             elif self.match(TokenType.LBRACKET):
+                # this.attribute[index] - atributo é array
                 self.advance()
                 index = self.parse_expression()
                 self.expect(TokenType.RBRACKET)
-                
+
                 # Verificar se há segunda dimensão
                 index2 = None
                 if self.match(TokenType.LBRACKET):
                     self.advance()
                     index2 = self.parse_expression()
                     self.expect(TokenType.RBRACKET)
-                
+
                 # Verificar se é acesso a atributo/método de objeto no array
                 if self.match(TokenType.DOT):
                     self.advance()
-                    attr_or_method = self.expect(TokenType.IDENT).lexeme
+                    member_name = self.expect(TokenType.IDENT).lexeme
                     if self.match(TokenType.LPAREN):
-                        # Chamada de método em elemento do array
+                        # this.array[i].metodo() ou this.obj.array[i].metodo()
                         self.advance()
                         args = self.parse_arguments()
                         self.expect(TokenType.RPAREN)
-                        array_access = ArrayAccessNode(name, index, index2)
-                        return ArrayElementMethodCallNode(array_access, attr_or_method, args)
+                        # Usar result (cadeia completa) ao invés de reconstruir
+                        array_access = ArrayAccessWithObjectNode(result, index, index2)
+                        return ArrayElementMethodCallNode(array_access, member_name, args)
                     else:
-                        # Acesso a atributo de elemento do array
-                        array_access = ArrayAccessNode(name, index, index2)
-                        return ArrayElementAttributeAccessNode(array_access, attr_or_method)
-                
-                return ArrayAccessNode(name, index, index2)
-            elif self.match(TokenType.DOT):
+                        # this.array[i].attribute ou this.obj.array[i].attribute
+                        # Usar result (cadeia completa) ao invés de reconstruir
+                        array_access = ArrayAccessWithObjectNode(result, index, index2)
+                        return ArrayElementAttributeAccessNode(array_access, member_name)
+                else:
+                    # this.array[i] ou this.obj.arr[i]
+                    # Usar result (cadeia completa)
+                    return ArrayAccessWithObjectNode(result, index, index2)
+            else:
+                # Retornar o resultado (pode ser encadeado)
+                return result
+        return IdentifierNode(name)
+
+    def parse_identifier_expression(self):
+        """x, f(...), arr[i][j], arr[i].attr, obj.attr, obj.metodo(...), ..."""
+        name = self.advance().lexeme
+        if self.match(TokenType.LPAREN):
+            self.advance()
+            args = self.parse_arguments()
+            self.expect(TokenType.RPAREN)
+            return FunctionCallNode(name, args)
+        elif self.match(TokenType.LBRACKET):
+            self.advance()
+            index = self.parse_expression()
+            self.expect(TokenType.RBRACKET)
+
+            # Verificar se há segunda dimensão
+            index2 = None
+            if self.match(TokenType.LBRACKET):
+                self.advance()
+                index2 = self.parse_expression()
+                self.expect(TokenType.RBRACKET)
+
+            # Verificar se é acesso a atributo/método de objeto no array
+            if self.match(TokenType.DOT):
                 self.advance()
                 attr_or_method = self.expect(TokenType.IDENT).lexeme
-                
-                # Criar AttributeAccessNode inicial
-                result = AttributeAccessNode(name, attr_or_method)
-                
-                # Suporte a acesso encadeado: obj.obj2.attr
-                while self.match(TokenType.DOT):
-                    self.advance()
-                    next_attr = self.expect(TokenType.IDENT).lexeme
-                    result = AttributeAccessNode(result, next_attr)
-                
-                # Verificar se é chamada de método no final da cadeia
                 if self.match(TokenType.LPAREN):
+                    # Chamada de método em elemento do array
                     self.advance()
                     args = self.parse_arguments()
                     self.expect(TokenType.RPAREN)
-                    if isinstance(result, AttributeAccessNode):
-                        return MethodCallNode(result.object_name, result.attribute_name, args)
-                elif self.match(TokenType.LBRACKET):
-                    # object.attribute[index] - atributo é array
+                    array_access = ArrayAccessNode(name, index, index2)
+                    return ArrayElementMethodCallNode(array_access, attr_or_method, args)
+                else:
+                    # Acesso a atributo de elemento do array
+                    array_access = ArrayAccessNode(name, index, index2)
+                    return ArrayElementAttributeAccessNode(array_access, attr_or_method)
+
+            return ArrayAccessNode(name, index, index2)
+        elif self.match(TokenType.DOT):
+            self.advance()
+            attr_or_method = self.expect(TokenType.IDENT).lexeme
+
+            # Criar AttributeAccessNode inicial
+            result = AttributeAccessNode(name, attr_or_method)
+
+            # Suporte a acesso encadeado: obj.obj2.attr
+            while self.match(TokenType.DOT):
+                self.advance()
+                next_attr = self.expect(TokenType.IDENT).lexeme
+                result = AttributeAccessNode(result, next_attr)
+
+            # Verificar se é chamada de método no final da cadeia
+            if self.match(TokenType.LPAREN):
+                self.advance()
+                args = self.parse_arguments()
+                self.expect(TokenType.RPAREN)
+                if isinstance(result, AttributeAccessNode):
+                    return MethodCallNode(result.object_name, result.attribute_name, args)
+            elif self.match(TokenType.LBRACKET):
+                # object.attribute[index] - atributo é array
+                self.advance()
+                index = self.parse_expression()
+                self.expect(TokenType.RBRACKET)
+
+                # Verificar se há segunda dimensão
+                index2 = None
+                if self.match(TokenType.LBRACKET):
                     self.advance()
-                    index = self.parse_expression()
+                    index2 = self.parse_expression()
                     self.expect(TokenType.RBRACKET)
-                    
-                    # Verificar se há segunda dimensão
-                    index2 = None
-                    if self.match(TokenType.LBRACKET):
-                        self.advance()
-                        index2 = self.parse_expression()
-                        self.expect(TokenType.RBRACKET)
-                    
-                    # Verificar se é acesso a atributo/método de objeto no array
-                    if self.match(TokenType.DOT):
+
+                # Verificar se é acesso a atributo/método de objeto no array
+                if self.match(TokenType.DOT):
+                    self.advance()
+                    member_name = self.expect(TokenType.IDENT).lexeme
+                    if self.match(TokenType.LPAREN):
+                        # object.array[i].metodo()
                         self.advance()
-                        member_name = self.expect(TokenType.IDENT).lexeme
-                        if self.match(TokenType.LPAREN):
-                            # object.array[i].metodo()
-                            self.advance()
-                            args = self.parse_arguments()
-                            self.expect(TokenType.RPAREN)
-                            attr_access = AttributeAccessNode(name, attr_or_method)
-                            array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
-                            return ArrayElementMethodCallNode(array_access, member_name, args)
-                        else:
-                            # object.array[i].attribute
-                            attr_access = AttributeAccessNode(name, attr_or_method)
-                            array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
-                            return ArrayElementAttributeAccessNode(array_access, member_name)
+                        args = self.parse_arguments()
+                        self.expect(TokenType.RPAREN)
+                        attr_access = AttributeAccessNode(name, attr_or_method)
+                        array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
+                        return ArrayElementMethodCallNode(array_access, member_name, args)
                     else:
-                        # object.array[i]
+                        # object.array[i].attribute
                         attr_access = AttributeAccessNode(name, attr_or_method)
-                        return ArrayAccessWithObjectNode(attr_access, index, index2)
+                        array_access = ArrayAccessWithObjectNode(attr_access, index, index2)
+                        return ArrayElementAttributeAccessNode(array_access, member_name)
                 else:
-                    # Retornar o resultado (pode ser encadeado)
-                    return result
-            return IdentifierNode(name)
-        elif self.match(TokenType.LPAREN):
-            self.advance()
-            expr = self.parse_expression()
-            self.expect(TokenType.RPAREN)
-            return expr
-        elif self.match(TokenType.STRLEN, TokenType.SUBSTR, TokenType.CHARAT, TokenType.INDEXOF, TokenType.PARSEINT):
-            name = self.advance().lexeme
-            self.expect(TokenType.LPAREN)
-            args = self.parse_arguments()
-            self.expect(TokenType.RPAREN)
-            return FunctionCallNode(name, args)
-        elif self.match(TokenType.MINUS):
-            operator = self.advance().lexeme
-            operand = self.parse_unary()
-            return UnaryOpNode(operator, operand)
-        else:
-            raise SyntaxError(f"Unexpected token: {self.current_token()}")  # nó raiz da AST
+                    # object.array[i]
+                    attr_access = AttributeAccessNode(name, attr_or_method)
+                    return ArrayAccessWithObjectNode(attr_access, index, index2)
+            else:
+                # Retornar o resultado (pode ser encadeado)
+                return result
+        return IdentifierNode(name)
+
+    def parse_builtin_call(self):
+        """Funções de string nativas: strlen(...), substr(...), ..."""
+        name = self.advance().lexeme
+        self.expect(TokenType.LPAREN)
+        args = self.parse_arguments()
+        self.expect(TokenType.RPAREN)
+        return FunctionCallNode(name, args)
@@ -0,0 +1,269 @@
+# ============================================================================
+# Traversal.py - Percurso da AST (visitor, transformer e walk iterativo)
+# ============================================================================
+# Base comum das passagens sobre a AST (análise semântica, geração de TAC,
+# impressão e serialização):
+#
+# - CHILD_FIELDS: para cada classe de nó, os campos que podem conter nós
+#   filhos (um nó ou uma lista de nós), na ordem do construtor
+# - NodeVisitor: despacho para visit_<Classe> por tabela, montada uma vez por
+#   classe de visitante, em vez de f-string + getattr a cada nó
+# - NodeTransformer: visitante que substitui/remove nós pelo retorno de visit
+# - walk / iter_child_nodes: percurso sem recursão, para árvores profundas
+# - ast_to_dict: serialização em dicionário (JSON), também sem recursão
+# ============================================================================
+
+from parser.AST import *
+
+
+# Campos que podem conter nós filhos. Os demais campos guardam nomes,
+# operadores e flags; alguns destes (ex.: object_name) também podem ser um
+# nó, e por isso aparecem aqui: o tipo é conferido ao percorrer.
+CHILD_FIELDS = {
+    ProgramNode: ('children',),
+    CommentNode: (),
+    ClassNode: ('attributes', 'methods'),
+    AttributeNode: ('array_size', 'array_dimensions'),
+    MethodNode: ('body',),
+    FunctionNode: ('body',),
+    BlockNode: ('statements',),
+    AssignmentNode: ('expression',),
+    IfNode: ('condition', 'then_body', 'else_body'),
+    WhileNode: ('condition', 'body'),
+    ForNode: ('init_expr', 'condition', 'increment', 'body'),
+    InstantiationNode: (),
+    NewExpressionNode: (),
+    ArrayElementMethodCallNode: ('array_access', 'arguments'),
+    ArrayElementAttributeAssignmentNode: ('array_access', 'value'),
+    ArrayElementAttributeAccessNode: ('array_access',),
+    ArrayAccessWithObjectNode: ('object_attr_access', 'index', 'index2'),
+    ObjectAttributeArrayAssignmentNode: ('index', 'value', 'index2'),
+    MethodCallNode: ('object_name', 'arguments'),
+    FunctionCallNode: ('arguments',),
+    PrintNode: ('expression',),
+    InputNode: ('prompt',),
+    SendNode: ('values',),
+    ReceiveNode: ('variables',),
+    ReturnNode: ('expression',),
+    BinaryOpNode: ('left', 'right'),
+    UnaryOpNode: ('operand',),
+    NumberNode: (),
+    StringNode: (),
+    IdentifierNode: (),
+    AttributeAccessNode: ('object_name',),
+    AttributeAssignmentNode: ('object_name', 'expression'),
+    ConditionNode: ('left', 'right'),
+    DeclarationNode: ('initial_value', 'array_size', 'array_dimensions'),
+    ArrayAccessNode: ('index', 'index2'),
+    ArrayAssignmentNode: ('index', 'expression', 'index2'),
+    ArrayInitNode: ('elements',),
+    BraceInitNode: ('values',),
+}
+
+
+def child_fields(cls):
+    """Campos de cls que podem conter nós (todos os _fields se cls não está na tabela)."""
+    fields = CHILD_FIELDS.get(cls)
+    if fields is None:
+        fields = CHILD_FIELDS[cls] = getattr(cls, '_fields', ())
+    return fields
+
+
+def iter_child_nodes(node):
+    """Gera os nós filhos diretos de node, na ordem dos campos."""
+    for field in child_fields(node.__class__):
+        value = getattr(node, field)
+        if isinstance(value, ASTNode):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ASTNode):
+                    yield item
+
+
+def walk(node):
+    """Todos os nós da subárvore de node em pré-ordem, sem recursão."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        children = list(iter_child_nodes(node))
+        children.reverse()
+        stack.extend(children)
+
+
+class NodeVisitor:
+    """
+    Visitante da AST: visit(node) chama visit_<Classe>(node) se existir, ou
+    generic_visit(node), que visita os filhos. A tabela classe -> método é
+    montada quando a subclasse é criada (e completada sob demanda para
+    classes que não são nós), então cada visita custa um acesso a dict.
+    """
+
+    _dispatch = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+        for node_class in CHILD_FIELDS:
+            cls._handler(node_class)
+
+    @classmethod
+    def _handler(cls, node_class):
+        handler = getattr(cls, 'visit_' + node_class.__name__, None) or cls.generic_visit
+        cls._dispatch[node_class] = handler
+        return handler
+
+    def visit(self, node):
+        """Visita node e retorna o resultado do método correspondente."""
+        if node is None:
+            return None
+        handler = self._dispatch.get(node.__class__)
+        if handler is None:
+            handler = self._handler(node.__class__)
+        return handler(self, node)
+
+    def generic_visit(self, node):
+        """Visita os filhos de node (nós sem visit_<Classe>)."""
+        for child in iter_child_nodes(node):
+            self.visit(child)
+        return None
+
+
+class NodeTransformer(NodeVisitor):
+    """
+    Visitante que reescreve a árvore: o retorno de visit substitui o nó
+    visitado. Em listas, None remove o nó e uma lista insere vários nós.
+    Sem visit_<Classe>, os filhos são transformados e o nó é mantido.
+    """
+
+    def generic_visit(self, node):
+        for field in child_fields(node.__class__):
+            value = getattr(node, field)
+            if isinstance(value, ASTNode):
+                setattr(node, field, self.visit(value))
+            elif isinstance(value, list):
+                new_values = []
+                for item in value:
+                    if isinstance(item, ASTNode):
+                        item = self.visit(item)
+                        if item is None:
+                            continue
+                        if isinstance(item, list):
+                            new_values.extend(item)
+                            continue
+                    new_values.append(item)
+                value[:] = new_values
+        return node
+
+
+# ============================================================================
+# Serialização em dicionário (JSON)
+# ============================================================================
+
+# Atributos simples (strings, números, booleanos)
+_SIMPLE_ATTRS = [
+    'value', 'name', 'operator', 'text', 'parent', 'class_name',
+    'type_name', 'var_name', 'identifier', 'method_name', 'object_name',
+    'attribute_name', 'array_name', 'var', 'return_type', 'block_type',
+    'prompt', 'channel', 'is_array', 'is_2d_array', 'attr_name', 'channel_capacity'
+]
+
+# Atributos que são nós únicos
+_SINGLE_NODE_ATTRS = [
+    'condition', 'expression', 'left', 'right', 'operand',
+    'init_expr', 'increment', 'initial_value', 'index', 'index2',
+    'array_access', 'object_attr_access', 'array_size', 'object'
+]
+
+# Atributos que são listas de nós
+_LIST_ATTRS = [
+    'children', 'attributes', 'methods', 'parameters', 'body',
+    'statements', 'arguments', 'values', 'elements', 'variables',
+    'then_body', 'else_body'
+]
+
+# Campos de cada classe separados por categoria, na ordem de serialização
+_DICT_PLANS = {}
+
+
+def _dict_plan(cls):
+    plan = _DICT_PLANS.get(cls)
+    if plan is None:
+        fields = set(cls._fields)
+        plan = (
+            [attr for attr in _SIMPLE_ATTRS if attr in fields],
+            [attr for attr in _SINGLE_NODE_ATTRS if attr in fields],
+            [attr for attr in _LIST_ATTRS if attr in fields],
+            'array_dimensions' in fields,
+            'channel_info' in fields,
+        )
+        _DICT_PLANS[cls] = plan
+    return plan
+
+
+def _value_dict(value, pending):
+    """Dicionário de value; nós entram em pending para serem preenchidos depois."""
+    if isinstance(value, ASTNode):
+        result = {}
+        pending.append((value, result))
+        return result
+    if isinstance(value, tuple) and len(value) == 2:
+        # Parâmetro de função/método: (tipo, nome)
+        return {'type': 'Parameter', 'type_name': str(value[0]), 'name': str(value[1])}
+    if isinstance(value, (str, bool, int, float)):
+        # Escalar em uma lista (ex.: nomes) ou em um campo de nó: sem mudança
+        return value
+    return {'type': type(value).__name__}
+
+
+def ast_to_dict(node):
+    """Converte um nó da AST para dicionário (serializável em JSON)."""
+    if node is None:
+        return None
+    pending = []
+    root = _value_dict(node, pending)
+    # Cada dicionário é criado vazio ao ser referenciado pelo pai e preenchido
+    # quando sai da pilha: a ordem das chaves é a mesma da versão recursiva
+    while pending:
+        node, result = pending.pop()
+        result['type'] = type(node).__name__
+        simple_attrs, single_node_attrs, list_attrs, has_dimensions, has_channel_info = _dict_plan(type(node))
+
+        for attr in simple_attrs:
+            val = getattr(node, attr)
+            if isinstance(val, ASTNode):
+                # Ex.: value de ArrayElementAttributeAssignmentNode é uma expressão
+                result[attr] = _value_dict(val, pending)
+            elif val is not None:
+                result[attr] = str(val) if not isinstance(val, (bool, int, float)) else val
+
+        for attr in single_node_attrs:
+            val = getattr(node, attr)
+            if val is not None:
+                result[attr] = _value_dict(val, pending)
+
+        for attr in list_attrs:
+            val = getattr(node, attr)
+            if val:
+                if isinstance(val, list):
+                    result[attr] = [_value_dict(item, pending) if item is not None else None for item in val]
+                else:
+                    # Se não for lista mas existir (ex: then_body pode ser lista ou None)
+                    result[attr] = _value_dict(val, pending)
+
+        # Atributos especiais
+        if has_dimensions and node.array_dimensions:
+            result['array_dimensions'] = [_value_dict(dim, pending) if isinstance(dim, ASTNode) else dim for dim in node.array_dimensions]
+
+        if has_channel_info and node.channel_info:
+            result['channel_info'] = str(node.channel_info)
+
+        # Posição no fonte
+        if node.line is not None:
+            result['line'] = node.line
+            result['col'] = node.col
+            result['end_line'] = node.end_line
+            result['end_col'] = node.end_col
+
+    return root
@@ -0,0 +1,85 @@
+# ============================================================================
+# AsyncRuntime.py - Execução com os Comandos do PAR como Corrotinas (async)
+# ============================================================================
+# Modo async: o programa é traduzido para Python como no PythonRuntime, mas
+# com PythonGenerator(coroutines=True). Funções, métodos e cada comando de
+# um PAR viram corrotinas executadas em um único event loop (asyncio.run),
+# na thread do programa:
+#
+# - PAR: os comandos rodam como tarefas do loop (asyncio.gather) e o bloco
+#   espera todas; um comando esperando em receive não ocupa uma thread, então
+#   cabem dezenas de milhares de ramos em um processo
+# - send/receive: Channel.send_async/receive_async; um receive sem valor
+#   suspende a corrotina até um send (de outra corrotina, ou da thread de
+#   leitura de um NetworkChannel) entregar um valor
+# - A troca entre ramos só acontece em um receive que espera: um ramo que
+#   nunca espera (ex.: laço que só calcula) executa até o fim antes dos
+#   outros, e input() e o envio por rede bloqueiam o loop enquanto duram
+# - Exceção não tratada em um ramo: mostrada em stderr, como nas threads, e
+#   os demais ramos continuam
+# ============================================================================
+
+import sys
+import asyncio
+import traceback
+
+from parser.AST import ProgramNode
+from codegen.PythonGenerator import PythonGenerator
+from runtime.Interpreter import ObjectInstance
+from runtime.PythonRuntime import PythonRuntime
+
+
+class AsyncRuntime(PythonRuntime):
+    """PythonRuntime com funções, métodos e comandos do PAR como corrotinas."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self.par_backend == 'process':
+            print("AVISO: no modo async os comandos do PAR são corrotinas; par_backend 'process' ignorado")
+
+    def interpret(self, ast):
+        if isinstance(ast, ProgramNode):
+            self.execute(PythonGenerator(coroutines=True).compile(ast))
+
+    def execute(self, program):
+        """Executa um PythonProgram gerado com coroutines=True em um event loop novo."""
+        self.program = program
+        self.collect_definitions(program.ast)
+        namespace = self.namespace(program)
+        exec(program.code, namespace)
+        asyncio.run(namespace['_main']())
+
+    def namespace(self, program):
+        namespace = super().namespace(program)
+        namespace['_parallel'] = self.run_parallel_async
+        namespace['_invoke'] = self.invoke_method_async
+        namespace['_invoke_element'] = self.invoke_element_method_async
+        return namespace
+
+    # ------------------- Funções usadas pelo código gerado -------------------
+
+    async def run_parallel_async(self, branches):
+        """Executa as corrotinas dos comandos de um PAR e espera todas."""
+        await asyncio.gather(*(self.run_branch_async(branch) for branch in branches))
+
+    async def run_branch_async(self, branch):
+        try:
+            await branch()
+        except Exception:
+            print(f"Exception in task {asyncio.current_task().get_name()}:", file=sys.stderr)
+            traceback.print_exc()
+
+    async def invoke_method_async(self, obj, method_name, count, *arguments):
+        if isinstance(obj, ObjectInstance):
+            method = obj.get_method(method_name)
+            if method:
+                return await self.methods[method](obj, *arguments[:count])
+        elif obj and hasattr(obj, method_name):
+            # Objetos Python (ex.: canais)
+            return getattr(obj, method_name)(*arguments[:count])
+        return None
+
+    async def invoke_element_method_async(self, obj, method_name, count, *arguments):
+        if isinstance(obj, ObjectInstance):
+            return await self.invoke_method_async(obj, method_name, count, *arguments)
+        return None
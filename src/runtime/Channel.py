@@ -1,28 +1,135 @@
 import queue
+import asyncio
 import threading
 import socket
 import struct
 import json
 import time
+from collections import deque
+
+
+def _resolve(future):
+    if not future.done():
+        future.set_result(None)
+
+
+def _unpack(values, count):
+    """Valores de um receive: o valor sozinho se count é 1 e veio um só."""
+    if count == 1:
+        return values[0] if len(values) == 1 else values
+    return values[:count]
 
 
 class Channel:
-    def __init__(self):
-        self.queue = queue.Queue()
+    # True depois de share(): a fila é vista por outros processos
+    shared = False
+    # Corrotinas esperando em receive_async: (future, loop, id da thread do loop)
+    _waiters = None
+    # Corrotinas esperando espaço em send_async (canal limitado cheio)
+    _senders = None
+
+    def __init__(self, capacity=0):
+        # capacity > 0: canal limitado, send espera enquanto há capacity
+        # valores não recebidos; 0: sem limite
+        self.capacity = capacity
+        self.queue = queue.Queue(capacity)
+    
+    def share(self, shared_queue):
+        """Passa a usar shared_queue (ex.: fila de um multiprocessing.Manager, com maxsize = capacity), com os valores já enviados."""
+        while True:
+            try:
+                shared_queue.put(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        self.queue = shared_queue
+        self.shared = True
     
     def send(self, *values):
         self.queue.put(values)
+        if self._waiters:
+            self._wake(self._waiters)
     
     def receive(self, count=1):
         values = self.queue.get(block=True)
-        if count == 1:
-            return values[0] if len(values) == 1 else values
-        return values[:count]
+        if self._senders:
+            self._wake(self._senders)
+        return _unpack(values, count)
+    
+    def _put(self, values):
+        """Entrega values (tupla) a quem recebe, como send."""
+        self.queue.put(values)
+        if self._waiters:
+            self._wake(self._waiters)
+    
+    def _wake(self, waiters):
+        """Acorda a corrotina de waiters que espera há mais tempo (de qualquer thread)."""
+        while waiters:
+            try:
+                future, loop, thread = waiters.popleft()
+            except IndexError:
+                return
+            if future.done():
+                continue
+            if thread == threading.get_ident():
+                future.set_result(None)
+            else:
+                loop.call_soon_threadsafe(_resolve, future)
+            return
+    
+    async def _suspend(self, name, blocked):
+        """Espera na fila de corrotinas name (_waiters ou _senders) até um _wake, se blocked() ainda é verdadeiro."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (future, loop, threading.get_ident())
+        waiters = getattr(self, name)
+        if waiters is None:
+            waiters = deque()
+            setattr(self, name, waiters)
+        waiters.append(waiter)
+        if not blocked():
+            # Um send/receive entre a tentativa e o append não acordou ninguém
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+            return
+        await future
+    
+    async def send_async(self, *values):
+        """send para corrotinas (modo async): com o canal cheio, espera no event loop."""
+        while True:
+            try:
+                self.queue.put_nowait(values)
+                break
+            except queue.Full:
+                await self._suspend('_senders', self.queue.full)
+        if self._waiters:
+            self._wake(self._waiters)
+    
+    async def receive_async(self, count=1):
+        """receive para corrotinas (modo async): espera no event loop, sem ocupar uma thread."""
+        return _unpack(await self._get_async(), count)
+    
+    async def _get_async(self):
+        while True:
+            try:
+                values = self.queue.get_nowait()
+                break
+            except queue.Empty:
+                await self._suspend('_waiters', self.queue.empty)
+        if self._senders:
+            self._wake(self._senders)
+        return values
     
     def is_empty(self):
         return self.queue.empty()
 
 
+class _Remote(tuple):
+    """Valores que chegaram pela rede: o receive devolve um crédito a quem enviou."""
+    __slots__ = ()
+
+
 class NetworkChannel(Channel):
     """Channel backed by a TCP connection. Supports one-to-one communication.
 
@@ -32,10 +139,16 @@ class NetworkChannel(Channel):
 
     Uses a small framing protocol: 4-byte big-endian length prefix followed by JSON payload.
     Payload format: {"op": "send", "values": [ {"t":"INT","v":5}, ... ] }
+
+    Com capacity > 0 (canal limitado), o envio usa créditos: cada lado começa
+    a conexão dando ao outro os lugares livres da sua fila
+    ({"op": "credit", "n": N}) e devolve 1 crédito a cada receive de um valor
+    que veio da rede; send espera um crédito antes de escrever no socket.
+    Assim nem o socket nem a fila de quem recebe passam de capacity valores.
     """
 
-    def __init__(self, mode: str, host: str, port: int, type_tag=True, reconnect=True):
-        super().__init__()
+    def __init__(self, mode: str, host: str, port: int, type_tag=True, reconnect=True, capacity=0):
+        super().__init__(capacity)
         self.mode = mode  # 'server' or 'client'
         self.host = host
         self.port = int(port)
@@ -45,13 +158,19 @@ class NetworkChannel(Channel):
         self.running = False
         self.type_tag = type_tag
         self.reconnect = reconnect
+        # Envios que o outro lado ainda aceita (canal limitado), por conexão
+        self.credits = 0
+        self.credit_ready = threading.Condition()
+        # Mensagens de threads diferentes (send e créditos) não se misturam no socket
+        self.write_lock = threading.Lock()
         self._start()
 
     # --- framing utils ---
     def _send_json(self, sock, obj):
         data = json.dumps(obj).encode('utf-8')
         length = struct.pack('>I', len(data))
-        sock.sendall(length + data)
+        with self.write_lock:
+            sock.sendall(length + data)
 
     def _recv_exact(self, sock, n):
         buf = b''
@@ -88,7 +207,7 @@ class NetworkChannel(Channel):
         while self.running:
             try:
                 conn, addr = self.sock.accept()
-                self.conn = conn
+                self._connected(conn)
                 # start reader for this connection
                 self._reader_loop(conn)
             except Exception:
@@ -99,13 +218,21 @@ class NetworkChannel(Channel):
             try:
                 s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 s.connect((self.host, self.port))
-                self.conn = s
+                self._connected(s)
                 self._reader_loop(s)
             except Exception:
                 if not self.reconnect:
                     break
                 time.sleep(1)
 
+    def _connected(self, conn):
+        """Nova conexão: os créditos da anterior não valem mais; dá ao outro lado os lugares livres da fila."""
+        with self.credit_ready:
+            self.credits = 0
+        self.conn = conn
+        if self.capacity:
+            self._send_json(conn, {'op': 'credit', 'n': max(self.capacity - self.queue.qsize(), 0)})
+
     def _reader_loop(self, conn):
         try:
             while self.running:
@@ -120,12 +247,39 @@ class NetworkChannel(Channel):
                         else:
                             values.append(it)
                     # push into local queue as tuple
-                    self.queue.put(tuple(values))
+                    self._put(_Remote(values))
+                elif msg.get('op') == 'credit':
+                    with self.credit_ready:
+                        self.credits += int(msg.get('n', 0))
+                        self.credit_ready.notify_all()
         except Exception:
             # connection closed
             self.conn = None
+            # Quem espera crédito desta conexão passa a usar a fila local
+            with self.credit_ready:
+                self.credit_ready.notify_all()
             return
 
+    def _take_credit(self, sock):
+        """Espera e consome um crédito de envio de sock; False se a conexão caiu antes."""
+        with self.credit_ready:
+            while self.credits == 0:
+                if self.conn is not sock or not self.running:
+                    return False
+                self.credit_ready.wait(0.5)
+            self.credits -= 1
+        return True
+
+    def _received(self, values):
+        """Depois de um receive: devolve o crédito de um valor que veio da rede."""
+        if self.capacity and values.__class__ is _Remote:
+            sock = self.conn
+            if sock:
+                try:
+                    self._send_json(sock, {'op': 'credit', 'n': 1})
+                except Exception:
+                    pass
+
     # --- send/receive overrides ---
     def send(self, *values):
         # Prepare payload with simple type tagging if requested
@@ -147,19 +301,33 @@ class NetworkChannel(Channel):
 
         # If connection available, send immediately; otherwise queue locally (best-effort)
         sock = self.conn
+        if sock and self.capacity and not self._take_credit(sock):
+            sock = None
         if sock:
             try:
                 self._send_json(sock, payload)
             except Exception:
                 # on failure, fallback to local queue
-                self.queue.put(tuple(values))
+                self._put(tuple(values))
         else:
             # no network connection - enqueue locally so local receive can still get it
-            self.queue.put(tuple(values))
+            self._put(tuple(values))
 
     def receive(self, count=1):
         # Blocking read from local queue (populated by network reader or local send fallback)
-        values = super().receive(count)
+        values = self.queue.get(block=True)
+        if self._senders:
+            self._wake(self._senders)
+        self._received(values)
+        return _unpack(values, count)
+
+    async def send_async(self, *values):
+        # O envio pela rede (e a espera por crédito) bloqueia o event loop enquanto dura
+        self.send(*values)
+
+    async def _get_async(self):
+        values = await super()._get_async()
+        self._received(values)
         return values
 
     def close(self):
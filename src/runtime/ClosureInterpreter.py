@@ -0,0 +1,683 @@
+# ============================================================================
+# ClosureInterpreter.py - Execução por Closures Compiladas
+# ============================================================================
+# Modo de execução alternativo ao percurso da AST: cada nó é compilado uma
+# única vez em uma closure Python (frame -> valor) que já conhece o tipo do
+# nó, seus filhos compilados, o slot da variável e a operação escolhida pelo
+# tipo estático. Executar deixa de passar pelas cadeias de isinstance de
+# execute_statement/evaluate_expression a cada comando e subexpressão.
+#
+# - Expressões: closure(frame) -> valor
+# - Comandos: closure(frame) -> None, ou (valor,) quando um RETURN foi
+#   executado; laços e blocos repassam esse retorno em vez de usar exceção
+# - O frame da função/método em execução é passado como argumento; o
+#   thread_state do Interpreter continua atualizado a cada chamada, então os
+#   nós menos frequentes (declarações de canal/array, input, send/receive,
+#   acessos via elementos de array...) usam os métodos do Interpreter, que
+#   por sua vez avaliam suas subexpressões já compiladas
+#
+# A semântica (saída, escopos, canais, PAR) é a mesma do Interpreter.
+# ============================================================================
+
+from parser.AST import *
+from runtime.Interpreter import Interpreter, ObjectInstance
+from runtime.TypedArray import ARRAY_TYPES
+from runtime.Resolver import UNSET
+from runtime.natives import NATIVE_FUNCTIONS
+from runtime.typed_ops import COMPARISONS, literal_value, select_binary_op
+
+
+def _nothing(frame):
+    return None
+
+
+class ClosureInterpreter(Interpreter):
+    """Interpreter que executa closures compiladas a partir da AST."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._statements = {}   # nó -> closure de comando
+        self._expressions = {}  # nó -> closure de expressão
+        self._bodies = {}       # FunctionNode/MethodNode -> closure do corpo
+
+    def interpret(self, ast):
+        if isinstance(ast, ProgramNode):
+            self.resolver.resolve(ast)
+            # Compila tudo antes de executar: o programa e o corpo de cada
+            # função e método
+            for node in ast.children:
+                if isinstance(node, FunctionNode):
+                    self._body(node)
+                elif isinstance(node, ClassNode):
+                    for method in node.methods:
+                        self._body(method)
+                else:
+                    self._statement(node)
+            self.collect_definitions(ast)
+            self.execute_program(ast)
+
+    # ------------------- Pontos de entrada do Interpreter -------------------
+
+    def execute_statement(self, node):
+        return self._statement(node)(self.thread_state.frame)
+
+    def evaluate_expression(self, node):
+        return self._expression(node)(self.thread_state.frame)
+
+    def execute_body(self, callable_node, frame):
+        body = self._bodies.get(callable_node)
+        if body is None:
+            body = self._body(callable_node)
+        state = self.thread_state
+        old_frame = state.frame
+        state.frame = frame
+        try:
+            result = body(frame)
+        finally:
+            state.frame = old_frame
+        if result is not None:
+            return result[0]
+        return None
+
+    # ------------------- Caches de compilação -------------------
+
+    def _statement(self, node):
+        closure = self._statements.get(node)
+        if closure is None:
+            closure = self._statements[node] = self.compile_statement(node)
+        return closure
+
+    def _expression(self, node):
+        closure = self._expressions.get(node)
+        if closure is None:
+            closure = self._expressions[node] = self.compile_expression(node)
+        return closure
+
+    def _body(self, callable_node):
+        body = self._bodies.get(callable_node)
+        if body is None:
+            body = self._bodies[callable_node] = self.compile_block(callable_node.body)
+        return body
+
+    def _invoke(self, callable_node, argument_closures, frame, this=None):
+        """Chama função/método: argumentos avaliados no frame de quem chama."""
+        layout = self.resolver.layouts.get(callable_node)
+        if layout is None:
+            layout = self.resolver.resolve_callable(callable_node, isinstance(callable_node, MethodNode))
+        new_frame = layout.new_frame()
+        bound = False
+        if this is not None:
+            new_frame[layout.this_slot] = this
+            bound = True
+        for argument, slot in zip(argument_closures, layout.parameter_slots):
+            new_frame[slot] = argument(frame)
+            bound = True
+        return self.execute_body(callable_node, new_frame if bound else None)
+
+    # ------------------- Comandos -------------------
+
+    def compile_statement(self, node):
+        """Closure de um comando: frame -> None, ou (valor,) após um RETURN."""
+        compiler = self._STATEMENT_COMPILERS.get(node.__class__)
+        if compiler is not None:
+            return compiler(self, node)
+        if node is None:
+            return _nothing
+        return self._fallback_statement(node)
+
+    def compile_block(self, statements):
+        """Closure de uma lista de comandos (repassa o RETURN)."""
+        closures = tuple(self._statement(stmt) for stmt in statements or ())
+        if not closures:
+            return _nothing
+        if len(closures) == 1:
+            return closures[0]
+
+        def block(frame):
+            for closure in closures:
+                result = closure(frame)
+                if result is not None:
+                    return result
+            return None
+        return block
+
+    def _fallback_statement(self, node):
+        execute = Interpreter.execute_statement
+
+        def statement(frame):
+            return execute(self, node)
+        return statement
+
+    def _compile_block_node(self, node):
+        if node.block_type == "seq":
+            return self.compile_block(node.statements)
+        if node.block_type == "par":
+            def parallel(frame):
+                self.execute_parallel_block(node)
+            return parallel
+        return _nothing
+
+    def _compile_declaration(self, node):
+        if node.type_name.lower() == "c_channel" or node.is_2d_array or node.is_array:
+            # Canais e arrays: montagem do valor fica com o Interpreter
+            def declaration(frame):
+                self.execute_declaration(node, frame)
+            return declaration
+
+        initial = self._expression(node.initial_value) if node.initial_value else None
+        name = node.identifier
+        type_name = node.type_name
+        slot = node.slot
+        variable_types = self.variable_types
+        define_global = self.define_global
+
+        def declaration(frame):
+            value = initial(frame) if initial is not None else None
+            if frame is not None and slot is not None:
+                frame[slot] = value
+                variable_types[name] = type_name
+            else:
+                define_global(name, type_name, value, node.is_array, node.array_size)
+        return declaration
+
+    def _compile_assignment(self, node):
+        value_of = self._expression(node.expression)
+        name = node.identifier
+        slot = node.slot
+        global_scope = self.global_scope
+        symbol_table = self.symbol_table
+        global_locks = self.global_locks
+
+        if slot is None:
+            def assignment(frame):
+                value = value_of(frame)
+                with global_locks(name):
+                    global_scope[name] = value
+                    symbol_table.update(name, value)
+            return assignment
+
+        def assignment(frame):
+            value = value_of(frame)
+            if frame is not None and frame[slot] is not UNSET:
+                frame[slot] = value
+            else:
+                with global_locks(name):
+                    global_scope[name] = value
+                    symbol_table.update(name, value)
+        return assignment
+
+    def _compile_array_assignment(self, node):
+        array_of = self.compile_load(node, node.array_name)
+        index_of = self._expression(node.index)
+        value_of = self._expression(node.expression)
+
+        if node.index2 is not None:
+            index2_of = self._expression(node.index2)
+
+            def array_assignment(frame):
+                array = array_of(frame)
+                if isinstance(array, ARRAY_TYPES):
+                    index1 = index_of(frame)
+                    index2 = index2_of(frame)
+                    value = value_of(frame)
+                    if isinstance(array[int(index1)], ARRAY_TYPES):
+                        array[int(index1)][int(index2)] = value
+            return array_assignment
+
+        def array_assignment(frame):
+            array = array_of(frame)
+            if isinstance(array, ARRAY_TYPES):
+                index = index_of(frame)
+                array[int(index)] = value_of(frame)
+        return array_assignment
+
+    def _compile_attribute_assignment(self, node):
+        object_of = self.compile_load(node, node.object_name)
+        value_of = self._expression(node.expression)
+        attribute = node.attribute_name
+
+        def attribute_assignment(frame):
+            obj = object_of(frame)
+            if isinstance(obj, ObjectInstance):
+                obj.set_attribute(attribute, value_of(frame))
+        return attribute_assignment
+
+    def _compile_if(self, node):
+        condition = self.compile_condition(node.condition)
+        then_body = self.compile_block(node.then_body)
+        if not node.else_body:
+            def if_statement(frame):
+                if condition(frame):
+                    return then_body(frame)
+                return None
+            return if_statement
+
+        else_body = self.compile_block(node.else_body)
+
+        def if_else(frame):
+            if condition(frame):
+                return then_body(frame)
+            return else_body(frame)
+        return if_else
+
+    def _compile_while(self, node):
+        condition = self.compile_condition(node.condition)
+        body = self.compile_block(node.body)
+
+        def while_loop(frame):
+            while condition(frame):
+                result = body(frame)
+                if result is not None:
+                    return result
+            return None
+        return while_loop
+
+    def _compile_for(self, node):
+        initial = self._expression(node.init_expr)
+        condition = self.compile_condition(node.condition)
+        body = self.compile_block(node.body)
+        increment = self._statement(node.increment)
+        name = node.var
+        slot = node.slot
+        global_scope = self.global_scope
+
+        def for_loop(frame):
+            value = initial(frame)
+            if frame is not None and slot is not None:
+                frame[slot] = value
+            else:
+                global_scope[name] = value
+            while condition(frame):
+                result = body(frame)
+                if result is not None:
+                    return result
+                increment(frame)
+            return None
+        return for_loop
+
+    def _compile_print(self, node):
+        value_of = self._expression(node.expression)
+        print_lock = self.print_lock
+
+        def print_statement(frame):
+            value = value_of(frame)
+            if isinstance(value, str):
+                value = value.replace('\\n', '\n').replace('\\t', '\t')
+            with print_lock:
+                if self.output_stream:
+                    self.output_stream.write(str(value))
+                    self.output_stream.flush()
+                else:
+                    print(value, end='')
+        return print_statement
+
+    def _compile_return(self, node):
+        value_of = self._expression(node.expression)
+
+        def return_statement(frame):
+            return (value_of(frame),)
+        return return_statement
+
+    def _compile_call_statement(self, node):
+        # Chamada como comando: o valor retornado é descartado
+        call = self._expression(node)
+
+        def call_statement(frame):
+            call(frame)
+        return call_statement
+
+    def _compile_instantiation(self, node):
+        class_name = node.class_name
+        name = node.var_name
+        slot = node.slot
+        classes = self.classes
+        new_instance = self.new_instance
+        global_scope = self.global_scope
+
+        def instantiation(frame):
+            class_def = classes.get(class_name)
+            if class_def is not None:
+                obj = new_instance(class_name, class_def)
+                if frame is not None and slot is not None:
+                    frame[slot] = obj
+                else:
+                    global_scope[name] = obj
+        return instantiation
+
+    def _compile_element_method_call_statement(self, node):
+        call = self._compile_element_method_call(node)
+
+        def call_statement(frame):
+            call(frame)
+        return call_statement
+
+    def _compile_element_attribute_assignment(self, node):
+        element_of = self._compile_element(node.array_access)
+        value_of = self._expression(node.value)
+        attribute = node.attribute_name
+
+        def element_attribute_assignment(frame):
+            obj = element_of(frame)
+            if isinstance(obj, ObjectInstance):
+                obj.set_attribute(attribute, value_of(frame))
+        return element_attribute_assignment
+
+    def _compile_object_attribute_array_assignment(self, node):
+        # this.produtos[i] = valor
+        object_of = self.compile_load(node, node.object_name)
+        attribute = node.attr_name
+        index_of = self._expression(node.index)
+        value_of = self._expression(node.value)
+        index2_of = self._expression(node.index2) if node.index2 is not None else None
+
+        def object_attribute_array_assignment(frame):
+            obj = object_of(frame)
+            if isinstance(obj, ObjectInstance):
+                array = obj.get_attribute(attribute)
+                if isinstance(array, ARRAY_TYPES):
+                    if index2_of is not None:
+                        index1 = index_of(frame)
+                        index2 = index2_of(frame)
+                        value = value_of(frame)
+                        if isinstance(array[int(index1)], ARRAY_TYPES):
+                            array[int(index1)][int(index2)] = value
+                    else:
+                        index = index_of(frame)
+                        array[int(index)] = value_of(frame)
+        return object_attribute_array_assignment
+
+    _STATEMENT_COMPILERS = {
+        BlockNode: _compile_block_node,
+        DeclarationNode: _compile_declaration,
+        AssignmentNode: _compile_assignment,
+        ArrayAssignmentNode: _compile_array_assignment,
+        AttributeAssignmentNode: _compile_attribute_assignment,
+        IfNode: _compile_if,
+        WhileNode: _compile_while,
+        ForNode: _compile_for,
+        PrintNode: _compile_print,
+        ReturnNode: _compile_return,
+        FunctionCallNode: _compile_call_statement,
+        MethodCallNode: _compile_call_statement,
+        InstantiationNode: _compile_instantiation,
+        ArrayElementMethodCallNode: _compile_element_method_call_statement,
+        ArrayElementAttributeAssignmentNode: _compile_element_attribute_assignment,
+        ObjectAttributeArrayAssignmentNode: _compile_object_attribute_array_assignment,
+    }
+
+    # ------------------- Expressões -------------------
+
+    def compile_expression(self, node):
+        """Closure de uma expressão: frame -> valor."""
+        compiler = self._EXPRESSION_COMPILERS.get(node.__class__)
+        if compiler is not None:
+            return compiler(self, node)
+        if node is None:
+            return _nothing
+        return self._fallback_expression(node)
+
+    def compile_condition(self, node):
+        """Closure de uma condição (relacional ou expressão qualquer)."""
+        if not isinstance(node, ConditionNode):
+            return self._expression(node)
+        left_of = self._expression(node.left)
+        right_of = self._expression(node.right)
+        comparison = COMPARISONS.get(node.operator)
+        if comparison is None:
+            def unknown(frame):
+                left_of(frame)
+                right_of(frame)
+                return False
+            return unknown
+
+        def condition(frame):
+            return comparison(left_of(frame), right_of(frame))
+        return condition
+
+    def compile_load(self, node, name):
+        """Leitura da variável name acessada por node (slot do frame ou global)."""
+        slot = node.slot
+        global_scope = self.global_scope
+        if slot is None:
+            def load_global(frame):
+                return global_scope.get(name)
+            return load_global
+
+        def load(frame):
+            if frame is not None:
+                value = frame[slot]
+                if value is not UNSET:
+                    return value
+            return global_scope.get(name)
+        return load
+
+    def _fallback_expression(self, node):
+        evaluate = Interpreter.evaluate_expression
+
+        def expression(frame):
+            return evaluate(self, node)
+        return expression
+
+    def _compile_number(self, node):
+        value = literal_value(node)
+
+        def constant(frame):
+            return value
+        return constant
+
+    def _compile_string(self, node):
+        value = str(node.value)
+
+        def constant(frame):
+            return value
+        return constant
+
+    def _compile_identifier(self, node):
+        return self.compile_load(node, node.name)
+
+    def _compile_binary_op(self, node):
+        operation = select_binary_op(node)
+        left_of = self._expression(node.left)
+        right_of = self._expression(node.right)
+
+        def binary_op(frame):
+            return operation(left_of(frame), right_of(frame))
+        return binary_op
+
+    def _compile_unary_op(self, node):
+        operand_of = self._expression(node.operand)
+        if node.operator == '-':
+            def negate(frame):
+                return -operand_of(frame)
+            return negate
+        return operand_of
+
+    def _compile_condition_expression(self, node):
+        # evaluate_expression não avalia ConditionNode (só evaluate_condition)
+        return _nothing
+
+    def _compile_attribute_access(self, node):
+        if isinstance(node.object_name, str):
+            object_of = self.compile_load(node, node.object_name)
+        else:
+            # Acesso encadeado (this.obj1.obj2.attr) ou outra expressão
+            object_of = self._expression(node.object_name)
+        attribute = node.attribute_name
+
+        def attribute_access(frame):
+            obj = object_of(frame)
+            if isinstance(obj, ObjectInstance):
+                return obj.get_attribute(attribute)
+            return None
+        return attribute_access
+
+    def _compile_array_access(self, node):
+        if isinstance(node.array_name, str):
+            array_of = self.compile_load(node, node.array_name)
+        else:
+            array_of = self._expression(node.array_name)
+        index_of = self._expression(node.index)
+
+        if node.index2 is not None:
+            index2_of = self._expression(node.index2)
+
+            def array_access_2d(frame):
+                array = array_of(frame)
+                if isinstance(array, ARRAY_TYPES):
+                    index1 = index_of(frame)
+                    index2 = index2_of(frame)
+                    if isinstance(array[int(index1)], ARRAY_TYPES):
+                        return array[int(index1)][int(index2)]
+                return None
+            return array_access_2d
+
+        def array_access(frame):
+            array = array_of(frame)
+            if isinstance(array, ARRAY_TYPES):
+                return array[int(index_of(frame))]
+            return None
+        return array_access
+
+    def _compile_function_call(self, node):
+        if node.name.lower() in NATIVE_FUNCTIONS:
+            return self._fallback_expression(node)
+        name = node.name
+        arguments = tuple(self._expression(argument) for argument in node.arguments)
+        functions = self.functions
+        invoke = self._invoke
+
+        def function_call(frame):
+            func = functions.get(name)
+            if func is None:
+                return None
+            return invoke(func, arguments, frame)
+        return function_call
+
+    def _compile_method_call(self, node):
+        if isinstance(node.object_name, str):
+            object_of = self.compile_load(node, node.object_name)
+        else:
+            object_of = self._expression(node.object_name)
+        method_name = node.method_name
+        arguments = tuple(self._expression(argument) for argument in node.arguments)
+        invoke = self._invoke
+        # Cache monomórfico da chamada: (ClassNode, MethodNode), trocado de uma vez
+        cache = (None, None)
+
+        def method_call(frame):
+            nonlocal cache
+            obj = object_of(frame)
+            if isinstance(obj, ObjectInstance):
+                cached_class, method = cache
+                if cached_class is not obj.class_def:
+                    method = obj.methods.get(method_name)
+                    if method is None:
+                        return None
+                    cache = (obj.class_def, method)
+                return invoke(method, arguments, frame, obj)
+            elif obj and hasattr(obj, method_name):
+                # Objetos Python (ex.: canais)
+                return getattr(obj, method_name)(*[argument(frame) for argument in arguments])
+            return None
+        return method_call
+
+    def _compile_new_expression(self, node):
+        class_name = node.class_name
+        classes = self.classes
+        new_instance = self.new_instance
+
+        def new_expression(frame):
+            class_def = classes.get(class_name)
+            if class_def is not None:
+                return new_instance(class_name, class_def)
+            return None
+        return new_expression
+
+    def _compile_array_access_with_object(self, node):
+        # this.produtos[i] ou this.obj.arr[i]
+        if not isinstance(node.object_attr_access, AttributeAccessNode):
+            return _nothing
+        array_of = self._expression(node.object_attr_access)
+        index_of = self._expression(node.index)
+
+        if node.index2 is not None:
+            index2_of = self._expression(node.index2)
+
+            def array_access_2d(frame):
+                array = array_of(frame)
+                if isinstance(array, ARRAY_TYPES):
+                    index1 = index_of(frame)
+                    index2 = index2_of(frame)
+                    if isinstance(array[int(index1)], ARRAY_TYPES):
+                        return array[int(index1)][int(index2)]
+                return None
+            return array_access_2d
+
+        def array_access(frame):
+            array = array_of(frame)
+            if isinstance(array, ARRAY_TYPES):
+                return array[int(index_of(frame))]
+            return None
+        return array_access
+
+    def _compile_element(self, array_access):
+        """Objeto guardado em um elemento de array (arr[i] ou this.arr[i])."""
+        if array_access.__class__ in (ArrayAccessNode, ArrayAccessWithObjectNode):
+            return self._expression(array_access)
+        if isinstance(array_access, ArrayAccessWithObjectNode):
+            evaluate = self.evaluate_array_access_with_object
+        else:
+            evaluate = self.evaluate_array_access
+
+        def element(frame):
+            return evaluate(array_access)
+        return element
+
+    def _compile_element_method_call(self, node):
+        element_of = self._compile_element(node.array_access)
+        method_name = node.method_name
+        arguments = tuple(self._expression(argument) for argument in node.arguments)
+        invoke = self._invoke
+        cache = (None, None)
+
+        def element_method_call(frame):
+            nonlocal cache
+            obj = element_of(frame)
+            if isinstance(obj, ObjectInstance):
+                cached_class, method = cache
+                if cached_class is not obj.class_def:
+                    method = obj.methods.get(method_name)
+                    if method is None:
+                        return None
+                    cache = (obj.class_def, method)
+                return invoke(method, arguments, frame, obj)
+            return None
+        return element_method_call
+
+    def _compile_element_attribute_access(self, node):
+        element_of = self._compile_element(node.array_access)
+        attribute = node.attribute_name
+
+        def element_attribute_access(frame):
+            obj = element_of(frame)
+            if isinstance(obj, ObjectInstance):
+                return obj.get_attribute(attribute)
+            return None
+        return element_attribute_access
+
+    _EXPRESSION_COMPILERS = {
+        NumberNode: _compile_number,
+        StringNode: _compile_string,
+        IdentifierNode: _compile_identifier,
+        BinaryOpNode: _compile_binary_op,
+        UnaryOpNode: _compile_unary_op,
+        ConditionNode: _compile_condition_expression,
+        AttributeAccessNode: _compile_attribute_access,
+        ArrayAccessNode: _compile_array_access,
+        FunctionCallNode: _compile_function_call,
+        MethodCallNode: _compile_method_call,
+        NewExpressionNode: _compile_new_expression,
+        ArrayAccessWithObjectNode: _compile_array_access_with_object,
+        ArrayElementMethodCallNode: _compile_element_method_call,
+        ArrayElementAttributeAccessNode: _compile_element_attribute_access,
+    }
@@ -1,6 +1,7 @@
 import sys
 import os
 import threading
+import functools
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
@@ -9,7 +10,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # ============================================================================
 # Executa a AST gerada pelo parser, implementando:
 # - Orientação a Objetos (classes, herança, instanciação)
-# - Concorrência com blocos PAR (threads Python)
+# - Concorrência com blocos PAR (pool de threads de runtime/Scheduler.py,
+#   ou processos com par_backend='process': runtime/ProcessPar.py)
 # - Comunicação entre threads via canais (Channels)
 # - Arrays 1D e 2D
 # - Funções nativas de string
@@ -17,102 +19,219 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 # ============================================================================
 
 from parser.AST import *
+from parser.Traversal import walk
 from runtime.Channel import Channel, NetworkChannel
-from runtime.ThreadManager import ThreadManager
+from runtime.Scheduler import default_scheduler
+from runtime.LockStripes import LockStripes
+from runtime.ProcessPar import PAR_BACKENDS, ProcessPar, fork_available
+from runtime.natives import NATIVE_FUNCTIONS
+from runtime.Resolver import Resolver, UNSET
+from runtime.TypedArray import ARRAY_TYPES, filled, filled_rows, array_of, rows_of
+from runtime import typed_ops
+from runtime.typed_ops import COMPARISONS, literal_value, select_binary_op
 from symbol_table.SymbolTable import SymbolTable
 
 
+def default_par_backend():
+    """Backend de PAR padrão: variável de ambiente MINIPAR_PAR ou 'thread'."""
+    return os.environ.get('MINIPAR_PAR') or 'thread'
+
+
+class _ThreadState(threading.local):
+    """Estado de execução de cada thread: o frame da função/método em execução."""
+    # None fora de funções (código do programa e início de cada thread PAR):
+    # todas as variáveis são globais
+    frame = None
+    # Chamadas MiniPar em andamento na thread (usado pela VirtualMachine)
+    depth = 0
+
+
+# Valor dos elementos de arrays declarados sem inicialização (pelo tipo)
+_ELEMENT_DEFAULTS = {'INT': 0, 'FLOAT': 0.0, 'STRING': "", 'BOOL': False}
+
+
+def new_array(type_name, size):
+    """Array de size elementos com o valor padrão do tipo."""
+    return filled(_ELEMENT_DEFAULTS.get(type_name.upper()), int(size))
+
+
+def new_matrix(type_name, rows, cols):
+    """Matriz rows x cols com o valor padrão do tipo."""
+    return fill_matrix(_ELEMENT_DEFAULTS.get(type_name.upper()), rows, cols)
+
+
+def fill_matrix(value, rows, cols):
+    """Matriz rows x cols com todos os elementos iguais a value."""
+    return filled_rows(value, int(rows), int(cols))
+
+
+def matrix_from_values(flat_values, rows, cols):
+    """Matriz rows x cols preenchida linha a linha ({1, 2, 3, 4}); o que faltar é None."""
+    rows = int(rows)
+    cols = int(cols)
+    size = rows * cols if rows > 0 and cols > 0 else 0
+    values = flat_values[:size]
+    values.extend([None] * (size - len(values)))
+    return rows_of(values, rows, cols)
+
+
 class ReturnException(Exception):
-    """Exceção usada para implementar RETURN em funções."""
+    """
+    RETURN fora de uma função (no topo do programa ou em um comando de PAR).
+    Dentro de funções e métodos o RETURN não levanta exceção: a execução de
+    cada comando retorna um registro de conclusão, None ao terminar
+    normalmente ou (valor,) após um RETURN, que os blocos repassam até
+    execute_body.
+    """
     def __init__(self, value):
         self.value = value
 
 
+def method_table(class_def, classes):
+    """
+    Métodos visíveis nas instâncias de class_def (nome -> MethodNode),
+    linearizados pela cadeia extends: os da própria classe primeiro, depois os
+    do pai, do avô... Um ancestral ainda não definido (ou um ciclo) encerra a
+    cadeia.
+    """
+    table = {}
+    visited = set()
+    while class_def is not None and class_def not in visited:
+        visited.add(class_def)
+        for method in class_def.methods:
+            table.setdefault(method.name, method)
+        class_def = classes.get(class_def.parent) if class_def.parent else None
+    return table
+
+
+# Valor inicial dos elementos de arrays de atributos, pelo tipo
+_ATTRIBUTE_DEFAULTS = {"INT": 0, "FLOAT": 0.0, "STRING": "", "BOOL": False}
+
+# Lock de cada objeto (pelo id) para o dicionário extra
+_OBJECT_LOCKS = LockStripes()
+
+
+class Shape:
+    """
+    Layout das instâncias de uma classe: slot de cada atributo (os da cadeia
+    extends inteira) e o molde copiado a cada new. Atributos escalares e os
+    herdados começam com None; arrays da própria classe são criados por
+    instância a partir de (slot, valor inicial, tamanho[s]).
+    """
+    __slots__ = ('slots', 'template', 'arrays', 'matrices')
+
+    def __init__(self, slots, template, arrays, matrices):
+        self.slots = slots
+        self.template = template
+        self.arrays = arrays
+        self.matrices = matrices
+
+
+def _dimension(size):
+    if isinstance(size, NumberNode):
+        size = int(size.value)
+    return int(size)
+
+
+def object_shape(class_def, classes):
+    """Shape das instâncias de class_def (levanta o mesmo erro que o new levantaria)."""
+    slots = {}
+    arrays = {}
+    matrices = {}
+    for attr in class_def.attributes:
+        index = slots.setdefault(attr.name, len(slots))
+        arrays.pop(index, None)
+        matrices.pop(index, None)
+        fill = _ATTRIBUTE_DEFAULTS.get(attr.type_name.upper())
+        if attr.is_2d_array and attr.array_dimensions:
+            dimensions = attr.array_dimensions
+            matrices[index] = (index, fill, _dimension(dimensions[0]), _dimension(dimensions[1]))
+        elif attr.is_array and attr.array_size:
+            arrays[index] = (index, fill, _dimension(attr.array_size))
+    # Atributos herdados não são inicializados, mas também ganham slot
+    visited = {class_def}
+    parent = classes.get(class_def.parent) if class_def.parent else None
+    while parent is not None and parent not in visited:
+        visited.add(parent)
+        for attr in parent.attributes:
+            slots.setdefault(attr.name, len(slots))
+        parent = classes.get(parent.parent) if parent.parent else None
+    return Shape(slots, [None] * len(slots), tuple(arrays.values()), tuple(matrices.values()))
+
+
 class ObjectInstance:
-    """Representa uma instância de objeto em runtime."""
-    def __init__(self, class_name, class_def, parent_classes=None):
+    """
+    Representa uma instância de objeto em runtime. Os valores dos atributos
+    ficam em fields, na ordem do Shape da classe; atributos fora do Shape
+    (atribuídos sem declaração) ficam no dicionário extra.
+    """
+    __slots__ = ('class_name', 'class_def', 'parent_classes', 'methods', 'shape', 'fields', 'extra')
+
+    def __init__(self, class_name, class_def, parent_classes=None, methods=None, shape=None):
         self.class_name = class_name
         self.class_def = class_def
         self.parent_classes = parent_classes or {}
-        self.attributes = {}  # Armazena valores dos atributos
-        
-        for attr in class_def.attributes:
-            if hasattr(attr, 'is_2d_array') and attr.is_2d_array and hasattr(attr, 'array_dimensions') and attr.array_dimensions:
-                # 2D array
-                dim1 = attr.array_dimensions[0]
-                dim2 = attr.array_dimensions[1]
-                if isinstance(dim1, NumberNode):
-                    dim1 = int(dim1.value)
-                if isinstance(dim2, NumberNode):
-                    dim2 = int(dim2.value)
-                # Inicializar com valor padrão baseado no tipo
-                if attr.type_name.upper() == "INT":
-                    self.attributes[attr.name] = [[0 for _ in range(int(dim2))] for _ in range(int(dim1))]
-                elif attr.type_name.upper() == "FLOAT":
-                    self.attributes[attr.name] = [[0.0 for _ in range(int(dim2))] for _ in range(int(dim1))]
-                elif attr.type_name.upper() == "STRING":
-                    self.attributes[attr.name] = [["" for _ in range(int(dim2))] for _ in range(int(dim1))]
-                elif attr.type_name.upper() == "BOOL":
-                    self.attributes[attr.name] = [[False for _ in range(int(dim2))] for _ in range(int(dim1))]
-                else:
-                    self.attributes[attr.name] = [[None for _ in range(int(dim2))] for _ in range(int(dim1))]
-            elif hasattr(attr, 'is_array') and attr.is_array and hasattr(attr, 'array_size') and attr.array_size:
-                # 1D array
-                size = attr.array_size
-                if isinstance(size, NumberNode):
-                    size = int(size.value)
-                # Inicializar com valor padrão baseado no tipo
-                if attr.type_name.upper() == "INT":
-                    self.attributes[attr.name] = [0] * int(size)
-                elif attr.type_name.upper() == "FLOAT":
-                    self.attributes[attr.name] = [0.0] * int(size)
-                elif attr.type_name.upper() == "STRING":
-                    self.attributes[attr.name] = [""] * int(size)
-                elif attr.type_name.upper() == "BOOL":
-                    self.attributes[attr.name] = [False] * int(size)
-                else:
-                    self.attributes[attr.name] = [None] * int(size)
-            else:
-                self.attributes[attr.name] = None
+        # Tabela de métodos e Shape da classe (Interpreter.method_tables e
+        # Interpreter.shapes), montados uma vez por classe e compartilhados
+        # entre as instâncias
+        self.methods = methods if methods is not None else method_table(class_def, self.parent_classes)
+        if shape is None:
+            shape = object_shape(class_def, self.parent_classes)
+        self.shape = shape
+        self.extra = None
+        fields = self.fields = shape.template[:]
+        for index, fill, size in shape.arrays:
+            fields[index] = filled(fill, size)
+        for index, fill, rows, columns in shape.matrices:
+            fields[index] = filled_rows(fill, rows, columns)
+    
+    @property
+    def attributes(self):
+        """Atributos e valores (nome -> valor), como um dicionário novo."""
+        attributes = dict(zip(self.shape.slots, self.fields))
+        if self.extra:
+            with _OBJECT_LOCKS(id(self)):
+                attributes.update(self.extra)
+        return attributes
     
     def get_attribute(self, name):
-        if name in self.attributes:
-            return self.attributes[name]
-        
-        if self.class_def.parent and self.class_def.parent in self.parent_classes:
-            parent_def = self.parent_classes[self.class_def.parent]
-            for attr in parent_def.attributes:
-                if attr.name == name:
-                    return self.attributes.get(name)
-        
+        try:
+            return self.fields[self.shape.slots[name]]
+        except KeyError:
+            pass
+        if self.extra is not None:
+            return self.extra.get(name)
         return None
     
     def set_attribute(self, name, value):
-        self.attributes[name] = value
+        try:
+            self.fields[self.shape.slots[name]] = value
+            return
+        except KeyError:
+            pass
+        # Atributo fora do Shape: threads do PAR podem criar o dicionário ou
+        # escrever nele ao mesmo tempo (atributos do Shape não usam lock)
+        with _OBJECT_LOCKS(id(self)):
+            if self.extra is None:
+                self.extra = {}
+            self.extra[name] = value
     
     def get_method(self, name):
-        for method in self.class_def.methods:
-            if method.name == name:
-                return method
-        
-        if self.class_def.parent and self.class_def.parent in self.parent_classes:
-            parent_def = self.parent_classes[self.class_def.parent]
-            for method in parent_def.methods:
-                if method.name == name:
-                    return method
-        
-        return None
+        return self.methods.get(name)
 
 
 class Interpreter:
-    def __init__(self, channel_bind=None, channel_connect=None, node_id=None, channel_map=None, output_stream=None, input_callback=None):
+    def __init__(self, channel_bind=None, channel_connect=None, node_id=None, channel_map=None, output_stream=None, input_callback=None,
+                 par_backend=None):
         self.symbol_table = SymbolTable()
         self.global_scope = {}
-        self.local_storage = threading.local()
+        self.thread_state = _ThreadState()
         self.classes = {}
         self.functions = {}
         self.variable_types = {}  # Mapeia nome_variavel -> tipo
-        self.thread_manager = ThreadManager()
+        # Lock (listrado) de cada variável global para escritas em
+        # global_scope + SymbolTable; leituras não usam lock (LockStripes.py)
+        self.global_locks = LockStripes()
         self.return_value = None
         self.print_lock = threading.Lock()
         # channel_bind/connect: dict mapping channel_name -> 'host:port'
@@ -125,26 +244,44 @@ class Interpreter:
         # Para integração com servidor web
         self.output_stream = output_stream
         self.input_provider = input_callback
-    
-    @property
-    def local_scope(self):
-        if not hasattr(self.local_storage, 'scope'):
-            self.local_storage.scope = {}
-        return self.local_storage.scope
-    
-    @local_scope.setter
-    def local_scope(self, value):
-        self.local_storage.scope = value
+        # Operação escolhida para cada BinaryOpNode (pelo static_type dos
+        # operandos) e valor já convertido de cada NumberNode
+        self._binary_ops = {}
+        self._constants = {}
+        # ClassNode -> tabela de métodos linearizada (method_table), ClassNode
+        # -> Shape das instâncias e cache monomórfico de cada chamada de
+        # método: nó -> (ClassNode, MethodNode)
+        self.method_tables = {}
+        self.shapes = {}
+        self._method_caches = {}
+        # Layout do frame de cada FunctionNode/MethodNode (runtime/Resolver.py)
+        self.resolver = Resolver()
+        # Onde rodam os comandos de um PAR: 'thread' ou 'process' (ProcessPar)
+        self.par_backend = par_backend or default_par_backend()
+        if self.par_backend not in PAR_BACKENDS:
+            raise ValueError(f"Backend de PAR desconhecido: '{self.par_backend}' (disponíveis: {', '.join(PAR_BACKENDS)})")
+        self._process_par = None
     
     def interpret(self, ast):
         if isinstance(ast, ProgramNode):
+            self.resolver.resolve(ast)
+            self.specialize(ast)
             self.collect_definitions(ast)
             self.execute_program(ast)
     
+    def specialize(self, ast):
+        """Escolhe de uma vez a operação de cada BinaryOpNode e o valor de cada NumberNode."""
+        for node in walk(ast):
+            if node.__class__ is BinaryOpNode:
+                self._binary_ops[node] = select_binary_op(node)
+            elif node.__class__ is NumberNode:
+                self._constants[node] = literal_value(node)
+    
     def collect_definitions(self, program):
         for node in program.children:
             if isinstance(node, ClassNode):
                 self.classes[node.name] = node
+                self.link_classes()
                 self.symbol_table.define_class(
                     node.name,
                     [attr.name for attr in node.attributes],
@@ -159,75 +296,141 @@ class Interpreter:
                     node.parameters
                 )
             elif isinstance(node, DeclarationNode):
-                self.execute_declaration(node, self.global_scope)
+                self.execute_declaration(node)
+    
+    def link_classes(self):
+        """
+        Monta a tabela de métodos de cada classe registrada. As tabelas são
+        atualizadas no lugar: objetos criados por declarações do topo antes
+        da definição de um ancestral passam a ver os métodos dele.
+        """
+        for class_def in self.classes.values():
+            table = self.method_tables.setdefault(class_def, {})
+            table.clear()
+            table.update(method_table(class_def, self.classes))
+        # Os Shapes incluem os atributos herdados: refeitos no próximo new
+        self.shapes.clear()
+    
+    def new_instance(self, class_name, class_def):
+        shape = self.shapes.get(class_def)
+        if shape is None:
+            # Montado no primeiro new (e não antes), para um tamanho de array
+            # inválido levantar o erro no mesmo ponto do programa
+            shape = self.shapes[class_def] = object_shape(class_def, self.classes)
+        return ObjectInstance(class_name, class_def, self.classes, self.method_tables.get(class_def), shape)
+    
+    def lookup_method(self, node, obj):
+        """Método chamado por node (MethodCallNode/ArrayElementMethodCallNode) em obj, com cache."""
+        cached = self._method_caches.get(node)
+        if cached is not None and cached[0] is obj.class_def:
+            return cached[1]
+        method = obj.methods.get(node.method_name)
+        if method is not None:
+            # Só acertos entram no cache: a tabela só cresce
+            self._method_caches[node] = (obj.class_def, method)
+        return method
     
     def execute_program(self, program):
         for node in program.children:
-            if isinstance(node, BlockNode):
-                self.execute_block(node)
-            elif isinstance(node, FunctionCallNode):
+            if isinstance(node, FunctionCallNode):
                 self.execute_function_call(node)
             else:
-                self.execute_statement(node)
+                self.execute_top_level(node)
+    
+    def execute_top_level(self, node):
+        """Executa um comando fora de função (topo ou thread do PAR)."""
+        completion = self.execute_statement(node)
+        if completion is not None:
+            raise ReturnException(completion[0])
     
     def execute_block(self, node):
         if node.block_type == "seq":
             for stmt in node.statements:
-                self.execute_statement(stmt)
+                completion = self.execute_statement(stmt)
+                if completion is not None:
+                    return completion
         elif node.block_type == "par":
             self.execute_parallel_block(node)
+        return None
     
     def execute_parallel_block(self, node):
-        self.thread_manager.clear()
-        
+        targets = []
         for stmt in node.statements:
             if isinstance(stmt, FunctionCallNode):
                 func = self.functions.get(stmt.name)
                 if func:
-                    thread = self.thread_manager.create_thread(
-                        target=self.execute_function_in_thread,
-                        args=(func, stmt.arguments)
-                    )
-            elif isinstance(stmt, BlockNode):
-                thread = self.thread_manager.create_thread(
-                    target=self.execute_block,
-                    args=(stmt,)
-                )
+                    targets.append(functools.partial(self.execute_function_in_thread, func, stmt.arguments))
             else:
-                thread = self.thread_manager.create_thread(
-                    target=self.execute_statement,
-                    args=(stmt,)
-                )
-        
-        self.thread_manager.start_all()
-        self.thread_manager.join_all()
+                targets.append(functools.partial(self.execute_top_level, stmt))
+        self.run_parallel(targets)
+    
+    def run_parallel(self, targets):
+        """Executa os comandos de um PAR (funções sem argumentos) em paralelo e espera todos."""
+        if self.par_backend == 'process':
+            if self._process_par is None:
+                if not fork_available():
+                    print("AVISO: PAR em processos precisa de fork; usando threads")
+                    self.par_backend = 'thread'
+                    return self.run_parallel(targets)
+                self._process_par = ProcessPar(self)
+            if self._process_par.supports():
+                self._process_par.run(targets)
+                return
+        # Um TaskGroup por bloco, nas threads do pool compartilhado (runtime/Scheduler.py)
+        default_scheduler().run([functools.partial(self.run_branch, target) for target in targets])
+    
+    def run_branch(self, target):
+        """Executa um comando do PAR em um worker, começando fora de funções (como uma thread nova)."""
+        state = self.thread_state
+        state.frame = None
+        state.depth = 0
+        target()
     
     def execute_function_in_thread(self, func, arguments):
-        local_env = {}
-        
-        for i, (param_type, param_name) in enumerate(func.parameters):
-            if i < len(arguments):
-                local_env[param_name] = self.evaluate_expression(arguments[i])
-        
-        old_local = self.local_scope
-        self.local_scope = local_env
-        
+        self.execute_body(func, self.new_frame(func, arguments))
+    
+    def new_frame(self, callable_node, arguments, this=None):
+        """
+        Frame da chamada com os argumentos (avaliados no frame de quem chama).
+        Sem nenhum valor local o frame é None, e o corpo usa só o escopo
+        global, como um escopo local vazio fazia.
+        """
+        layout = self.resolver.layouts.get(callable_node)
+        if layout is None:
+            layout = self.resolver.resolve_callable(callable_node, isinstance(callable_node, MethodNode))
+        frame = layout.new_frame()
+        bound = False
+        if this is not None:
+            frame[layout.this_slot] = this
+            bound = True
+        for argument, slot in zip(arguments, layout.parameter_slots):
+            frame[slot] = self.evaluate_expression(argument)
+            bound = True
+        return frame if bound else None
+    
+    def execute_body(self, callable_node, frame):
+        """Executa o corpo da função/método com o frame e retorna o valor do RETURN."""
+        state = self.thread_state
+        old_frame = state.frame
+        state.frame = frame
         try:
-            for stmt in func.body:
-                self.execute_statement(stmt)
-        except ReturnException as e:
-            pass
+            for stmt in callable_node.body:
+                completion = self.execute_statement(stmt)
+                if completion is not None:
+                    return completion[0]
         finally:
-            self.local_scope = old_local
+            state.frame = old_frame
+        return None
     
     def execute_statement(self, node):
+        """Executa node e retorna o registro de conclusão: None, ou (valor,) após um RETURN."""
         if node is None:
-            return
+            return None
         
         if isinstance(node, BlockNode):
-            self.execute_block(node)
+            return self.execute_block(node)
         elif isinstance(node, DeclarationNode):
-            self.execute_declaration(node, self.local_scope if self.local_scope else self.global_scope)
+            self.execute_declaration(node, self.thread_state.frame)
         elif isinstance(node, AssignmentNode):
             self.execute_assignment(node)
         elif isinstance(node, ArrayAssignmentNode):
@@ -235,11 +438,11 @@ class Interpreter:
         elif isinstance(node, AttributeAssignmentNode):
             self.execute_attribute_assignment(node)
         elif isinstance(node, IfNode):
-            self.execute_if(node)
+            return self.execute_if(node)
         elif isinstance(node, WhileNode):
-            self.execute_while(node)
+            return self.execute_while(node)
         elif isinstance(node, ForNode):
-            self.execute_for(node)
+            return self.execute_for(node)
         elif isinstance(node, PrintNode):
             self.execute_print(node)
         elif isinstance(node, InputNode):
@@ -253,7 +456,7 @@ class Interpreter:
         elif isinstance(node, ReceiveNode):
             self.execute_receive(node)
         elif isinstance(node, ReturnNode):
-            self.execute_return(node)
+            return self.execute_return(node)
         elif isinstance(node, InstantiationNode):
             self.execute_instantiation(node)
         elif isinstance(node, ArrayElementMethodCallNode):
@@ -270,88 +473,13 @@ class Interpreter:
             self.evaluate_array_access(node)
         elif isinstance(node, ArrayAccessWithObjectNode):
             self.evaluate_array_access_with_object(node)
+        return None
     
-    def execute_declaration(self, node, scope):
+    def execute_declaration(self, node, frame=None):
         value = None
         
         if node.type_name.lower() == "c_channel":
-            chan_name = node.identifier
-            # If declaration carries channel_info (ids), use automatic rule:
-            # channel declaration: c_channel name id1 id2
-            # -> id1 is server (bind), id2 is client (connect)
-            if hasattr(node, 'channel_info') and node.channel_info:
-                try:
-                    id1 = node.channel_info[0]
-                    id2 = node.channel_info[1] if len(node.channel_info) > 1 else None
-                except Exception:
-                    id1 = None
-                    id2 = None
-
-                if self.node_id and id1 and id2:
-                    # If this process is the server side for that channel -> bind
-                    if self.node_id == id1:
-                        hostport = self.channel_map.get(id1)
-                        if hostport:
-                            try:
-                                host, port = hostport.split(":", 1)
-                                value = NetworkChannel('server', host, int(port))
-                            except Exception:
-                                value = Channel()
-                        else:
-                            # No mapping provided for server id -> fallback local
-                            value = Channel()
-                    elif self.node_id == id2:
-                        # This process is the client side -> connect to server id1
-                        hostport = self.channel_map.get(id1)
-                        if hostport:
-                            try:
-                                host, port = hostport.split(":", 1)
-                                value = NetworkChannel('client', host, int(port))
-                            except Exception:
-                                value = Channel()
-                        else:
-                            value = Channel()
-                    else:
-                        # This node is not part of the declared pair -> local channel
-                        value = Channel()
-                else:
-                    # No node_id or insufficient channel_info -> fallback to previous CLI mapping
-                    chan_name = node.identifier
-                    if chan_name in self.channel_bind:
-                        hostport = self.channel_bind[chan_name]
-                        try:
-                            host, port = hostport.split(":")
-                            value = NetworkChannel('server', host, int(port))
-                        except Exception:
-                            value = Channel()
-                    elif chan_name in self.channel_connect:
-                        hostport = self.channel_connect[chan_name]
-                        try:
-                            host, port = hostport.split(":")
-                            value = NetworkChannel('client', host, int(port))
-                        except Exception:
-                            value = Channel()
-                    else:
-                        value = Channel()
-            else:
-                # No channel_info: fall back to explicit CLI mappings or local channel
-                chan_name = node.identifier
-                if chan_name in self.channel_bind:
-                    hostport = self.channel_bind[chan_name]
-                    try:
-                        host, port = hostport.split(":")
-                        value = NetworkChannel('server', host, int(port))
-                    except Exception:
-                        value = Channel()
-                elif chan_name in self.channel_connect:
-                    hostport = self.channel_connect[chan_name]
-                    try:
-                        host, port = hostport.split(":")
-                        value = NetworkChannel('client', host, int(port))
-                    except Exception:
-                        value = Channel()
-                else:
-                    value = Channel()
+            value = self.create_channel(node)
         elif node.is_2d_array and node.array_dimensions:
             # Array bidimensional
             rows = self.evaluate_expression(node.array_dimensions[0])
@@ -361,97 +489,157 @@ class Interpreter:
                 if isinstance(node.initial_value, BraceInitNode):
                     # Inicialização com {1, 2, 3, 4, 5, 6}
                     flat_values = [self.evaluate_expression(val) for val in node.initial_value.values]
-                    # Criar matriz rows x cols
-                    value = []
-                    for i in range(int(rows)):
-                        row = []
-                        for j in range(int(cols)):
-                            idx = i * int(cols) + j
-                            if idx < len(flat_values):
-                                row.append(flat_values[idx])
-                            else:
-                                row.append(None)
-                        value.append(row)
+                    value = matrix_from_values(flat_values, rows, cols)
                 else:
                     # Inicialização com expressão
-                    init_val = self.evaluate_expression(node.initial_value)
-                    value = [[init_val for _ in range(int(cols))] for _ in range(int(rows))]
+                    value = fill_matrix(self.evaluate_expression(node.initial_value), rows, cols)
             else:
                 # Array sem inicialização - inicializar com 0 baseado no tipo
-                if node.type_name.upper() == "INT":
-                    value = [[0 for _ in range(int(cols))] for _ in range(int(rows))]
-                elif node.type_name.upper() == "FLOAT":
-                    value = [[0.0 for _ in range(int(cols))] for _ in range(int(rows))]
-                elif node.type_name.upper() == "STRING":
-                    value = [["" for _ in range(int(cols))] for _ in range(int(rows))]
-                elif node.type_name.upper() == "BOOL":
-                    value = [[False for _ in range(int(cols))] for _ in range(int(rows))]
-                else:
-                    value = [[None for _ in range(int(cols))] for _ in range(int(rows))]
+                value = new_matrix(node.type_name, rows, cols)
         elif node.is_array:
             # Array unidimensional
             if node.initial_value:
                 if isinstance(node.initial_value, ArrayInitNode):
-                    value = [self.evaluate_expression(elem) for elem in node.initial_value.elements]
+                    value = array_of([self.evaluate_expression(elem) for elem in node.initial_value.elements])
                 elif isinstance(node.initial_value, BraceInitNode):
-                    value = [self.evaluate_expression(val) for val in node.initial_value.values]
+                    value = array_of([self.evaluate_expression(val) for val in node.initial_value.values])
                 else:
                     value = self.evaluate_expression(node.initial_value)
             elif node.array_size:
-                size = self.evaluate_expression(node.array_size)
                 # Inicializar com 0 (INT/FLOAT) ou "" (STRING) ao invés de None
-                if node.type_name.upper() == "INT":
-                    value = [0] * int(size)
-                elif node.type_name.upper() == "FLOAT":
-                    value = [0.0] * int(size)
-                elif node.type_name.upper() == "STRING":
-                    value = [""] * int(size)
-                elif node.type_name.upper() == "BOOL":
-                    value = [False] * int(size)
-                else:
-                    value = [None] * int(size)
+                value = new_array(node.type_name, self.evaluate_expression(node.array_size))
             else:
                 value = []
         elif node.initial_value:
             value = self.evaluate_expression(node.initial_value)
         
-        scope[node.identifier] = value
-        
-        # Registrar o tipo da variável para validação de input
-        self.variable_types[node.identifier] = node.type_name
-        
-        if scope is self.global_scope:
-            self.symbol_table.define(
-                node.identifier,
-                node.type_name,
-                value,
-                node.is_array,
-                node.array_size
-            )
+        if frame is not None and node.slot is not None:
+            frame[node.slot] = value
+            # Registrar o tipo da variável para validação de input
+            self.variable_types[node.identifier] = node.type_name
+        else:
+            self.define_global(node.identifier, node.type_name, value, node.is_array, node.array_size)
+    
+    def define_global(self, name, type_name, value, is_array=False, array_size=None):
+        """Declaração global: global_scope, variable_types e SymbolTable juntos."""
+        with self.global_locks(name):
+            self.global_scope[name] = value
+            self.variable_types[name] = type_name
+            self.symbol_table.define(name, type_name, value, is_array, array_size)
+    
+    def assign_global(self, name, value):
+        """Atribuição global: global_scope e o valor na SymbolTable juntos."""
+        with self.global_locks(name):
+            self.global_scope[name] = value
+            self.symbol_table.update(name, value)
+    
+    def create_channel(self, node):
+        """Canal da declaração c_channel: NetworkChannel se há papel de rede, senão local."""
+        value = None
+        chan_name = node.identifier
+        # c_channel nome [ids] capacidade: canal limitado (0 = sem limite)
+        capacity = node.channel_capacity or 0
+        # If declaration carries channel_info (ids), use automatic rule:
+        # channel declaration: c_channel name id1 id2
+        # -> id1 is server (bind), id2 is client (connect)
+        if hasattr(node, 'channel_info') and node.channel_info:
+            try:
+                id1 = node.channel_info[0]
+                id2 = node.channel_info[1] if len(node.channel_info) > 1 else None
+            except Exception:
+                id1 = None
+                id2 = None
+
+            if self.node_id and id1 and id2:
+                # If this process is the server side for that channel -> bind
+                if self.node_id == id1:
+                    hostport = self.channel_map.get(id1)
+                    if hostport:
+                        try:
+                            host, port = hostport.split(":", 1)
+                            value = NetworkChannel('server', host, int(port), capacity=capacity)
+                        except Exception:
+                            value = Channel(capacity)
+                    else:
+                        # No mapping provided for server id -> fallback local
+                        value = Channel(capacity)
+                elif self.node_id == id2:
+                    # This process is the client side -> connect to server id1
+                    hostport = self.channel_map.get(id1)
+                    if hostport:
+                        try:
+                            host, port = hostport.split(":", 1)
+                            value = NetworkChannel('client', host, int(port), capacity=capacity)
+                        except Exception:
+                            value = Channel(capacity)
+                    else:
+                        value = Channel(capacity)
+                else:
+                    # This node is not part of the declared pair -> local channel
+                    value = Channel(capacity)
+            else:
+                # No node_id or insufficient channel_info -> fallback to previous CLI mapping
+                chan_name = node.identifier
+                if chan_name in self.channel_bind:
+                    hostport = self.channel_bind[chan_name]
+                    try:
+                        host, port = hostport.split(":")
+                        value = NetworkChannel('server', host, int(port), capacity=capacity)
+                    except Exception:
+                        value = Channel(capacity)
+                elif chan_name in self.channel_connect:
+                    hostport = self.channel_connect[chan_name]
+                    try:
+                        host, port = hostport.split(":")
+                        value = NetworkChannel('client', host, int(port), capacity=capacity)
+                    except Exception:
+                        value = Channel(capacity)
+                else:
+                    value = Channel(capacity)
+        else:
+            # No channel_info: fall back to explicit CLI mappings or local channel
+            chan_name = node.identifier
+            if chan_name in self.channel_bind:
+                hostport = self.channel_bind[chan_name]
+                try:
+                    host, port = hostport.split(":")
+                    value = NetworkChannel('server', host, int(port), capacity=capacity)
+                except Exception:
+                    value = Channel(capacity)
+            elif chan_name in self.channel_connect:
+                hostport = self.channel_connect[chan_name]
+                try:
+                    host, port = hostport.split(":")
+                    value = NetworkChannel('client', host, int(port), capacity=capacity)
+                except Exception:
+                    value = Channel(capacity)
+            else:
+                value = Channel(capacity)
+        return value
     
     def execute_assignment(self, node):
         value = self.evaluate_expression(node.expression)
-        if node.identifier in self.local_scope:
-            self.local_scope[node.identifier] = value
+        frame = self.thread_state.frame
+        if frame is not None and node.slot is not None and frame[node.slot] is not UNSET:
+            frame[node.slot] = value
         else:
-            self.global_scope[node.identifier] = value
-            self.symbol_table.update(node.identifier, value)
+            self.assign_global(node.identifier, value)
     
     def execute_attribute_assignment(self, node):
-        obj = self.get_variable(node.object_name)
+        obj = self.get_variable(node, node.object_name)
         if isinstance(obj, ObjectInstance):
             value = self.evaluate_expression(node.expression)
             obj.set_attribute(node.attribute_name, value)
     
     def execute_array_assignment(self, node):
-        array = self.get_variable(node.array_name)
-        if isinstance(array, list):
+        array = self.get_variable(node, node.array_name)
+        if isinstance(array, ARRAY_TYPES):
             if node.index2 is not None:
                 # Array bidimensional
                 index1 = self.evaluate_expression(node.index)
                 index2 = self.evaluate_expression(node.index2)
                 value = self.evaluate_expression(node.expression)
-                if isinstance(array[int(index1)], list):
+                if isinstance(array[int(index1)], ARRAY_TYPES):
                     array[int(index1)][int(index2)] = value
             else:
                 # Array unidimensional
@@ -462,44 +650,64 @@ class Interpreter:
     def execute_if(self, node):
         condition = self.evaluate_condition(node.condition)
         if condition:
-            for stmt in node.then_body:
-                self.execute_statement(stmt)
+            body = node.then_body
         elif node.else_body:
-            for stmt in node.else_body:
-                self.execute_statement(stmt)
+            body = node.else_body
+        else:
+            return None
+        for stmt in body:
+            completion = self.execute_statement(stmt)
+            if completion is not None:
+                return completion
+        return None
     
     def execute_while(self, node):
         while self.evaluate_condition(node.condition):
             for stmt in node.body:
-                self.execute_statement(stmt)
+                completion = self.execute_statement(stmt)
+                if completion is not None:
+                    return completion
+        return None
     
     def execute_for(self, node):
-        scope = self.local_scope if self.local_scope else self.global_scope
-        scope[node.var] = self.evaluate_expression(node.init_expr)
+        self.bind_variable(node, node.var, self.evaluate_expression(node.init_expr))
         
         while self.evaluate_condition(node.condition):
             for stmt in node.body:
-                self.execute_statement(stmt)
+                completion = self.execute_statement(stmt)
+                if completion is not None:
+                    return completion
             self.execute_statement(node.increment)
+        return None
     
     def execute_print(self, node):
-        value = self.evaluate_expression(node.expression)
+        self.print_value(self.evaluate_expression(node.expression))
+    
+    def print_value(self, value):
         if isinstance(value, str):
             value = value.replace('\\n', '\n').replace('\\t', '\t')
         
+        self.write_output(str(value))
+    
+    def write_output(self, text):
+        """Escreve text na saída do programa (output_stream ou stdout)."""
         # Usar lock para garantir que prints de threads diferentes não se misturem
         with self.print_lock:
             if self.output_stream:
-                self.output_stream.write(str(value))
+                self.output_stream.write(text)
                 self.output_stream.flush()
             else:
-                print(value, end='')
+                print(text, end='')
     
     def execute_input(self, node):
         prompt = ""
         if node.prompt:
             prompt = str(self.evaluate_expression(node.prompt))
-
+        value = self.read_input(prompt, node.identifier)
+        self.set_variable(node, node.identifier, value)
+    
+    def read_input(self, prompt, identifier):
+        """Lê uma entrada e a converte para o tipo declarado da variável identifier."""
         # Allow injection of a custom input provider (used by the web bridge).
         # If a provider exists, use it and if it fails, return an empty string
         # instead of falling back to builtin input() which may raise EOFError
@@ -529,8 +737,8 @@ class Interpreter:
         
         # Buscar o tipo da variável
         var_type = None
-        if node.identifier in self.variable_types:
-            var_type = self.variable_types[node.identifier].lower()
+        if identifier in self.variable_types:
+            var_type = self.variable_types[identifier].lower()
         
         # Validar e converter o valor conforme o tipo da variável
         if var_type:
@@ -539,7 +747,7 @@ class Interpreter:
                     # Tipo INT: aceita apenas números inteiros
                     value = value.strip()
                     if not value.lstrip('-').isdigit():
-                        raise ValueError(f"Erro de tipo: variável '{node.identifier}' é INT, mas recebeu '{value}' que não é um número inteiro")
+                        raise ValueError(f"Erro de tipo: variável '{identifier}' é INT, mas recebeu '{value}' que não é um número inteiro")
                     value = int(value)
                     
                 elif var_type == 'float':
@@ -555,7 +763,7 @@ class Interpreter:
                     elif value in ['false', '0', 'falso', 'nao', 'não']:
                         value = False
                     else:
-                        raise ValueError(f"Erro de tipo: variável '{node.identifier}' é BOOL, mas recebeu '{value}' que não é um valor booleano válido (true/false, 1/0)")
+                        raise ValueError(f"Erro de tipo: variável '{identifier}' é BOOL, mas recebeu '{value}' que não é um valor booleano válido (true/false, 1/0)")
                         
                 elif var_type in ['string', 'str']:
                     # Tipo STRING: aceita qualquer valor (já é string)
@@ -584,127 +792,40 @@ class Interpreter:
             except ValueError:
                 pass  # Manter como string
         
-        if node.identifier in self.local_scope:
-            self.local_scope[node.identifier] = value
-        else:
-            self.global_scope[node.identifier] = value
+        return value
     
     def execute_function_call(self, node):
         # Verificar se é uma função nativa de string
-        if node.name.lower() in ['strlen', 'substr', 'charat', 'indexof', 'parseint']:
+        if node.name.lower() in NATIVE_FUNCTIONS:
             return self.execute_native_string_function(node.name.lower(), node.arguments)
         
         if node.name not in self.functions:
             return None
         
         func = self.functions[node.name]
-        local_env = {}
-        
-        for i, (param_type, param_name) in enumerate(func.parameters):
-            if i < len(node.arguments):
-                local_env[param_name] = self.evaluate_expression(node.arguments[i])
-        
-        old_local = self.local_scope
-        self.local_scope = local_env
-        
-        try:
-            for stmt in func.body:
-                self.execute_statement(stmt)
-        except ReturnException as e:
-            self.local_scope = old_local
-            return e.value
-        
-        self.local_scope = old_local
-        return None
+        return self.execute_body(func, self.new_frame(func, node.arguments))
     
     def execute_native_string_function(self, func_name, arguments):
-        if func_name == 'strlen':
-            if len(arguments) >= 1:
-                string_arg = self.evaluate_expression(arguments[0])
-                return len(str(string_arg))
-        
-        elif func_name == 'substr':
-            if len(arguments) >= 3:
-                string_arg = self.evaluate_expression(arguments[0])
-                start = int(self.evaluate_expression(arguments[1]))
-                length = int(self.evaluate_expression(arguments[2]))
-                return str(string_arg)[start:start + length]
-        
-        elif func_name == 'charat':
-            if len(arguments) >= 2:
-                string_arg = self.evaluate_expression(arguments[0])
-                index = int(self.evaluate_expression(arguments[1]))
-                string_str = str(string_arg)
-                if 0 <= index < len(string_str):
-                    return string_str[index]
-                return ""
-        
-        elif func_name == 'indexof':
-            if len(arguments) >= 2:
-                string_arg = self.evaluate_expression(arguments[0])
-                char_to_find = str(self.evaluate_expression(arguments[1]))
-                start_pos = 0
-                if len(arguments) >= 3:
-                    start_pos = int(self.evaluate_expression(arguments[2]))
-                
-                string_str = str(string_arg)
-                try:
-                    return string_str.index(char_to_find, start_pos)
-                except ValueError:
-                    return -1
-        
-        elif func_name == 'parseint':
-            if len(arguments) >= 1:
-                string_arg = self.evaluate_expression(arguments[0])
-                string_str = str(string_arg).strip()
-                try:
-                    return int(string_str)
-                except ValueError:
-                    # Tentar extrair apenas os dígitos e sinal
-                    clean_str = ""
-                    for i, char in enumerate(string_str):
-                        if char == '-' and i == 0:
-                            clean_str += char
-                        elif char.isdigit():
-                            clean_str += char
-                        elif char == ' ':
-                            break
-                    if clean_str and clean_str != '-':
-                        return int(clean_str)
-                    return 0
-        
-        return None
+        native = NATIVE_FUNCTIONS.get(func_name)
+        if native is None:
+            return None
+        function, minimum, maximum = native
+        if len(arguments) < minimum:
+            return None
+        return function(*[self.evaluate_expression(arg) for arg in arguments[:maximum]])
     
     def execute_method_call(self, node):
         # object_name pode ser uma string ou AttributeAccessNode (this.usuario)
         if isinstance(node.object_name, str):
-            obj = self.get_variable(node.object_name)
+            obj = self.get_variable(node, node.object_name)
         else:
             # É um AttributeAccessNode, avaliar recursivamente
             obj = self.evaluate_expression(node.object_name)
         
         if isinstance(obj, ObjectInstance):
-            method = obj.get_method(node.method_name)
+            method = self.lookup_method(node, obj)
             if method:
-                local_env = {'this': obj}
-                
-                for i, (param_type, param_name) in enumerate(method.parameters):
-                    if i < len(node.arguments):
-                        local_env[param_name] = self.evaluate_expression(node.arguments[i])
-                
-                old_local = self.local_scope
-                self.local_scope = local_env
-                
-                try:
-                    for stmt in method.body:
-                        self.execute_statement(stmt)
-                except ReturnException as e:
-                    self.local_scope = old_local
-                    return e.value
-                finally:
-                    self.local_scope = old_local
-                
-                return None
+                return self.execute_body(method, self.new_frame(method, node.arguments, this=obj))
         elif obj and hasattr(obj, node.method_name):
             method = getattr(obj, node.method_name)
             args = [self.evaluate_expression(arg) for arg in node.arguments]
@@ -713,31 +834,20 @@ class Interpreter:
         return None
     
     def execute_send(self, node):
-        channel = self.get_variable(node.channel)
+        channel = self.get_variable(node, node.channel)
         # If channel variable not declared, create an in-process Channel automatically
         if channel is None:
-            channel = Channel()
-            # store in global scope by default
-            self.global_scope[node.channel] = channel
-            try:
-                self.symbol_table.define(node.channel, 'c_channel', channel, False, None)
-            except Exception:
-                pass
+            channel = self.implicit_channel(node.channel)
 
         if isinstance(channel, Channel):
             values = [self.evaluate_expression(val) for val in node.values]
             channel.send(*values)
     
     def execute_receive(self, node):
-        channel = self.get_variable(node.channel)
+        channel = self.get_variable(node, node.channel)
         # If channel variable not declared, create an in-process Channel automatically
         if channel is None:
-            channel = Channel()
-            self.global_scope[node.channel] = channel
-            try:
-                self.symbol_table.define(node.channel, 'c_channel', channel, False, None)
-            except Exception:
-                pass
+            channel = self.implicit_channel(node.channel)
 
         if isinstance(channel, Channel):
             values = channel.receive(len(node.variables))
@@ -749,37 +859,45 @@ class Interpreter:
                 for i, var in enumerate(node.variables):
                     if i < len(values):
                         if isinstance(var, IdentifierNode):
-                            var_name = var.name
-                        else:
-                            var_name = str(var)
-                        
-                        if var_name in self.local_scope:
-                            self.local_scope[var_name] = values[i]
+                            self.set_variable(var, var.name, values[i])
                         else:
-                            self.global_scope[var_name] = values[i]
+                            self.global_scope[str(var)] = values[i]
+    
+    def implicit_channel(self, name):
+        """Canal local criado por send/receive em um canal não declarado (global)."""
+        # Com o lock do nome: ramos do PAR que usam o canal ao mesmo tempo
+        # recebem o mesmo Channel
+        with self.global_locks(name):
+            channel = self.global_scope.get(name)
+            if channel is not None:
+                return channel
+            channel = Channel()
+            self.global_scope[name] = channel
+            try:
+                self.symbol_table.define(name, 'c_channel', channel, False, None)
+            except Exception:
+                pass
+        return channel
     
     def execute_return(self, node):
-        value = self.evaluate_expression(node.expression)
-        raise ReturnException(value)
+        return (self.evaluate_expression(node.expression),)
     
     def execute_instantiation(self, node):
         if node.class_name in self.classes:
             class_def = self.classes[node.class_name]
-            obj = ObjectInstance(node.class_name, class_def, self.classes)
-            
-            scope = self.local_scope if self.local_scope else self.global_scope
-            scope[node.var_name] = obj
+            obj = self.new_instance(node.class_name, class_def)
+            self.bind_variable(node, node.var_name, obj)
     
     def evaluate_expression(self, node):
         if isinstance(node, NumberNode):
-            value = node.value
-            if '.' in str(value):
-                return float(value)
-            return int(value)
+            value = self._constants.get(node)
+            if value is None:
+                value = self._constants[node] = literal_value(node)
+            return value
         elif isinstance(node, StringNode):
             return str(node.value)
         elif isinstance(node, IdentifierNode):
-            return self.get_variable(node.name)
+            return self.get_variable(node, node.name)
         elif isinstance(node, AttributeAccessNode):
             return self.evaluate_attribute_access(node)
         elif isinstance(node, ArrayAccessNode):
@@ -787,7 +905,10 @@ class Interpreter:
         elif isinstance(node, BinaryOpNode):
             left = self.evaluate_expression(node.left)
             right = self.evaluate_expression(node.right)
-            return self.apply_binary_op(left, node.operator, right)
+            operation = self._binary_ops.get(node)
+            if operation is None:
+                operation = self._binary_ops[node] = select_binary_op(node)
+            return operation(left, right)
         elif isinstance(node, UnaryOpNode):
             operand = self.evaluate_expression(node.operand)
             if node.operator == '-':
@@ -795,7 +916,7 @@ class Interpreter:
             return operand
         elif isinstance(node, FunctionCallNode):
             # Verificar se é uma função nativa de string
-            if node.name.lower() in ['strlen', 'substr', 'charat', 'indexof', 'parseint']:
+            if node.name.lower() in NATIVE_FUNCTIONS:
                 return self.execute_native_string_function(node.name.lower(), node.arguments)
             return self.execute_function_call(node)
         elif isinstance(node, MethodCallNode):
@@ -803,7 +924,7 @@ class Interpreter:
         elif isinstance(node, NewExpressionNode):
             if node.class_name in self.classes:
                 class_def = self.classes[node.class_name]
-                return ObjectInstance(node.class_name, class_def, self.classes)
+                return self.new_instance(node.class_name, class_def)
         elif isinstance(node, ArrayElementAttributeAccessNode):
             return self.evaluate_array_element_attribute_access(node)
         elif isinstance(node, ArrayElementMethodCallNode):
@@ -821,7 +942,7 @@ class Interpreter:
             obj = self.evaluate_attribute_access(node.object_name)
         elif isinstance(node.object_name, str):
             # Acesso simples: busca variável pelo nome
-            obj = self.get_variable(node.object_name)
+            obj = self.get_variable(node, node.object_name)
         else:
             # node.object_name pode ser outro tipo de nó
             obj = self.evaluate_expression(node.object_name)
@@ -835,18 +956,18 @@ class Interpreter:
         
         # array_name pode ser string ou AttributeAccessNode (this.array)
         if isinstance(node.array_name, str):
-            array = self.get_variable(node.array_name)
+            array = self.get_variable(node, node.array_name)
         elif isinstance(node.array_name, AttributeAccessNode):
             array = self.evaluate_attribute_access(node.array_name)
         else:
             array = self.evaluate_expression(node.array_name)
         
-        if isinstance(array, list):
+        if isinstance(array, ARRAY_TYPES):
             if node.index2 is not None:
                 # Array bidimensional
                 index1 = self.evaluate_expression(node.index)
                 index2 = self.evaluate_expression(node.index2)
-                if isinstance(array[int(index1)], list):
+                if isinstance(array[int(index1)], ARRAY_TYPES):
                     return array[int(index1)][int(index2)]
             else:
                 # Array unidimensional
@@ -858,36 +979,16 @@ class Interpreter:
         if isinstance(node, ConditionNode):
             left = self.evaluate_expression(node.left)
             right = self.evaluate_expression(node.right)
-            return self.apply_comparison(left, node.operator, right)
+            comparison = COMPARISONS.get(node.operator)
+            if comparison is None:
+                return False
+            return comparison(left, right)
         else:
             return self.evaluate_expression(node)
     
     def apply_binary_op(self, left, operator, right):
-        if operator == '+':
-            if isinstance(left, str) or isinstance(right, str):
-                return str(left) + str(right)
-            return left + right
-        elif operator == '-':
-            return left - right
-        elif operator == '*':
-            return left * right
-        elif operator == '/':
-            if right == 0:
-                raise ZeroDivisionError("Division by zero")
-            if isinstance(left, int) and isinstance(right, int):
-                return left // right
-            return left / right
-        elif operator == '%':
-            if right == 0:
-                raise ZeroDivisionError("Modulo by zero")
-            if isinstance(left, float) or isinstance(right, float):
-                return float(left) % float(right)
-            return left % right
-        elif operator == '&&':
-            return bool(left) and bool(right)
-        elif operator == '||':
-            return bool(left) or bool(right)
-        return None
+        # Versão genérica (sem tipo estático); as especializadas estão em typed_ops
+        return typed_ops.apply_binary_op(left, operator, right)
     
     def apply_comparison(self, left, operator, right):
         if operator == '==':
@@ -904,12 +1005,39 @@ class Interpreter:
             return left <= right
         return False
     
-    def get_variable(self, name):
-        if name in self.local_scope:
-            return self.local_scope[name]
-        elif name in self.global_scope:
-            return self.global_scope[name]
-        return None
+    def get_variable(self, node, name):
+        """Valor de name lido por node: slot do frame atual, ou global (None se não existe)."""
+        frame = self.thread_state.frame
+        if frame is not None:
+            slot = node.slot
+            if slot is not None:
+                value = frame[slot]
+                if value is not UNSET:
+                    return value
+        return self.global_scope.get(name)
+    
+    def set_variable(self, node, name, value):
+        """Atribuição: no frame se name já tem valor local, senão global. True se local."""
+        frame = self.thread_state.frame
+        if frame is not None:
+            slot = node.slot
+            if slot is not None and frame[slot] is not UNSET:
+                frame[slot] = value
+                return True
+        self.global_scope[name] = value
+        return False
+    
+    def bind_variable(self, node, name, value, frame=UNSET):
+        """Declaração: no frame atual se houver um, senão global. True se local."""
+        if frame is UNSET:
+            frame = self.thread_state.frame
+        if frame is not None:
+            slot = node.slot
+            if slot is not None:
+                frame[slot] = value
+                return True
+        self.global_scope[name] = value
+        return False
     
     def execute_array_element_method_call(self, node):
         # Obter o objeto do array
@@ -919,27 +1047,9 @@ class Interpreter:
             obj = self.evaluate_array_access(node.array_access)
         
         if isinstance(obj, ObjectInstance):
-            method = obj.get_method(node.method_name)
+            method = self.lookup_method(node, obj)
             if method:
-                local_env = {'this': obj}
-                
-                for i, (param_type, param_name) in enumerate(method.parameters):
-                    if i < len(node.arguments):
-                        local_env[param_name] = self.evaluate_expression(node.arguments[i])
-                
-                old_local = self.local_scope
-                self.local_scope = local_env
-                
-                try:
-                    for stmt in method.body:
-                        self.execute_statement(stmt)
-                except ReturnException as e:
-                    self.local_scope = old_local
-                    return e.value
-                finally:
-                    self.local_scope = old_local
-                
-                return None
+                return self.execute_body(method, self.new_frame(method, node.arguments, this=obj))
         
         return None
     
@@ -968,17 +1078,17 @@ class Interpreter:
     
     def execute_object_attribute_array_assignment(self, node):
         # this.produtos[i] = valor
-        obj = self.get_variable(node.object_name)
+        obj = self.get_variable(node, node.object_name)
         
         if isinstance(obj, ObjectInstance):
             array = obj.get_attribute(node.attr_name)
-            if isinstance(array, list):
+            if isinstance(array, ARRAY_TYPES):
                 if node.index2 is not None:
                     # Array bidimensional
                     index1 = self.evaluate_expression(node.index)
                     index2 = self.evaluate_expression(node.index2)
                     value = self.evaluate_expression(node.value)
-                    if isinstance(array[int(index1)], list):
+                    if isinstance(array[int(index1)], ARRAY_TYPES):
                         array[int(index1)][int(index2)] = value
                 else:
                     # Array unidimensional
@@ -992,12 +1102,12 @@ class Interpreter:
             # Avaliar completamente a cadeia de atributos até chegar no array
             array = self.evaluate_attribute_access(node.object_attr_access)
             
-            if isinstance(array, list):
+            if isinstance(array, ARRAY_TYPES):
                 if node.index2 is not None:
                     # Array bidimensional
                     index1 = self.evaluate_expression(node.index)
                     index2 = self.evaluate_expression(node.index2)
-                    if isinstance(array[int(index1)], list):
+                    if isinstance(array[int(index1)], ARRAY_TYPES):
                         return array[int(index1)][int(index2)]
                 else:
                     # Array unidimensional
@@ -0,0 +1,62 @@
+# ============================================================================
+# LockStripes.py - Locks Listrados para o Estado Compartilhado pelo PAR
+# ============================================================================
+# Modelo de concorrência do runtime (threads do PAR, com ou sem GIL):
+#
+# - Leituras não usam lock: global_scope, os campos de um ObjectInstance e
+#   os arrays são lidos direto (uma leitura de dict/list/array.array é
+#   atômica no CPython, com GIL ou free-threaded).
+# - Uma escrita que muda mais de uma estrutura é feita com o lock da chave:
+#   variável global (global_scope + valor na SymbolTable + variable_types
+#   na declaração) pelo nome, atributos fora do Shape de um objeto e a troca
+#   do buffer de uma TypedArray por lista pelo id do objeto.
+# - Os locks são listrados: LockStripes tem um número fixo de locks e a
+#   chave escolhe um pelo hash, sem um lock por variável ou por objeto
+#   (memória) nem um lock único (disputa entre threads que não se tocam).
+#
+# Uma atribuição MiniPar como x = x + 1 continua sendo leitura e escrita
+# separadas: dois ramos do PAR que fazem isso na mesma variável precisam se
+# coordenar pelos canais, como antes.
+# ============================================================================
+
+import os
+import sys
+import weakref
+import threading
+
+
+# Locks em cada LockStripes (potência de 2)
+STRIPES = 64
+
+# True em um CPython free-threaded com o GIL desligado (3.13t+)
+FREE_THREADED = not getattr(sys, '_is_gil_enabled', lambda: True)()
+
+_instances = weakref.WeakSet()
+
+
+class LockStripes:
+    """Conjunto de locks; stripes(chave) é o lock da chave."""
+    __slots__ = ('locks', 'mask', '__weakref__')
+
+    def __init__(self, count=STRIPES):
+        if count & (count - 1):
+            raise ValueError(f"LockStripes: número de locks deve ser potência de 2 (recebido {count})")
+        self.mask = count - 1
+        self.locks = tuple(threading.Lock() for _ in range(count))
+        _instances.add(self)
+
+    def __call__(self, key):
+        return self.locks[hash(key) & self.mask]
+
+    def _reset(self):
+        self.locks = tuple(threading.Lock() for _ in range(self.mask + 1))
+
+
+def _reset_after_fork():
+    # Um lock preso por outra thread no momento do fork ficaria preso no filho
+    for stripes in list(_instances):
+        stripes._reset()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
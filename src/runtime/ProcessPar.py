@@ -0,0 +1,240 @@
+# ============================================================================
+# ProcessPar.py - Comandos de um PAR em Processos
+# ============================================================================
+# Com par_backend='process' (opção --par process do main.py ou MINIPAR_PAR),
+# cada comando de um PAR roda em um processo filho criado com fork no início
+# do bloco, em vez de uma thread: ramos que só calculam usam núcleos
+# diferentes, sem a disputa pelo GIL.
+#
+# O fork é feito a cada bloco (e não em um pool criado antes) porque o filho
+# precisa do estado do programa naquele ponto: variáveis globais, objetos,
+# funções e o código já compilado pelo modo de execução. Por isso o backend
+# só existe onde há fork (Linux, macOS); nos demais sistemas o PAR continua
+# em threads.
+#
+# - Variáveis globais: cada ramo começa com uma cópia (a do fork). Ao fim do
+#   ramo, o filho manda ao processo principal o que mudou: valores novos de
+#   variáveis, elementos alterados de arrays e matrizes e atributos
+#   alterados de objetos (um nível), que são aplicados no lugar, na ordem
+#   dos comandos do PAR. Ramos que escrevem elementos diferentes de um mesmo
+#   array combinam; no mesmo elemento vale o último ramo. Um ramo não vê as
+#   escritas dos outros enquanto executa: a comunicação é pelos canais.
+# - Canais: os Channel locais das variáveis globais passam a usar uma fila
+#   de um multiprocessing.Manager, compartilhada pelos processos (send e
+#   receive continuam bloqueando do mesmo jeito). Canais de rede não são
+#   compartilhados: um PAR com NetworkChannel nas globais roda em threads.
+# - Saída: o print de um filho vai para o processo principal, que escreve
+#   com o print_lock, como as threads.
+# - input() em um ramo lê fim de arquivo (o multiprocessing fecha a entrada
+#   padrão dos filhos), e um PAR dentro de um ramo usa threads.
+# ============================================================================
+
+import sys
+import queue
+import threading
+import traceback
+import multiprocessing
+
+from runtime.Channel import Channel, NetworkChannel
+from runtime.TypedArray import ARRAY_TYPES
+
+
+PAR_BACKENDS = ('thread', 'process')
+
+# Valores que vão do filho para o processo principal (arrays só destes)
+_PLAIN_TYPES = (int, float, str, bool, type(None))
+
+# Intervalo (s) entre as verificações de filhos que terminaram sem avisar
+_POLL_INTERVAL = 0.1
+
+
+def fork_available():
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def _plain(value):
+    """Se o valor pode ir para o processo principal (escalar, ou array/matriz de escalares)."""
+    if isinstance(value, _PLAIN_TYPES):
+        return True
+    if isinstance(value, ARRAY_TYPES):
+        return all(_plain(item) for item in value)
+    return False
+
+
+def _is_matrix(value):
+    return len(value) > 0 and isinstance(value[0], ARRAY_TYPES)
+
+
+def _array_copy(value):
+    if _is_matrix(value):
+        return [list(row) for row in value]
+    return list(value)
+
+
+def _array_changes(current, original):
+    """Elementos (índice ou (linha, coluna), valor) de current diferentes da cópia original."""
+    changes = []
+    if isinstance(original[0] if original else None, list):
+        for i, (row, old_row) in enumerate(zip(current, original)):
+            if not isinstance(row, ARRAY_TYPES):
+                continue
+            values = list(row)
+            if values != old_row:
+                changes.extend(((i, j), value) for j, (value, old) in enumerate(zip(values, old_row))
+                               if value != old or value.__class__ is not old.__class__)
+        return changes
+    values = list(current)
+    if values != original:
+        changes.extend((i, value) for i, (value, old) in enumerate(zip(values, original))
+                       if value != old or value.__class__ is not old.__class__)
+    return changes
+
+
+class _OutputRelay:
+    """output_stream de um filho: o texto vai para o processo principal."""
+
+    def __init__(self, results, index):
+        self.results = results
+        self.index = index
+
+    def write(self, text):
+        self.results.put(('out', self.index, text))
+
+    def flush(self):
+        pass
+
+
+class ProcessPar:
+    """Executa os comandos de um PAR (funções sem argumentos) em processos filhos."""
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.context = multiprocessing.get_context('fork')
+        self._manager = None
+
+    def supports(self):
+        """Se o bloco pode rodar em processos agora (senão, threads)."""
+        return not any(isinstance(value, NetworkChannel) for value in list(self.interpreter.global_scope.values()))
+
+    @property
+    def manager(self):
+        if self._manager is None:
+            self._manager = self.context.Manager()
+        return self._manager
+
+    def share_channels(self):
+        """Troca a fila de cada Channel global por uma fila do Manager, vista por todos os processos."""
+        for value in list(self.interpreter.global_scope.values()):
+            if value.__class__ is Channel and not value.shared:
+                value.share(self.manager.Queue(value.capacity))
+
+    def run(self, targets):
+        self.share_channels()
+        results = self.context.Queue()
+        processes = []
+        for index, target in enumerate(targets):
+            process = self.context.Process(target=self._child, args=(target, results, index), daemon=True)
+            processes.append(process)
+        for process in processes:
+            process.start()
+        changes = self._collect(processes, results)
+        for process in processes:
+            process.join()
+        for index in range(len(targets)):
+            self.apply(changes.get(index, ()))
+
+    def _collect(self, processes, results):
+        """Repassa a saída dos filhos até todos mandarem as mudanças; índice -> mudanças."""
+        changes = {}
+        running = set(range(len(processes)))
+        while running:
+            try:
+                message = results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                for index in list(running):
+                    if not processes[index].is_alive() and results.empty():
+                        # Terminou sem mandar as mudanças (ex.: morto por sinal)
+                        running.discard(index)
+                continue
+            kind, index, payload = message
+            if kind == 'out':
+                self.interpreter.write_output(payload)
+            else:
+                changes[index] = payload
+                running.discard(index)
+        return changes
+
+    # ------------------------- Processo filho -------------------------
+
+    def _child(self, target, results, index):
+        interpreter = self.interpreter
+        # Travas copiadas no fork podem ter ficado presas por outra thread
+        interpreter.print_lock = threading.Lock()
+        interpreter.symbol_table.lock = threading.Lock()
+        interpreter.output_stream = _OutputRelay(results, index)
+        interpreter.par_backend = 'thread'
+        baseline = self.snapshot()
+        try:
+            target()
+        except Exception:
+            print(f"Exception in PAR process {index}:", file=sys.stderr)
+            traceback.print_exc()
+        finally:
+            results.put(('done', index, self.changes(baseline)))
+
+    def snapshot(self):
+        """Nome -> (valor, cópia) das globais que podem mudar no ramo."""
+        baseline = {}
+        for name, value in self.interpreter.global_scope.items():
+            if isinstance(value, ARRAY_TYPES):
+                baseline[name] = (value, _array_copy(value))
+            elif hasattr(value, 'fields'):
+                baseline[name] = (value, dict(value.attributes))
+            else:
+                baseline[name] = (value, None)
+        return baseline
+
+    def changes(self, baseline):
+        """Mudanças das globais desde o snapshot, no formato de apply."""
+        changes = []
+        for name, value in list(self.interpreter.global_scope.items()):
+            if name not in baseline:
+                if _plain(value):
+                    changes.append(('set', name, value))
+                continue
+            original, copy = baseline[name]
+            if value is not original:
+                if _plain(value):
+                    changes.append(('set', name, value))
+            elif copy is None:
+                continue
+            elif isinstance(value, ARRAY_TYPES):
+                items = [(index, item) for index, item in _array_changes(value, copy) if _plain(item)]
+                if items:
+                    changes.append(('items', name, items))
+            else:
+                fields = [(attribute, item) for attribute, item in value.attributes.items()
+                          if (item is not copy.get(attribute)) and _plain(item)]
+                if fields:
+                    changes.append(('fields', name, fields))
+        return changes
+
+    def apply(self, changes):
+        """Aplica no processo principal as mudanças de um ramo."""
+        interpreter = self.interpreter
+        scope = interpreter.global_scope
+        for kind, name, payload in changes:
+            if kind == 'set':
+                scope[name] = payload
+                interpreter.symbol_table.update(name, payload)
+            elif kind == 'items':
+                target = scope.get(name)
+                for index, item in payload:
+                    if isinstance(index, tuple):
+                        target[index[0]][index[1]] = item
+                    else:
+                        target[index] = item
+            else:
+                target = scope.get(name)
+                for attribute, item in payload:
+                    target.set_attribute(attribute, item)
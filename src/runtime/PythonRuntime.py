@@ -0,0 +1,137 @@
+# ============================================================================
+# PythonRuntime.py - Execução do Programa Traduzido para Python
+# ============================================================================
+# Executa o PythonProgram gerado por codegen/PythonGenerator.py: o code
+# object roda com exec() em um namespace que fornece o que o código gerado
+# usa do Interpreter, para a semântica continuar a mesma:
+#
+# - _G/_get/_assign/_set_global/_declare: escopo global e tabela de símbolos
+# - _print/_input: saída (output_stream, print_lock) e entrada com conversão
+#   pelo tipo declarado
+# - _channel/_implicit_channel: Channel/NetworkChannel das declarações e
+#   canais criados por send/receive
+# - _parallel: comandos do PAR (run_parallel: threads ou processos)
+# - _new/_invoke/_arity: objetos (ObjectInstance) e chamada dos métodos,
+#   cujo código gerado está em _methods (MethodNode -> função)
+# - funções nativas de string, arrays e as operações escolhidas pelo tipo
+# ============================================================================
+
+from parser.AST import *
+from codegen.PythonGenerator import PythonGenerator
+from runtime.Channel import Channel
+from runtime.Interpreter import (Interpreter, ObjectInstance, ReturnException,
+                                 new_array, new_matrix, fill_matrix, matrix_from_values)
+from runtime.Resolver import UNSET
+from runtime.TypedArray import ARRAY_TYPES, array_of
+from runtime.natives import NATIVE_FUNCTIONS
+from runtime.typed_ops import select_operation
+
+
+def _item2(array, index1, index2):
+    """array[index1][index2], ou None se a linha não é um array."""
+    row = array[int(index1)]
+    if isinstance(row, ARRAY_TYPES):
+        return row[int(index2)]
+    return None
+
+
+class PythonRuntime(Interpreter):
+    """Interpreter que traduz o programa para Python e executa o código gerado."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.program = None
+        self.methods = {}  # MethodNode -> função gerada
+
+    def interpret(self, ast):
+        if isinstance(ast, ProgramNode):
+            self.execute(PythonGenerator().compile(ast))
+
+    def execute(self, program):
+        """Executa um PythonProgram (gerado agora ou carregado do cache)."""
+        self.program = program
+        self.collect_definitions(program.ast)
+        namespace = self.namespace(program)
+        exec(program.code, namespace)
+        namespace['_main']()
+
+    def namespace(self, program):
+        """Globais do módulo gerado."""
+        namespace = {
+            '_G': self.global_scope,
+            '_get': self.global_scope.get,
+            '_types': self.variable_types,
+            '_N': program.nodes,
+            '_methods': self.methods,
+            '_NUMBERS': (int, float),
+            '_ARRAYS': ARRAY_TYPES,
+            'UNSET': UNSET,
+            'Channel': Channel,
+            'ObjectInstance': ObjectInstance,
+            'ReturnException': ReturnException,
+            'select_operation': select_operation,
+            '_assign': self.assign_global,
+            '_set_global': self.global_scope.__setitem__,
+            '_declare': self.declare_global,
+            '_print': self.print_value,
+            '_input': self.read_input,
+            '_channel': self.create_channel,
+            '_implicit_channel': self.implicit_channel,
+            '_parallel': self.run_parallel,
+            '_new': self.new_object,
+            '_invoke': self.invoke_method,
+            '_arity': self.method_arity,
+            '_invoke_element': self.invoke_element_method,
+            '_element_arity': self.element_method_arity,
+            '_item2': _item2,
+            '_new_array': new_array,
+            '_array_of': array_of,
+            '_new_matrix': new_matrix,
+            '_fill_matrix': fill_matrix,
+            '_matrix_from_values': matrix_from_values,
+        }
+        for name, (function, _, _) in NATIVE_FUNCTIONS.items():
+            namespace['_' + name] = function
+        return namespace
+
+    # ------------------- Funções usadas pelo código gerado -------------------
+
+    def declare_global(self, node, value):
+        self.define_global(node.identifier, node.type_name, value, node.is_array, node.array_size)
+
+    def new_object(self, class_name):
+        class_def = self.classes.get(class_name)
+        if class_def is not None:
+            return self.new_instance(class_name, class_def)
+        return None
+
+    def method_arity(self, obj, method_name, count):
+        """Quantos dos count argumentos são avaliados na chamada de obj.method_name."""
+        if isinstance(obj, ObjectInstance):
+            method = obj.get_method(method_name)
+            if method:
+                return min(count, len(method.parameters))
+            return 0
+        if obj and hasattr(obj, method_name):
+            return count
+        return 0
+
+    def invoke_method(self, obj, method_name, count, *arguments):
+        if isinstance(obj, ObjectInstance):
+            method = obj.get_method(method_name)
+            if method:
+                return self.methods[method](obj, *arguments[:count])
+        elif obj and hasattr(obj, method_name):
+            # Objetos Python (ex.: canais)
+            return getattr(obj, method_name)(*arguments[:count])
+        return None
+
+    def element_method_arity(self, obj, method_name, count):
+        if isinstance(obj, ObjectInstance):
+            return self.method_arity(obj, method_name, count)
+        return 0
+
+    def invoke_element_method(self, obj, method_name, count, *arguments):
+        if isinstance(obj, ObjectInstance):
+            return self.invoke_method(obj, method_name, count, *arguments)
+        return None
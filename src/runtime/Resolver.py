@@ -0,0 +1,111 @@
+# ============================================================================
+# Resolver.py - Resolução de Endereços Léxicos (slots de variáveis)
+# ============================================================================
+# Antes da execução, cada função e método recebe um layout de frame: os nomes
+# que podem ser locais (parâmetros, 'this', declarações, variável do for e
+# instanciações) ganham um índice fixo, e todo nó que lê ou escreve uma
+# variável é anotado com o slot do nome (node.slot). O Interpreter executa o
+# corpo com uma lista pré-alocada desse tamanho, e cada acesso a variável
+# local vira uma indexação em vez de consultas a dicionários.
+#
+# A semântica de escopo é a mesma dos dicionários de antes:
+# - um slot ainda sem valor (UNSET) faz a leitura cair no escopo global
+# - atribuição só escreve no frame se o nome já tem valor local
+# - nomes sem slot (slot None) são sempre globais
+# ============================================================================
+
+from parser.AST import *
+from parser.Traversal import walk
+
+
+class _Unset:
+    """Marca de slot sem valor (None é um valor válido de variável)."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'UNSET'
+
+
+UNSET = _Unset()
+
+# Campo com o nome da variável acessada por cada classe de nó
+NAME_FIELDS = {
+    IdentifierNode: 'name',
+    DeclarationNode: 'identifier',
+    AssignmentNode: 'identifier',
+    InputNode: 'identifier',
+    ForNode: 'var',
+    InstantiationNode: 'var_name',
+    ArrayAccessNode: 'array_name',
+    ArrayAssignmentNode: 'array_name',
+    AttributeAccessNode: 'object_name',
+    AttributeAssignmentNode: 'object_name',
+    ObjectAttributeArrayAssignmentNode: 'object_name',
+    MethodCallNode: 'object_name',
+    SendNode: 'channel',
+    ReceiveNode: 'channel',
+}
+
+# Comandos que criam a variável no frame (se ele não estiver vazio)
+_BINDING_NODES = (DeclarationNode, ForNode, InstantiationNode)
+
+
+class FrameLayout:
+    """Nomes locais de uma função/método, na ordem dos slots."""
+    __slots__ = ('names', 'parameter_slots', 'this_slot')
+
+    def __init__(self, names, parameter_slots, this_slot=None):
+        self.names = names
+        self.parameter_slots = parameter_slots
+        self.this_slot = this_slot
+
+    @property
+    def size(self):
+        return len(self.names)
+
+    def new_frame(self):
+        return [UNSET] * len(self.names)
+
+
+class Resolver:
+    """Calcula os layouts de frame e anota os slots nos nós da AST."""
+
+    def __init__(self):
+        self.layouts = {}  # FunctionNode/MethodNode -> FrameLayout
+
+    def resolve(self, program):
+        """Resolve todas as funções e métodos; fora deles, todo nome é global."""
+        for node in program.children:
+            if isinstance(node, FunctionNode):
+                self.resolve_callable(node)
+            elif isinstance(node, ClassNode):
+                for method in node.methods:
+                    self.resolve_callable(method, is_method=True)
+            else:
+                self._annotate(node, {})
+        return self.layouts
+
+    def resolve_callable(self, node, is_method=False):
+        """Layout de uma função (ou método, com 'this' no slot 0)."""
+        slots = {}
+        if is_method:
+            slots['this'] = 0
+        parameter_slots = [slots.setdefault(name, len(slots)) for _, name in node.parameters]
+        for stmt in node.body:
+            for child in walk(stmt):
+                if isinstance(child, _BINDING_NODES):
+                    slots.setdefault(getattr(child, NAME_FIELDS[child.__class__]), len(slots))
+        for stmt in node.body:
+            self._annotate(stmt, slots)
+
+        layout = FrameLayout(list(slots), parameter_slots, 0 if is_method else None)
+        self.layouts[node] = layout
+        return layout
+
+    def _annotate(self, root, slots):
+        for node in walk(root):
+            field = NAME_FIELDS.get(node.__class__)
+            if field is not None:
+                name = getattr(node, field)
+                # object_name/array_name podem ser nós (ex.: this.obj.attr)
+                node.slot = slots.get(name) if isinstance(name, str) else None
@@ -0,0 +1,225 @@
+# ============================================================================
+# Scheduler.py - Pool de Threads com Roubo de Tarefas para os Blocos PAR
+# ============================================================================
+# Os comandos de um PAR viram tarefas de um TaskGroup (um grupo por bloco,
+# com um TaskHandle por comando), executadas por threads de um pool que
+# existe durante todo o programa: um PAR dentro de um laço não cria nem
+# destrói threads a cada iteração, e blocos PAR aninhados ou simultâneos
+# (em threads diferentes) esperam cada um só pelas próprias tarefas.
+#
+# - Cada worker tem uma fila (deque) própria. Um PAR executado por um worker
+#   (PAR aninhado) coloca as tarefas na fila dele; um PAR de outra thread
+#   (o programa principal) coloca na fila de entrada do scheduler.
+# - Um worker procura tarefa na própria fila (a mais recente), depois na
+#   fila de entrada e depois rouba a mais antiga da fila de outro worker.
+# - O pool guarda até max_workers threads. Como os comandos de um PAR podem
+#   esperar uns pelos outros (send/receive), toda tarefa precisa de uma
+#   thread: se não há workers livres para todas as tarefas na fila, o pool
+#   cresce, e os workers além de max_workers terminam depois de
+#   IDLE_TIMEOUT segundos sem tarefa.
+# - Uma exceção não tratada em uma tarefa é mostrada em stderr (como nas
+#   threads do Python) e fica em TaskHandle.exception; o grupo termina
+#   normalmente.
+# ============================================================================
+
+import os
+import sys
+import threading
+import traceback
+from collections import deque
+
+
+# Segundos que um worker além de max_workers espera por tarefa antes de terminar
+IDLE_TIMEOUT = 5.0
+
+
+def default_workers():
+    """Workers mantidos no pool: variável de ambiente MINIPAR_WORKERS ou max(4, núcleos)."""
+    value = os.environ.get('MINIPAR_WORKERS')
+    if value:
+        return max(1, int(value))
+    return max(4, os.cpu_count() or 1)
+
+
+class TaskHandle:
+    """Uma tarefa de um TaskGroup: join() espera o fim; exception guarda o erro, se houve."""
+    __slots__ = ('function', 'group', 'done', 'exception')
+
+    def __init__(self, function, group):
+        self.function = function
+        self.group = group
+        self.done = False
+        self.exception = None
+
+    def run(self):
+        try:
+            self.function()
+        except BaseException as e:
+            self.exception = e
+            print(f"Exception in thread {threading.current_thread().name}:", file=sys.stderr)
+            traceback.print_exc()
+
+    def join(self):
+        with self.group.condition:
+            while not self.done:
+                self.group.condition.wait()
+
+
+class TaskGroup:
+    """Tarefas de um bloco PAR; join() espera todas (e só elas)."""
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+        self.handles = []
+        self.pending = 0
+        self.condition = threading.Condition()
+
+    def spawn(self, function):
+        return self.spawn_all([function])[0]
+
+    def spawn_all(self, functions):
+        """Agenda as funções (sem argumentos) de uma vez e retorna os TaskHandle."""
+        handles = [TaskHandle(function, self) for function in functions]
+        if handles:
+            with self.condition:
+                self.pending += len(handles)
+            self.handles.extend(handles)
+            self.scheduler.submit(handles)
+        return handles
+
+    def join(self):
+        with self.condition:
+            while self.pending:
+                self.condition.wait()
+
+    def _finish(self, handle):
+        with self.condition:
+            handle.done = True
+            self.pending -= 1
+            self.condition.notify_all()
+
+
+class _Worker:
+    __slots__ = ('tasks', 'thread')
+
+    def __init__(self):
+        self.tasks = deque()
+        self.thread = None
+
+
+class Scheduler:
+    """Pool de workers persistente; cada bloco PAR usa um TaskGroup (group())."""
+
+    def __init__(self, max_workers=None, idle_timeout=IDLE_TIMEOUT):
+        self.max_workers = max_workers or default_workers()
+        self.idle_timeout = idle_timeout
+        self.lock = threading.Lock()
+        self.work = threading.Condition(self.lock)
+        # Tarefas agendadas por threads que não são workers
+        self.injected = deque()
+        self.workers = []
+        # Tarefas nas filas, workers esperando tarefa, ainda iniciando e
+        # voltando de uma tarefa (que logo procuram a próxima)
+        self.queued = 0
+        self.idle = 0
+        self.starting = 0
+        self.returning = 0
+        self.current = threading.local()
+
+    def group(self):
+        return TaskGroup(self)
+
+    def run(self, functions):
+        """Executa as funções (sem argumentos) em paralelo e espera todas."""
+        group = TaskGroup(self)
+        group.spawn_all(functions)
+        group.join()
+        return group.handles
+
+    def submit(self, handles):
+        worker = getattr(self.current, 'worker', None)
+        with self.lock:
+            (worker.tasks if worker is not None else self.injected).extend(handles)
+            self.queued += len(handles)
+            for _ in range(self.queued - self.idle - self.starting - self.returning):
+                self._spawn()
+            self.work.notify(len(handles))
+
+    def _spawn(self):
+        worker = _Worker()
+        worker.thread = threading.Thread(target=self._work, args=(worker,),
+                                         name=f"MiniPar-worker-{len(self.workers) + 1}", daemon=True)
+        self.workers.append(worker)
+        self.starting += 1
+        worker.thread.start()
+
+    def _take(self, worker):
+        """Próxima tarefa do worker (com self.lock): a própria fila, a de entrada ou roubada."""
+        if worker.tasks:
+            task = worker.tasks.pop()
+        elif self.injected:
+            task = self.injected.popleft()
+        else:
+            for other in self.workers:
+                if other.tasks:
+                    task = other.tasks.popleft()
+                    break
+            else:
+                return None
+        self.queued -= 1
+        return task
+
+    def _work(self, worker):
+        self.current.worker = worker
+        lock = self.lock
+        # Até procurar a primeira tarefa o worker conta em self.starting;
+        # depois de cada tarefa, em self.returning
+        first = True
+        while True:
+            with lock:
+                if first:
+                    self.starting -= 1
+                    first = False
+                else:
+                    self.returning -= 1
+                task = self._take(worker)
+                while task is None:
+                    surplus = len(self.workers) > self.max_workers
+                    self.idle += 1
+                    woken = self.work.wait(self.idle_timeout if surplus else None)
+                    self.idle -= 1
+                    task = self._take(worker)
+                    if task is None and not woken and len(self.workers) > self.max_workers:
+                        self.workers.remove(worker)
+                        return
+            task.run()
+            # Conta como disponível antes do join do grupo voltar: um PAR
+            # seguinte (em um laço) não cria workers para o lugar deste
+            with lock:
+                self.returning += 1
+            task.group._finish(task)
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def default_scheduler():
+    """Scheduler compartilhado pelos interpretadores do processo (criado no primeiro PAR)."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = Scheduler()
+    return _default
+
+
+def _forget_default():
+    # Um processo criado com fork não tem as threads do pool do processo pai
+    global _default, _default_lock
+    _default = None
+    _default_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_forget_default)
@@ -0,0 +1,262 @@
+# ============================================================================
+# TypedArray.py - Arrays INT/FLOAT/BOOL em Buffers Contíguos
+# ============================================================================
+# Arrays cujos elementos são todos int, float ou bool (os declarados INT,
+# FLOAT e BOOL sem inicialização, ou inicializados com valores de um desses
+# tipos) ficam em um array.array ('q', 'd' ou 'b'): 8 ou 1 byte por
+# elemento, em vez de uma lista de ponteiros para objetos Python.
+#
+# Matrizes continuam sendo listas de linhas, mas as linhas são TypedRow
+# sobre um único buffer, linha a linha (row-major): m[i] é a linha (que pode
+# ser passada adiante ou trocada, como antes) e m[i][j] é o elemento
+# i*colunas+j do buffer.
+#
+# O comportamento é o de uma lista: índices negativos, IndexError fora dos
+# limites, str/==/+ iguais aos da lista com os mesmos valores e elementos
+# BOOL lidos como bool. Um valor que o buffer não representa exatamente
+# (float em um array INT, int fora de 64 bits, string...) troca o buffer por
+# uma lista, no lugar: quem já tinha o array (ou a linha) continua vendo as
+# mudanças.
+# ============================================================================
+
+from array import array
+
+from runtime.LockStripes import LockStripes
+
+
+# Classe dos elementos -> typecode do buffer
+TYPECODES = {int: 'q', float: 'd', bool: 'b'}
+
+# Troca do buffer por lista: lock do id da TypedArray
+_ARRAY_LOCKS = LockStripes()
+
+
+class _ArrayProtocol:
+    """str, ==, <, +, * e iteração de lista, a partir de tolist()."""
+    __slots__ = ()
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, ARRAY_TYPES):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __lt__(self, other):
+        if isinstance(other, ARRAY_TYPES):
+            return self.tolist() < list(other)
+        return NotImplemented
+
+    def __le__(self, other):
+        if isinstance(other, ARRAY_TYPES):
+            return self.tolist() <= list(other)
+        return NotImplemented
+
+    def __gt__(self, other):
+        if isinstance(other, ARRAY_TYPES):
+            return self.tolist() > list(other)
+        return NotImplemented
+
+    def __ge__(self, other):
+        if isinstance(other, ARRAY_TYPES):
+            return self.tolist() >= list(other)
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, ARRAY_TYPES):
+            return self.tolist() + list(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, list):
+            return other + self.tolist()
+        return NotImplemented
+
+    def __mul__(self, count):
+        if isinstance(count, int):
+            return self.tolist() * count
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+
+class TypedArray(_ArrayProtocol):
+    """
+    Array MiniPar com os elementos em data: um array.array cujos valores são
+    todos da classe element, ou uma lista (element None) depois que um valor
+    não coube no buffer.
+    """
+    __slots__ = ('data', 'element')
+
+    def __init__(self, data, element=None):
+        self.data = data
+        self.element = element
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        try:
+            value = self.data[index]
+        except IndexError:
+            raise IndexError('list index out of range') from None
+        if self.element is bool:
+            return value == 1
+        return value
+
+    def __setitem__(self, index, value):
+        data = self.data
+        if value.__class__ is self.element:
+            try:
+                data[index] = value
+            except IndexError:
+                raise IndexError('list assignment index out of range') from None
+            except OverflowError:
+                self.to_list()[index] = value
+            else:
+                if self.data is not data:
+                    # Outra thread trocou o buffer por uma lista enquanto isso
+                    self.data[index] = value
+            return
+        if self.element is not None:
+            data = self.to_list()
+        data[index] = value
+
+    def to_list(self):
+        """Troca o buffer por uma lista com os mesmos valores e a retorna."""
+        with _ARRAY_LOCKS(id(self)):
+            if self.element is not None:
+                # data antes de element: quem ler no meio já vê os valores certos
+                self.data = self.tolist()
+                self.element = None
+            return self.data
+
+    def tolist(self, start=0, stop=None):
+        values = self.data[start:stop]
+        if self.element is None:
+            return values
+        values = values.tolist()
+        if self.element is bool:
+            return [value == 1 for value in values]
+        return values
+
+    def view(self):
+        """memoryview dos elementos no buffer (sem cópia), ou None se eles já estão em uma lista."""
+        if self.element is None:
+            return None
+        return memoryview(self.data)
+
+
+class TypedRow(_ArrayProtocol):
+    """
+    Linha de uma matriz: os elementos matrix.data[start:start + length] da
+    TypedArray com todos os elementos da matriz, linha a linha. Um valor que
+    não cabe no buffer troca o buffer da matriz inteira por uma lista.
+    """
+    __slots__ = ('matrix', 'start', 'length')
+
+    def __init__(self, matrix, start, length):
+        self.matrix = matrix
+        self.start = start
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.length
+            if index < 0:
+                raise IndexError('list index out of range')
+        elif index >= self.length:
+            raise IndexError('list index out of range')
+        matrix = self.matrix
+        value = matrix.data[self.start + index]
+        if matrix.element is bool:
+            return value == 1
+        return value
+
+    def __setitem__(self, index, value):
+        if index < 0:
+            index += self.length
+            if index < 0:
+                raise IndexError('list assignment index out of range')
+        elif index >= self.length:
+            raise IndexError('list assignment index out of range')
+        self.matrix[self.start + index] = value
+
+    def tolist(self):
+        return self.matrix.tolist(self.start, self.start + self.length)
+
+    def view(self):
+        view = self.matrix.view()
+        if view is None:
+            return None
+        return view[self.start:self.start + self.length]
+
+
+# Valores que o interpretador trata como array (indexáveis com a[i])
+ARRAY_TYPES = (list, TypedArray, TypedRow)
+
+
+def filled(value, size):
+    """Array de size elementos iguais a value."""
+    typecode = TYPECODES.get(value.__class__)
+    if typecode is not None:
+        try:
+            return TypedArray(array(typecode, [value]) * size, value.__class__)
+        except OverflowError:
+            pass
+    return [value] * size
+
+
+def filled_rows(value, rows, columns):
+    """Matriz rows x columns com todos os elementos iguais a value."""
+    if rows > 0 and columns > 0:
+        matrix = filled(value, rows * columns)
+        if matrix.__class__ is TypedArray:
+            return _rows(matrix, rows, columns)
+    return [[value for _ in range(columns)] for _ in range(rows)]
+
+
+def array_of(values):
+    """TypedArray com os valores (lista) se todos são da mesma classe de TYPECODES; senão a lista."""
+    data = _buffer(values)
+    if data is None:
+        return values
+    return TypedArray(data, values[0].__class__)
+
+
+def rows_of(values, rows, columns):
+    """Matriz rows x columns com os valores (lista com rows*columns valores), linha a linha."""
+    columns = max(columns, 0)
+    data = _buffer(values) if rows > 0 else None
+    if data is None:
+        return [values[row * columns:(row + 1) * columns] for row in range(rows)]
+    return _rows(TypedArray(data, values[0].__class__), rows, columns)
+
+
+def _buffer(values):
+    if not values:
+        return None
+    element = values[0].__class__
+    typecode = TYPECODES.get(element)
+    if typecode is None:
+        return None
+    for value in values:
+        if value.__class__ is not element:
+            return None
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        return None
+
+
+def _rows(matrix, rows, columns):
+    return [TypedRow(matrix, row * columns, columns) for row in range(rows)]
@@ -0,0 +1,394 @@
+# ============================================================================
+# VirtualMachine.py - Máquina Virtual de Pilha para o Bytecode MiniPar
+# ============================================================================
+# Executa o BytecodeProgram gerado por codegen/BytecodeCompiler.py com um
+# laço de despacho sobre os opcodes: uma pilha de operandos por execução de
+# código, o frame de slots do Resolver para as variáveis locais e o escopo
+# global do Interpreter para as demais.
+#
+# - Funções e métodos: cada chamada executa o CodeObject do corpo com um
+#   frame novo (this e parâmetros nos slots do layout), no mesmo laço de
+#   despacho: o estado de quem chama vai para uma pilha de chamadas própria,
+#   em vez de uma chamada recursiva de run_code. A recursão MiniPar não usa
+#   a pilha do Python, e a profundidade máxima é max_call_depth (opção
+#   --max-depth do main.py ou MINIPAR_MAX_DEPTH); passar dela levanta
+#   CallStackOverflow
+# - PAR: cada comando do bloco é um CodeObject executado por run_parallel
+#   (em uma thread, ou em um processo), sem frame (como no Interpreter)
+# - send/receive, input e declarações de canal/array usam os métodos do
+#   Interpreter (EXEC_NODE/EVAL_NODE), com o mesmo Channel
+#
+# A semântica (saída, escopos, canais, PAR) é a mesma do Interpreter.
+# ============================================================================
+
+import os
+import functools
+
+from parser.AST import *
+from codegen.BytecodeCompiler import *
+from runtime.Interpreter import Interpreter, ObjectInstance, ReturnException
+from runtime.Resolver import UNSET
+from runtime.TypedArray import ARRAY_TYPES
+from runtime.typed_ops import COMPARISONS, select_operation
+
+
+# Chamada de método em preparação: (tipo, objeto, método, nº de argumentos
+# avaliados, argumentos já vistos)
+_NO_METHOD = 0
+_MINIPAR_METHOD = 1
+_PYTHON_METHOD = 2
+
+# Função de cada operador relacional, na numeração de COMPARE
+_COMPARISON_FUNCTIONS = [COMPARISONS[operator] for operator in COMPARISON_OPERATORS]
+
+# Chamadas MiniPar aninhadas permitidas, se nem a opção nem MINIPAR_MAX_DEPTH
+# dizem outra coisa
+DEFAULT_MAX_CALL_DEPTH = 100000
+
+
+def default_max_call_depth():
+    """Profundidade máxima padrão: variável de ambiente MINIPAR_MAX_DEPTH ou DEFAULT_MAX_CALL_DEPTH."""
+    value = os.environ.get('MINIPAR_MAX_DEPTH')
+    return int(value) if value else DEFAULT_MAX_CALL_DEPTH
+
+
+class CallStackOverflow(RuntimeError):
+    """Recursão MiniPar mais funda que max_call_depth."""
+
+
+class VirtualMachine(Interpreter):
+    """Interpreter que compila o programa para bytecode e o executa."""
+
+    def __init__(self, *args, max_call_depth=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_call_depth = max_call_depth or default_max_call_depth()
+        self.program = None
+        self._compiler = None
+        self._prepared = {}  # CodeObject -> tabelas prontas para execução
+
+    def interpret(self, ast):
+        if isinstance(ast, ProgramNode):
+            self._compiler = BytecodeCompiler()
+            program = self._compiler.compile(ast)
+            self.resolver = self._compiler.resolver
+            self.execute(program)
+
+    def execute(self, program):
+        """Executa um BytecodeProgram (compilado agora ou carregado do cache)."""
+        self.program = program
+        self.collect_definitions(program.ast)
+        result = self.run_code(program.main, None)
+        if result is not None:
+            # RETURN fora de uma função: mesmo comportamento do Interpreter
+            raise ReturnException(result[0])
+
+    def execute_body(self, callable_node, frame):
+        code_object = self._code_for(callable_node)
+        state = self.thread_state
+        old_frame = state.frame
+        state.frame = frame
+        try:
+            # Chamada feita pelos métodos do Interpreter (EVAL_NODE/EXEC_NODE):
+            # um laço de despacho novo, que continua a contagem de profundidade
+            result = self.run_code(code_object, frame, state.depth + 1)
+        except ReturnException as e:
+            return e.value
+        finally:
+            state.frame = old_frame
+        if result is not None:
+            return result[0]
+        return None
+
+    def _code_for(self, callable_node):
+        code_object = self.program.bodies.get(callable_node)
+        if code_object is None:
+            if self._compiler is None:
+                self._compiler = BytecodeCompiler()
+                self._compiler.functions = dict(self.functions)
+            code_object = self._compiler.compile_callable(callable_node, isinstance(callable_node, MethodNode))
+            self.program.bodies[callable_node] = code_object
+        return code_object
+
+    def _frame(self, code_object, arguments, this=None):
+        """Frame da chamada; None se nada foi atribuído (tudo global)."""
+        if this is None and not arguments:
+            return None
+        frame = [UNSET] * code_object.frame_size
+        if this is not None:
+            frame[code_object.this_slot] = this
+        for slot, value in zip(code_object.parameter_slots, arguments):
+            frame[slot] = value
+        return frame
+
+    def _prepare(self, code_object):
+        """Tabelas do CodeObject na forma usada pelo laço de despacho."""
+        prepared = (
+            code_object.code.tolist(),
+            code_object.constants,
+            code_object.names,
+            [slot for slot, _ in code_object.variables],
+            [name for _, name in code_object.variables],
+            [select_operation(*operator) for operator in code_object.operators],
+            code_object.calls,
+            code_object.method_calls,
+            # Cache monomórfico de cada chamada de método: (ClassNode, MethodNode)
+            [(None, None)] * len(code_object.method_calls),
+            code_object.nodes,
+            code_object.blocks,
+        )
+        self._prepared[code_object] = prepared
+        return prepared
+
+    def _run_thread(self, code_object):
+        result = self.run_code(code_object, None)
+        if result is not None:
+            raise ReturnException(result[0])
+
+    def stack_overflow(self, name):
+        return CallStackOverflow(
+            f"Estouro da pilha de chamadas: mais de {self.max_call_depth} chamadas aninhadas (ao chamar '{name}')")
+
+    def run_code(self, code_object, frame, depth=0):
+        """
+        Laço de despacho: None ao fim do código, ou (valor,) após um RETURN.
+        depth é o número de chamadas MiniPar já em andamento na thread.
+
+        Uma chamada guarda em call_stack o código, o pc e o frame de quem
+        chama e a altura das pilhas de operandos e de chamadas de método
+        (compartilhadas por todos os níveis); o RETURN ou o fim do corpo
+        chamado restaura esse estado e empilha o valor retornado.
+        """
+        prepared = self._prepared.get(code_object) or self._prepare(code_object)
+        code, constants, names, slots, variable_names, operations, calls, method_calls, method_caches, nodes, blocks = prepared
+        comparisons = _COMPARISON_FUNCTIONS
+        global_scope = self.global_scope
+        symbol_table = self.symbol_table
+        global_locks = self.global_locks
+        functions = self.functions
+        bodies = self.program.bodies
+        state = self.thread_state
+        limit = self.max_call_depth - depth
+        call_stack = []
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        pending = []
+        pc = 0
+
+        while True:
+            try:
+                while True:
+                    op = code[pc]
+                    arg = code[pc + 1]
+                    pc += 2
+
+                    if op == LOAD_LOCAL:
+                        if frame is not None:
+                            value = frame[slots[arg]]
+                            if value is not UNSET:
+                                push(value)
+                                continue
+                        push(global_scope.get(variable_names[arg]))
+                    elif op == LOAD_CONST:
+                        push(constants[arg])
+                    elif op == BINARY_OP:
+                        right = pop()
+                        stack[-1] = operations[arg](stack[-1], right)
+                    elif op == JUMP_IF_FALSE:
+                        if not pop():
+                            pc = arg
+                    elif op == COMPARE:
+                        right = pop()
+                        stack[-1] = comparisons[arg](stack[-1], right)
+                    elif op == STORE_LOCAL:
+                        value = pop()
+                        slot = slots[arg]
+                        if frame is not None and frame[slot] is not UNSET:
+                            frame[slot] = value
+                        else:
+                            name = variable_names[arg]
+                            with global_locks(name):
+                                global_scope[name] = value
+                                symbol_table.update(name, value)
+                    elif op == JUMP:
+                        pc = arg
+                    elif op == LOAD_GLOBAL:
+                        push(global_scope.get(names[arg]))
+                    elif op == SUBSCR:
+                        index = pop()
+                        stack[-1] = stack[-1][int(index)]
+                    elif op == TEST_LIST_OR_NONE:
+                        if not isinstance(stack[-1], ARRAY_TYPES):
+                            stack[-1] = None
+                            pc = arg
+                    elif op == STORE_GLOBAL:
+                        value = pop()
+                        name = names[arg]
+                        with global_locks(name):
+                            global_scope[name] = value
+                            symbol_table.update(name, value)
+                    elif op == POP:
+                        pop()
+                    elif op == CALL_FUNCTION:
+                        name, count = calls[arg]
+                        if count:
+                            arguments = stack[-count:]
+                            del stack[-count:]
+                        else:
+                            arguments = ()
+                        func = functions.get(name)
+                        if func is None:
+                            push(None)
+                        else:
+                            if len(call_stack) >= limit:
+                                raise self.stack_overflow(name)
+                            callee = bodies.get(func) or self._code_for(func)
+                            call_stack.append((prepared, pc, frame, len(stack), len(pending)))
+                            frame = self._frame(callee, arguments)
+                            prepared = self._prepared.get(callee) or self._prepare(callee)
+                            code, constants, names, slots, variable_names, operations, calls, method_calls, method_caches, nodes, blocks = prepared
+                            pc = 0
+                    elif op == RETURN_VALUE or op == END:
+                        value = pop() if op == RETURN_VALUE else None
+                        if not call_stack:
+                            return None if op == END else (value,)
+                        prepared, pc, frame, stack_height, pending_height = call_stack.pop()
+                        code, constants, names, slots, variable_names, operations, calls, method_calls, method_caches, nodes, blocks = prepared
+                        if len(stack) != stack_height:
+                            del stack[stack_height:]
+                        if len(pending) != pending_height:
+                            del pending[pending_height:]
+                        push(value)
+                    elif op == STORE_SUBSCR:
+                        value = pop()
+                        index = pop()
+                        pop()[int(index)] = value
+                    elif op == TEST_LIST:
+                        if not isinstance(stack[-1], ARRAY_TYPES):
+                            pop()
+                            pc = arg
+                    elif op == LOAD_ATTR:
+                        obj = stack[-1]
+                        stack[-1] = obj.get_attribute(names[arg]) if isinstance(obj, ObjectInstance) else None
+                    elif op == PREPARE_METHOD or op == PREPARE_ELEMENT_METHOD:
+                        method_name, count = method_calls[arg]
+                        obj = pop()
+                        if isinstance(obj, ObjectInstance):
+                            cached_class, method = method_caches[arg]
+                            if cached_class is not obj.class_def:
+                                method = obj.methods.get(method_name)
+                                if method is not None:
+                                    method_caches[arg] = (obj.class_def, method)
+                            if method:
+                                # Só os argumentos que têm parâmetro são avaliados
+                                pending.append([_MINIPAR_METHOD, obj, method, min(count, len(method.parameters)), 0])
+                            else:
+                                pending.append([_NO_METHOD, None, None, 0, 0])
+                        elif op == PREPARE_METHOD and obj and hasattr(obj, method_name):
+                            # Objetos Python (ex.: canais)
+                            pending.append([_PYTHON_METHOD, obj, getattr(obj, method_name), count, 0])
+                        else:
+                            pending.append([_NO_METHOD, None, None, 0, 0])
+                    elif op == SKIP_ARG:
+                        call = pending[-1]
+                        if call[4] >= call[3]:
+                            pc = arg
+                        else:
+                            call[4] += 1
+                    elif op == CALL_METHOD:
+                        kind, obj, method, count, _ = pending.pop()
+                        if count:
+                            arguments = stack[-count:]
+                            del stack[-count:]
+                        else:
+                            arguments = ()
+                        if kind == _MINIPAR_METHOD:
+                            if len(call_stack) >= limit:
+                                raise self.stack_overflow(method.name)
+                            callee = bodies.get(method) or self._code_for(method)
+                            call_stack.append((prepared, pc, frame, len(stack), len(pending)))
+                            frame = self._frame(callee, arguments, obj)
+                            prepared = self._prepared.get(callee) or self._prepare(callee)
+                            code, constants, names, slots, variable_names, operations, calls, method_calls, method_caches, nodes, blocks = prepared
+                            pc = 0
+                        elif kind == _PYTHON_METHOD:
+                            push(method(*arguments))
+                        else:
+                            push(None)
+                    elif op == TEST_OBJECT:
+                        if not isinstance(stack[-1], ObjectInstance):
+                            pop()
+                            pc = arg
+                    elif op == STORE_ATTR:
+                        value = pop()
+                        pop().set_attribute(names[arg], value)
+                    elif op == SUBSCR_2D:
+                        index2 = pop()
+                        index1 = pop()
+                        row = stack[-1][int(index1)]
+                        stack[-1] = row[int(index2)] if isinstance(row, ARRAY_TYPES) else None
+                    elif op == STORE_SUBSCR_2D:
+                        value = pop()
+                        index2 = pop()
+                        index1 = pop()
+                        row = pop()[int(index1)]
+                        if isinstance(row, ARRAY_TYPES):
+                            row[int(index2)] = value
+                    elif op == UNARY_NEG:
+                        stack[-1] = -stack[-1]
+                    elif op == PRINT:
+                        value = pop()
+                        if isinstance(value, str):
+                            value = value.replace('\\n', '\n').replace('\\t', '\t')
+                        with self.print_lock:
+                            if self.output_stream:
+                                self.output_stream.write(str(value))
+                                self.output_stream.flush()
+                            else:
+                                print(value, end='')
+                    elif op == BIND_LOCAL:
+                        if frame is not None:
+                            frame[slots[arg]] = pop()
+                        else:
+                            global_scope[variable_names[arg]] = pop()
+                    elif op == BIND_GLOBAL:
+                        global_scope[names[arg]] = pop()
+                    elif op == DECLARE:
+                        node = nodes[arg]
+                        value = pop()
+                        if frame is not None and node.slot is not None:
+                            frame[node.slot] = value
+                            self.variable_types[node.identifier] = node.type_name
+                        else:
+                            self.define_global(node.identifier, node.type_name, value, node.is_array, node.array_size)
+                    elif op == NEW:
+                        class_name = constants[arg]
+                        class_def = self.classes.get(class_name)
+                        push(self.new_instance(class_name, class_def) if class_def is not None else None)
+                    elif op == INSTANTIATE:
+                        node = nodes[arg]
+                        class_def = self.classes.get(node.class_name)
+                        if class_def is not None:
+                            self.bind_variable(node, node.var_name, self.new_instance(node.class_name, class_def), frame)
+                    elif op == EVAL_NODE:
+                        state.frame = frame
+                        state.depth = depth + len(call_stack)
+                        push(Interpreter.evaluate_expression(self, nodes[arg]))
+                    elif op == EXEC_NODE:
+                        state.frame = frame
+                        state.depth = depth + len(call_stack)
+                        Interpreter.execute_statement(self, nodes[arg])
+                    elif op == PAR:
+                        self.run_parallel([functools.partial(self._run_thread, thread_code) for thread_code in blocks[arg]])
+                    else:
+                        raise RuntimeError(f"Opcode desconhecido: {op}")
+            except ReturnException as e:
+                # RETURN levantado dentro de um corpo chamado (como execute_body
+                # fazia): é o valor da chamada
+                if not call_stack:
+                    raise
+                prepared, pc, frame, stack_height, pending_height = call_stack.pop()
+                code, constants, names, slots, variable_names, operations, calls, method_calls, method_caches, nodes, blocks = prepared
+                del stack[stack_height:]
+                del pending[pending_height:]
+                push(e.value)
@@ -0,0 +1,48 @@
+# ============================================================================
+# engines.py - Seleção do Modo de Execução
+# ============================================================================
+# Os modos de execução disponíveis para um programa já analisado:
+# - tree: Interpreter, percorre a AST a cada execução
+# - closure: ClosureInterpreter, compila a AST em closures uma vez e as executa
+# - vm: VirtualMachine, compila para bytecode e o executa em um laço de despacho,
+#   com as chamadas em uma pilha própria (recursão sem o limite do Python)
+# - python: PythonRuntime, traduz para Python e executa o código gerado
+# - async: AsyncRuntime, como python, com os comandos do PAR (e as funções e
+#   métodos) como corrotinas de um event loop, em vez de threads
+#
+# main.py escolhe com --engine <nome>; os servidores, pelo campo "engine" da
+# requisição. Sem escolha explícita vale MINIPAR_ENGINE, ou DEFAULT_ENGINE.
+# ============================================================================
+
+import os
+
+from runtime.Interpreter import Interpreter
+from runtime.ClosureInterpreter import ClosureInterpreter
+from runtime.VirtualMachine import VirtualMachine
+from runtime.PythonRuntime import PythonRuntime
+from runtime.AsyncRuntime import AsyncRuntime
+
+
+ENGINES = {
+    'tree': Interpreter,
+    'closure': ClosureInterpreter,
+    'vm': VirtualMachine,
+    'python': PythonRuntime,
+    'async': AsyncRuntime,
+}
+
+DEFAULT_ENGINE = 'tree'
+
+
+def default_engine():
+    """Modo padrão: variável de ambiente MINIPAR_ENGINE ou DEFAULT_ENGINE."""
+    return os.environ.get('MINIPAR_ENGINE') or DEFAULT_ENGINE
+
+
+def create_interpreter(engine=None, **options):
+    """Cria o interpretador do modo engine com as opções do Interpreter."""
+    name = engine or default_engine()
+    interpreter_class = ENGINES.get(name)
+    if interpreter_class is None:
+        raise ValueError(f"Modo de execução desconhecido: '{name}' (disponíveis: {', '.join(ENGINES)})")
+    return interpreter_class(**options)
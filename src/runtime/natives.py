@@ -0,0 +1,70 @@
+# ============================================================================
+# natives.py - Funções Nativas de String
+# ============================================================================
+# strlen, substr, charat, indexof e parseint recebem os argumentos já
+# avaliados. NATIVE_FUNCTIONS guarda, para cada nome (minúsculo), a função e
+# quantos argumentos ela usa: com menos que o mínimo a chamada vale None e
+# nenhum argumento é avaliado; além do máximo, os argumentos são ignorados.
+# As funções vetoriais sobre arrays (vsum, vdot...) ficam em vector.py e
+# entram na mesma tabela.
+# ============================================================================
+
+from runtime.vector import VECTOR_FUNCTIONS
+
+
+def strlen(string_arg):
+    return len(str(string_arg))
+
+
+def substr(string_arg, start, length):
+    start = int(start)
+    length = int(length)
+    return str(string_arg)[start:start + length]
+
+
+def charat(string_arg, index):
+    index = int(index)
+    string_str = str(string_arg)
+    if 0 <= index < len(string_str):
+        return string_str[index]
+    return ""
+
+
+def indexof(string_arg, char_to_find, start_pos=0):
+    char_to_find = str(char_to_find)
+    start_pos = int(start_pos)
+    string_str = str(string_arg)
+    try:
+        return string_str.index(char_to_find, start_pos)
+    except ValueError:
+        return -1
+
+
+def parseint(string_arg):
+    string_str = str(string_arg).strip()
+    try:
+        return int(string_str)
+    except ValueError:
+        # Tentar extrair apenas os dígitos e sinal
+        clean_str = ""
+        for i, char in enumerate(string_str):
+            if char == '-' and i == 0:
+                clean_str += char
+            elif char.isdigit():
+                clean_str += char
+            elif char == ' ':
+                break
+        if clean_str and clean_str != '-':
+            return int(clean_str)
+        return 0
+
+
+# nome -> (função, mínimo de argumentos, máximo de argumentos)
+NATIVE_FUNCTIONS = {
+    'strlen': (strlen, 1, 1),
+    'substr': (substr, 3, 3),
+    'charat': (charat, 2, 2),
+    'indexof': (indexof, 2, 3),
+    'parseint': (parseint, 1, 1),
+}
+NATIVE_FUNCTIONS.update(VECTOR_FUNCTIONS)
@@ -0,0 +1,176 @@
+# ============================================================================
+# typed_ops.py - Operações Especializadas pelo Tipo Estático
+# ============================================================================
+# O SemanticAnalyzer anota cada expressão com o tipo inferido (static_type).
+# Com os tipos dos operandos, cada BinaryOpNode recebe uma vez a função que
+# executa seu operador: soma de inteiros, concatenação de strings, divisão
+# real etc., sem a cadeia de comparações de operador e de isinstance de
+# apply_binary_op a cada avaliação.
+#
+# O tipo estático é uma previsão (variáveis sem tipo, input(), retornos de
+# funções, análise interrompida por erro), então cada versão especializada
+# confere o tipo real dos operandos com um teste barato e, se a previsão
+# falhar, cai em apply_binary_op: o resultado é sempre o da versão genérica.
+# ============================================================================
+
+import operator as _operator
+
+
+_NUMBERS = (int, float)
+
+
+def apply_binary_op(left, operator, right):
+    """Versão genérica: decide pelo operador e pelos tipos em tempo de execução."""
+    if operator == '+':
+        if isinstance(left, str) or isinstance(right, str):
+            return str(left) + str(right)
+        return left + right
+    elif operator == '-':
+        return left - right
+    elif operator == '*':
+        return left * right
+    elif operator == '/':
+        if right == 0:
+            raise ZeroDivisionError("Division by zero")
+        if isinstance(left, int) and isinstance(right, int):
+            return left // right
+        return left / right
+    elif operator == '%':
+        if right == 0:
+            raise ZeroDivisionError("Modulo by zero")
+        if isinstance(left, float) or isinstance(right, float):
+            return float(left) % float(right)
+        return left % right
+    elif operator == '&&':
+        return bool(left) and bool(right)
+    elif operator == '||':
+        return bool(left) or bool(right)
+    return None
+
+
+# ------------------- Versões especializadas -------------------
+
+def _add_numbers(left, right):
+    if left.__class__ in _NUMBERS and right.__class__ in _NUMBERS:
+        return left + right
+    return apply_binary_op(left, '+', right)
+
+
+def _concat_left_string(left, right):
+    if left.__class__ is str:
+        return left + str(right)
+    return apply_binary_op(left, '+', right)
+
+
+def _concat_right_string(left, right):
+    if right.__class__ is str:
+        return str(left) + right
+    return apply_binary_op(left, '+', right)
+
+
+def _div_ints(left, right):
+    if left.__class__ is int and right.__class__ is int and right:
+        return left // right
+    return apply_binary_op(left, '/', right)
+
+
+def _div_floats(left, right):
+    if (left.__class__ is float or right.__class__ is float) and right != 0:
+        return left / right
+    return apply_binary_op(left, '/', right)
+
+
+def _mod_ints(left, right):
+    if left.__class__ is int and right.__class__ is int and right:
+        return left % right
+    return apply_binary_op(left, '%', right)
+
+
+def _mod_floats(left, right):
+    if (left.__class__ is float or right.__class__ is float) and right != 0:
+        return float(left) % float(right)
+    return apply_binary_op(left, '%', right)
+
+
+def _and(left, right):
+    return bool(left) and bool(right)
+
+
+def _or(left, right):
+    return bool(left) or bool(right)
+
+
+# Operadores cujo resultado não depende dos tipos: '-' e '*' são sempre a
+# operação do Python; '&&' e '||' recebem os dois lados já avaliados
+_UNTYPED_OPS = {
+    '-': _operator.sub,
+    '*': _operator.mul,
+    '&&': _and,
+    '||': _or,
+}
+
+# (operador, tipo esquerdo, tipo direito) -> versão especializada
+_TYPED_OPS = {
+    ('+', 'int', 'int'): _add_numbers,
+    ('+', 'int', 'float'): _add_numbers,
+    ('+', 'float', 'int'): _add_numbers,
+    ('+', 'float', 'float'): _add_numbers,
+    ('/', 'int', 'int'): _div_ints,
+    ('/', 'int', 'float'): _div_floats,
+    ('/', 'float', 'int'): _div_floats,
+    ('/', 'float', 'float'): _div_floats,
+    ('%', 'int', 'int'): _mod_ints,
+    ('%', 'int', 'float'): _mod_floats,
+    ('%', 'float', 'int'): _mod_floats,
+    ('%', 'float', 'float'): _mod_floats,
+}
+
+# Operadores relacionais (ConditionNode)
+COMPARISONS = {
+    '==': _operator.eq,
+    '!=': _operator.ne,
+    '>': _operator.gt,
+    '<': _operator.lt,
+    '>=': _operator.ge,
+    '<=': _operator.le,
+}
+
+
+def _generic(operator):
+    def operation(left, right):
+        return apply_binary_op(left, operator, right)
+    return operation
+
+
+def select_binary_op(node):
+    """Função (left, right) -> resultado para o BinaryOpNode, pelos tipos anotados."""
+    left_type = node.left.static_type if node.left is not None else None
+    right_type = node.right.static_type if node.right is not None else None
+    return select_operation(node.operator, left_type, right_type)
+
+
+def select_operation(op, left_type, right_type):
+    """Função (left, right) -> resultado para o operador e os tipos estáticos dos operandos."""
+    operation = _UNTYPED_OPS.get(op)
+    if operation is not None:
+        return operation
+    operation = _TYPED_OPS.get((op, left_type, right_type))
+    if operation is not None:
+        return operation
+    if op == '+':
+        if left_type == 'string':
+            return _concat_left_string
+        if right_type == 'string':
+            return _concat_right_string
+    return _generic(op)
+
+
+def literal_value(node):
+    """Valor de um NumberNode (int, ou float se o literal tem ponto)."""
+    value = node.value
+    if value.__class__ in _NUMBERS:
+        # Já decodificado pelo ASTOptimizer
+        return value
+    if '.' in str(value):
+        return float(value)
+    return int(value)
@@ -0,0 +1,337 @@
+# ============================================================================
+# vector.py - Funções Nativas Vetoriais sobre Arrays
+# ============================================================================
+# Operações sobre arrays inteiros em uma chamada, em vez de um laço MiniPar
+# com uma leitura de elemento por iteração:
+#
+#   vsum(a)          soma dos elementos (a pode ser uma matriz)
+#   vdot(a, b)       produto escalar
+#   vscale(a, k)     novo array com a[i] * k
+#   vadd(a, b)       novo array com a[i] + b[i]
+#   vmul(a, b)       novo array com a[i] * b[i]
+#   vmatmul(a, b)    produto de matrizes (nova matriz)
+#   vfill(a, x)      a[i] = x para todo i (no lugar; a pode ser uma matriz)
+#   vcopy(a)         cópia do array (ou da matriz)
+#   vmin(a), vmax(a) menor e maior elemento
+#   vargmax(a)       índice do (primeiro) maior elemento
+#
+# Os nomes começam com v porque as nativas são procuradas antes das funções
+# do programa: sum, dot, min ou max escondiam funções que programas já
+# declaram com esses nomes.
+#
+# Com o NumPy instalado, arrays INT e FLOAT em buffer (TypedArray e linhas de
+# matriz) são lidos sem cópia pelo NumPy e a operação é vetorizada; sem ele,
+# ou com arrays que viraram listas, o cálculo é em Python puro. O resultado é
+# o mesmo nos dois casos (int continua int, float continua float): operações
+# com INT que poderiam estourar 64 bits no NumPy são feitas em Python, que
+# não tem limite. A exceção é a soma de FLOAT em vsum, vdot e vmatmul: o
+# NumPy soma em outra ordem, e o resultado pode diferir nos últimos bits.
+# ============================================================================
+
+import operator
+from array import array
+
+from runtime.TypedArray import ARRAY_TYPES, TypedArray, TypedRow, array_of, rows_of
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# Arrays menores que isso ficam em Python puro: converter para o NumPy custa
+# mais do que a operação
+NUMPY_MIN_SIZE = 32
+
+_INT64_LIMIT = 2 ** 63
+
+# dtype do NumPy -> (typecode, classe dos elementos) do TypedArray
+_RESULT_TYPES = {'int64': ('q', int), 'float64': ('d', float)}
+
+
+# ============================================================================
+# Conversões
+# ============================================================================
+
+def _array(value, name):
+    if not isinstance(value, ARRAY_TYPES):
+        raise ValueError(f"{name}: esperado um array, encontrado {value!r}")
+    return value
+
+
+def _values(values):
+    """Elementos do array como lista."""
+    if values.__class__ is list:
+        return values
+    return values.tolist()
+
+
+def _rows(matrix, name):
+    """Linhas da matriz e o número de colunas (todas as linhas do mesmo tamanho)."""
+    _array(matrix, name)
+    columns = None
+    for row in matrix:
+        if not isinstance(row, ARRAY_TYPES):
+            raise ValueError(f"{name}: esperada uma matriz, encontrado {matrix!r}")
+        if columns is None:
+            columns = len(row)
+        elif len(row) != columns:
+            raise ValueError(f"{name}: linhas da matriz com tamanhos diferentes")
+    return list(matrix), columns or 0
+
+
+def _same_length(a, b, name):
+    if len(a) != len(b):
+        raise ValueError(f"{name}: arrays de tamanhos diferentes ({len(a)} e {len(b)})")
+
+
+def _numeric(values):
+    """ndarray sobre o buffer (sem cópia) de um array INT/FLOAT, ou None."""
+    if numpy is None or len(values) < NUMPY_MIN_SIZE:
+        return None
+    if values.__class__ is TypedArray:
+        element = values.element
+    elif values.__class__ is TypedRow:
+        element = values.matrix.element
+    else:
+        return None
+    if element is not int and element is not float:
+        return None
+    view = values.view()
+    if view is None:
+        return None
+    return numpy.asarray(view)
+
+
+def _numeric_matrix(rows, columns):
+    """ndarray 2D sobre o buffer de uma matriz criada inteira (linhas na ordem), ou None."""
+    if numpy is None or not rows or len(rows) * columns < NUMPY_MIN_SIZE:
+        return None
+    first = rows[0]
+    if first.__class__ is not TypedRow:
+        return None
+    matrix = first.matrix
+    for index, row in enumerate(rows):
+        if row.__class__ is not TypedRow or row.matrix is not matrix or row.start != index * columns:
+            return None
+    if len(matrix) != len(rows) * columns:
+        return None
+    values = _numeric(matrix)
+    if values is None:
+        return None
+    return values.reshape(len(rows), columns)
+
+
+def _bound(values):
+    """Maior valor absoluto de um ndarray (como int do Python)."""
+    if values.size == 0:
+        return 0
+    return max(-int(values.min()), int(values.max()))
+
+
+def _fits(*arrays, factor=1):
+    """Se produtos/somas dos elementos (vezes factor) cabem em 64 bits, ou se algum é FLOAT."""
+    if any(values.dtype.kind == 'f' for values in arrays):
+        return True
+    bound = factor
+    for values in arrays:
+        bound *= max(_bound(values), 1)
+    return bound < _INT64_LIMIT
+
+
+def _typed(result):
+    """TypedArray com os elementos de um ndarray 1D do NumPy."""
+    if result.size == 0:
+        return []
+    typecode, element = _RESULT_TYPES[result.dtype.name]
+    return TypedArray(array(typecode, result.tobytes()), element)
+
+
+def _typed_rows(result):
+    """Matriz (linhas TypedRow) com os elementos de um ndarray 2D do NumPy."""
+    rows, columns = result.shape
+    matrix = _typed(numpy.ascontiguousarray(result).reshape(-1))
+    return [TypedRow(matrix, row * columns, columns) for row in range(rows)]
+
+
+def _scalar(result):
+    return result.item()
+
+
+# ============================================================================
+# Reduções
+# ============================================================================
+
+def vsum(values):
+    _array(values, 'vsum')
+    if values and isinstance(values[0], ARRAY_TYPES):
+        return sum(vsum(row) for row in values)
+    numeric = _numeric(values)
+    if numeric is not None and _fits(numeric, factor=numeric.size):
+        return _scalar(numeric.sum())
+    return sum(_values(values))
+
+
+def vdot(a, b):
+    _array(a, 'vdot')
+    _array(b, 'vdot')
+    _same_length(a, b, 'vdot')
+    left = _numeric(a)
+    right = _numeric(b)
+    if left is not None and right is not None and _fits(left, right, factor=left.size):
+        return _scalar(numpy.dot(left, right))
+    return sum(map(operator.mul, _values(a), _values(b)))
+
+
+def _extreme(values, name, python_function, numpy_name):
+    _array(values, name)
+    if not len(values):
+        raise ValueError(f"{name}: array vazio")
+    numeric = _numeric(values)
+    # Com NaN no array o NumPy e o Python escolhem elementos diferentes
+    if numeric is not None and not (numeric.dtype.kind == 'f' and numpy.isnan(numeric).any()):
+        return _scalar(getattr(numpy, numpy_name)(numeric))
+    return python_function(_values(values))
+
+
+def _argmax(values):
+    best = 0
+    for index in range(1, len(values)):
+        if values[index] > values[best]:
+            best = index
+    return best
+
+
+def vmin(values):
+    return _extreme(values, 'vmin', min, 'min')
+
+
+def vmax(values):
+    return _extreme(values, 'vmax', max, 'max')
+
+
+def vargmax(values):
+    return _extreme(values, 'vargmax', _argmax, 'argmax')
+
+
+# ============================================================================
+# Operações elemento a elemento
+# ============================================================================
+
+def vscale(values, factor):
+    _array(values, 'vscale')
+    numeric = _numeric(values)
+    if numeric is not None and (factor.__class__ is float or
+                                (factor.__class__ is int and _fits(numeric, factor=max(abs(factor), 1)))):
+        return _typed(numeric * factor)
+    return array_of([value * factor for value in _values(values)])
+
+
+def vadd(a, b):
+    _array(a, 'vadd')
+    _array(b, 'vadd')
+    _same_length(a, b, 'vadd')
+    left = _numeric(a)
+    right = _numeric(b)
+    if left is not None and right is not None and _fits(left, factor=2) and _fits(right, factor=2):
+        return _typed(left + right)
+    return array_of(list(map(operator.add, _values(a), _values(b))))
+
+
+def vmul(a, b):
+    _array(a, 'vmul')
+    _array(b, 'vmul')
+    _same_length(a, b, 'vmul')
+    left = _numeric(a)
+    right = _numeric(b)
+    if left is not None and right is not None and _fits(left, right):
+        return _typed(left * right)
+    return array_of(list(map(operator.mul, _values(a), _values(b))))
+
+
+def vmatmul(a, b):
+    a_rows, inner = _rows(a, 'vmatmul')
+    b_rows, columns = _rows(b, 'vmatmul')
+    if inner != len(b_rows):
+        raise ValueError(f"vmatmul: matriz {len(a_rows)}x{inner} não pode ser multiplicada por {len(b_rows)}x{columns}")
+    if not a_rows:
+        return []
+    left = _numeric_matrix(a_rows, inner)
+    right = _numeric_matrix(b_rows, columns)
+    if left is not None and right is not None and _fits(left, right, factor=inner):
+        return _typed_rows(left @ right)
+    b_columns = list(zip(*[_values(row) for row in b_rows]))
+    values = []
+    for row in a_rows:
+        row = _values(row)
+        values.extend(sum(map(operator.mul, row, column)) for column in b_columns)
+    return rows_of(values, len(a_rows), columns)
+
+
+# ============================================================================
+# Preenchimento e cópia
+# ============================================================================
+
+def _fill_buffer(values, value):
+    """Preenche o buffer de uma vez; False se o valor não cabe nele (o chamador usa a[i] = x)."""
+    if values.__class__ is TypedArray:
+        target, start, stop = values, 0, len(values)
+    elif values.__class__ is TypedRow:
+        target, start, stop = values.matrix, values.start, values.start + values.length
+    else:
+        return False
+    data = target.data
+    if value.__class__ is not target.element or data.__class__ is not array:
+        return False
+    try:
+        data[start:stop] = array(data.typecode, [value]) * (stop - start)
+    except OverflowError:
+        return False
+    # Outra thread pode ter trocado o buffer por uma lista enquanto isso
+    return target.data is data
+
+
+def vfill(values, value):
+    _array(values, 'vfill')
+    if values and isinstance(values[0], ARRAY_TYPES):
+        for row in values:
+            vfill(row, value)
+        return None
+    if not _fill_buffer(values, value):
+        for index in range(len(values)):
+            values[index] = value
+    return None
+
+
+def vcopy(values):
+    _array(values, 'vcopy')
+    if values and isinstance(values[0], ARRAY_TYPES):
+        if len({len(row) for row in values}) != 1:
+            return [vcopy(row) for row in values]
+        flat = []
+        for row in values:
+            flat.extend(_values(_array(row, 'vcopy')))
+        return rows_of(flat, len(values), len(values[0]))
+    if values.__class__ is TypedArray:
+        # element antes de data: se data ainda é o buffer, element é o dele
+        element = values.element
+        data = values.data
+        if element is not None and data.__class__ is array:
+            return TypedArray(data[:], element)
+    return array_of(list(_values(values)))
+
+
+# nome -> (função, mínimo de argumentos, máximo de argumentos), como em NATIVE_FUNCTIONS
+VECTOR_FUNCTIONS = {
+    'vsum': (vsum, 1, 1),
+    'vdot': (vdot, 2, 2),
+    'vscale': (vscale, 2, 2),
+    'vadd': (vadd, 2, 2),
+    'vmul': (vmul, 2, 2),
+    'vmatmul': (vmatmul, 2, 2),
+    'vfill': (vfill, 2, 2),
+    'vcopy': (vcopy, 1, 1),
+    'vmin': (vmin, 1, 1),
+    'vmax': (vmax, 1, 1),
+    'vargmax': (vargmax, 1, 1),
+}
@@ -15,9 +15,55 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from parser.AST import *
+from parser.Traversal import NodeVisitor
 from symbol_table.SymbolTable import SymbolTable
 
-class SemanticAnalyzer:
+
+# Nós de expressão que recebem o tipo inferido em static_type
+_EXPRESSION_NODES = frozenset([
+    NumberNode, StringNode, IdentifierNode, BinaryOpNode, UnaryOpNode,
+    ConditionNode, FunctionCallNode, MethodCallNode, NewExpressionNode,
+    AttributeAccessNode, ArrayAccessNode, ArrayInitNode, BraceInitNode,
+    ArrayElementMethodCallNode, ArrayElementAttributeAccessNode,
+    ArrayAccessWithObjectNode,
+])
+
+# Funções vetoriais (runtime/vector.py): nome -> (resultado, parâmetros). Os
+# parâmetros aceitam arrays de qualquer tipo; o resultado depende dos tipos
+# dos argumentos: 'element' é o tipo dos elementos (float se algum argumento
+# é FLOAT), 'array' um array desse tipo
+_VECTOR_FUNCTIONS = {
+    'vsum': ('element', ['values']),
+    'vdot': ('element', ['a', 'b']),
+    'vscale': ('array', ['values', 'factor']),
+    'vadd': ('array', ['a', 'b']),
+    'vmul': ('array', ['a', 'b']),
+    'vmatmul': ('array', ['a', 'b']),
+    'vfill': ('void', ['values', 'value']),
+    'vcopy': ('array', ['values']),
+    'vmin': ('element', ['values']),
+    'vmax': ('element', ['values']),
+    'vargmax': ('int', ['values']),
+}
+
+_BASIC_STATIC_TYPES = {'int': 'int', 'float': 'float', 'bool': 'bool', 'string': 'string', 'char': 'string'}
+
+
+def _static_type(type_name):
+    """Tipo inferido pelo analisador -> categoria usada no runtime (ou None)."""
+    if not type_name:
+        return None
+    normalized = type_name.lower()
+    if normalized.endswith('[]') or normalized == 'array':
+        return 'array'
+    if normalized in _BASIC_STATIC_TYPES:
+        return _BASIC_STATIC_TYPES[normalized]
+    if normalized in ('object', 'void', 'type', 'c_channel'):
+        return None
+    return type_name  # Nome de classe
+
+
+class SemanticAnalyzer(NodeVisitor):
     """Analisador semântico para validação de código MiniPar."""
     
     def __init__(self):
@@ -89,6 +135,10 @@ class SemanticAnalyzer:
         for name, return_type, params in builtin_functions:
             self.symbol_table.define_function(name, return_type, params)
 
+        for name, (result, params) in _VECTOR_FUNCTIONS.items():
+            return_type = result if result in ('int', 'void') else 'object'
+            self.symbol_table.define_function(name, return_type, [(None, param) for param in params], builtin=True)
+
     def _check_undeclared_variables(self):
         """Verifica variáveis usadas mas não declaradas e variáveis não utilizadas."""
         # Verificar variáveis usadas sem declaração
@@ -103,32 +153,17 @@ class SemanticAnalyzer:
             if var_name not in self.used_variables and var_name != 'this':
                 self.warning(f"Variável '{var_name}' declarada mas nunca utilizada")
 
+    def visit(self, node):
+        """Visita o nó e, se for uma expressão, anota nele o tipo inferido."""
+        result = NodeVisitor.visit(self, node)
+        if node.__class__ in _EXPRESSION_NODES:
+            node.static_type = _static_type(result)
+        return result
+
     def _is_builtin_function(self, name):
         """Verifica se é uma função built-in."""
         builtins = ['strlen', 'substr', 'charat', 'indexof', 'parseint', 'print', 'input']
-        return name in builtins
-
-    def visit(self, node):
-        """Método principal de visitação dos nós da AST."""
-        if node is None:
-            return None
-
-        method_name = f'visit_{type(node).__name__}'
-        visitor = getattr(self, method_name, self.generic_visit)
-        return visitor(node)
-
-    def generic_visit(self, node):
-        """Visita genérica para nós sem método específico."""
-        for attr_name in dir(node):
-            if not attr_name.startswith('_'):
-                attr_value = getattr(node, attr_name)
-                if isinstance(attr_value, list):
-                    for item in attr_value:
-                        if isinstance(item, ASTNode):
-                            self.visit(item)
-                elif isinstance(attr_value, ASTNode):
-                    self.visit(attr_value)
-        return None
+        return name in builtins or name in _VECTOR_FUNCTIONS
 
     def error(self, message, node=None):
         """Registra um erro semântico."""
@@ -403,6 +438,9 @@ class SemanticAnalyzer:
             self.error(f"Tipo '{node.type_name}' não é válido", node)
             return
 
+        if node.channel_capacity is not None and node.channel_capacity < 1:
+            self.error(f"Capacidade do canal '{node.identifier}' deve ser maior que zero", node)
+
         # Definir variável (simples ou array)
         is_array = node.is_array or node.is_2d_array
         array_size = node.array_size
@@ -646,16 +684,44 @@ class SemanticAnalyzer:
 
         # Verificar argumentos
         expected_params = func_symbol.parameters
+        arg_types = []
         if len(node.arguments) != len(expected_params):
             self.error(f"Número incorreto de argumentos para '{node.name}'. Esperado: {len(expected_params)}, Encontrado: {len(node.arguments)}", node)
         else:
             for i, (arg, (expected_type, param_name)) in enumerate(zip(node.arguments, expected_params)):
                 arg_type = self.visit(arg)
+                arg_types.append(arg_type)
                 if arg_type and not self._is_assignable(expected_type, arg_type):
                     self.error(f"Tipo incompatível no argumento {i+1} de '{node.name}'. Esperado: {expected_type}, Encontrado: {arg_type}", node)
 
+        if node.name in _VECTOR_FUNCTIONS and arg_types:
+            return self._vector_result_type(node.name, arg_types)
         return func_symbol.return_type
 
+    def _vector_result_type(self, name, arg_types):
+        """Tipo do resultado de uma função vetorial, pelos tipos dos argumentos."""
+        result = _VECTOR_FUNCTIONS[name][0]
+        if result not in ('element', 'array'):
+            return result
+        element_types = set()
+        for arg_type in arg_types:
+            normalized = self._normalize_type(arg_type)
+            if normalized is None or normalized == 'object':
+                return 'object'
+            element_types.add(normalized.replace('[]', '').strip())
+        if 'float' in element_types and element_types <= {'int', 'float'}:
+            element_type = 'float'
+        elif len(element_types) == 1:
+            element_type = element_types.pop()
+        else:
+            return 'object'
+        if result == 'array':
+            return f"{element_type}[]"
+        if element_type == 'bool':
+            # Soma de BOOL conta os verdadeiros
+            return 'int' if name in ('vsum', 'vdot') else 'bool'
+        return element_type
+
     def visit_PrintNode(self, node):
         """Analisa comando PRINT para saída de dados."""
         self.symbol_table.add_statement('PRINT', line=getattr(node, 'line', None))
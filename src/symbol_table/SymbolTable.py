@@ -213,7 +213,7 @@ class SymbolTable:
                 self.all_symbols.append(symbol)
             return symbol
     
-    def define_function(self, name, return_type, parameters):
+    def define_function(self, name, return_type, parameters, builtin=False):
         with self.lock:
             if self.current_scope.exists(name):
                 return self.current_scope.lookup(name)
@@ -223,7 +223,7 @@ class SymbolTable:
             symbol.parameters = parameters
             self.current_scope.define(name, symbol)
             # Rastrear função se não for built-in
-            if name not in ['strlen', 'substr', 'charat', 'indexof', 'parseint', 'print', 'input']:
+            if not builtin and name not in ['strlen', 'substr', 'charat', 'indexof', 'parseint', 'print', 'input']:
                 self.all_symbols.append(symbol)
             return symbol
     
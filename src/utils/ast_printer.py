@@ -3,220 +3,248 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from parser.AST import *
+from parser.Traversal import NodeVisitor
 
 
-class ASTPrinter:
-    def __init__(self):
+class ExpressionPrinter(NodeVisitor):
+    """Imprime uma expressão em uma linha (sem quebra no final)."""
+
+    def print_expression(self, node):
+        if node is None:
+            print("<expr>", end="")
+        else:
+            self.visit(node)
+
+    def generic_visit(self, node):
+        print("<expr>", end="")
+
+    def visit_NumberNode(self, node):
+        print(node.value, end="")
+
+    def visit_StringNode(self, node):
+        print(f'"{node.value}"', end="")
+
+    def visit_IdentifierNode(self, node):
+        print(node.name, end="")
+
+    def visit_BinaryOpNode(self, node):
+        print("(", end="")
+        self.print_expression(node.left)
+        print(f" {node.operator} ", end="")
+        self.print_expression(node.right)
+        print(")", end="")
+
+    def visit_UnaryOpNode(self, node):
+        print(f"{node.operator}", end="")
+        self.print_expression(node.operand)
+
+    def visit_FunctionCallNode(self, node):
+        print(f"{node.name}(...)", end="")
+
+    def visit_MethodCallNode(self, node):
+        print(f"{node.object_name}.{node.method_name}(...)", end="")
+
+    def visit_ArrayAccessNode(self, node):
+        print(f"{node.array_name}[", end="")
+        self.print_expression(node.index)
+        print("]", end="")
+
+    def visit_AttributeAccessNode(self, node):
+        print(f"{node.object_name}.{node.attribute_name}", end="")
+
+    def visit_ConditionNode(self, node):
+        self.print_expression(node.left)
+        print(f" {node.operator} ", end="")
+        self.print_expression(node.right)
+
+    def visit_AssignmentNode(self, node):
+        print(f"{node.identifier} = ", end="")
+        self.print_expression(node.expression)
+
+
+class ASTPrinter(NodeVisitor):
+    def __init__(self, show_positions=False):
         self.indent_level = 0
         self.indent_char = "  "
-    
+        self.show_positions = show_positions  # Prefixa cada nó com [linha:coluna]
+        self.expressions = ExpressionPrinter()
+
     def print_ast(self, node, label=""):
         if label:
             print(f"\n{label}")
             print("-" * 40)
-        self._print_node(node)
-    
-    def _print_node(self, node, prefix=""):
-        if node is None:
-            return
-        
+        self.visit(node)
+
+    def _head(self, node):
+        """Indentação do nó e sua primeira linha (com a posição no fonte, se pedida)."""
         indent = self.indent_char * self.indent_level
-        
-        if isinstance(node, ProgramNode):
-            print(f"{indent}Program:")
-            self.indent_level += 1
-            for child in node.children:
-                self._print_node(child)
-            self.indent_level -= 1
-        
-        elif isinstance(node, ClassNode):
-            parent_info = f" extends {node.parent}" if node.parent else ""
-            print(f"{indent}class {node.name}{parent_info} {{")
-            self.indent_level += 1
-            
-            if node.attributes:
-                print(f"{self.indent_char * self.indent_level}Attributes:")
-                self.indent_level += 1
-                for attr in node.attributes:
-                    self._print_node(attr)
-                self.indent_level -= 1
-            
-            if node.methods:
-                print(f"{self.indent_char * self.indent_level}Methods:")
-                self.indent_level += 1
-                for method in node.methods:
-                    self._print_node(method)
-                self.indent_level -= 1
-            
-            self.indent_level -= 1
-            print(f"{indent}}}")
-        
-        elif isinstance(node, AttributeNode):
-            print(f"{indent}{node.type_name} {node.name}")
-        
-        elif isinstance(node, MethodNode):
-            params = ", ".join([f"{t} {n}" for t, n in node.parameters])
-            print(f"{indent}{node.return_type} {node.name}({params}) {{")
-            self.indent_level += 1
-            for stmt in node.body:
-                self._print_node(stmt)
-            self.indent_level -= 1
-            print(f"{indent}}}")
-        
-        elif isinstance(node, FunctionNode):
-            params = ", ".join([f"{t} {n}" for t, n in node.parameters])
-            print(f"{indent}func {node.name}({params}) -> {node.return_type} {{")
-            self.indent_level += 1
-            for stmt in node.body:
-                self._print_node(stmt)
-            self.indent_level -= 1
-            print(f"{indent}}}")
-        
-        elif isinstance(node, BlockNode):
-            print(f"{indent}{node.block_type.upper()} {{")
-            self.indent_level += 1
-            for stmt in node.statements:
-                self._print_node(stmt)
-            self.indent_level -= 1
-            print(f"{indent}}}")
-        
-        elif isinstance(node, DeclarationNode):
-            array_info = f"[{node.array_size if node.array_size else ''}]" if node.is_array else ""
-            init_info = ""
-            if node.initial_value:
-                if isinstance(node.initial_value, ArrayInitNode):
-                    init_info = " = [...]"
-                else:
-                    init_info = f" = <expr>"
-            print(f"{indent}var {node.type_name} {node.identifier}{array_info}{init_info}")
-        
-        elif isinstance(node, AssignmentNode):
-            print(f"{indent}{node.identifier} = ", end="")
-            self._print_expression(node.expression)
-            print()
-        
-        elif isinstance(node, ArrayAssignmentNode):
-            print(f"{indent}{node.array_name}[", end="")
-            self._print_expression(node.index)
-            print("] = ", end="")
-            self._print_expression(node.expression)
-            print()
-        
-        elif isinstance(node, AttributeAssignmentNode):
-            print(f"{indent}{node.object_name}.{node.attribute_name} = ", end="")
-            self._print_expression(node.expression)
-            print()
-        
-        elif isinstance(node, IfNode):
-            print(f"{indent}if (", end="")
-            self._print_expression(node.condition)
-            print(") {")
-            self.indent_level += 1
-            for stmt in node.then_body:
-                self._print_node(stmt)
-            self.indent_level -= 1
-            if node.else_body:
-                print(f"{indent}}} else {{")
-                self.indent_level += 1
-                for stmt in node.else_body:
-                    self._print_node(stmt)
-                self.indent_level -= 1
-            print(f"{indent}}}")
-        
-        elif isinstance(node, WhileNode):
-            print(f"{indent}while (", end="")
-            self._print_expression(node.condition)
-            print(") {")
-            self.indent_level += 1
-            for stmt in node.body:
-                self._print_node(stmt)
-            self.indent_level -= 1
-            print(f"{indent}}}")
-        
-        elif isinstance(node, ForNode):
-            print(f"{indent}for {node.var} = ", end="")
-            self._print_expression(node.init_expr)
-            print("; ", end="")
-            self._print_expression(node.condition)
-            print("; ", end="")
-            self._print_expression(node.increment)
-            print(" {")
-            self.indent_level += 1
-            for stmt in node.body:
-                self._print_node(stmt)
-            self.indent_level -= 1
-            print(f"{indent}}}")
-        
-        elif isinstance(node, PrintNode):
-            print(f"{indent}print(", end="")
-            self._print_expression(node.expression)
-            print(")")
-        
-        elif isinstance(node, InputNode):
-            prompt = f'"{node.prompt}"' if node.prompt else ''
-            print(f"{indent}{node.identifier} = input({prompt})")
-        
-        elif isinstance(node, ReturnNode):
-            print(f"{indent}return ", end="")
-            self._print_expression(node.expression)
-            print()
-        
-        elif isinstance(node, FunctionCallNode):
-            args_str = ", ".join(["..." for _ in node.arguments]) if node.arguments else ""
-            print(f"{indent}{node.name}({args_str})")
-        
-        elif isinstance(node, MethodCallNode):
-            args_str = ", ".join(["..." for _ in node.arguments]) if node.arguments else ""
-            print(f"{indent}{node.object_name}.{node.method_name}({args_str})")
-        
-        elif isinstance(node, InstantiationNode):
-            print(f"{indent}{node.var_name} = new {node.class_name}()")
-        
-        elif isinstance(node, SendNode):
-            values_str = ", ".join(["..." for _ in node.values]) if node.values else ""
-            print(f"{indent}{node.channel}.send({values_str})")
-        
-        elif isinstance(node, ReceiveNode):
-            vars_str = ", ".join(["..." for _ in node.variables]) if node.variables else ""
-            print(f"{indent}{node.channel}.receive({vars_str})")
-    
+        if self.show_positions and node.line is not None:
+            return indent, f"{indent}[{node.line}:{node.col}] "
+        return indent, indent
+
+    def _print_body(self, statements):
+        self.indent_level += 1
+        for stmt in statements:
+            self.visit(stmt)
+        self.indent_level -= 1
+
     def _print_expression(self, node):
-        if isinstance(node, NumberNode):
-            print(node.value, end="")
-        elif isinstance(node, StringNode):
-            print(f'"{node.value}"', end="")
-        elif isinstance(node, IdentifierNode):
-            print(node.name, end="")
-        elif isinstance(node, BinaryOpNode):
-            print("(", end="")
-            self._print_expression(node.left)
-            print(f" {node.operator} ", end="")
-            self._print_expression(node.right)
-            print(")", end="")
-        elif isinstance(node, UnaryOpNode):
-            print(f"{node.operator}", end="")
-            self._print_expression(node.operand)
-        elif isinstance(node, FunctionCallNode):
-            print(f"{node.name}(...)", end="")
-        elif isinstance(node, MethodCallNode):
-            print(f"{node.object_name}.{node.method_name}(...)", end="")
-        elif isinstance(node, ArrayAccessNode):
-            print(f"{node.array_name}[", end="")
-            self._print_expression(node.index)
-            print("]", end="")
-        elif isinstance(node, AttributeAccessNode):
-            print(f"{node.object_name}.{node.attribute_name}", end="")
-        elif isinstance(node, ConditionNode):
-            self._print_expression(node.left)
-            print(f" {node.operator} ", end="")
-            self._print_expression(node.right)
-        elif isinstance(node, AssignmentNode):
-            print(f"{node.identifier} = ", end="")
-            self._print_expression(node.expression)
-        else:
-            print("<expr>", end="")
+        self.expressions.print_expression(node)
+
+    def generic_visit(self, node):
+        # Nós sem forma de comando não são impressos
+        return None
+
+    def visit_ProgramNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}Program:")
+        self._print_body(node.children)
+
+    def visit_ClassNode(self, node):
+        indent, head = self._head(node)
+        parent_info = f" extends {node.parent}" if node.parent else ""
+        print(f"{head}class {node.name}{parent_info} {{")
+        self.indent_level += 1
+
+        if node.attributes:
+            print(f"{self.indent_char * self.indent_level}Attributes:")
+            self._print_body(node.attributes)
+
+        if node.methods:
+            print(f"{self.indent_char * self.indent_level}Methods:")
+            self._print_body(node.methods)
+
+        self.indent_level -= 1
+        print(f"{indent}}}")
+
+    def visit_AttributeNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}{node.type_name} {node.name}")
+
+    def visit_MethodNode(self, node):
+        indent, head = self._head(node)
+        params = ", ".join([f"{t} {n}" for t, n in node.parameters])
+        print(f"{head}{node.return_type} {node.name}({params}) {{")
+        self._print_body(node.body)
+        print(f"{indent}}}")
+
+    def visit_FunctionNode(self, node):
+        indent, head = self._head(node)
+        params = ", ".join([f"{t} {n}" for t, n in node.parameters])
+        print(f"{head}func {node.name}({params}) -> {node.return_type} {{")
+        self._print_body(node.body)
+        print(f"{indent}}}")
+
+    def visit_BlockNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}{node.block_type.upper()} {{")
+        self._print_body(node.statements)
+        print(f"{indent}}}")
+
+    def visit_DeclarationNode(self, node):
+        indent, head = self._head(node)
+        array_info = f"[{node.array_size if node.array_size else ''}]" if node.is_array else ""
+        init_info = ""
+        if node.initial_value:
+            if isinstance(node.initial_value, ArrayInitNode):
+                init_info = " = [...]"
+            else:
+                init_info = f" = <expr>"
+        print(f"{head}var {node.type_name} {node.identifier}{array_info}{init_info}")
+
+    def visit_AssignmentNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}{node.identifier} = ", end="")
+        self._print_expression(node.expression)
+        print()
+
+    def visit_ArrayAssignmentNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}{node.array_name}[", end="")
+        self._print_expression(node.index)
+        print("] = ", end="")
+        self._print_expression(node.expression)
+        print()
+
+    def visit_AttributeAssignmentNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}{node.object_name}.{node.attribute_name} = ", end="")
+        self._print_expression(node.expression)
+        print()
+
+    def visit_IfNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}if (", end="")
+        self._print_expression(node.condition)
+        print(") {")
+        self._print_body(node.then_body)
+        if node.else_body:
+            print(f"{indent}}} else {{")
+            self._print_body(node.else_body)
+        print(f"{indent}}}")
+
+    def visit_WhileNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}while (", end="")
+        self._print_expression(node.condition)
+        print(") {")
+        self._print_body(node.body)
+        print(f"{indent}}}")
+
+    def visit_ForNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}for {node.var} = ", end="")
+        self._print_expression(node.init_expr)
+        print("; ", end="")
+        self._print_expression(node.condition)
+        print("; ", end="")
+        self._print_expression(node.increment)
+        print(" {")
+        self._print_body(node.body)
+        print(f"{indent}}}")
+
+    def visit_PrintNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}print(", end="")
+        self._print_expression(node.expression)
+        print(")")
+
+    def visit_InputNode(self, node):
+        indent, head = self._head(node)
+        prompt = f'"{node.prompt}"' if node.prompt else ''
+        print(f"{head}{node.identifier} = input({prompt})")
+
+    def visit_ReturnNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}return ", end="")
+        self._print_expression(node.expression)
+        print()
+
+    def visit_FunctionCallNode(self, node):
+        indent, head = self._head(node)
+        args_str = ", ".join(["..." for _ in node.arguments]) if node.arguments else ""
+        print(f"{head}{node.name}({args_str})")
+
+    def visit_MethodCallNode(self, node):
+        indent, head = self._head(node)
+        args_str = ", ".join(["..." for _ in node.arguments]) if node.arguments else ""
+        print(f"{head}{node.object_name}.{node.method_name}({args_str})")
+
+    def visit_InstantiationNode(self, node):
+        indent, head = self._head(node)
+        print(f"{head}{node.var_name} = new {node.class_name}()")
+
+    def visit_SendNode(self, node):
+        indent, head = self._head(node)
+        values_str = ", ".join(["..." for _ in node.values]) if node.values else ""
+        print(f"{head}{node.channel}.send({values_str})")
+
+    def visit_ReceiveNode(self, node):
+        indent, head = self._head(node)
+        vars_str = ", ".join(["..." for _ in node.variables]) if node.variables else ""
+        print(f"{head}{node.channel}.receive({vars_str})")
 
 
-def print_ast(ast, label="Árvore de Sintaxe Abstrata (AST):"):
-    printer = ASTPrinter()
+def print_ast(ast, label="Árvore de Sintaxe Abstrata (AST):", show_positions=False):
+    printer = ASTPrinter(show_positions)
     printer.print_ast(ast, label)
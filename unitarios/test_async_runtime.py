@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o modo async (AsyncRuntime): milhares de comandos de
+PAR esperando em receive sem criar threads, métodos e recursão como
+corrotinas, exceção em um ramo sem parar os outros e receive_async acordado
+por um send de outra thread (como a leitura de um NetworkChannel)
+"""
+import io
+import sys
+import asyncio
+import threading
+import contextlib
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.AsyncRuntime import AsyncRuntime
+from runtime.Channel import Channel
+from runtime.Scheduler import default_scheduler
+
+
+def estagios(n):
+    """n ramos esperando um valor de entrada; alimenta envia os n valores e soma recebe os dobros."""
+    ramos = ''.join(f'        espera({k});\n' for k in range(n))
+    return f'''
+C_CHANNEL entrada;
+C_CHANNEL saida;
+VOID espera(INT k) {{
+    INT x;
+    entrada.receive(x);
+    saida.send(x * 2);
+}}
+VOID alimenta() {{
+    for i = 0; i < {n}; i = i + 1 {{
+        entrada.send(i);
+    }}
+}}
+VOID soma() {{
+    INT total = 0;
+    INT y;
+    for j = 0; j < {n}; j = j + 1 {{
+        saida.receive(y);
+        total = total + y;
+    }}
+    print(total);
+}}
+SEQ {{
+    PAR {{
+        soma();
+{ramos}        alimenta();
+    }}
+}}
+'''
+
+
+OBJETOS = '''
+C_CHANNEL pedidos;
+class Fila {
+    INT atendidos;
+    INT atende(INT n) {
+        INT valor;
+        pedidos.receive(valor);
+        this.atendidos = this.atendidos + 1;
+        return valor + fat(n);
+    }
+}
+INT fat(INT n) {
+    if n < 2 {
+        return 1;
+    }
+    return n * fat(n - 1);
+}
+Fila f = new Fila();
+VOID cliente() {
+    print(f.atende(5));
+}
+VOID falha() {
+    INT v[2];
+    v[5] = 1;
+}
+VOID servidor() {
+    pedidos.send(1000);
+}
+SEQ {
+    f.atendidos = 0;
+    PAR {
+        cliente();
+        falha();
+        servidor();
+    }
+    print(" ");
+    print(f.atendidos);
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def executa(classe, fonte):
+    saida = io.StringIO()
+    classe(output_stream=saida).interpret(analisa(fonte))
+    return saida.getvalue()
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO MODO ASYNC (PAR EM CORROTINAS)")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    n = 10000
+    workers = len(default_scheduler().workers)
+    threads = threading.active_count()
+    saida = executa(AsyncRuntime, estagios(n))
+    verifica(saida == str(n * (n - 1)) and len(default_scheduler().workers) == workers
+             and threading.active_count() == threads,
+             f"{n} ramos esperando em receive, sem threads novas")
+
+    esperado = executa(ENGINES['python'], estagios(50))
+    verifica(executa(AsyncRuntime, estagios(50)) == esperado, "mesma saída do modo python")
+
+    with contextlib.redirect_stderr(io.StringIO()) as erros:
+        saida = executa(AsyncRuntime, OBJETOS)
+    verifica(saida == '1120 1' and 'IndexError' in erros.getvalue(),
+             "método e recursão como corrotinas; exceção em um ramo vai para stderr e os outros continuam")
+
+    canal = Channel()
+
+    async def recebe():
+        threading.Timer(0.05, canal.send, args=(7, 8)).start()
+        return await canal.receive_async(2)
+
+    verifica(asyncio.run(recebe()) == (7, 8), "receive_async acordado por um send de outra thread")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Script para verificar os canais limitados (c_channel nome [ids] capacidade):
+declaração no parser e no analisador semântico, send esperando com o canal
+cheio (threads e corrotinas), o mesmo resultado em todos os modos de
+execução e os créditos do NetworkChannel segurando o envio pela rede
+"""
+import io
+import sys
+import time
+import socket
+import asyncio
+import threading
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.Channel import Channel, NetworkChannel
+
+
+PRODUTOR_CONSUMIDOR = '''
+c_channel fila 4;
+VOID produz(INT n) {
+    for i = 0; i < n; i = i + 1 {
+        fila.send(i);
+    }
+}
+VOID consome(INT n) {
+    INT x;
+    INT total = 0;
+    for j = 0; j < n; j = j + 1 {
+        fila.receive(x);
+        total = total + x;
+    }
+    print(total);
+}
+SEQ {
+    PAR {
+        produz(300);
+        consome(300);
+    }
+}
+'''
+
+
+def declaracao(fonte):
+    """(nó da declaração, erros semânticos) da primeira linha de fonte."""
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    resultado = SemanticAnalyzer().analyze(ast)
+    return ast.children[0], resultado['errors']
+
+
+def porta_livre():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def espera(condicao, limite=5.0):
+    fim = time.monotonic() + limite
+    while not condicao() and time.monotonic() < fim:
+        time.sleep(0.01)
+    return condicao()
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DOS CANAIS LIMITADOS (CAPACIDADE E CRÉDITOS)")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    no, erros = declaracao('c_channel chat cliente servidor 8;')
+    verifica(no.channel_info == ['cliente', 'servidor'] and no.channel_capacity == 8 and not erros,
+             "c_channel nome ids capacidade: ids e capacidade na declaração")
+    no, erros = declaracao('c_channel chat;')
+    verifica(no.channel_capacity is None and not erros, "sem capacidade: canal sem limite")
+    _, erros = declaracao('c_channel chat 0;')
+    verifica(any('maior que zero' in erro for erro in erros), "capacidade 0: erro semântico")
+    try:
+        declaracao('c_channel chat 2.5;')
+        verifica(False, "capacidade não inteira: SyntaxError")
+    except SyntaxError:
+        verifica(True, "capacidade não inteira: SyntaxError")
+
+    canal = Channel(2)
+    canal.send(1)
+    canal.send(2)
+    envio = threading.Thread(target=canal.send, args=(3,))
+    envio.start()
+    envio.join(0.2)
+    cheio = envio.is_alive() and canal.queue.qsize() == 2
+    recebidos = [canal.receive(), canal.receive(), canal.receive()]
+    envio.join(1)
+    verifica(cheio and not envio.is_alive() and recebidos == [1, 2, 3],
+             "send espera com o canal cheio e continua depois de um receive")
+
+    esperado = str(sum(range(300)))
+    for nome, classe in ENGINES.items():
+        ast = Parser(Lexer(PRODUTOR_CONSUMIDOR).tokenize()).parse()
+        SemanticAnalyzer().analyze(ast)
+        saida = io.StringIO()
+        interpretador = classe(output_stream=saida)
+        interpretador.interpret(ast)
+        verifica(saida.getvalue() == esperado and interpretador.global_scope['fila'].capacity == 4,
+                 f"{nome}: produtor e consumidor em um canal de capacidade 4")
+
+    async def corrotinas():
+        canal = Channel(1)
+        ocupacao = []
+
+        async def produz():
+            for valor in range(20):
+                await canal.send_async(valor)
+
+        async def consome():
+            valores = []
+            for _ in range(20):
+                ocupacao.append(canal.queue.qsize())
+                valores.append(await canal.receive_async())
+            return valores
+
+        _, valores = await asyncio.gather(produz(), consome())
+        return valores == list(range(20)) and max(ocupacao) <= 1
+
+    verifica(asyncio.run(corrotinas()), "send_async suspende a corrotina com o canal cheio")
+
+    porta = porta_livre()
+    servidor = NetworkChannel('server', '127.0.0.1', porta, capacity=2)
+    cliente = NetworkChannel('client', '127.0.0.1', porta, capacity=2)
+    try:
+        conectado = espera(lambda: servidor.conn is not None and cliente.conn is not None
+                           and cliente.credits == 2 and servidor.credits == 2)
+        envio = threading.Thread(target=lambda: [cliente.send(valor) for valor in range(6)])
+        envio.start()
+        envio.join(0.3)
+        segurado = envio.is_alive() and servidor.queue.qsize() == 2
+        recebidos = [servidor.receive() for _ in range(6)]
+        envio.join(2)
+        verifica(conectado and segurado and not envio.is_alive() and recebidos == list(range(6))
+                 and espera(lambda: cliente.credits == 2),
+                 "NetworkChannel: sem crédito o envio espera; cada receive devolve um crédito")
+    finally:
+        cliente.close()
+        servidor.close()
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o bytecode (BytecodeCompiler) e a VirtualMachine:
+mesma saída do Interpreter, inclusive depois de serializar o programa
+compilado com pickle
+"""
+import io
+import sys
+import pickle
+from array import array
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from codegen.BytecodeCompiler import BytecodeCompiler
+from runtime.Interpreter import Interpreter
+from runtime.VirtualMachine import VirtualMachine
+
+
+PROGRAMA = '''
+c_channel canal;
+class Conta {
+    INT saldo;
+    VOID deposita(INT v) { this.saldo = this.saldo + v; }
+    INT valor() { return this.saldo; }
+}
+INT dobro(INT x) { return x * 2; }
+INT v[3];
+INT r;
+Conta c = new Conta();
+SEQ {
+    c.saldo = 0;
+    v[0] = dobro(4);
+    v[1] = v[0] + 1;
+    c.deposita(v[1]);
+    c.deposita(5);
+    print(c.valor());
+    print(" ");
+}
+PAR {
+    canal.send(v[0] + v[1]);
+    SEQ {
+        canal.receive(r);
+        print(r);
+    }
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO BYTECODE E DA VIRTUALMACHINE")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    arvore = io.StringIO()
+    Interpreter(output_stream=arvore).interpret(analisa(PROGRAMA))
+
+    maquina = io.StringIO()
+    VirtualMachine(output_stream=maquina).interpret(analisa(PROGRAMA))
+    verifica(maquina.getvalue() == arvore.getvalue() == '14 17',
+             "classes, métodos, arrays, PAR e send/receive com a mesma saída do Interpreter")
+
+    programa = BytecodeCompiler().compile(analisa(PROGRAMA))
+    verifica(isinstance(programa.main.code, array) and programa.main.code.typecode == 'i',
+             "opcodes em array('i')")
+
+    copia = pickle.loads(pickle.dumps(programa))
+    saida = io.StringIO()
+    VirtualMachine(output_stream=saida).execute(copia)
+    verifica(saida.getvalue() == arvore.getvalue(), "programa serializado com pickle executa igual")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Script para verificar a pilha de chamadas própria da VirtualMachine:
+recursão mais funda que a pilha do Python, CallStackOverflow ao passar de
+max_call_depth e a mesma saída dos outros modos quando um RETURN desempilha
+a chamada no meio de laços e de argumentos de métodos
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.VirtualMachine import VirtualMachine, CallStackOverflow
+
+
+PROFUNDIDADE = '''
+class Contador {
+    INT desce(INT n) {
+        if n == 0 {
+            return 0;
+        }
+        return this.desce(n - 1) + 1;
+    }
+}
+INT profundidade(INT n) {
+    if n == 0 {
+        return 0;
+    }
+    return profundidade(n - 1) + 1;
+}
+SEQ {
+    Contador c = new Contador();
+    print(profundidade(N));
+    print(" ");
+    print(c.desce(N));
+}
+'''
+
+RETORNOS = '''
+class Acumulador {
+    INT total;
+    INT soma(INT a, INT b) {
+        return a + b;
+    }
+}
+INT primeiro_multiplo(INT n, INT k) {
+    for i = 1; i < 100; i = i + 1 {
+        if (i * k) % n == 0 {
+            return i * k;
+        }
+    }
+    return -1;
+}
+INT fib(INT n) {
+    if n < 2 {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+SEQ {
+    Acumulador a = new Acumulador();
+    for j = 2; j < 6; j = j + 1 {
+        print(a.soma(primeiro_multiplo(j, 3), a.soma(fib(j), fib(j + 1))));
+        print(" ");
+    }
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def executa(classe, fonte, **opcoes):
+    saida = io.StringIO()
+    classe(output_stream=saida, **opcoes).interpret(analisa(fonte))
+    return saida.getvalue()
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DA PILHA DE CHAMADAS DA VM")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    profundo = PROFUNDIDADE.replace('N', '20000')
+    verifica(executa(VirtualMachine, profundo) == '20000 20000',
+             "recursão de 20000 chamadas de função e de método")
+
+    limite = PROFUNDIDADE.replace('N', '99')
+    verifica(executa(VirtualMachine, limite, max_call_depth=100) == '99 99',
+             "max_call_depth=100 permite 100 chamadas aninhadas")
+    try:
+        executa(VirtualMachine, PROFUNDIDADE.replace('N', '100'), max_call_depth=100)
+        mensagem = None
+    except CallStackOverflow as e:
+        mensagem = str(e)
+    verifica(mensagem is not None and 'profundidade' in mensagem and '100' in mensagem,
+             "CallStackOverflow na chamada 101, com o nome da função")
+
+    esperado = executa(ENGINES['tree'], RETORNOS)
+    verifica(esperado == '9 8 20 28 ' and executa(VirtualMachine, RETORNOS) == esperado,
+             "RETURN em laços e em argumentos de métodos: mesma saída do Interpreter")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o modo de execução por closures (ClosureInterpreter):
+mesma saída do Interpreter nos programas de tests/ e em casos de RETURN
+dentro de laços, escopos e PAR
+"""
+import io
+import re
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES, create_interpreter
+
+
+PROGRAMA_RETORNOS = '''
+INT total = 0;
+INT busca(INT alvo) {
+    INT i = 0;
+    while i < 100 {
+        for j = 0; j < 10; j = j + 1 {
+            if i * 10 + j == alvo { return i * 100 + j; }
+        }
+        i = i + 1;
+    }
+    return -1;
+}
+INT conta(INT n) {
+    if n == 0 { return 0; } else { return 1 + conta(n - 1); }
+}
+VOID soma(INT v) { total = total + v; }
+SEQ {
+    print(busca(57)); print(" ");
+    print(busca(5000)); print(" ");
+    print(conta(50)); print(" ");
+    print(2 * 3 + 7 / 2 - 10 % 4); print(" ");
+    print("x" + 1 + 2.5); print(" ");
+    print(-(4 - 9));
+}
+PAR {
+    soma(1);
+    soma(2);
+    soma(3);
+}
+SEQ {
+    print(" ");
+    print(total);
+}
+'''
+
+ENTRADAS = {'tests/programa6_quicksort.minipar': '9 4 7 1 8 2'}
+
+
+def executa(engine, fonte, entrada=''):
+    saida = io.StringIO()
+    aviso = io.StringIO()
+    sys.stdout, anterior = aviso, sys.stdout
+    try:
+        ast = Parser(Lexer(fonte).tokenize()).parse()
+        SemanticAnalyzer().analyze(ast)
+        create_interpreter(engine, output_stream=saida, input_callback=lambda prompt: entrada).interpret(ast)
+    finally:
+        sys.stdout = anterior
+    # Mensagens do input_provider incluem o endereço da função
+    return re.sub(r'0x[0-9a-f]+', 'ADDR', saida.getvalue() + aviso.getvalue())
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO MODO DE EXECUÇÃO POR CLOSURES")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    esperado = '507 -1 50 7 x12.5 5 6'
+    verifica(executa('closure', PROGRAMA_RETORNOS) == executa('tree', PROGRAMA_RETORNOS) == esperado,
+             "RETURN em laços aninhados, recursão, operadores e PAR")
+
+    for caminho in ('tests/hello_world.minipar', 'tests/programa2_threads.minipar',
+                    'tests/programa3_neuronio.minipar', 'tests/programa4_xor_cpp.minipar',
+                    'tests/programa5_recomendacao.minipar', 'tests/programa6_quicksort.minipar'):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            fonte = f.read()
+        entrada = ENTRADAS.get(caminho, '')
+        saidas = {engine: executa(engine, fonte, entrada) for engine in ENGINES}
+        verifica(len(set(saidas.values())) == 1, f"{caminho}: mesma saída em {', '.join(ENGINES)}")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o RETURN por registros de conclusão no Interpreter:
+retornos de dentro de laços e ifs aninhados sem ReturnException, e o RETURN
+fora de função, que continua levantando ReturnException
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.Interpreter import Interpreter, ReturnException
+
+
+PROGRAMA = '''
+INT busca(INT alvo) {
+    INT i;
+    for i = 0; i < 10; i = i + 1 {
+        while i < 100 {
+            if i == alvo {
+                SEQ { return i * 10; }
+            }
+            i = i + 1;
+        }
+    }
+    return -1;
+}
+INT fib(INT n) {
+    if n < 2 { return n; }
+    return fib(n - 1) + fib(n - 2);
+}
+SEQ {
+    print(busca(3));
+    print(" ");
+    print(busca(200));
+    print(" ");
+    print(fib(10));
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DOS REGISTROS DE CONCLUSÃO (RETURN)")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    criadas = []
+    init_original = ReturnException.__init__
+
+    def conta_init(self, value):
+        criadas.append(value)
+        init_original(self, value)
+
+    ReturnException.__init__ = conta_init
+    try:
+        saida = io.StringIO()
+        Interpreter(output_stream=saida).interpret(analisa(PROGRAMA))
+        verifica(saida.getvalue() == '30 -1 55', "retornos de laços, ifs e blocos aninhados")
+        verifica(not criadas, "nenhuma ReturnException nas chamadas")
+
+        try:
+            Interpreter(output_stream=io.StringIO()).interpret(analisa('SEQ { return 7; print("nunca"); }'))
+            verifica(False, "RETURN fora de função levanta ReturnException")
+        except ReturnException as e:
+            verifica(e.value == 7, "RETURN fora de função levanta ReturnException")
+    finally:
+        ReturnException.__init__ = init_original
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Script para verificar que o motor léxico por regex produz exatamente
+a mesma sequência de tokens que o scanner caractere a caractere
+"""
+import io
+import sys
+import glob
+import random
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+
+# Casos de borda conhecidos do scanner original
+casos = {
+    'Comentário //': 'INT x; // comentário estilo C que passa de trinta caracteres\nx = 1;',
+    'String multilinha': 'print("linha 1\nlinha 2");\nINT y;',
+    'String não terminada': 'STRING s = "sem fim\n INT z;',
+    'Operadores compostos': 'a && b || c == d != e >= f <= g & h | i ! j',
+    'Números': '1 2.5 3. 10.25.3',
+    'Unicode': 'INT ação; x = ²; y = 1٣; ½',
+    'Caractere nulo': 'print("a\0b"); # c\0d',
+    'Vazio': '',
+}
+
+
+def compara(nome, fonte):
+    regex = Lexer(fonte, 'regex').tokenize()
+    scanner = Lexer(fonte, 'scanner').tokenize()
+    if regex == scanner:
+        return True
+    print(f"  ❌ {nome}")
+    for a, b in zip(regex, scanner):
+        if a != b:
+            print(f"      regex:   {a}")
+            print(f"      scanner: {b}")
+            break
+    else:
+        print(f"      tamanhos diferentes: {len(regex)} x {len(scanner)}")
+    return False
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DOS MOTORES LÉXICOS (regex x scanner)")
+    print("=" * 80)
+
+    falhas = 0
+    for nome, fonte in casos.items():
+        if compara(nome, fonte):
+            print(f"  ✅ {nome}")
+        else:
+            falhas += 1
+
+    for caminho in sorted(glob.glob('tests/*.minipar')):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            if compara(caminho, f.read()):
+                print(f"  ✅ {caminho}")
+            else:
+                falhas += 1
+
+    # Entradas aleatórias com os caracteres que exercitam cada regra
+    alfabeto = list('ab_XY019.\n \t"#/=&|!<>+-*%(){}[];,@\0²٣é')
+    rng = random.Random(42)
+    aleatorios_ok = all(
+        compara(f'aleatório {i}', ''.join(rng.choice(alfabeto) for _ in range(rng.randint(0, 40))))
+        for i in range(2000)
+    )
+    if aleatorios_ok:
+        print("  ✅ 2000 entradas aleatórias")
+    else:
+        falhas += 1
+
+    # Leitura em blocos (Lexer.from_stream) deve gerar os mesmos tokens
+    stream_ok = True
+    for nome, fonte in casos.items():
+        esperado = Lexer(fonte).tokenize()
+        for tamanho in (1, 3, 16):
+            if list(Lexer.from_stream(io.StringIO(fonte), tamanho).iter_tokens()) != esperado:
+                print(f"  ❌ stream {nome} (blocos de {tamanho})")
+                stream_ok = False
+    if stream_ok:
+        print("  ✅ Lexer.from_stream em blocos de 1, 3 e 16 caracteres")
+    else:
+        falhas += 1
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com diferença"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Script para verificar a chamada de métodos: tabelas de métodos por classe,
+linearizadas pela cadeia extends inteira, e o cache de cada chamada quando
+o mesmo ponto do programa recebe objetos de classes diferentes
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import ClassNode, MethodNode
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.Interpreter import Interpreter, method_table
+
+
+PROGRAMA = '''
+class A {
+    INT base() { return 1; }
+    INT nome() { return 10; }
+}
+class B extends A {
+    INT nome() { return 20; }
+    INT meio() { return this.base() + 100; }
+}
+class C extends B {
+    INT nome() { return 30; }
+}
+A x = new A();
+C z = new C();
+A v[2];
+SEQ {
+    v[0] = x;
+    v[1] = z;
+    for i = 0; i < 4; i = i + 1 {
+        print(v[i % 2].nome());
+        print(" ");
+    }
+    print(z.base());
+    print(" ");
+    print(z.meio());
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DA CHAMADA DE MÉTODOS")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    for nome, classe in ENGINES.items():
+        saida = io.StringIO()
+        classe(output_stream=saida).interpret(analisa(PROGRAMA))
+        verifica(saida.getvalue() == '10 30 10 30 1 101',
+                 f"{nome}: métodos sobrescritos, do avô e chamada com classes alternadas")
+
+    interpretador = Interpreter(output_stream=io.StringIO())
+    interpretador.interpret(analisa(PROGRAMA))
+    tabela = interpretador.method_tables[interpretador.classes['C']]
+    verifica(sorted(tabela) == ['base', 'meio', 'nome'] and tabela['nome'] is interpretador.classes['C'].methods[0],
+             "tabela de C tem os métodos de toda a cadeia, com os da própria classe primeiro")
+    verifica(interpretador.global_scope['z'].methods is tabela, "instâncias usam a tabela da classe")
+
+    a = ClassNode('A', 'B', [], [MethodNode('INT', 'f', [], [])])
+    b = ClassNode('B', 'A', [], [MethodNode('INT', 'g', [], [])])
+    verifica(sorted(method_table(a, {'A': a, 'B': b})) == ['f', 'g'], "herança cíclica não trava a linearização")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o layout dos objetos (Shape): slots dos atributos da
+cadeia extends, arrays novos a cada instância e atributos fora do Shape
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.Interpreter import Interpreter
+
+
+PROGRAMA = '''
+class Base {
+    INT id;
+}
+class Ponto extends Base {
+    INT x;
+    FLOAT m[2][2];
+    INT h[3];
+    VOID marca(INT v) { this.h[1] = v; this.id = v * 2; }
+}
+Ponto a = new Ponto();
+Ponto b = new Ponto();
+SEQ {
+    a.marca(5);
+    print(a.h[1]);
+    print(" ");
+    print(b.h[1]);
+    print(" ");
+    print(a.id);
+    print(" ");
+    print(b.id);
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO LAYOUT DOS OBJETOS")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    for nome, classe in ENGINES.items():
+        saida = io.StringIO()
+        classe(output_stream=saida).interpret(analisa(PROGRAMA))
+        verifica(saida.getvalue() == '5 0 10 None', f"{nome}: arrays por instância e atributo herdado")
+
+    interpretador = Interpreter(output_stream=io.StringIO())
+    interpretador.interpret(analisa(PROGRAMA))
+    a = interpretador.global_scope['a']
+    b = interpretador.global_scope['b']
+    verifica(a.shape is b.shape and list(a.shape.slots) == ['x', 'm', 'h', 'id'],
+             "instâncias da classe compartilham o Shape, com os atributos herdados no fim")
+    verifica(a.get_attribute('m') == [[0.0, 0.0], [0.0, 0.0]] and a.get_attribute('m') is not b.get_attribute('m'),
+             "matriz inicializada pelo tipo, uma por instância")
+
+    a.set_attribute('extra', 1)
+    verifica(a.get_attribute('extra') == 1 and b.get_attribute('extra') is None
+             and a.attributes['extra'] == 1 and a.attributes['id'] == 10,
+             "atributo fora do Shape fica só na instância")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
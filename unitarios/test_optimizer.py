@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o ASTOptimizer: literais decodificados, cálculo de
+constantes, propagação, remoção de código morto e a mesma saída do
+programa sem otimização
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import *
+from parser.Traversal import walk
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from optimizer.ASTOptimizer import ASTOptimizer
+from runtime.Interpreter import Interpreter
+
+
+PROGRAMA = '''
+INT N = 3;
+STRING SEP = "-";
+INT DEBUG = 0;
+INT contador = 0;
+INT dobro(INT x) {
+    return x * 2;
+    print("nunca");
+}
+SEQ {
+    print(2 * 3 + 1);
+    print(SEP + N + SEP);
+    print(dobro(N));
+    if DEBUG == 1 { print("debug"); } else { print(" sem debug"); }
+    while DEBUG > 0 { print("laço"); }
+    contador = contador + 1;
+    print(contador);
+}
+PAR {
+    if 1 == 1 { print(" a"); print(" b"); }
+    print(" c");
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def executa(ast):
+    saida = io.StringIO()
+    Interpreter(output_stream=saida).interpret(ast)
+    return saida.getvalue()
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO ASTOPTIMIZER")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    ast = analisa(PROGRAMA)
+    report = ASTOptimizer().optimize(ast)
+    nos = list(walk(ast))
+    seq, par = [child for child in ast.children if isinstance(child, BlockNode)]
+
+    verifica(all(isinstance(node.value, (int, float)) for node in nos if isinstance(node, NumberNode)),
+             "literais numéricos decodificados")
+    verifica(isinstance(seq.statements[0].expression, NumberNode) and seq.statements[0].expression.value == 7,
+             "2 * 3 + 1 calculado na compilação")
+    verifica(isinstance(seq.statements[1].expression, StringNode) and seq.statements[1].expression.value == '-3-',
+             "constantes globais propagadas e concatenadas")
+    verifica(not any(isinstance(node, IdentifierNode) and node.name == 'N' for node in nos),
+             "nenhuma leitura de N sobra")
+    verifica(any(isinstance(node, IdentifierNode) and node.name == 'contador' for node in nos),
+             "variável reatribuída não é propagada")
+    verifica(not any(isinstance(node, (IfNode, WhileNode)) for node in nos),
+             "if/while com condição constante removidos")
+    dobro = [child for child in ast.children if isinstance(child, FunctionNode)][0]
+    verifica(len(dobro.body) == 1, "comando depois de return removido")
+    verifica(len(par.statements) == 2 and isinstance(par.statements[0], BlockNode),
+             "ramo mantido em um PAR continua sendo uma única thread")
+    verifica(report.total > 0 and report.counts['dead-code'] == 4, "relatório conta os nós reescritos")
+
+    divisao = analisa('SEQ { print(1 / 0); }')
+    ASTOptimizer().optimize(divisao)
+    verifica(any(isinstance(node, BinaryOpNode) for node in walk(divisao)),
+             "divisão por zero fica para a execução")
+
+    # Sem o PAR, para a ordem das threads não mudar a saída
+    sequencial = PROGRAMA[:PROGRAMA.index('PAR {')]
+    otimizado = analisa(sequencial)
+    ASTOptimizer().optimize(otimizado)
+    verifica(executa(otimizado) == executa(analisa(sequencial)) == '7-3-6 sem debug1',
+             "mesma saída com e sem otimização")
+
+    try:
+        ASTOptimizer(['fold', 'inexistente'])
+        verifica(False, "passagem desconhecida é rejeitada")
+    except ValueError:
+        verifica(True, "passagem desconhecida é rejeitada")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
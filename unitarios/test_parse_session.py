@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Script para verificar que a análise incremental (ParseSession) produz a
+mesma AST que a análise completa após cada edição, inclusive as posições
+(line/col) dos nós reaproveitados
+"""
+import re
+import sys
+import glob
+import random
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.Traversal import ast_to_dict
+from parser.ParseSession import ParseSession
+
+
+def normaliza(ast):
+    # ast_to_dict inclui reprs com endereços de memória
+    return re.sub(r'0x[0-9a-f]+', 'ADDR', repr(ast_to_dict(ast)))
+
+
+def analise_completa(fonte):
+    try:
+        return normaliza(Parser(Lexer(fonte).iter_tokens()).parse())
+    except SyntaxError:
+        return 'SyntaxError'
+
+
+def analise_incremental(sessao, inicio, fim, texto):
+    try:
+        return normaliza(sessao.apply_edit(inicio, fim, texto))
+    except SyntaxError:
+        return 'SyntaxError'
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DA ANÁLISE INCREMENTAL (ParseSession)")
+    print("=" * 80)
+
+    trechos = ['x', 'INT a = 1;', '}', '{', '\n', '"', '# c\n', 'print("a");', ';', 'void f() { }']
+    rng = random.Random(7)
+    falhas = 0
+
+    for caminho in sorted(glob.glob('tests/*.minipar')):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            original = f.read()
+        sessao = ParseSession(original)
+        atual = original
+        reaproveitados = 0
+        erros = 0
+        for _ in range(40):
+            inicio = rng.randint(0, len(atual))
+            fim = min(len(atual), inicio + rng.choice([0, 1, 5]))
+            texto = rng.choice(trechos) if rng.random() < 0.7 else ''
+            atual = atual[:inicio] + texto + atual[fim:]
+            if analise_incremental(sessao, inicio, fim, texto) != analise_completa(atual):
+                erros += 1
+            reaproveitados += sessao.last_reused
+            if rng.random() < 0.2:
+                # Desfaz tudo de uma vez (delta calculado por update)
+                sessao.update(original)
+                atual = original
+                if normaliza(sessao.ast) != analise_completa(original):
+                    erros += 1
+        if erros:
+            falhas += 1
+            print(f"  ❌ {caminho:45} | {erros} edição(ões) divergente(s)")
+        else:
+            print(f"  ✅ {caminho:45} | itens reaproveitados: {reaproveitados}")
+
+    # Edição com erro de sintaxe seguida do mesmo texto: o erro volta a aparecer
+    sessao = ParseSession('INT a = 1;\nSEQ {\n    print(a);\n}\n')
+    invalido = 'INT a = 1;\nSEQ {\n    print(a;\n}\n'
+    resultados = [analise_incremental(sessao, 0, len(sessao.source), invalido)]
+    for _ in range(2):
+        try:
+            resultados.append(normaliza(sessao.update(invalido)))
+        except SyntaxError:
+            resultados.append('SyntaxError')
+    if resultados == ['SyntaxError'] * 3:
+        print(f"  ✅ {'mesmo texto após erro de sintaxe':45} | SyntaxError a cada update")
+    else:
+        falhas += 1
+        print(f"  ❌ {'mesmo texto após erro de sintaxe':45} | {resultados}")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} arquivo(s) com diferença"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
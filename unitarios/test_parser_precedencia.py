@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Script para verificar a tabela de precedência do parser de expressões e o
+parsing sem recursão de aninhamentos profundos
+"""
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import BinaryOpNode, ConditionNode, UnaryOpNode, NumberNode, IdentifierNode
+
+
+def forma(node):
+    """Expressão totalmente parentizada, para comparar a associação."""
+    if isinstance(node, (BinaryOpNode, ConditionNode)):
+        return f"({forma(node.left)} {node.operator} {forma(node.right)})"
+    if isinstance(node, UnaryOpNode):
+        return f"(-{forma(node.operand)})"
+    if isinstance(node, NumberNode):
+        return str(node.value)
+    if isinstance(node, IdentifierNode):
+        return node.name
+    return type(node).__name__
+
+
+# Condição -> forma esperada (&& liga mais fraco que ||, como na gramática)
+casos = {
+    'a + b * c - d': '((a + (b * c)) - d)',
+    '-a * -(b + c) % 2': '(((-a) * (-(b + c))) % 2)',
+    'a < b + 1 || c == d && e': '(((a < (b + 1)) || (c == d)) && e)',
+    'a && b || c': '(a && (b || c))',
+    'a - - - b': '(a - (-(-b)))',
+    '(a + b) * (c - (d / e))': '((a + b) * (c - (d / e)))',
+}
+
+
+def condicao(fonte):
+    return Parser(Lexer(fonte).tokenize()).parse_condition()
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO PARSER DE EXPRESSÕES (tabela de precedência)")
+    print("=" * 80)
+
+    falhas = 0
+    for fonte, esperado in casos.items():
+        obtido = forma(condicao(fonte))
+        if obtido == esperado:
+            print(f"  ✅ {fonte:35} -> {obtido}")
+        else:
+            falhas += 1
+            print(f"  ❌ {fonte:35} -> {obtido} (esperado {esperado})")
+
+    # Relacionais não encadeiam: 'a < b < c' para depois de 'a < b'
+    parser = Parser(Lexer('a < b < c').tokenize())
+    if forma(parser.parse_condition()) == '(a < b)' and parser.current_token().lexeme == '<':
+        print("  ✅ a < b < c termina em (a < b)")
+    else:
+        falhas += 1
+        print("  ❌ a < b < c deveria terminar em (a < b)")
+
+    # Dentro de parênteses vale apenas a aritmética
+    try:
+        condicao('(a < b)')
+        falhas += 1
+        print("  ❌ (a < b) deveria gerar SyntaxError")
+    except SyntaxError:
+        print("  ✅ (a < b) gera SyntaxError")
+
+    # Aninhamentos muito além do limite de recursão do Python
+    profundidade = sys.getrecursionlimit() * 5
+    for nome, fonte in (('parênteses', '(' * profundidade + '1' + ')' * profundidade),
+                        ('"-" unário', '-' * profundidade + '1'),
+                        ('cadeia de "+"', ' + '.join(['x'] * profundidade))):
+        try:
+            Parser(Lexer(f'SEQ {{ y = {fonte}; }}').tokenize()).parse()
+            print(f"  ✅ {nome} com profundidade {profundidade}")
+        except RecursionError:
+            falhas += 1
+            print(f"  ❌ {nome} com profundidade {profundidade}: RecursionError")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o PAR em processos (par_backend='process'): mudanças
+de variáveis globais, de elementos de arrays e de atributos de objetos
+aplicadas no processo principal, canais entre os ramos e saída dos filhos
+no output_stream do processo principal, em todos os modos de execução
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.ProcessPar import fork_available
+
+
+GLOBAIS = '''
+class Ponto {
+    INT x;
+    INT y;
+}
+INT total = 0;
+STRING nome = "a";
+INT v[6];
+INT m[2][2];
+Ponto p = new Ponto();
+SEQ {
+    PAR {
+        for i = 0; i < 3; i = i + 1 {
+            v[i] = i + 1;
+        }
+        for i = 3; i < 6; i = i + 1 {
+            v[i] = i * 10;
+        }
+        total = 42;
+        nome = "b";
+        m[1][0] = 7;
+        p.y = 5;
+    }
+    print(total);
+    print(" ");
+    print(nome);
+    print(" ");
+    print(v);
+    print(m);
+    print(p.y);
+}
+'''
+
+CANAIS = '''
+C_CHANNEL canal;
+C_CHANNEL resultado;
+INT dobro(INT n) {
+    return n * 2;
+}
+VOID envia() {
+    canal.send(dobro(21));
+}
+VOID repassa() {
+    INT recebido;
+    canal.receive(recebido);
+    print("ramo 2 recebeu " + recebido);
+    resultado.send(recebido + 1);
+}
+SEQ {
+    INT final;
+    PAR {
+        envia();
+        repassa();
+    }
+    resultado.receive(final);
+    print(" e o principal " + final);
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def executa(classe, fonte, par_backend):
+    saida = io.StringIO()
+    classe(output_stream=saida, par_backend=par_backend).interpret(analisa(fonte))
+    return saida.getvalue()
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO PAR EM PROCESSOS")
+    print("=" * 80)
+
+    if not fork_available():
+        print("  (fork não disponível neste sistema: teste não executado)")
+        return 0
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    for nome, classe in ENGINES.items():
+        esperado = executa(classe, GLOBAIS, 'thread')
+        verifica(esperado == '42 b [1, 2, 3, 30, 40, 50][[0, 0], [7, 0]]5'
+                 and executa(classe, GLOBAIS, 'process') == esperado,
+                 f"{nome}: globais, elementos de arrays e atributos alterados nos ramos")
+        verifica(executa(classe, CANAIS, 'process') == 'ramo 2 recebeu 42 e o principal 43',
+                 f"{nome}: canal entre os ramos e do ramo para o principal, saída no output_stream")
+
+    try:
+        ENGINES['tree'](par_backend='fork')
+        verifica(False, "par_backend desconhecido levanta ValueError")
+    except ValueError:
+        verifica(True, "par_backend desconhecido levanta ValueError")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o cache em disco de programas compilados (.miniparc):
+acerto/falta, invalidação quando o fonte muda, remoção LRU e recuperação de
+arquivos corrompidos
+"""
+import os
+import re
+import sys
+import glob
+import tempfile
+sys.path.insert(0, 'src')
+
+from parser.Traversal import ast_to_dict
+from parser.ParseSession import ParseSession
+from cache.ProgramCache import ProgramCache, CACHE_SUFFIX
+
+
+def normaliza(ast):
+    # ast_to_dict inclui reprs com endereços de memória
+    return re.sub(r'0x[0-9a-f]+', 'ADDR', repr(ast_to_dict(ast)))
+
+
+def compila(cache, fonte):
+    program = cache.compile(fonte)
+    program.semantic_report()
+    program.tac_generator()
+    cache.save(program)
+    return program
+
+
+def arquivos(diretorio):
+    return sorted(glob.glob(os.path.join(diretorio, '*' + CACHE_SUFFIX)))
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO CACHE DE PROGRAMAS (.miniparc)")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    fontes = []
+    for caminho in sorted(glob.glob('tests/*.minipar'))[:2]:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            fontes.append(f.read())
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        cache = ProgramCache(diretorio)
+
+        # Falta e depois acerto com a mesma AST, semântica e TAC
+        primeiro = compila(cache, fontes[0])
+        segundo = compila(cache, fontes[0])
+        verifica(not primeiro.from_cache and segundo.from_cache, "segunda compilação vem do disco")
+        verifica(normaliza(primeiro.ast) == normaliza(segundo.ast), "AST do cache igual à original")
+        verifica(primeiro.semantic_report() == segundo.semantic_report(), "relatório semântico igual")
+        verifica(primeiro.tac.to_string() == segundo.tac.to_string(), "TAC igual")
+
+        # Sessão incremental reposicionada sobre a AST do cache
+        sessao = ParseSession()
+        cache.compile(fontes[0], sessao)
+        editado = fontes[0] + '\n# fim\n'
+        verifica(normaliza(sessao.update(editado)) == normaliza(ParseSession(editado).ast),
+                 "sessão continua incremental após carregar do cache")
+
+        # Fonte diferente não reaproveita a entrada
+        verifica(not cache.compile(fontes[0] + '\n').from_cache, "fonte alterado invalida a entrada")
+
+        # Arquivo corrompido é descartado e recompilado
+        with open(arquivos(diretorio)[0], 'wb') as f:
+            f.write(b'lixo')
+        program = compila(cache, fontes[0])
+        verifica(not program.from_cache and cache.compile(fontes[0]).from_cache,
+                 "arquivo corrompido é recompilado")
+
+        # Cache desligado não lê nem grava
+        desligado = ProgramCache(diretorio, enabled=False)
+        antes = arquivos(diretorio)
+        verifica(not compila(desligado, fontes[1]).from_cache and arquivos(diretorio) == antes,
+                 "cache desligado não usa o disco")
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        # Três variantes de tamanho quase igual e limite para duas: a menos
+        # usada recentemente sai primeiro
+        variantes = [fontes[0], fontes[0] + '\n', fontes[0] + '\n\n']
+        cache = ProgramCache(diretorio)
+        for instante, fonte in zip((1000, 2000), variantes):
+            os.utime(cache._path(compila(cache, fonte).key), (instante, instante))
+        cache.max_bytes = sum(os.path.getsize(caminho) for caminho in arquivos(diretorio)) + 32
+        cache.compile(variantes[0])  # Acesso renova a entrada mais antiga
+        compila(cache, variantes[2])
+        restantes = {os.path.basename(caminho) for caminho in arquivos(diretorio)}
+        esperadas = {cache.key(fonte) + CACHE_SUFFIX for fonte in (variantes[0], variantes[2])}
+        verifica(restantes == esperadas, "remoção LRU respeita max_bytes e a ordem de acesso")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o PythonGenerator e o PythonRuntime: o programa
+traduzido para Python tem a mesma saída do Interpreter, inclusive depois de
+serializar o code object (marshal, via pickle do PythonProgram)
+"""
+import io
+import sys
+import pickle
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from codegen.PythonGenerator import PythonGenerator
+from runtime.Interpreter import Interpreter
+from runtime.PythonRuntime import PythonRuntime
+from runtime.AsyncRuntime import AsyncRuntime
+
+
+PROGRAMA = '''
+c_channel canal;
+class Conta {
+    INT saldo;
+    VOID deposita(INT v) { this.saldo = this.saldo + v; }
+    INT valor() { return this.saldo; }
+}
+INT dobro(INT x) { return x * 2; }
+INT v[3];
+INT r;
+INT i;
+STRING s;
+Conta c = new Conta();
+SEQ {
+    c.saldo = 0;
+    v[0] = dobro(4);
+    v[1] = v[0] + 1;
+    c.deposita(v[1]);
+    c.deposita(5);
+    print(c.valor());
+    print(" ");
+    s = "minipar";
+    print(strlen(s) + indexof(s, "p") + parseint("12x"));
+    print(" " + substr(s, 4, 3) + charat(s, 0) + " ");
+    for i = 0; i < 3; i = i + 1 {
+        print(7 / 2 + i % 2);
+    }
+    print(" ");
+}
+PAR {
+    canal.send(v[0] + v[1]);
+    SEQ {
+        canal.receive(r);
+        print(r);
+    }
+}
+'''
+
+
+# Nomes \w que não são identificadores Python (x²) ou que o Python
+# normalizaria para o mesmo nome (ﬁ e fi, NFKC)
+NAO_ASCII = '''
+INT x² = 2;
+INT dobro_π(INT ñ) {
+    INT ﬁ = ñ * 2;
+    INT fi = 10;
+    return ﬁ + fi;
+}
+class Ψ {
+    INT ω;
+    INT mais_ω(INT k) {
+        return this.ω + k;
+    }
+}
+SEQ {
+    Ψ ψ = new Ψ();
+    ψ.ω = 100;
+    print(dobro_π(x²) + ψ.mais_ω(1000));
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO PYTHONGENERATOR E DO PYTHONRUNTIME")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    arvore = io.StringIO()
+    Interpreter(output_stream=arvore).interpret(analisa(PROGRAMA))
+
+    traduzido = io.StringIO()
+    PythonRuntime(output_stream=traduzido).interpret(analisa(PROGRAMA))
+    verifica(traduzido.getvalue() == arvore.getvalue() == '14 23 parm 343 17',
+             "classes, funções, laços, arrays, nativas, PAR e send/receive com a mesma saída do Interpreter")
+
+    programa = PythonGenerator().compile(analisa(PROGRAMA))
+    verifica('def _main():' in programa.source and 'def f_dobro(' in programa.source,
+             "fonte Python com _main() e uma função por função MiniPar")
+
+    copia = pickle.loads(pickle.dumps(programa))
+    saida = io.StringIO()
+    PythonRuntime(output_stream=saida).execute(copia)
+    verifica(saida.getvalue() == arvore.getvalue(), "code object serializado com marshal executa igual")
+
+    esperado = io.StringIO()
+    Interpreter(output_stream=esperado).interpret(analisa(NAO_ASCII))
+    saidas = []
+    for classe in (PythonRuntime, AsyncRuntime):
+        saida = io.StringIO()
+        classe(output_stream=saida).interpret(analisa(NAO_ASCII))
+        saidas.append(saida.getvalue())
+    verifica(esperado.getvalue() == '1114' and saidas == [esperado.getvalue()] * 2,
+             "identificadores não ASCII (x², ﬁ e fi distintos) com a mesma saída do Interpreter")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
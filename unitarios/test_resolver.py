@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Script para verificar a resolução de variáveis em slots de frame
+(runtime/Resolver.py): layouts de funções e métodos e a mesma semântica de
+escopo local/global dos dicionários de antes
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import FunctionNode, IdentifierNode
+from parser.Traversal import walk
+from runtime.Interpreter import Interpreter
+from runtime.Resolver import Resolver
+
+
+PROGRAMA = '''
+INT g = 1;
+INT semParam() {
+    INT x = 10;
+    g = g + x;
+    return x;
+}
+INT comParam(INT a) {
+    INT y = a * 2;
+    g = g + 100;
+    z = 5;
+    return y + g;
+}
+INT fat(INT n) {
+    if n <= 1 { return 1; }
+    return n * fat(n - 1);
+}
+class Conta {
+    INT saldo;
+    void abre() { this.saldo = 0; }
+    void deposita(INT v) {
+        INT t = v;
+        this.saldo = this.saldo + t;
+    }
+    INT total() { return this.saldo; }
+}
+SEQ {
+    print(semParam()); print(" ");
+    print(x); print(" ");
+    print(comParam(3)); print(" ");
+    print(y); print(" ");
+    print(z); print(" ");
+    print(fat(10)); print(" ");
+    Conta c = new Conta();
+    c.abre();
+    c.deposita(5);
+    c.deposita(7);
+    print(c.total()); print(" ");
+    print(g);
+}
+PAR {
+    comParam(1);
+    semParam();
+}
+SEQ {
+    print(" ");
+    print(g);
+}
+'''
+
+# Saída do interpretador com escopos em dicionários:
+# - declaração em função sem parâmetros vai para o escopo global (x)
+# - atribuição a nome não local escreve no global (g, z)
+# - y é local de comParam
+SAIDA_ESPERADA = '10 10 117 None 5 3628800 12 111 221'
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DA RESOLUÇÃO DE SLOTS (Resolver)")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    ast = Parser(Lexer(PROGRAMA).tokenize()).parse()
+    layouts = Resolver().resolve(ast)
+    funcoes = {node.name: node for node in ast.children if isinstance(node, FunctionNode)}
+    metodos = {(node.name, m.name): m for node in ast.children if hasattr(node, 'methods') for m in node.methods}
+
+    comparam = layouts[funcoes['comParam']]
+    verifica(comparam.names == ['a', 'y'] and comparam.parameter_slots == [0],
+             "função: parâmetros primeiro, depois declarações")
+    deposita = layouts[metodos[('Conta', 'deposita')]]
+    verifica(deposita.names == ['this', 'v', 't'] and deposita.this_slot == 0,
+             "método: 'this' no slot 0")
+    slots = {node.name: node.slot for node in walk(funcoes['comParam']) if isinstance(node, IdentifierNode)}
+    verifica(slots == {'a': 0, 'y': 1, 'g': None}, "nomes não locais ficam sem slot (globais)")
+
+    saida = io.StringIO()
+    Interpreter(output_stream=saida).interpret(ast)
+    verifica(saida.getvalue() == SAIDA_ESPERADA, f"mesma semântica de escopo: {saida.getvalue()!r}")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
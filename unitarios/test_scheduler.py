@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o Scheduler dos blocos PAR: threads reutilizadas por
+PAR dentro de laços, PAR aninhados e simultâneos esperando só as próprias
+tarefas, tarefas que dependem umas das outras com mais comandos que
+max_workers, roubo de tarefas e exceções guardadas no TaskHandle
+"""
+import io
+import sys
+import time
+import threading
+import contextlib
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.Scheduler import Scheduler, default_scheduler
+
+
+LACO = '''
+INT total = 0;
+INT v[3];
+VOID incrementa(INT i) {
+    v[i] = v[i] + 1;
+}
+SEQ {
+    for k = 0; k < 50; k = k + 1 {
+        PAR {
+            incrementa(0);
+            incrementa(1);
+            incrementa(2);
+        }
+    }
+    print(v);
+}
+'''
+
+ANINHADO = '''
+C_CHANNEL canal;
+INT v[4];
+VOID folha(INT i) {
+    v[i] = i * 10;
+}
+VOID inicio() {
+    PAR {
+        folha(0);
+        folha(1);
+    }
+}
+VOID fim() {
+    PAR {
+        folha(2);
+        folha(3);
+    }
+}
+VOID produtor() {
+    for enviado = 0; enviado < 5; enviado = enviado + 1 {
+        canal.send(enviado);
+    }
+}
+VOID consumidor() {
+    INT soma = 0;
+    INT x;
+    for lido = 0; lido < 5; lido = lido + 1 {
+        canal.receive(x);
+        soma = soma + x;
+    }
+    print("soma " + soma + " ");
+}
+SEQ {
+    PAR {
+        consumidor();
+        inicio();
+        fim();
+        produtor();
+    }
+    print(v);
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def executa(classe, fonte):
+    saida = io.StringIO()
+    classe(output_stream=saida).interpret(analisa(fonte))
+    return saida.getvalue()
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO SCHEDULER DOS BLOCOS PAR")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    for nome, classe in ENGINES.items():
+        workers = len(default_scheduler().workers)
+        verifica(executa(classe, LACO) == '[50, 50, 50]'
+                 and len(default_scheduler().workers) <= max(workers, 3),
+                 f"{nome}: 50 blocos PAR em um laço reutilizam as threads do pool")
+        verifica(executa(classe, ANINHADO) == 'soma 10 [0, 10, 20, 30]',
+                 f"{nome}: PAR aninhado e ramos que se comunicam por canal")
+
+    # Mais tarefas que max_workers, todas esperando umas pelas outras
+    scheduler = Scheduler(max_workers=2, idle_timeout=0.2)
+    barreira = threading.Barrier(6)
+    handles = scheduler.run([barreira.wait] * 6)
+    verifica(all(h.done and h.exception is None for h in handles),
+             "6 tarefas que se esperam com max_workers=2: o pool cresce")
+    time.sleep(0.6)
+    verifica(len(scheduler.workers) == 2, "workers além de max_workers terminam depois de idle_timeout")
+
+    # Grupos simultâneos em threads diferentes esperam só as próprias tarefas
+    liberado = threading.Event()
+    lento = scheduler.group()
+    lento.spawn(liberado.wait)
+    rapido = scheduler.group()
+    terminou = []
+    rapido.spawn(lambda: terminou.append(1))
+    rapido.join()
+    verifica(terminou == [1] and lento.pending == 1, "join de um grupo não espera as tarefas de outro grupo")
+    liberado.set()
+    lento.join()
+
+    # PAR aninhado em um worker: as tarefas ficam na fila dele e são roubadas
+    executores = set()
+
+    def interno():
+        time.sleep(0.01)
+        executores.add(threading.current_thread().name)
+
+    def externo():
+        executores.add(threading.current_thread().name)
+        scheduler.run([interno, interno, interno])
+
+    scheduler.run([externo])
+    verifica(len(executores) >= 2, "tarefas de um PAR aninhado executadas por outros workers (roubo)")
+
+    def falha():
+        raise ValueError("erro da tarefa")
+
+    with contextlib.redirect_stderr(io.StringIO()) as erros:
+        grupo = scheduler.group()
+        ruim, bom = grupo.spawn_all([falha, lambda: None])
+        grupo.join()
+    verifica(isinstance(ruim.exception, ValueError) and bom.done and bom.exception is None
+             and 'erro da tarefa' in erros.getvalue(),
+             "exceção de uma tarefa fica no TaskHandle e vai para stderr")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Script de estresse do estado compartilhado pelas threads do PAR: globais
+escritas por muitos ramos ao mesmo tempo (global_scope e SymbolTable sempre
+iguais), atributos fora do Shape criados por várias threads no mesmo objeto,
+escritas em uma TypedArray durante a troca do buffer por lista e o canal
+implícito pedido por várias threads. Usa um switch interval mínimo para
+forçar trocas de thread no meio das operações (no CPython free-threaded as
+threads já rodam em paralelo).
+"""
+import io
+import sys
+import threading
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.Interpreter import Interpreter
+from runtime.LockStripes import LockStripes, FREE_THREADED
+from runtime.TypedArray import filled
+
+RAMOS = 8
+THREADS = 16
+
+
+def contadores(ramos, iteracoes):
+    """Cada ramo incrementa a sua global iteracoes vezes e a sua posição do array (i é local: a função tem parâmetro)."""
+    globais = ''.join(f'INT g{k} = 0;\n' for k in range(ramos))
+    funcoes = ''.join(f'''
+VOID conta{k}(INT n) {{
+    INT i = 0;
+    while i < n {{
+        g{k} = g{k} + 1;
+        v[{k}] = v[{k}] + 2;
+        i = i + 1;
+    }}
+}}
+''' for k in range(ramos))
+    comandos = ''.join(f'        conta{k}({iteracoes});\n' for k in range(ramos))
+    return f'''
+{globais}INT v[{ramos}];
+{funcoes}
+SEQ {{
+    PAR {{
+{comandos}    }}
+    print(vsum(v));
+}}
+'''
+
+
+def executa(classe, fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    saida = io.StringIO()
+    interpretador = classe(output_stream=saida)
+    interpretador.interpret(ast)
+    return interpretador, saida.getvalue()
+
+
+def em_threads(funcao, quantidade=THREADS):
+    """Executa funcao(k) em quantidade threads que começam juntas; retorna os resultados."""
+    barreira = threading.Barrier(quantidade)
+    resultados = [None] * quantidade
+
+    def alvo(k):
+        barreira.wait()
+        resultados[k] = funcao(k)
+
+    threads = [threading.Thread(target=alvo, args=(k,)) for k in range(quantidade)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return resultados
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DE ESTRESSE DO ESTADO COMPARTILHADO (THREADS DO PAR)")
+    print(f" GIL {'desligado (free-threaded)' if FREE_THREADED else 'ligado'}")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        iteracoes = 300
+        fonte = contadores(RAMOS, iteracoes)
+        for nome, classe in ENGINES.items():
+            interpretador, saida = executa(classe, fonte)
+            globais = [f'g{k}' for k in range(RAMOS)]
+            verifica(saida == str(RAMOS * iteracoes * 2)
+                     and all(interpretador.global_scope[g] == iteracoes for g in globais)
+                     and all(interpretador.symbol_table.get_value(g) == iteracoes for g in globais),
+                     f"{nome}: {RAMOS} ramos escrevendo globais e array; global_scope e SymbolTable iguais")
+
+        interpretador, _ = executa(ENGINES['tree'], 'class P {\n    INT a;\n}\nP p = new P();\n')
+        objeto = interpretador.global_scope['p']
+
+        def cria_atributos(k):
+            for i in range(200):
+                objeto.set_attribute(f'x{k}_{i}', i)
+
+        em_threads(cria_atributos)
+        verifica(len(objeto.extra) == THREADS * 200
+                 and all(objeto.get_attribute(f'x{k}_199') == 199 for k in range(THREADS)),
+                 f"{THREADS} threads criando atributos fora do Shape no mesmo objeto")
+
+        perdidas = 0
+        for _ in range(20):
+            array = filled(0, THREADS)
+
+            def escreve(k):
+                if k == 0:
+                    array[0] = 'texto'
+                else:
+                    for valor in range(1, 101):
+                        array[k] = valor
+
+            em_threads(escreve)
+            if array.element is not None or array[0] != 'texto' or any(array[k] != 100 for k in range(1, THREADS)):
+                perdidas += 1
+        verifica(perdidas == 0,
+                 "escritas de INT durante a troca do buffer por lista não se perdem")
+
+        interpretador = Interpreter(output_stream=io.StringIO())
+        canais = em_threads(lambda k: interpretador.implicit_channel('canal'))
+        verifica(all(canal is canais[0] for canal in canais)
+                 and interpretador.symbol_table.get_value('canal') is canais[0],
+                 f"{THREADS} threads pedindo o canal implícito recebem o mesmo Channel")
+
+        locks = LockStripes(8)
+        try:
+            LockStripes(6)
+            verifica(False, "LockStripes exige potência de 2")
+        except ValueError:
+            verifica(locks('x') is locks('x') and len(set(map(locks, range(64)))) == 8,
+                     "LockStripes: mesma chave, mesmo lock; chaves espalhadas entre os locks")
+    finally:
+        sys.setswitchinterval(intervalo)
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
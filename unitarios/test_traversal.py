@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Script para verificar o módulo de percurso da AST (parser/Traversal.py):
+walk iterativo, despacho do NodeVisitor, NodeTransformer e ast_to_dict em
+árvores mais profundas que o limite de recursão
+"""
+import sys
+import glob
+import json
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import ASTNode, BinaryOpNode, NumberNode
+from parser.Traversal import (CHILD_FIELDS, NodeVisitor, NodeTransformer,
+                              iter_child_nodes, walk, ast_to_dict)
+
+
+def analisa(fonte):
+    return Parser(Lexer(fonte).tokenize()).parse()
+
+
+def pre_ordem_recursiva(node, saida):
+    saida.append(node)
+    for child in iter_child_nodes(node):
+        pre_ordem_recursiva(child, saida)
+    return saida
+
+
+def filhos_por_campos(node):
+    """Filhos encontrados em qualquer campo (_fields), para conferir CHILD_FIELDS."""
+    for field in node._fields:
+        value = getattr(node, field)
+        for item in value if isinstance(value, list) else [value]:
+            if isinstance(item, ASTNode):
+                yield item
+
+
+def por_campos(node):
+    """Serialização recursiva de referência: todos os campos (_fields) de cada nó."""
+    resultado = {'type': type(node).__name__}
+    for campo in node._fields:
+        valor = getattr(node, campo)
+        if isinstance(valor, list):
+            valor = [por_campos(item) if isinstance(item, ASTNode) else item for item in valor]
+        elif isinstance(valor, ASTNode):
+            valor = por_campos(valor)
+        resultado[campo] = valor
+    return resultado
+
+
+def diferencas(obtido, referencia, caminho, saida):
+    """Campos em que ast_to_dict difere da referência (None, listas vazias e channel_info são omitidos/texto)."""
+    if isinstance(referencia, dict):
+        if not isinstance(obtido, dict) or obtido.get('type') != referencia['type']:
+            saida.append(f"{caminho}: {obtido!r:.60}")
+            return saida
+        for campo, valor in referencia.items():
+            if campo == 'type' or campo == 'channel_info' or valor is None or valor == []:
+                continue
+            if campo not in obtido:
+                saida.append(f"{caminho}.{campo}: ausente")
+            else:
+                diferencas(obtido[campo], valor, f"{caminho}.{campo}", saida)
+    elif isinstance(referencia, list):
+        if not isinstance(obtido, list) or len(obtido) != len(referencia):
+            saida.append(f"{caminho}: {obtido!r:.60}")
+            return saida
+        for indice, (item, esperado) in enumerate(zip(obtido, referencia)):
+            diferencas(item, esperado, f"{caminho}[{indice}]", saida)
+    elif isinstance(referencia, tuple):
+        if obtido != {'type': 'Parameter', 'type_name': str(referencia[0]), 'name': str(referencia[1])}:
+            saida.append(f"{caminho}: {obtido!r:.60}")
+    elif obtido != (referencia if isinstance(referencia, (bool, int, float)) else str(referencia)):
+        saida.append(f"{caminho}: {obtido!r:.60} != {referencia!r:.60}")
+    return saida
+
+
+class ContaNos(NodeVisitor):
+    def __init__(self):
+        self.numeros = 0
+        self.impressoes = 0
+
+    def visit_NumberNode(self, node):
+        self.numeros += 1
+
+    def visit_PrintNode(self, node):
+        self.impressoes += 1
+        self.generic_visit(node)
+
+
+class DobraConstantes(NodeTransformer):
+    def visit_BinaryOpNode(self, node):
+        self.generic_visit(node)
+        if isinstance(node.left, NumberNode) and isinstance(node.right, NumberNode) and node.operator in '+*':
+            a, b = int(node.left.value), int(node.right.value)
+            return NumberNode(str(a + b if node.operator == '+' else a * b))
+        return node
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DO PERCURSO DA AST (Traversal)")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    # walk iterativo = pré-ordem recursiva, e CHILD_FIELDS não perde filhos
+    ordem_ok = campos_ok = True
+    for caminho in sorted(glob.glob('tests/*.minipar')):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            ast = analisa(f.read())
+        nos = list(walk(ast))
+        ordem_ok &= nos == pre_ordem_recursiva(ast, [])
+        campos_ok &= all(list(iter_child_nodes(n)) == list(filhos_por_campos(n)) for n in nos)
+    verifica(ordem_ok, "walk percorre em pré-ordem")
+    verifica(campos_ok, "CHILD_FIELDS cobre todos os filhos dos testes")
+    verifica(all(cls in CHILD_FIELDS for cls in ASTNode.__subclasses__()), "toda classe de nó está em CHILD_FIELDS")
+
+    # Despacho por tabela
+    contador = ContaNos()
+    contador.visit(analisa('SEQ { print(1 + 2); INT x = 3; print(x); }'))
+    verifica((contador.numeros, contador.impressoes) == (3, 2), "NodeVisitor despacha para visit_<Classe>")
+
+    # Transformer substitui nós dentro de listas e campos
+    ast = DobraConstantes().visit(analisa('SEQ { print(2 * 3 + 4); print(x + 1 * 5); }'))
+    valores = [stmt.expression for stmt in ast.children[0].statements]
+    verifica(isinstance(valores[0], NumberNode) and valores[0].value == '10'
+             and isinstance(valores[1], BinaryOpNode) and valores[1].right.value == '5',
+             "NodeTransformer reescreve subárvores")
+
+    # ast_to_dict tem os mesmos valores da serialização recursiva por _fields
+    divergencias = []
+    for caminho in sorted(glob.glob('tests/*.minipar')):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            ast = analisa(f.read())
+        dicionario = ast_to_dict(ast)
+        diferencas(dicionario, por_campos(ast), caminho, divergencias)
+        if 'object at 0x' in json.dumps(dicionario):
+            divergencias.append(f"{caminho}: repr de nó no JSON")
+    for divergencia in divergencias[:5]:
+        print(f"     {divergencia}")
+    verifica(not divergencias, "ast_to_dict = serialização por _fields nos tests/*.minipar")
+
+    # Árvores além do limite de recursão
+    profundidade = sys.getrecursionlimit() * 5
+    ast = analisa(f"SEQ {{ y = {'(' * profundidade}1{')' * profundidade}; z = {' + '.join(['x'] * profundidade)}; }}")
+    try:
+        total = sum(1 for _ in walk(ast))
+        ast_to_dict(ast)
+        verifica(total > profundidade, f"walk e ast_to_dict com profundidade {profundidade}")
+    except RecursionError:
+        verifica(False, f"walk e ast_to_dict com profundidade {profundidade}: RecursionError")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Script para verificar os arrays INT/FLOAT/BOOL em array.array (TypedArray):
+mesmo comportamento de lista, matrizes linha a linha em um único buffer e
+troca para lista quando um valor não cabe no buffer
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.engines import ENGINES
+from runtime.Interpreter import Interpreter
+from runtime.TypedArray import TypedArray, TypedRow, filled, filled_rows, array_of
+
+
+PROGRAMA = '''
+INT a[3];
+FLOAT f[2];
+INT m[2][2];
+INT fat = 1;
+SEQ {
+    a[-1] = 7;
+    f[0] = 3;
+    m[1][0] = 5;
+    for i = 1; i < 25; i = i + 1 {
+        fat = fat * i;
+    }
+    a[0] = fat;
+    print(a);
+    print(f);
+    print(m);
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DOS ARRAYS TIPADOS")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    esperado = '[620448401733239439360000, 0, 7][3, 0.0][[0, 0], [5, 0]]'
+    for nome, classe in ENGINES.items():
+        saida = io.StringIO()
+        classe(output_stream=saida).interpret(analisa(PROGRAMA))
+        verifica(saida.getvalue() == esperado, f"{nome}: mesma saída dos arrays em listas")
+
+    interpretador = Interpreter(output_stream=io.StringIO())
+    interpretador.interpret(analisa('INT a[4];\nFLOAT m[2][3];\nSEQ {\n    m[1][2] = 1.5;\n}\n'))
+    a = interpretador.global_scope['a']
+    m = interpretador.global_scope['m']
+    verifica(isinstance(a, TypedArray) and a.data.typecode == 'q' and a.data.itemsize == 8,
+             "INT a[4] em array('q')")
+    verifica(all(isinstance(linha, TypedRow) and linha.matrix is m[0].matrix for linha in m)
+             and m[0].matrix.data.tolist() == [0.0, 0.0, 0.0, 0.0, 0.0, 1.5],
+             "linhas da matriz sobre um único buffer, linha a linha")
+
+    b = filled(False, 3)
+    b[1] = True
+    verifica(b.data.typecode == 'b' and b[1] is True and str(b) == '[False, True, False]',
+             "BOOL em bytes, lido como bool")
+
+    v = array_of([1, 2, 3])
+    apelido = v
+    v[0] = 2.5
+    verifica(apelido is v and v.element is None and v == [2.5, 2, 3] and v.view() is None,
+             "valor de outro tipo troca o buffer por lista no lugar")
+
+    linhas = filled_rows(0, 2, 2)
+    linhas[0][1] = "x"
+    verifica(linhas == [[0, "x"], [0, 0]] and linhas[1].matrix.element is None,
+             "a matriz inteira passa a lista")
+
+    erros = []
+    for operacao in (lambda: a[4], lambda: a.__setitem__(-5, 1), lambda: m[0][3]):
+        try:
+            operacao()
+        except IndexError as e:
+            erros.append(str(e))
+    verifica(erros == ['list index out of range', 'list assignment index out of range', 'list index out of range'],
+             "IndexError com as mensagens de lista")
+    verifica(array_of(["a", "b"]) == ["a", "b"] and not isinstance(array_of(["a"]), TypedArray),
+             "STRING continua em lista")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Script para verificar as operações especializadas pelo tipo estático
+(runtime/typed_ops.py): anotação das expressões pelo SemanticAnalyzer e
+resultado igual ao de apply_binary_op mesmo quando a previsão de tipo falha
+"""
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import BinaryOpNode, NumberNode, StringNode
+from parser.Traversal import walk
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime.typed_ops import apply_binary_op, select_binary_op
+
+
+def resultado(funcao, *args):
+    try:
+        valor = funcao(*args)
+        return type(valor), valor
+    except Exception as erro:
+        return type(erro)
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DAS OPERAÇÕES ESPECIALIZADAS (typed_ops)")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    # Tipos anotados pela análise semântica
+    ast = Parser(Lexer('SEQ { INT a = 1; FLOAT b = 2.5; STRING s = "x"; '
+                       'print(a + a); print(a / b); print(s + a); }').tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    tipos = [(n.operator, n.left.static_type, n.right.static_type) for n in walk(ast) if isinstance(n, BinaryOpNode)]
+    verifica(tipos == [('+', 'int', 'int'), ('/', 'int', 'float'), ('+', 'string', 'int')],
+             "SemanticAnalyzer anota static_type nas expressões")
+
+    # Toda combinação de tipo previsto e valor real dá o resultado genérico
+    tipos_previstos = [None, 'int', 'float', 'string', 'bool']
+    valores = [0, 3, -7, 2.5, 0.0, True, 'ab', '']
+    divergencias = []
+    for operador in ['+', '-', '*', '/', '%', '&&', '||']:
+        for tipo_esquerdo in tipos_previstos:
+            for tipo_direito in tipos_previstos:
+                node = BinaryOpNode(NumberNode('1'), operador, StringNode('x'))
+                node.left.static_type, node.right.static_type = tipo_esquerdo, tipo_direito
+                operacao = select_binary_op(node)
+                for esquerdo in valores:
+                    for direito in valores:
+                        esperado = resultado(apply_binary_op, esquerdo, operador, direito)
+                        if resultado(operacao, esquerdo, direito) != esperado:
+                            divergencias.append((operador, tipo_esquerdo, tipo_direito, esquerdo, direito))
+    verifica(not divergencias, "versões especializadas = apply_binary_op"
+             + (f" (divergem: {divergencias[:3]})" if divergencias else ""))
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Script para verificar as funções vetoriais (vsum, vdot, vmatmul...): mesma
+saída em todos os modos de execução, tipos inferidos pelo analisador e, com
+o NumPy instalado, o mesmo resultado com e sem ele
+"""
+import io
+import sys
+sys.path.insert(0, 'src')
+
+from lexer.Lexer import Lexer
+from parser.Parser import Parser
+from parser.AST import FunctionCallNode
+from parser.Traversal import walk
+from semantic.SemanticAnalyzer import SemanticAnalyzer
+from runtime import vector
+from runtime.engines import ENGINES
+from runtime.TypedArray import TypedArray, array_of, filled_rows, rows_of
+
+
+PROGRAMA = '''
+FLOAT a[4];
+FLOAT b[4];
+INT m[2][3];
+INT n[3][2];
+INT k[5];
+SEQ {
+    for i = 0; i < 4; i = i + 1 {
+        a[i] = i * 1.5;
+        b[i] = 2.0;
+    }
+    for i = 0; i < 2; i = i + 1 {
+        for j = 0; j < 3; j = j + 1 {
+            m[i][j] = i + j;
+            n[j][i] = i * j + 1;
+        }
+    }
+    vfill(k, 7);
+    k[2] = 9;
+    print(vsum(a));
+    print(" ");
+    print(vdot(a, b));
+    print(" ");
+    print(vscale(a, 2));
+    print(vadd(a, b));
+    print(vmul(a, b));
+    print(vmatmul(m, n));
+    print(vsum(m));
+    print(" ");
+    print(vcopy(m));
+    print(vmin(k) + vmax(k) + vargmax(k));
+}
+'''
+
+
+def analisa(fonte):
+    ast = Parser(Lexer(fonte).tokenize()).parse()
+    SemanticAnalyzer().analyze(ast)
+    return ast
+
+
+def sem_numpy(funcao, *argumentos):
+    """Resultado da função em Python puro (mesmo com o NumPy instalado)."""
+    numpy = vector.numpy
+    vector.numpy = None
+    try:
+        return funcao(*argumentos)
+    finally:
+        vector.numpy = numpy
+
+
+def main():
+    print("=" * 80)
+    print(" TESTE DAS FUNÇÕES VETORIAIS")
+    print("=" * 80)
+
+    falhas = 0
+
+    def verifica(condicao, descricao):
+        nonlocal falhas
+        if condicao:
+            print(f"  ✅ {descricao}")
+        else:
+            falhas += 1
+            print(f"  ❌ {descricao}")
+
+    esperado = ('9.0 18.0 [0.0, 3.0, 6.0, 9.0][2.0, 3.5, 5.0, 6.5][0.0, 3.0, 6.0, 9.0]'
+                '[[3, 8], [6, 14]]9 [[0, 1, 2], [1, 2, 3]]18')
+    for nome, classe in ENGINES.items():
+        saida = io.StringIO()
+        classe(output_stream=saida).interpret(analisa(PROGRAMA))
+        verifica(saida.getvalue() == esperado, f"{nome}: saída das funções vetoriais")
+
+    tipos = {}
+    for node in walk(analisa(PROGRAMA)):
+        if node.__class__ is FunctionCallNode:
+            tipos[node.name] = node.static_type
+    verifica(tipos == {'vfill': None, 'vsum': 'int', 'vdot': 'float', 'vscale': 'array', 'vadd': 'array',
+                       'vmul': 'array', 'vmatmul': 'array', 'vcopy': 'array', 'vmin': 'int', 'vmax': 'int',
+                       'vargmax': 'int'},
+             "tipos dos resultados inferidos pelos argumentos")
+
+    k = array_of([1, 2, 3])
+    vector.vfill(k, 4)
+    copia = vector.vcopy(k)
+    copia[0] = 0
+    verifica(k == [4, 4, 4] and copia == [0, 4, 4] and isinstance(copia, TypedArray),
+             "vfill no lugar; vcopy em um buffer novo")
+
+    erros = []
+    for chamada in (lambda: vector.vdot([1, 2], [1]), lambda: vector.vmax([]),
+                    lambda: vector.vmatmul([[1, 2]], [[1, 2]]), lambda: vector.vsum(3)):
+        try:
+            chamada()
+        except ValueError as e:
+            erros.append(str(e).split(':')[0])
+    verifica(erros == ['vdot', 'vmax', 'vmatmul', 'vsum'], "tamanhos incompatíveis e não-arrays levantam ValueError")
+
+    grande = 2 ** 62
+    verifica(vector.vsum(array_of([grande] * 64)) == grande * 64
+             and vector.vdot(array_of([grande] * 64), array_of([3] * 64)) == grande * 192,
+             "INT sem estouro de 64 bits")
+
+    inteiros = array_of([(i * 7919) % 101 - 50 for i in range(200)])
+    reais = array_of([i * 0.25 - 3.0 for i in range(200)])
+    matriz = rows_of([(i * 31) % 17 for i in range(64 * 48)], 64, 48)
+    outra = filled_rows(2, 48, 40)
+    casos = [
+        ('vsum', vector.vsum, (inteiros,)),
+        ('vdot', vector.vdot, (inteiros, inteiros)),
+        ('vscale', vector.vscale, (reais, 3)),
+        ('vadd', vector.vadd, (inteiros, reais)),
+        ('vmul', vector.vmul, (inteiros, inteiros)),
+        ('vmatmul', vector.vmatmul, (matriz, outra)),
+        ('vmin', vector.vmin, (reais,)),
+        ('vargmax', vector.vargmax, (inteiros,)),
+    ]
+    if vector.numpy is None:
+        print("  (NumPy não instalado: comparação com o NumPy não executada)")
+    for nome, funcao, argumentos in casos:
+        resultado = funcao(*argumentos)
+        puro = sem_numpy(funcao, *argumentos)
+        verifica(resultado == puro and type(resultado) is type(puro)
+                 and str(resultado) == str(puro), f"{nome}: mesmo resultado com e sem NumPy")
+
+    print("=" * 80)
+    print(" RESULTADO: " + ("todos os casos passaram" if falhas == 0 else f"{falhas} caso(s) com falha"))
+    print("=" * 80)
+    return 0 if falhas == 0 else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())